@@ -22,6 +22,18 @@ class Settings(BaseSettings):
     host: str = "localhost"
     port: int = 8000
     
+    # 멀티 프로세스 서버 설정 (workers > 1 이면 preload 후 fork)
+    server_workers: int = 1
+    server_reuse_port: bool = False
+    server_max_requests: int = 0
+    server_max_requests_jitter: int = 0
+    server_max_memory_mb: int = 0
+    server_graceful_timeout_seconds: float = 30.0
+    server_share_read_only: bool = True
+    # 단일 작성자 엔드포인트 (업로드 / 동기화: 이벤트 로그, 원본 저장소 manifest, 스케치 / 지문 색인 파일, 업로드 상태를
+    # 프로세스 하나가 소유). 작업 프로세스 2개 이상은 False 일 때만 실행 가능하며 해당 엔드포인트는 503
+    server_writers_enabled: bool = True
+    
     # 보안 설정
     secret_key: str = "healthsync-ai-secret-key-change-in-production"
     algorithm: str = "HS256"
@@ -33,9 +45,92 @@ class Settings(BaseSettings):
     
     # 데이터베이스 설정
     database_url: str = "sqlite:///./healthsync_ai.db"
+    db_pool_size: int = 4
+    db_statement_cache_size: int = 256
+    db_write_batch_size: int = 500
+    db_write_batch_delay_ms: float = 5.0
+    
+    # 건강검진 컬럼형 저장소 설정
+    checkup_store_dir: str = "./data/checkups"
+    raw_checkup_store_dir: str = "./data/checkups_raw"
+    pipeline_chunk_size: int = 100_000
+    
+    # 원본 건강검진 회원 매칭 설정 (linkage_workers 0 = CPU 수)
+    linkage_workers: int = 0
+    linkage_chunk_rows: int = 50_000
+    
+    # 건강검진 변경분 동기화 설정 ((회원, 기준 년도) 별 내용 지문 색인)
+    health_sync_fingerprint_path: str = "./data/checkup_fingerprints.npz"
+    # 동기화마다 생기는 작은 세그먼트(compact_rows 행 미만)가 compact_segments 개 쌓이면 병합
+    health_sync_compact_rows: int = 10_000
+    health_sync_compact_segments: int = 32
+    
+    # 건강검진 파일 업로드 설정
+    upload_dir: str = "./data/uploads"
+    upload_buffer_bytes: int = 256 * 1024
+    upload_parse_chunk_rows: int = 10_000
+    upload_max_bytes: int = 500 * 1024 * 1024
+    upload_retention_seconds: int = 3600
+    
+    # 이벤트 로그 설정
+    event_log_dir: str = "./data/events"
+    event_log_segment_bytes: int = 64 * 1024 * 1024
+    event_log_batch_size: int = 512
+    event_log_batch_delay_ms: float = 5.0
+    event_log_fsync: bool = True
+    
+    # 이벤트 버스 설정 (구독자별 기본값, 넘침 정책: block / drop_oldest / drop_newest)
+    event_bus_queue_size: int = 10000
+    event_bus_batch_size: int = 256
+    event_bus_batch_delay_ms: float = 10.0
+    event_bus_overflow: str = "drop_oldest"
+    event_bus_close_timeout_seconds: float = 5.0
+    
+    # 채팅 세션 캐시 설정
+    chat_cache_backend: str = "memory"
+    chat_cache_redis_url: str = "redis://localhost:6379/0"
+    chat_cache_max_bytes: int = 64 * 1024 * 1024
+    chat_cache_ttl_seconds: int = 1800
+    chat_history_window: int = 50
+    
+    # 건강 진단 캐시 설정
+    diagnosis_model_version: str = "health-diagnosis-v1"
+    diagnosis_cache_max_entries: int = 10_000
+    
+    # 배치 알림 발송 설정
+    notification_checkpoint_dir: str = "./data/notifications"
+    notification_chunk_size: int = 500
+    notification_concurrency: int = 64
+    notification_max_retries: int = 3
+    notification_retry_base_ms: float = 100.0
+    notification_retry_max_ms: float = 5000.0
+    notification_checkpoint_interval_ms: float = 1000.0
+    
+    # 코호트 통계 설정
+    cohort_sketch_path: str = "./data/cohort_sketches.bin"
+    cohort_age_band_years: int = 5
+    cohort_min_samples: int = 30
+    cohort_sketch_k: int = 200
+    
+    # 페이지네이션 설정
+    page_default_limit: int = 20
+    page_max_limit: int = 100
+    
+    # 런타임 샘플러 설정
+    runtime_sample_interval_ms: int = 1000
+    runtime_history_size: int = 300
+    
+    # 기동 시간 예산 설정 (새 프로세스 기준, tests/test_startup.py 에서 확인)
+    startup_import_budget_ms: int = 1500
+    startup_ready_budget_ms: int = 3000
+    
+    # 차트 데이터 설정
+    chart_max_points: int = 200
+    chart_point_limit: int = 2000
     
     # 로깅 설정
     log_level: str = "INFO"
+    request_log_sample_rate: float = 0.01
     
     class Config:
         env_file = ".env"
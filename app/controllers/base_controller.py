@@ -7,6 +7,7 @@ from typing import Any
 from fastapi.params import Depends
 
 from app.core.dependencies import get_settings
+from app.core.responses import ModelJSONResponse
 from app.models.base import BaseResponse, ErrorResponse
 from app.config.settings import settings, Settings
 import logging
@@ -19,9 +20,11 @@ class BaseController:
         self.settings = settings
         self.logger = logging.getLogger(self.__class__.__name__)
     
-    def create_success_response(self, data: Any = None, message: str = "성공적으로 처리되었습니다.") -> BaseResponse:
-        """성공 응답 생성"""
-        return BaseResponse(success=True, message=message, data=data, timestamp=datetime.now())
+    def create_success_response(self, data: Any = None, message: str = "성공적으로 처리되었습니다.",
+                                status_code: int = status.HTTP_200_OK) -> ModelJSONResponse:
+        """성공 응답 생성. 응답 모델을 바로 JSON 바이트로 직렬화 (response_model 재검증 생략)"""
+        return ModelJSONResponse(BaseResponse(success=True, message=message, data=data, timestamp=datetime.now()),
+                                 status_code=status_code)
     
     def handle_service_error(self, error: Exception, operation: str = "unknown"):
         """서비스 에러 처리"""
@@ -29,6 +32,8 @@ class BaseController:
         
         if isinstance(error, ValueError):
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(error))
+        elif isinstance(error, LookupError):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(error))
         else:
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="서버 내부 오류가 발생했습니다.")
     
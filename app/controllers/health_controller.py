@@ -0,0 +1,187 @@
+"""
+HealthSync AI 건강검진 컨트롤러
+"""
+import asyncio
+from functools import cached_property
+from datetime import date
+from typing import TYPE_CHECKING, List, Optional
+from fastapi import APIRouter, Depends, Query, Request, status
+from app.controllers.base_controller import BaseController
+from app.models.base import BaseResponse
+from app.models.common import ChartResolution
+from app.models.health import (CheckupUploadProgress, CohortPercentileResponse, FileUploadResponse, HealthCheckup,
+                               HealthHistoryResponse, HealthSyncResponse)
+from app.core.dependencies import get_current_user_id, get_event_writer, require_writers
+
+if TYPE_CHECKING:
+    from app.services.chart_service import ChartService
+    from app.services.checkup_upload_service import CheckupUploadService
+    from app.services.cohort_stats_service import CohortStatsService
+    from app.services.health_sync_service import HealthSyncService
+
+class HealthController(BaseController):
+    """건강검진 관련 컨트롤러"""
+    
+    def __init__(self):
+        super().__init__()
+        self.router = APIRouter()
+        # 동시에 들어온 첫 동기화 요청들이 서비스를 한 번만 생성하도록 직렬화
+        self._sync_service_lock = asyncio.Lock()
+        self._setup_routes()
+
+    # 서비스는 첫 요청 시 생성 (numpy / 컬럼형 저장소 로드를 서버 기동 경로에서 제외)
+    @cached_property
+    def cohort_service(self) -> "CohortStatsService":
+        from app.services.cohort_stats_service import CohortStatsService
+        return CohortStatsService()
+
+    @cached_property
+    def upload_service(self) -> "CheckupUploadService":
+        from app.services.checkup_upload_service import CheckupUploadService
+        return CheckupUploadService(batch_listeners=[self.cohort_service.ingest_batch])
+
+    async def get_sync_service(self) -> "HealthSyncService":
+        """동기화 서비스. 생성 시 지문 색인 로드 / 저장소 전체 재구성이 있으므로 스레드에서 생성 (이벤트 루프 비차단)"""
+        if "sync_service" not in self.__dict__:
+            async with self._sync_service_lock:
+                if "sync_service" not in self.__dict__:
+                    from app.services.health_sync_service import HealthSyncService
+                    event_writer = get_event_writer()
+                    self.__dict__["sync_service"] = await asyncio.to_thread(HealthSyncService,
+                                                                            event_writer=event_writer)
+        return self.__dict__["sync_service"]
+
+    async def get_chart_service(self) -> "ChartService":
+        """차트 서비스. 작성자 프로세스는 동기화 서비스와 같은 저장소 인스턴스를 읽어 동기화 결과가 바로 보이도록"""
+        if "chart_service" not in self.__dict__:
+            from app.services.chart_service import ChartService
+            store = (await self.get_sync_service()).store if self.settings.server_writers_enabled else None
+            self.__dict__.setdefault("chart_service", ChartService(store))
+        return self.__dict__["chart_service"]
+
+    def save_state(self):
+        """생성된 서비스가 있으면 코호트 스케치 / 동기화 지문 색인 저장 (종료 시, 작성자 비활성 프로세스는 저장하지 않음)"""
+        if not self.settings.server_writers_enabled:
+            return
+        if "cohort_service" in self.__dict__:
+            self.cohort_service.save_if_dirty()
+        if "sync_service" in self.__dict__:
+            self.__dict__["sync_service"].save_if_dirty()
+    
+    def _upload_response(self, progress: CheckupUploadProgress, message: str) -> FileUploadResponse:
+        """업로드 상태 → 파일 업로드 응답"""
+        return FileUploadResponse(
+            file_id=progress.file_id,
+            upload_url=f"{self.settings.api_v1_prefix}/health/checkup/uploads/{progress.file_id}",
+            status=progress.status.value,
+            message=message
+        )
+    
+    def _setup_routes(self):
+        """라우트 설정"""
+
+        @self.router.post("/checkup/uploads", response_model=BaseResponse[FileUploadResponse],
+                          status_code=status.HTTP_201_CREATED, dependencies=[Depends(require_writers)],
+                          summary="📤 건강검진 파일 업로드 생성")
+        async def create_checkup_upload(file_name: str = Query(..., description="파일명"),
+                                        file_type: str = Query(default="csv", description="파일 형식"),
+                                        user_id: str = Depends(get_current_user_id)):
+            """업로드 ID 발급. 반환된 upload_url 로 파일 본문을 PUT 합니다."""
+            try:
+                self.log_request("create_checkup_upload", user_id=user_id)
+                progress = self.upload_service.create_upload(user_id, file_name, file_type)
+                return self.create_success_response(
+                    data=self._upload_response(progress, "파일 본문을 업로드해 주세요."),
+                    message="업로드가 생성되었습니다.",
+                    status_code=status.HTTP_201_CREATED
+                )
+            except Exception as e:
+                self.handle_service_error(e, "create_checkup_upload")
+
+        @self.router.put("/checkup/uploads/{file_id}", response_model=BaseResponse[FileUploadResponse],
+                         dependencies=[Depends(require_writers)],
+                         summary="📤 건강검진 파일 스트리밍 업로드")
+        async def upload_checkup_file(file_id: str, request: Request,
+                                      user_id: str = Depends(get_current_user_id)):
+            """파일 본문(raw chunked 또는 multipart/form-data)을 스트리밍으로 수신"""
+            try:
+                self.log_request("upload_checkup_file", user_id=user_id, file_id=file_id)
+                progress = await self.upload_service.receive(
+                    file_id, user_id, request.stream(), request.headers.get("content-type", "")
+                )
+                return self.create_success_response(
+                    data=self._upload_response(progress, f"{progress.records_parsed:,}건의 검진 기록을 저장했습니다."),
+                    message="파일 업로드가 완료되었습니다."
+                )
+            except Exception as e:
+                self.handle_service_error(e, "upload_checkup_file")
+
+        @self.router.get("/checkup/uploads/{file_id}", response_model=BaseResponse[CheckupUploadProgress],
+                         dependencies=[Depends(require_writers)],
+                         summary="📊 건강검진 파일 업로드 진행 상태")
+        async def get_checkup_upload(file_id: str, user_id: str = Depends(get_current_user_id)):
+            """업로드 진행 상태 조회"""
+            try:
+                progress = self.upload_service.get_progress(file_id, user_id)
+                return self.create_success_response(data=progress, message="업로드 진행 상태입니다.")
+            except Exception as e:
+                self.handle_service_error(e, "get_checkup_upload")
+
+        @self.router.post("/checkup/sync/{member_serial_number}", response_model=BaseResponse[HealthSyncResponse],
+                          dependencies=[Depends(require_writers)],
+                          summary="🔄 건강검진 데이터 동기화")
+        async def sync_checkups(member_serial_number: int, checkups: List[HealthCheckup],
+                                user_id: str = Depends(get_current_user_id)):
+            """회원의 연도별 건강검진 기록 동기화. 이전 동기화와 내용이 달라진 기준 년도만 반영합니다."""
+            try:
+                self.log_request("sync_checkups", user_id=user_id, member_serial_number=member_serial_number)
+                sync_service = await self.get_sync_service()
+                result = await sync_service.sync_member(member_serial_number, checkups)
+                if result.sync_status == "synced" and "chart_service" in self.__dict__:
+                    self.__dict__["chart_service"].invalidate_members([member_serial_number])
+                return self.create_success_response(data=result, message=result.message)
+            except Exception as e:
+                self.handle_service_error(e, "sync_checkups")
+
+        @self.router.get("/checkup/history/{member_serial_number}",
+                         response_model=BaseResponse[HealthHistoryResponse],
+                         summary="📈 건강검진 이력 / 차트 조회")
+        async def get_checkup_history(member_serial_number: int,
+                                      metrics: Optional[List[str]] = Query(default=None, description="차트 지표 (없으면 전체)"),
+                                      resolution: ChartResolution = Query(default=ChartResolution.YEAR,
+                                                                          description="차트 해상도"),
+                                      start_date: Optional[date] = Query(default=None, description="조회 시작일"),
+                                      end_date: Optional[date] = Query(default=None, description="조회 종료일"),
+                                      max_points: Optional[int] = Query(default=None, ge=2,
+                                                                        description="지표별 최대 점 개수"),
+                                      user_id: str = Depends(get_current_user_id)):
+            """회원의 연도별 검진 기록과 지표별 차트 시계열"""
+            try:
+                self.log_request("get_checkup_history", user_id=user_id, member_serial_number=member_serial_number)
+                chart_service = await self.get_chart_service()
+                # 첫 조회는 저장소 읽기 + 시계열 집계가 있으므로 스레드에서 실행
+                result = await asyncio.to_thread(chart_service.build_health_history_response, member_serial_number,
+                                                 metrics, resolution, start_date, end_date, max_points)
+                return self.create_success_response(data=result, message="건강검진 이력 조회 완료")
+            except Exception as e:
+                self.handle_service_error(e, "get_checkup_history")
+
+        @self.router.get("/cohort/percentile", response_model=BaseResponse[CohortPercentileResponse],
+                         summary="📈 코호트 백분위 조회")
+        async def get_cohort_percentile(metric: str = Query(..., description="검사 항목 (예: systolic_bp)"),
+                                        value: float = Query(..., description="검사 값"),
+                                        age: int = Query(..., ge=0, description="나이"),
+                                        gender_code: int = Query(..., description="성별 코드"),
+                                        region_code: int = Query(..., description="지역 코드"),
+                                        user_id: str = Depends(get_current_user_id)):
+            """같은 나이대 / 성별 / 지역 코호트에서의 백분위"""
+            try:
+                self.log_request("get_cohort_percentile", user_id=user_id, metric=metric)
+                await self.cohort_service.ensure_loaded()
+                result = self.cohort_service.percentile(age, gender_code, region_code, metric, value)
+                return self.create_success_response(data=CohortPercentileResponse(**result),
+                                                    message="코호트 백분위 조회 완료")
+            except Exception as e:
+                self.handle_service_error(e, "get_cohort_percentile")
+
+health_controller = HealthController()
@@ -0,0 +1,100 @@
+"""
+HealthSync AI 이력 컨트롤러 (채팅 / 미션 완료 이력 커서 페이지, 미션 완료 기록 / 달성 통계)
+"""
+from datetime import date
+from typing import TYPE_CHECKING, Optional
+from fastapi import APIRouter, Depends, Query, status
+from app.controllers.base_controller import BaseController
+from app.core.dependencies import (get_chat_history_service, get_current_user_id, get_mission_history_service,
+                                   get_page_params, require_writers)
+from app.core.pagination import PageParams
+from app.models.base import BaseResponse
+from app.models.common import ChartResolution, CursorPage
+from app.models.goal import MissionCompletionHistory, MissionHistoryResponse
+from app.models.intelligence import ChatMessage
+
+if TYPE_CHECKING:
+    from app.services.chat_history_service import ChatHistoryService
+    from app.services.mission_history_service import MissionHistoryService
+
+class HistoryController(BaseController):
+    """이력 조회 컨트롤러"""
+
+    def __init__(self):
+        super().__init__()
+        self.router = APIRouter()
+        self._setup_routes()
+
+    def _setup_routes(self):
+        """라우트 설정"""
+
+        @self.router.get("/chat/{session_id}/messages", response_model=BaseResponse[CursorPage[ChatMessage]],
+                         summary="💬 채팅 이력 페이지 조회")
+        async def get_chat_messages(session_id: str, params: PageParams = Depends(get_page_params),
+                                    user_id: str = Depends(get_current_user_id),
+                                    service: "ChatHistoryService" = Depends(get_chat_history_service)):
+            """세션 전체 채팅 이력 (최신순). 다음 페이지는 응답의 next_cursor 로 조회합니다."""
+            try:
+                self.log_request("get_chat_messages", user_id=user_id, session_id=session_id)
+                page = await service.get_page(session_id, params)
+                return self.create_success_response(data=page, message="채팅 이력 조회 완료")
+            except Exception as e:
+                self.handle_service_error(e, "get_chat_messages")
+
+        @self.router.get("/missions/{member_serial_number}/completions",
+                         response_model=BaseResponse[CursorPage[MissionCompletionHistory]],
+                         summary="🎯 미션 완료 이력 페이지 조회")
+        async def get_mission_completions(member_serial_number: int,
+                                          start_date: Optional[date] = Query(default=None, description="조회 시작일"),
+                                          end_date: Optional[date] = Query(default=None, description="조회 종료일"),
+                                          params: PageParams = Depends(get_page_params),
+                                          user_id: str = Depends(get_current_user_id),
+                                          service: "MissionHistoryService" = Depends(get_mission_history_service)):
+            """회원의 미션 완료 이력 (날짜순). 다음 페이지는 응답의 next_cursor 로 조회합니다."""
+            try:
+                self.log_request("get_mission_completions", user_id=user_id,
+                                 member_serial_number=member_serial_number)
+                page = await service.get_page(member_serial_number, params, start_date, end_date)
+                return self.create_success_response(data=page, message="미션 완료 이력 조회 완료")
+            except Exception as e:
+                self.handle_service_error(e, "get_mission_completions")
+
+        @self.router.get("/missions/{member_serial_number}/stats", response_model=BaseResponse[MissionHistoryResponse],
+                         summary="📊 미션 달성 통계 / 차트 조회")
+        async def get_mission_stats(member_serial_number: int,
+                                    start_date: Optional[date] = Query(default=None, description="조회 시작일 (기본: 종료일 29일 전)"),
+                                    end_date: Optional[date] = Query(default=None, description="조회 종료일 (기본: 오늘)"),
+                                    resolution: ChartResolution = Query(default=ChartResolution.DAY,
+                                                                        description="차트 해상도"),
+                                    max_points: Optional[int] = Query(default=None, ge=2,
+                                                                      description="지표별 최대 점 개수"),
+                                    user_id: str = Depends(get_current_user_id),
+                                    service: "MissionHistoryService" = Depends(get_mission_history_service)):
+            """기간 달성률 / 연속 달성과 미션별 달성률 차트"""
+            try:
+                self.log_request("get_mission_stats", user_id=user_id, member_serial_number=member_serial_number)
+                result = await service.get_stats(member_serial_number, start_date, end_date, resolution, max_points)
+                return self.create_success_response(data=result, message="미션 달성 통계 조회 완료")
+            except Exception as e:
+                self.handle_service_error(e, "get_mission_stats")
+
+        @self.router.post("/missions/{member_serial_number}/completions",
+                          response_model=BaseResponse[MissionCompletionHistory],
+                          status_code=status.HTTP_201_CREATED, dependencies=[Depends(require_writers)],
+                          summary="✅ 미션 완료 기록")
+        async def record_mission_completion(member_serial_number: int, completion: MissionCompletionHistory,
+                                            user_id: str = Depends(get_current_user_id),
+                                            service: "MissionHistoryService" = Depends(get_mission_history_service)):
+            """일일 미션 수행 결과 기록 (completion_id 가 0 이면 자동 발급). 같은 날짜는 통계에서 마지막 기록이 반영됩니다."""
+            try:
+                self.log_request("record_mission_completion", user_id=user_id,
+                                 member_serial_number=member_serial_number)
+                if completion.member_serial_number != member_serial_number:
+                    raise ValueError("다른 회원의 미션 완료 기록입니다.")
+                saved = await service.record_completion(completion)
+                return self.create_success_response(data=saved.to_model(), message="미션 완료가 기록되었습니다.",
+                                                    status_code=status.HTTP_201_CREATED)
+            except Exception as e:
+                self.handle_service_error(e, "record_mission_completion")
+
+history_controller = HistoryController()
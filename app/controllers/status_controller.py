@@ -2,11 +2,12 @@
 HealthSync AI 헬스체크 컨트롤러
 """
 from fastapi import APIRouter, Depends, status
+from fastapi.responses import PlainTextResponse
 from app.controllers.base_controller import BaseController
 from app.models.base import BaseResponse
-from app.core.dependencies import get_settings
+from app.core.dependencies import get_settings, get_session_cache, get_runtime_sampler, get_event_bus
+from app.core.metrics import metrics_registry
 from app.config.settings import Settings
-import time, psutil
 from datetime import datetime
 
 class StatusController(BaseController):
@@ -27,16 +28,15 @@ class StatusController(BaseController):
             """시스템 상태 확인"""
             try:
                 self.log_request("system_status")
-                try:
-                    memory_mb = round(psutil.Process().memory_info().rss / 1024 / 1024, 2)
-                except:
-                    memory_mb = 0.0
+                # 백그라운드 샘플러의 마지막 측정값 (요청마다 시스템 호출 없음)
+                runtime = get_runtime_sampler().current()
 
                 status_data = {
                     "status": "running",
                     "service": app_settings.app_name,
                     "version": app_settings.app_version,
-                    "memory_mb": memory_mb,
+                    "memory_mb": runtime.rss_mb,
+                    "loop_lag_ms": runtime.loop_lag_ms,
                     "environment": "development" if app_settings.debug else "production"
                 }
 
@@ -48,4 +48,62 @@ class StatusController(BaseController):
             except Exception as e:
                 self.handle_service_error(e, "system_status")
 
+        @self.router.get("/cache", response_model=BaseResponse,
+                         status_code=status.HTTP_200_OK,
+                         summary="🗄️ 세션 캐시 상태")
+        async def get_cache_status():
+            """채팅 세션 캐시 hit/miss/eviction 카운터"""
+            try:
+                self.log_request("cache_status")
+                return self.create_success_response(
+                    data=get_session_cache().stats,
+                    message="세션 캐시 상태 조회 완료"
+                )
+
+            except Exception as e:
+                self.handle_service_error(e, "cache_status")
+
+        @self.router.get("/events", response_model=BaseResponse,
+                         status_code=status.HTTP_200_OK,
+                         summary="📨 이벤트 버스 상태")
+        async def get_event_bus_status():
+            """구독자별 큐 깊이, 발행 → 전달 지연, 병합 / 폐기 / 오류 카운터"""
+            try:
+                self.log_request("event_bus_status")
+                return self.create_success_response(
+                    data=get_event_bus().stats,
+                    message="이벤트 버스 상태 조회 완료"
+                )
+
+            except Exception as e:
+                self.handle_service_error(e, "event_bus_status")
+
+        @self.router.get("/runtime", response_model=BaseResponse,
+                         status_code=status.HTTP_200_OK,
+                         summary="⏱️ 런타임 상세 상태")
+        async def get_runtime_status():
+            """이벤트 루프 지연, GC, RSS/CPU/FD/스레드 최근 샘플 이력과 요약"""
+            try:
+                self.log_request("runtime_status")
+                sampler = get_runtime_sampler()
+                return self.create_success_response(
+                    data={
+                        "running": sampler.running,
+                        "summary": sampler.summary(),
+                        "samples": [sample.as_dict() for sample in sampler.history()],
+                    },
+                    message="런타임 상태 조회 완료"
+                )
+
+            except Exception as e:
+                self.handle_service_error(e, "runtime_status")
+
+        @self.router.get("/metrics", response_class=PlainTextResponse,
+                         status_code=status.HTTP_200_OK,
+                         summary="📊 요청 메트릭 (Prometheus)")
+        async def get_metrics():
+            """라우트별 지연 시간 히스토그램, 상태 코드별 요청 수, 처리 중 요청 수 (Prometheus 텍스트 형식)"""
+            return PlainTextResponse(metrics_registry.render(),
+                                     media_type="text/plain; version=0.0.4")
+
 status_controller = StatusController()
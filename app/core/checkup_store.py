@@ -0,0 +1,697 @@
+"""
+HealthSync AI 건강검진 컬럼형 저장소
+
+수백만 건의 HealthCheckupRaw / HealthCheckup 레코드를 pydantic 객체 대신
+필드별 타입 배열(컬럼)로 보관합니다.
+- Decimal 필드는 고정소수점 정수(scale 배)로 저장
+- Optional 필드는 별도의 null 비트맵으로 관리
+- 세그먼트 단위 .npy 파일로 영속화하고 mmap 으로 읽기
+- 세그먼트 내부는 (키, reference_year) 순으로 정렬되어 회원별 이력이 연속 구간(zero-copy 슬라이스)
+- 작은 세그먼트가 쌓이면 compact() 로 연속 구간을 병합 (조회 시 순회할 세그먼트 수를 제한)
+pydantic 모델은 API 경계에서만 to_models() 로 생성합니다.
+"""
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import threading
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Type, TypeVar, Union, get_args, get_origin
+
+import numpy as np
+from pydantic import BaseModel
+
+from app.models.health import HealthCheckup, HealthCheckupRaw
+
+# 고정소수점 배율 (Decimal 소수 둘째 자리까지 보존)
+DECIMAL_SCALE = 100
+
+# 내부 레코드 타입 (app.models.records)
+R = TypeVar("R")
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+_KIND_DTYPES = {
+    "int32": np.int32,
+    "int64": np.int64,
+    "fixed": np.int32,
+    "date": np.int32,
+    "datetime": np.int64,
+}
+
+
+class ColumnSpec(NamedTuple):
+    """컬럼 정의"""
+    name: str
+    kind: str  # int32 / int64 / fixed / date / datetime / str
+    nullable: bool
+    scale: int = 1
+
+
+class ColumnSchema:
+    """모델 하나에 대응하는 컬럼 스키마"""
+
+    def __init__(self, name: str, model: Type[BaseModel], columns: Sequence[ColumnSpec], key_field: str):
+        self.name = name
+        self.model = model
+        self.columns: Tuple[ColumnSpec, ...] = tuple(columns)
+        self.key_field = key_field
+        self.by_name: Dict[str, ColumnSpec] = {c.name: c for c in self.columns}
+
+    def __getitem__(self, name: str) -> ColumnSpec:
+        return self.by_name[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.by_name
+
+    @property
+    def names(self) -> List[str]:
+        return [c.name for c in self.columns]
+
+
+def schema_from_model(name: str, model: Type[BaseModel], key_field: str,
+                      decimal_scale: int = DECIMAL_SCALE) -> ColumnSchema:
+    """pydantic 모델 필드 정의로부터 컬럼 스키마 생성"""
+    columns = []
+    for field_name, field in model.model_fields.items():
+        annotation = field.annotation
+        nullable = False
+        if get_origin(annotation) is Union:
+            args = [a for a in get_args(annotation) if a is not type(None)]
+            nullable = len(args) != len(get_args(annotation))
+            annotation = args[0]
+
+        if annotation is int:
+            wide = field_name.endswith("_id") or field_name.endswith("serial_number")
+            columns.append(ColumnSpec(field_name, "int64" if wide else "int32", nullable))
+        elif annotation is Decimal:
+            columns.append(ColumnSpec(field_name, "fixed", nullable, decimal_scale))
+        elif annotation is datetime:
+            columns.append(ColumnSpec(field_name, "datetime", nullable))
+        elif annotation is date:
+            columns.append(ColumnSpec(field_name, "date", nullable))
+        elif annotation is str:
+            columns.append(ColumnSpec(field_name, "str", nullable))
+        else:
+            raise ValueError(f"컬럼형으로 저장할 수 없는 필드 타입입니다: {model.__name__}.{field_name}")
+    return ColumnSchema(name, model, columns, key_field)
+
+
+# ---------------------------------------------------------------------------
+# 값 변환 (Python ↔ 컬럼 정수 표현)
+# ---------------------------------------------------------------------------
+
+def to_fixed(value: Any, scale: int = DECIMAL_SCALE) -> int:
+    """Decimal/float → 고정소수점 정수"""
+    if not isinstance(value, Decimal):
+        value = Decimal(str(value))
+    return int((value * scale).to_integral_value(rounding=ROUND_HALF_UP))
+
+
+def from_fixed(value: int, scale: int = DECIMAL_SCALE) -> Decimal:
+    """고정소수점 정수 → Decimal"""
+    return (Decimal(int(value)) / scale).quantize(Decimal(1) / scale)
+
+
+def encode_value(spec: ColumnSpec, value: Any) -> int:
+    if spec.kind == "fixed":
+        return to_fixed(value, spec.scale)
+    if spec.kind == "date":
+        return value.toordinal() - _EPOCH_ORDINAL
+    if spec.kind == "datetime":
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        delta = value - _EPOCH
+        return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+    return int(value)
+
+
+def decode_value(spec: ColumnSpec, value: Any) -> Any:
+    if spec.kind == "fixed":
+        return from_fixed(value, spec.scale)
+    if spec.kind == "date":
+        return date.fromordinal(int(value) + _EPOCH_ORDINAL)
+    if spec.kind == "datetime":
+        return _EPOCH + timedelta(microseconds=int(value))
+    return int(value)
+
+
+# ---------------------------------------------------------------------------
+# 컬럼 컨테이너
+# ---------------------------------------------------------------------------
+
+class Bitmap:
+    """null 비트맵 (1 = 값 있음). 패킹된 비트 배열 위의 [start, start+length) 구간 뷰"""
+
+    __slots__ = ("bits", "start", "length")
+
+    def __init__(self, bits: np.ndarray, start: int, length: int):
+        self.bits = bits
+        self.start = start
+        self.length = length
+
+    @classmethod
+    def from_mask(cls, mask: np.ndarray) -> "Bitmap":
+        mask = np.asarray(mask, dtype=bool)
+        return cls(np.packbits(mask), 0, len(mask))
+
+    def __len__(self) -> int:
+        return self.length
+
+    def slice(self, start: int, stop: int) -> "Bitmap":
+        return Bitmap(self.bits, self.start + start, stop - start)
+
+    def to_mask(self) -> np.ndarray:
+        """필요한 바이트 구간만 풀어서 bool 배열로 반환"""
+        if self.length == 0:
+            return np.zeros(0, dtype=bool)
+        first = self.start // 8
+        last = (self.start + self.length + 7) // 8
+        unpacked = np.unpackbits(self.bits[first:last])
+        offset = self.start - first * 8
+        return unpacked[offset:offset + self.length].astype(bool)
+
+    def null_count(self) -> int:
+        return self.length - int(np.count_nonzero(self.to_mask()))
+
+
+class StringColumn:
+    """가변 길이 UTF-8 문자열 컬럼 (offsets + bytes)"""
+
+    __slots__ = ("offsets", "data")
+
+    def __init__(self, offsets: np.ndarray, data: np.ndarray):
+        self.offsets = offsets
+        self.data = data
+
+    @classmethod
+    def from_values(cls, values: Iterable[Optional[str]]) -> "StringColumn":
+        encoded = [(v or "").encode("utf-8") for v in values]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        if encoded:
+            np.cumsum([len(b) for b in encoded], out=offsets[1:])
+        data = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+        return cls(offsets, data)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        start, stop = int(self.offsets[index]), int(self.offsets[index + 1])
+        return bytes(self.data[start:stop]).decode("utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def slice(self, start: int, stop: int) -> "StringColumn":
+        return StringColumn(self.offsets[start:stop + 1], self.data)
+
+    def take(self, indices: np.ndarray) -> "StringColumn":
+        indices = np.asarray(indices, dtype=np.int64)
+        starts = np.asarray(self.offsets[:-1])[indices]
+        lengths = np.asarray(self.offsets[1:])[indices] - starts
+        offsets = np.zeros(len(indices) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        # 각 바이트의 원본 위치 = 문자열 시작 위치 + 문자열 내부 위치
+        gather = np.repeat(starts - offsets[:-1], lengths) + np.arange(offsets[-1], dtype=np.int64)
+        return StringColumn(offsets, np.asarray(self.data)[gather])
+
+    def compact(self) -> Tuple[np.ndarray, np.ndarray]:
+        """0 부터 시작하는 offsets 와 해당 구간 bytes 반환 (저장용)"""
+        base = int(self.offsets[0]) if len(self.offsets) else 0
+        end = int(self.offsets[-1]) if len(self.offsets) else 0
+        return np.asarray(self.offsets, dtype=np.int64) - base, np.asarray(self.data[base:end])
+
+
+Column = Union[np.ndarray, StringColumn]
+
+
+class ColumnBatch:
+    """스키마에 맞춘 컬럼 묶음 (한 세그먼트 또는 그 일부 구간)"""
+
+    __slots__ = ("schema", "columns", "validity", "length")
+
+    def __init__(self, schema: ColumnSchema, columns: Dict[str, Column],
+                 validity: Optional[Dict[str, Bitmap]] = None, length: Optional[int] = None):
+        self.schema = schema
+        self.columns = columns
+        self.validity = validity or {}
+        if length is None:
+            length = len(next(iter(columns.values()))) if columns else 0
+        self.length = length
+
+    def __len__(self) -> int:
+        return self.length
+
+    # 생성 -------------------------------------------------------------------
+    @classmethod
+    def empty(cls, schema: ColumnSchema) -> "ColumnBatch":
+        return cls.from_rows(schema, [])
+
+    @classmethod
+    def from_rows(cls, schema: ColumnSchema, rows: Sequence[Dict[str, Any]]) -> "ColumnBatch":
+        """dict 행 목록 → 컬럼 배치"""
+        n = len(rows)
+        columns: Dict[str, Column] = {}
+        validity: Dict[str, Bitmap] = {}
+        for spec in schema.columns:
+            values = [row.get(spec.name) for row in rows]
+            if spec.kind == "str":
+                columns[spec.name] = StringColumn.from_values(values)
+            else:
+                array = np.zeros(n, dtype=_KIND_DTYPES[spec.kind])
+                for i, value in enumerate(values):
+                    if value is not None:
+                        array[i] = encode_value(spec, value)
+                columns[spec.name] = array
+            if spec.nullable:
+                validity[spec.name] = Bitmap.from_mask(np.fromiter((v is not None for v in values), dtype=bool, count=n))
+            elif any(v is None for v in values):
+                raise ValueError(f"필수 컬럼에 빈 값이 있습니다: {spec.name}")
+        return cls(schema, columns, validity, n)
+
+    @classmethod
+    def from_models(cls, schema: ColumnSchema, models: Sequence[Any]) -> "ColumnBatch":
+        """pydantic 모델 또는 내부 레코드(as_dict) 목록으로부터 배치 생성"""
+        return cls.from_rows(schema, [dict(m) if isinstance(m, BaseModel) else m.as_dict() for m in models])
+
+    @classmethod
+    def from_arrays(cls, schema: ColumnSchema, arrays: Dict[str, Any],
+                    masks: Optional[Dict[str, np.ndarray]] = None) -> "ColumnBatch":
+        """이미 인코딩된 배열(정수 표현)로부터 배치 생성. masks 가 없는 nullable 컬럼은 모두 유효로 간주"""
+        masks = masks or {}
+        columns: Dict[str, Column] = {}
+        validity: Dict[str, Bitmap] = {}
+        length = None
+        for spec in schema.columns:
+            value = arrays[spec.name]
+            if spec.kind == "str":
+                column = value if isinstance(value, StringColumn) else StringColumn.from_values(value)
+            else:
+                column = np.asarray(value, dtype=_KIND_DTYPES[spec.kind])
+            columns[spec.name] = column
+            length = len(column) if length is None else length
+            if len(column) != length:
+                raise ValueError(f"컬럼 길이가 일치하지 않습니다: {spec.name}")
+            mask = masks.get(spec.name)
+            if spec.nullable:
+                validity[spec.name] = Bitmap.from_mask(np.ones(length, dtype=bool) if mask is None else mask)
+            elif mask is not None and not np.all(mask):
+                raise ValueError(f"필수 컬럼에 빈 값이 있습니다: {spec.name}")
+        return cls(schema, columns, validity, length or 0)
+
+    @classmethod
+    def from_strings(cls, schema: ColumnSchema, columns: Dict[str, Sequence[str]], length: int,
+                     defaults: Optional[Dict[str, Any]] = None) -> "ColumnBatch":
+        """CSV 등에서 읽은 문자열 컬럼을 컬럼 단위(벡터)로 변환. 빈 문자열은 null"""
+        defaults = defaults or {}
+        arrays: Dict[str, Any] = {}
+        masks: Dict[str, np.ndarray] = {}
+        for spec in schema.columns:
+            values = columns.get(spec.name)
+            if values is None:
+                if spec.name in defaults:
+                    default = defaults[spec.name]
+                    arrays[spec.name] = [default] * length if spec.kind == "str" else \
+                        np.full(length, encode_value(spec, default), dtype=_KIND_DTYPES[spec.kind])
+                    continue
+                if not spec.nullable:
+                    raise ValueError(f"필수 컬럼이 없습니다: {spec.name}")
+                arrays[spec.name] = [""] * length if spec.kind == "str" else np.zeros(length, dtype=_KIND_DTYPES[spec.kind])
+                masks[spec.name] = np.zeros(length, dtype=bool)
+                continue
+
+            text = np.char.strip(np.asarray(values, dtype=str))
+            mask = np.char.str_len(text) > 0
+            if not spec.nullable and not mask.all():
+                raise ValueError(f"필수 컬럼에 빈 값이 있습니다: {spec.name}")
+            masks[spec.name] = mask
+            if spec.kind == "str":
+                arrays[spec.name] = list(text)
+                continue
+            try:
+                if spec.kind == "fixed":
+                    filled = np.where(mask, text, "0").astype(np.float64)
+                    encoded = np.floor(filled * spec.scale + 0.5 + 1e-9)
+                elif spec.kind == "date":
+                    encoded = np.where(mask, text, "1970-01-01").astype("datetime64[D]").astype(np.int64)
+                elif spec.kind == "datetime":
+                    encoded = np.where(mask, text, "1970-01-01T00:00:00").astype("datetime64[us]").astype(np.int64)
+                else:
+                    encoded = np.where(mask, text, "0").astype(np.int64)
+            except ValueError as e:
+                raise ValueError(f"컬럼 값을 해석할 수 없습니다: {spec.name} ({e})") from e
+            arrays[spec.name] = encoded.astype(_KIND_DTYPES[spec.kind])
+        return cls.from_arrays(schema, arrays, masks)
+
+    # 접근 -------------------------------------------------------------------
+    def column(self, name: str) -> Column:
+        return self.columns[name]
+
+    def valid(self, name: str) -> np.ndarray:
+        """값 존재 여부 bool 배열 (non-nullable 컬럼은 전부 True)"""
+        bitmap = self.validity.get(name)
+        if bitmap is None:
+            return np.ones(self.length, dtype=bool)
+        return bitmap.to_mask()
+
+    def as_float(self, name: str) -> np.ndarray:
+        """고정소수점 해제 + null 을 NaN 으로 바꾼 float64 배열 (벡터 연산용)"""
+        spec = self.schema[name]
+        values = np.asarray(self.columns[name], dtype=np.float64)
+        if spec.kind == "fixed":
+            values = values / spec.scale
+        if spec.nullable:
+            values = np.where(self.valid(name), values, np.nan)
+        return values
+
+    # 구간 / 선택 --------------------------------------------------------------
+    def slice(self, start: int, stop: int) -> "ColumnBatch":
+        """복사 없는 연속 구간 뷰"""
+        columns = {name: col.slice(start, stop) if isinstance(col, StringColumn) else col[start:stop]
+                   for name, col in self.columns.items()}
+        validity = {name: bitmap.slice(start, stop) for name, bitmap in self.validity.items()}
+        return ColumnBatch(self.schema, columns, validity, stop - start)
+
+    def take(self, indices: np.ndarray) -> "ColumnBatch":
+        """인덱스 선택 (복사)"""
+        indices = np.asarray(indices, dtype=np.int64)
+        columns = {name: col.take(indices) if isinstance(col, StringColumn) else np.asarray(col)[indices]
+                   for name, col in self.columns.items()}
+        validity = {name: Bitmap.from_mask(bitmap.to_mask()[indices]) for name, bitmap in self.validity.items()}
+        return ColumnBatch(self.schema, columns, validity, len(indices))
+
+    @staticmethod
+    def concat(schema: ColumnSchema, batches: Sequence["ColumnBatch"]) -> "ColumnBatch":
+        """여러 배치를 하나로 합침 (복사)"""
+        batches = [b for b in batches if len(b)]
+        if not batches:
+            return ColumnBatch.empty(schema)
+        if len(batches) == 1:
+            return batches[0]
+        columns: Dict[str, Column] = {}
+        validity: Dict[str, Bitmap] = {}
+        for spec in schema.columns:
+            parts = [b.columns[spec.name] for b in batches]
+            if spec.kind == "str":
+                columns[spec.name] = StringColumn.from_values(v for part in parts for v in part)
+            else:
+                columns[spec.name] = np.concatenate([np.asarray(p) for p in parts])
+            if spec.nullable:
+                validity[spec.name] = Bitmap.from_mask(np.concatenate([b.valid(spec.name) for b in batches]))
+        return ColumnBatch(schema, columns, validity, sum(len(b) for b in batches))
+
+    def sort_order(self) -> np.ndarray:
+        """(키, reference_year) 정렬 순서"""
+        keys = [np.asarray(self.columns[self.schema.key_field])]
+        if "reference_year" in self.schema and self.schema.key_field != "reference_year":
+            keys.insert(0, np.asarray(self.columns["reference_year"]))
+        return np.lexsort(keys)
+
+    # API 경계 변환 ------------------------------------------------------------
+    def iter_rows(self) -> Iterator[Dict[str, Any]]:
+        masks = {name: self.valid(name) for name in self.validity}
+        for i in range(self.length):
+            row = {}
+            for spec in self.schema.columns:
+                mask = masks.get(spec.name)
+                if mask is not None and not mask[i]:
+                    row[spec.name] = None
+                elif spec.kind == "str":
+                    row[spec.name] = self.columns[spec.name][i]
+                else:
+                    row[spec.name] = decode_value(spec, self.columns[spec.name][i])
+            yield row
+
+    def to_models(self, model: Optional[Type[BaseModel]] = None) -> List[BaseModel]:
+        """pydantic 모델 목록으로 변환 (API 응답 직전에만 사용)"""
+        model = model or self.schema.model
+        return [model(**row) for row in self.iter_rows()]
+
+    def to_records(self, record: Type[R]) -> List[R]:
+        """내부 레코드 목록으로 변환 (저장된 값이므로 검증 없음, 행 단위 서비스 코드용)"""
+        return [record(**row) for row in self.iter_rows()]
+
+
+# ---------------------------------------------------------------------------
+# 세그먼트 저장소
+# ---------------------------------------------------------------------------
+
+class _Segment:
+    """mmap 으로 열린 세그먼트 하나"""
+
+    def __init__(self, schema: ColumnSchema, path: str, rows: int):
+        self.path = path
+        self.rows = rows
+        columns: Dict[str, Column] = {}
+        validity: Dict[str, Bitmap] = {}
+        for spec in schema.columns:
+            base = os.path.join(path, spec.name)
+            if spec.kind == "str":
+                columns[spec.name] = StringColumn(np.load(base + ".offsets.npy", mmap_mode="r"),
+                                                  np.load(base + ".npy", mmap_mode="r"))
+            else:
+                columns[spec.name] = np.load(base + ".npy", mmap_mode="r")
+            if spec.nullable:
+                validity[spec.name] = Bitmap(np.load(base + ".valid.npy", mmap_mode="r"), 0, rows)
+        self.batch = ColumnBatch(schema, columns, validity, rows)
+        self.keys = columns[schema.key_field]
+        self.years = columns.get("reference_year")
+
+    def key_range(self, key: int) -> Tuple[int, int]:
+        return (int(np.searchsorted(self.keys, key, side="left")),
+                int(np.searchsorted(self.keys, key, side="right")))
+
+
+class CheckupColumnStore:
+    """세그먼트 파일 기반 컬럼형 건강검진 저장소"""
+
+    MANIFEST = "manifest.json"
+
+    def __init__(self, root: str, schema: ColumnSchema):
+        self.root = root
+        self.schema = schema
+        self._lock = threading.Lock()
+        # 병합은 한 번에 하나만 (병합 중에도 stage / commit 은 진행 가능)
+        self._compact_lock = threading.Lock()
+        self._segments: List[_Segment] = []
+        # 다음 세그먼트 번호 (stage 후 commit 전인 세그먼트도 번호를 미리 예약)
+        self._next_number = 1
+        os.makedirs(root, exist_ok=True)
+        self._load_manifest()
+
+    @classmethod
+    def for_raw(cls, root: str) -> "CheckupColumnStore":
+        return cls(root, RAW_SCHEMA)
+
+    @classmethod
+    def for_checkups(cls, root: str) -> "CheckupColumnStore":
+        return cls(root, CHECKUP_SCHEMA)
+
+    def __len__(self) -> int:
+        return sum(s.rows for s in self._segments)
+
+    @property
+    def segment_count(self) -> int:
+        return len(self._segments)
+
+    # 메타데이터 ----------------------------------------------------------------
+    def _load_manifest(self):
+        path = os.path.join(self.root, self.MANIFEST)
+        if not os.path.exists(path):
+            return
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("schema") != self.schema.name:
+            raise ValueError(f"저장소 스키마가 일치하지 않습니다: {manifest.get('schema')} != {self.schema.name}")
+        self._segments = [_Segment(self.schema, os.path.join(self.root, s["name"]), s["rows"])
+                          for s in manifest["segments"]]
+        self._next_number = max((int(s["name"].rsplit("-", 1)[1]) for s in manifest["segments"]), default=0) + 1
+
+    def _write_manifest(self, segments: List[_Segment]):
+        manifest = {
+            "schema": self.schema.name,
+            "columns": [spec._asdict() for spec in self.schema.columns],
+            "segments": [{"name": os.path.basename(s.path), "rows": s.rows} for s in segments],
+        }
+        tmp = os.path.join(self.root, self.MANIFEST + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, os.path.join(self.root, self.MANIFEST))
+
+    # 쓰기 --------------------------------------------------------------------
+    def stage(self, batch: ColumnBatch) -> Optional[_Segment]:
+        """배치를 정렬하여 세그먼트 파일로 기록만 하고 manifest 에는 넣지 않음 (commit 전까지 조회되지 않음)"""
+        if batch.schema is not self.schema:
+            raise ValueError("배치 스키마가 저장소 스키마와 다릅니다.")
+        if len(batch) == 0:
+            return None
+        ordered = batch.take(batch.sort_order())
+        with self._lock:
+            name = f"seg-{self._next_number:06d}"
+            self._next_number += 1
+
+        final = os.path.join(self.root, name)
+        tmp = final + ".tmp"
+        # 예약한 번호는 manifest 에 없으므로 남아 있는 디렉터리는 중단된 이전 기록
+        shutil.rmtree(tmp, ignore_errors=True)
+        shutil.rmtree(final, ignore_errors=True)
+        os.makedirs(tmp)
+        for spec in self.schema.columns:
+            base = os.path.join(tmp, spec.name)
+            column = ordered.columns[spec.name]
+            if spec.kind == "str":
+                offsets, data = column.compact()
+                np.save(base + ".offsets.npy", offsets)
+                np.save(base + ".npy", data)
+            else:
+                np.save(base + ".npy", np.ascontiguousarray(column))
+            if spec.nullable:
+                np.save(base + ".valid.npy", np.packbits(ordered.valid(spec.name)))
+        os.replace(tmp, final)
+        return _Segment(self.schema, final, len(ordered))
+
+    def commit(self, staged: Sequence[Optional[_Segment]]):
+        """stage 한 세그먼트들을 manifest 한 번 교체로 함께 반영"""
+        staged = [segment for segment in staged if segment is not None]
+        if not staged:
+            return
+        with self._lock:
+            segments = self._segments + staged
+            self._write_manifest(segments)
+            self._segments = segments
+
+    def discard(self, staged: Sequence[Optional[_Segment]]):
+        """commit 하지 않은 세그먼트 파일 삭제"""
+        for segment in staged:
+            if segment is not None:
+                shutil.rmtree(segment.path, ignore_errors=True)
+
+    def append(self, batch: ColumnBatch) -> Optional[str]:
+        """배치를 정렬하여 새 세그먼트로 기록. 기록된 세그먼트 이름 반환"""
+        segment = self.stage(batch)
+        if segment is None:
+            return None
+        self.commit([segment])
+        return os.path.basename(segment.path)
+
+    def append_models(self, models: Sequence[BaseModel]) -> Optional[str]:
+        return self.append(ColumnBatch.from_models(self.schema, models))
+
+    # 병합 --------------------------------------------------------------------
+    def small_segment_count(self, small_rows: int) -> int:
+        return sum(1 for segment in self._segments if segment.rows < small_rows)
+
+    def compact(self, small_rows: int, min_segments: int = 2) -> int:
+        """행 수가 small_rows 미만인 세그먼트가 min_segments 개 이상 연속된 구간을 각각 하나로 병합
+
+        같은 (키, 기준 년도) 가 여러 세그먼트에 있으면 가장 최신 세그먼트의 행만 남기고 (history / get 결과 유지),
+        manifest 는 병합이 끝난 뒤 한 번만 교체합니다. 병합 중에 commit 된 세그먼트는 뒤에 그대로 이어집니다.
+        줄어든 세그먼트 수 반환
+        """
+        with self._compact_lock:
+            with self._lock:
+                snapshot = list(self._segments)
+            runs: List[List[int]] = []
+            run: List[int] = []
+            for position, segment in enumerate(snapshot + [None]):
+                if segment is not None and segment.rows < small_rows:
+                    run.append(position)
+                    continue
+                if len(run) >= min_segments:
+                    runs.append(run)
+                run = []
+            if not runs:
+                return 0
+
+            merged: Dict[int, Optional[_Segment]] = {}
+            try:
+                for run in runs:
+                    merged[run[0]] = self.stage(self._merge([snapshot[i] for i in run]))
+            except BaseException:
+                self.discard(list(merged.values()))
+                raise
+            removed = {i for run in runs for i in run}
+            segments = []
+            for position, segment in enumerate(snapshot):
+                if position in merged:
+                    if merged[position] is not None:
+                        segments.append(merged[position])
+                elif position not in removed:
+                    segments.append(segment)
+            with self._lock:
+                segments += self._segments[len(snapshot):]
+                self._write_manifest(segments)
+                self._segments = segments
+            # 이미 열린 mmap 은 파일이 지워져도 유효하므로 진행 중인 조회에는 영향 없음
+            self.discard([snapshot[i] for i in removed])
+        return len(removed) - len(runs)
+
+    def _merge(self, segments: Sequence[_Segment]) -> ColumnBatch:
+        """세그먼트들을 합치고 (키, 기준 년도) 마다 가장 뒤(최신) 세그먼트의 행만 남김"""
+        merged = ColumnBatch.concat(self.schema, [segment.batch for segment in segments])
+        if "reference_year" not in self.schema:
+            return merged
+        sources = np.repeat(np.arange(len(segments)), [segment.rows for segment in segments])
+        # lexsort 는 안정 정렬이므로 같은 (키, 년도) 안에서는 세그먼트 순서 유지
+        order = merged.sort_order()
+        keys = np.asarray(merged.columns[self.schema.key_field])[order]
+        years = np.asarray(merged.columns["reference_year"])[order]
+        sources = sources[order]
+        starts = np.append(True, (keys[1:] != keys[:-1]) | (years[1:] != years[:-1]))
+        ends = np.append(starts[1:], True)
+        newest = sources[ends][np.cumsum(starts) - 1]
+        return merged.take(order[sources == newest])
+
+    # 읽기 --------------------------------------------------------------------
+    def scan(self) -> Iterator[ColumnBatch]:
+        """세그먼트별 전체 배치 순회 (mmap 뷰)"""
+        for segment in self._segments:
+            yield segment.batch
+
+    def history(self, key: int) -> ColumnBatch:
+        """키(회원 일련번호 등)의 전체 이력. 단일 세그먼트에 있으면 복사 없는 슬라이스
+
+        여러 세그먼트에 같은 기준 년도가 있으면 (변경분 동기화로 다시 기록된 경우) 최신 세그먼트의 행만 남깁니다.
+        """
+        parts = []
+        for segment in self._segments:
+            start, stop = segment.key_range(key)
+            if stop > start:
+                parts.append(segment.batch.slice(start, stop))
+        if len(parts) == 1:
+            return parts[0]
+        merged = ColumnBatch.concat(self.schema, parts)
+        if len(parts) > 1 and "reference_year" in self.schema:
+            years = np.asarray(merged.columns["reference_year"])
+            order = np.argsort(years, kind="stable")
+            ordered_years = years[order]
+            # 안정 정렬이므로 같은 년도 안에서는 뒤쪽(최신 세그먼트) 행이 마지막
+            latest = np.append(ordered_years[1:] != ordered_years[:-1], True)
+            merged = merged.take(order[latest])
+        return merged
+
+    def get(self, key: int, reference_year: int) -> ColumnBatch:
+        """(키, 기준 년도) 레코드 조회. 최신 세그먼트 우선"""
+        for segment in reversed(self._segments):
+            start, stop = segment.key_range(key)
+            if stop <= start:
+                continue
+            if segment.years is None:
+                return segment.batch.slice(start, stop)
+            years = segment.years[start:stop]
+            lo = int(np.searchsorted(years, reference_year, side="left"))
+            hi = int(np.searchsorted(years, reference_year, side="right"))
+            if hi > lo:
+                return segment.batch.slice(start + lo, start + hi)
+        return ColumnBatch.empty(self.schema)
+
+
+RAW_SCHEMA = schema_from_model("health_checkup_raw", HealthCheckupRaw, key_field="raw_id")
+CHECKUP_SCHEMA = schema_from_model("health_checkup", HealthCheckup, key_field="member_serial_number")
@@ -0,0 +1,301 @@
+"""
+HealthSync AI 비동기 데이터베이스 계층 (SQLite)
+
+- 읽기 커넥션 풀: asyncio.Queue 로 관리하고 쿼리는 전용 스레드풀에서 실행 (이벤트 루프 비차단)
+- 커넥션마다 sqlite3 문장 캐시(cached_statements)로 준비된 문장 재사용
+- WAL 모드로 읽기와 쓰기를 동시에 허용
+- 쓰기 배치 큐: 짧은 시간 동안 들어온 작은 INSERT 들을 한 트랜잭션으로 묶어 커밋
+"""
+import asyncio
+import logging
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, List, Optional, Sequence, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+Params = Sequence[Any]
+
+SCHEMA: Tuple[str, ...] = (
+    """
+    CREATE TABLE IF NOT EXISTS mission_completion_history (
+        completion_id INTEGER PRIMARY KEY,
+        mission_id INTEGER NOT NULL,
+        member_serial_number INTEGER NOT NULL,
+        completion_date TEXT NOT NULL,
+        daily_target_count INTEGER NOT NULL,
+        daily_completed_count INTEGER NOT NULL,
+        created_at TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS ix_mission_completion_member_date
+        ON mission_completion_history (member_serial_number, completion_date, completion_id)
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS chat_message (
+        message_id INTEGER PRIMARY KEY,
+        session_id TEXT NOT NULL,
+        member_serial_number INTEGER NOT NULL,
+        message_type TEXT NOT NULL,
+        message_content TEXT NOT NULL,
+        response_content TEXT,
+        created_at TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS ix_chat_message_session
+        ON chat_message (session_id, message_id)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS ix_chat_message_member
+        ON chat_message (member_serial_number, message_id)
+    """,
+)
+
+
+def sqlite_path(database_url: str) -> str:
+    """sqlite:///./healthsync_ai.db → ./healthsync_ai.db"""
+    prefix = "sqlite:///"
+    if not database_url.startswith(prefix):
+        raise ValueError(f"지원하지 않는 데이터베이스 URL 입니다: {database_url}")
+    return database_url[len(prefix):] or ":memory:"
+
+
+class _WriteBatcher:
+    """작은 쓰기 요청을 모아 하나의 트랜잭션으로 커밋"""
+
+    def __init__(self, database: "Database", max_batch: int, max_delay: float):
+        self.database = database
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+        self.batches_committed = 0
+        self.statements_committed = 0
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def submit(self, sql: str, params: Params) -> int:
+        # 종료 신호 뒤에 들어온 요청은 처리할 태스크가 없어 영원히 기다리게 되므로 바로 거부
+        if self._closed:
+            raise RuntimeError("데이터베이스 연결이 종료되었습니다.")
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((sql, params, future))
+        return await future
+
+    async def _run(self):
+        while True:
+            item = await self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            deadline = asyncio.get_running_loop().time() + self.max_delay
+            stop = False
+            while len(batch) < self.max_batch:
+                timeout = deadline - asyncio.get_running_loop().time()
+                try:
+                    item = self._queue.get_nowait() if timeout <= 0 else await asyncio.wait_for(self._queue.get(), timeout)
+                except (asyncio.QueueEmpty, asyncio.TimeoutError):
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            await self._commit(batch)
+            if stop:
+                return
+
+    async def _commit(self, batch: List[Tuple[str, Params, asyncio.Future]]):
+        statements = [(sql, params) for sql, params, _ in batch]
+        try:
+            results = await self.database.run_write(_write_batch, statements)
+        except Exception:
+            # 배치 중 하나라도 실패하면 롤백 후 건별로 다시 실행하여 실패한 요청에만 오류 전달
+            for sql, params, future in batch:
+                try:
+                    result = await self.database.run_write(_write_batch, [(sql, params)])
+                    _resolve(future, result[0])
+                except Exception as e:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+        self.batches_committed += 1
+        self.statements_committed += len(batch)
+        for (_, _, future), result in zip(batch, results):
+            _resolve(future, result)
+
+    async def close(self):
+        self._closed = True
+        if self._task is not None:
+            await self._queue.put(None)
+            await self._task
+            self._task = None
+
+
+def _resolve(future: asyncio.Future, result: Any):
+    if not future.done():
+        future.set_result(result)
+
+
+def _write_batch(conn: sqlite3.Connection, statements: List[Tuple[str, Params]]) -> List[int]:
+    """문장들을 한 트랜잭션으로 실행하고 각 문장의 lastrowid 반환 (문장 캐시로 같은 SQL 은 재컴파일 없음)"""
+    results: List[int] = []
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        for sql, params in statements:
+            results.append(conn.execute(sql, params).lastrowid)
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    return results
+
+
+class Database:
+    """SQLite 비동기 접근 객체"""
+
+    def __init__(self, path: str, pool_size: int = 4, statement_cache_size: int = 256,
+                 write_batch_size: int = 500, write_batch_delay: float = 0.005):
+        self.path = path
+        self.pool_size = pool_size
+        self.statement_cache_size = statement_cache_size
+        self.write_batch_size = write_batch_size
+        self.write_batch_delay = write_batch_delay
+        self._readers: Optional[asyncio.Queue] = None
+        self._reader_connections: List[sqlite3.Connection] = []
+        self._writer: Optional[sqlite3.Connection] = None
+        self._read_executor: Optional[ThreadPoolExecutor] = None
+        self._write_executor: Optional[ThreadPoolExecutor] = None
+        self._batcher: Optional[_WriteBatcher] = None
+        # 동시에 들어온 첫 요청들이 connect 를 한 번만 실행하도록 직렬화
+        self._connect_lock = asyncio.Lock()
+
+    @property
+    def is_connected(self) -> bool:
+        return self._writer is not None
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None,
+                               cached_statements=self.statement_cache_size)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA busy_timeout = 5000")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA foreign_keys = ON")
+        return conn
+
+    async def connect(self):
+        """커넥션 풀 생성, WAL 설정, 스키마 적용"""
+        if self.is_connected:
+            return
+        async with self._connect_lock:
+            if not self.is_connected:
+                await self._connect()
+
+    async def _connect(self):
+        loop = asyncio.get_running_loop()
+        write_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-writer")
+        read_executor = ThreadPoolExecutor(max_workers=self.pool_size, thread_name_prefix="db-reader")
+
+        def open_writer() -> sqlite3.Connection:
+            conn = self._open()
+            conn.execute("PRAGMA journal_mode = WAL")
+            for statement in SCHEMA:
+                conn.execute(statement)
+            return conn
+
+        writer = None
+        readers: List[sqlite3.Connection] = []
+        # :memory: 는 커넥션마다 다른 DB 이므로 읽기도 쓰기 커넥션을 사용
+        reader_count = 0 if self.path == ":memory:" else self.pool_size
+        try:
+            writer = await loop.run_in_executor(write_executor, open_writer)
+            for _ in range(reader_count):
+                readers.append(await loop.run_in_executor(read_executor, self._open))
+        except BaseException:
+            for conn in readers + ([writer] if writer is not None else []):
+                conn.close()
+            read_executor.shutdown(wait=False)
+            write_executor.shutdown(wait=False)
+            raise
+
+        self._write_executor = write_executor
+        self._read_executor = read_executor
+        self._reader_connections = readers
+        self._readers = asyncio.Queue()
+        for conn in readers:
+            self._readers.put_nowait(conn)
+        self._batcher = _WriteBatcher(self, self.write_batch_size, self.write_batch_delay)
+        self._batcher.start()
+        # is_connected 는 쓰기 커넥션 기준이므로 나머지 준비가 끝난 뒤 마지막에 설정
+        self._writer = writer
+        logger.info(f"Database connected: {self.path} (readers={reader_count})")
+
+    async def close(self):
+        """대기 중인 쓰기를 커밋하고 모든 커넥션 종료"""
+        if not self.is_connected:
+            return
+        await self._batcher.close()
+        loop = asyncio.get_running_loop()
+        for conn in self._reader_connections:
+            await loop.run_in_executor(self._read_executor, conn.close)
+        await loop.run_in_executor(self._write_executor, self._writer.close)
+        self._read_executor.shutdown(wait=True)
+        self._write_executor.shutdown(wait=True)
+        self._writer = None
+        self._reader_connections = []
+        self._readers = None
+        self._batcher = None
+
+    # 실행 -------------------------------------------------------------------
+    async def run_write(self, fn: Callable[..., T], *args) -> T:
+        """쓰기 커넥션으로 fn(conn, *args) 실행 (전용 단일 스레드)"""
+        if not self.is_connected:
+            raise RuntimeError("데이터베이스가 연결되지 않았습니다.")
+        return await asyncio.get_running_loop().run_in_executor(self._write_executor, fn, self._writer, *args)
+
+    @asynccontextmanager
+    async def _reader(self) -> AsyncIterator[Tuple[sqlite3.Connection, ThreadPoolExecutor]]:
+        if not self.is_connected:
+            raise RuntimeError("데이터베이스가 연결되지 않았습니다.")
+        if not self._reader_connections:
+            yield self._writer, self._write_executor
+            return
+        conn = await self._readers.get()
+        try:
+            yield conn, self._read_executor
+        finally:
+            self._readers.put_nowait(conn)
+
+    async def run_read(self, fn: Callable[..., T], *args) -> T:
+        """풀에서 읽기 커넥션을 빌려 fn(conn, *args) 실행"""
+        async with self._reader() as (conn, executor):
+            return await asyncio.get_running_loop().run_in_executor(executor, fn, conn, *args)
+
+    async def fetch_all(self, sql: str, params: Params = ()) -> List[sqlite3.Row]:
+        return await self.run_read(lambda conn: conn.execute(sql, params).fetchall())
+
+    async def fetch_one(self, sql: str, params: Params = ()) -> Optional[sqlite3.Row]:
+        return await self.run_read(lambda conn: conn.execute(sql, params).fetchone())
+
+    async def execute(self, sql: str, params: Params = ()) -> int:
+        """즉시 단독 트랜잭션으로 실행. lastrowid 반환"""
+        return (await self.run_write(_write_batch, [(sql, params)]))[0]
+
+    async def enqueue_write(self, sql: str, params: Params = ()) -> int:
+        """쓰기 배치 큐에 넣고 커밋될 때까지 대기. lastrowid 반환"""
+        if self._batcher is None:
+            raise RuntimeError("데이터베이스가 연결되지 않았습니다.")
+        return await self._batcher.submit(sql, params)
+
+    @property
+    def write_stats(self) -> dict:
+        batcher = self._batcher
+        return {
+            "batches_committed": batcher.batches_committed if batcher else 0,
+            "statements_committed": batcher.statements_committed if batcher else 0,
+        }
@@ -1,12 +1,38 @@
 """
 HealthSync AI 공통 의존성 관리
+
+데이터베이스, 이벤트 로그, 캐시, 서비스 모듈은 각 의존성이 처음 생성될 때 가져옵니다.
+(앱 import 시점에는 라우트 정의에 필요한 모듈만 로드되어 기동 시간이 짧아짐)
 """
 from fastapi import Depends, HTTPException, status, Query
 from app.config.settings import settings, Settings
+from app.core.pagination import CursorCodec, PageParams
+from typing import TYPE_CHECKING, Optional, Union
 import logging
 
+if TYPE_CHECKING:
+    from app.core.database import Database
+    from app.core.event_bus import EventBus
+    from app.core.event_log import EventLog, GroupCommitWriter
+    from app.core.runtime_sampler import RuntimeSampler
+    from app.core.session_cache import LocalSessionCache, RedisSessionCache
+    from app.services.chat_history_service import ChatHistoryService
+    from app.services.diagnosis_cache_service import DiagnosisCacheService
+    from app.services.mission_history_service import MissionHistoryService
+
 logger = logging.getLogger(__name__)
 
+_database: Optional["Database"] = None
+_event_log: Optional["EventLog"] = None
+_event_writer: Optional["GroupCommitWriter"] = None
+_event_bus: Optional["EventBus"] = None
+_session_cache: Optional[Union["LocalSessionCache", "RedisSessionCache"]] = None
+_chat_history_service: Optional["ChatHistoryService"] = None
+_mission_history_service: Optional["MissionHistoryService"] = None
+_diagnosis_cache: Optional["DiagnosisCacheService"] = None
+_runtime_sampler: Optional["RuntimeSampler"] = None
+_cursor_codec: Optional[CursorCodec] = None
+
 def get_settings() -> Settings:
     """설정 의존성 주입"""
     return settings
@@ -16,3 +42,155 @@ def get_current_user_id(user_id: str = Query(..., description="사용자 ID")) -
     if not user_id or len(user_id.strip()) == 0:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="사용자 ID가 필요합니다.")
     return user_id.strip()
+
+def require_writers():
+    """단일 작성자 엔드포인트 보호 (멀티 프로세스 서버에서는 SERVER_WRITERS_ENABLED=false 로 503)"""
+    if not settings.server_writers_enabled:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                            detail="이 서버에서는 업로드 / 동기화를 처리하지 않습니다. 단일 프로세스 서버로 요청하세요.")
+
+def get_page_params(cursor: Optional[str] = Query(default=None, description="다음 페이지 커서"),
+                    limit: int = Query(default=settings.page_default_limit, ge=1, le=settings.page_max_limit,
+                                       description="페이지 크기")) -> PageParams:
+    """커서 페이지네이션 파라미터 (목록 엔드포인트 공통). 서명이 맞지 않는 커서는 400"""
+    global _cursor_codec
+    if _cursor_codec is None:
+        _cursor_codec = CursorCodec(settings.secret_key)
+    if cursor:
+        try:
+            _cursor_codec.verify(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return PageParams(cursor, limit, _cursor_codec)
+
+async def get_database() -> "Database":
+    """데이터베이스 의존성 주입 (첫 사용 시 연결)"""
+    global _database
+    if _database is None:
+        from app.core.database import Database, sqlite_path
+        _database = Database(
+            sqlite_path(settings.database_url),
+            pool_size=settings.db_pool_size,
+            statement_cache_size=settings.db_statement_cache_size,
+            write_batch_size=settings.db_write_batch_size,
+            write_batch_delay=settings.db_write_batch_delay_ms / 1000
+        )
+    if not _database.is_connected:
+        await _database.connect()
+    return _database
+
+async def close_database():
+    """대기 중인 쓰기를 커밋하고 데이터베이스 연결 종료"""
+    global _database, _chat_history_service, _mission_history_service
+    _chat_history_service = None
+    _mission_history_service = None
+    if _database is not None:
+        await _database.close()
+        _database = None
+
+def get_event_log() -> "EventLog":
+    """이벤트 로그 의존성 주입 (첫 사용 시 열기, 커밋된 이벤트는 이벤트 버스로 발행)"""
+    global _event_log
+    if _event_log is None:
+        from app.core.event_log import EventLog
+        _event_log = EventLog(settings.event_log_dir, segment_max_bytes=settings.event_log_segment_bytes,
+                              fsync=settings.event_log_fsync)
+        _event_log.add_listener(get_event_bus().publish_threadsafe)
+    return _event_log
+
+def get_event_writer() -> "GroupCommitWriter":
+    """그룹 커밋 이벤트 작성기 의존성 주입"""
+    global _event_writer
+    if _event_writer is None:
+        from app.core.event_log import GroupCommitWriter
+        _event_writer = GroupCommitWriter(get_event_log(), max_batch=settings.event_log_batch_size,
+                                          max_delay=settings.event_log_batch_delay_ms / 1000)
+    return _event_writer
+
+async def close_event_log():
+    """남은 이벤트를 커밋하고 이벤트 로그 닫기"""
+    global _event_log, _event_writer
+    if _event_writer is not None:
+        await _event_writer.close()
+        _event_writer = None
+    if _event_log is not None:
+        _event_log.close()
+        _event_log = None
+
+def get_event_bus() -> "EventBus":
+    """이벤트 버스 의존성 주입 (구독자 전달 태스크는 앱 시작 시 start)"""
+    global _event_bus
+    if _event_bus is None:
+        from app.core.event_bus import EventBus
+        from app.core.metrics import metrics_registry
+        _event_bus = EventBus(queue_size=settings.event_bus_queue_size, batch_size=settings.event_bus_batch_size,
+                              max_delay=settings.event_bus_batch_delay_ms / 1000, overflow=settings.event_bus_overflow,
+                              close_timeout=settings.event_bus_close_timeout_seconds)
+        metrics_registry.add_collector(_event_bus.collect_metrics)
+    return _event_bus
+
+async def close_event_bus():
+    """구독자 큐에 남은 이벤트를 전달한 뒤 이벤트 버스 종료"""
+    global _event_bus, _diagnosis_cache
+    if _event_bus is not None:
+        from app.core.metrics import metrics_registry
+        await _event_bus.close()
+        metrics_registry.remove_collector(_event_bus.collect_metrics)
+        _event_bus = None
+    _diagnosis_cache = None
+
+def get_session_cache() -> Union["LocalSessionCache", "RedisSessionCache"]:
+    """세션 캐시 백엔드 의존성 주입 (CHAT_CACHE_BACKEND 에 따라 memory / redis)"""
+    global _session_cache
+    if _session_cache is None:
+        from app.core.session_cache import LocalSessionCache, RedisSessionCache
+        if settings.chat_cache_backend == "redis":
+            _session_cache = RedisSessionCache.from_url(settings.chat_cache_redis_url, settings.chat_cache_ttl_seconds)
+        else:
+            _session_cache = LocalSessionCache(settings.chat_cache_max_bytes, settings.chat_cache_ttl_seconds)
+    return _session_cache
+
+async def get_chat_history_service() -> "ChatHistoryService":
+    """채팅 이력 서비스 의존성 주입"""
+    global _chat_history_service
+    if _chat_history_service is None:
+        from app.core.repositories import ChatMessageRepository
+        from app.services.chat_history_service import ChatHistoryService
+        _chat_history_service = ChatHistoryService(ChatMessageRepository(await get_database()), get_session_cache())
+    return _chat_history_service
+
+async def get_mission_history_service() -> "MissionHistoryService":
+    """미션 완료 이력 서비스 의존성 주입"""
+    global _mission_history_service
+    if _mission_history_service is None:
+        from app.core.repositories import MissionCompletionRepository
+        from app.services.mission_history_service import MissionHistoryService
+        _mission_history_service = MissionHistoryService(MissionCompletionRepository(await get_database()))
+    return _mission_history_service
+
+def get_diagnosis_cache() -> "DiagnosisCacheService":
+    """건강 진단 캐시 의존성 주입 (HEALTH_DATA_SYNCED 이벤트 버스 구독으로 회원별 무효화)"""
+    global _diagnosis_cache
+    if _diagnosis_cache is None:
+        from app.core.event_bus import member_key
+        from app.models.common import EventType
+        from app.services.diagnosis_cache_service import DiagnosisCacheService
+        _diagnosis_cache = DiagnosisCacheService()
+        get_event_bus().subscribe("diagnosis_cache", _diagnosis_cache.on_events,
+                                  event_types={EventType.HEALTH_DATA_SYNCED}, coalesce_key=member_key)
+    return _diagnosis_cache
+
+def get_runtime_sampler() -> "RuntimeSampler":
+    """런타임 샘플러 의존성 주입"""
+    global _runtime_sampler
+    if _runtime_sampler is None:
+        from app.core.runtime_sampler import RuntimeSampler
+        _runtime_sampler = RuntimeSampler(settings.runtime_sample_interval_ms / 1000, settings.runtime_history_size)
+    return _runtime_sampler
+
+async def close_runtime_sampler():
+    """런타임 샘플링 태스크 종료"""
+    global _runtime_sampler
+    if _runtime_sampler is not None:
+        await _runtime_sampler.stop()
+        _runtime_sampler = None
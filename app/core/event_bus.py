@@ -0,0 +1,285 @@
+"""
+HealthSync AI 프로세스 내 이벤트 버스
+
+커밋된 EventType 이벤트를 구독자별 비동기 작업으로 전달합니다.
+발행은 구독자 큐에 넣기만 하므로 요청 지연이 후속 작업(재점수 계산, 캐시 무효화, 축하 메시지 등)과 무관합니다.
+- 구독자마다 크기 제한 큐와 전달 태스크 하나
+- 마이크로 배치: 첫 이벤트 후 max_delay 동안 모아 최대 batch_size 개를 목록 하나로 전달
+- 키별 병합(coalesce_key): 전달 대기 중인 같은 키의 이벤트는 마지막 것 하나만 남김
+  (한 회원의 MISSION_COMPLETED 10건 → 재계산 1번. 큐 위치와 대기 시작 시각은 첫 이벤트 기준)
+- 큐가 가득 찼을 때: block(발행자 대기) / drop_oldest(가장 오래된 이벤트 폐기) / drop_newest(새 이벤트 폐기)
+- 구독자별 큐 깊이, 지연(발행 → 전달 시작), 병합 / 폐기 / 오류 수 메트릭
+이벤트 로그의 커밋 리스너(쓰기 스레드)에서는 publish_threadsafe 로 발행합니다.
+"""
+import asyncio
+import concurrent.futures
+import inspect
+import itertools
+import logging
+import time
+from collections import OrderedDict
+from enum import Enum
+from typing import Any, Awaitable, Callable, Collection, Dict, Hashable, Iterable, List, Optional, Set, Tuple, Union
+
+from app.core.metrics import MetricFamily
+from app.models.common import EventType
+from app.models.records import EventRecord
+
+logger = logging.getLogger(__name__)
+
+# 이벤트 묶음을 받는 구독 함수 (동기 함수는 이벤트 루프에서 바로 실행되므로 짧아야 함)
+EventHandler = Callable[[List[EventRecord]], Union[None, Awaitable[None]]]
+# 병합 키 함수 (None 을 반환한 이벤트는 병합하지 않음)
+CoalesceKey = Callable[[EventRecord], Optional[Hashable]]
+
+
+class OverflowPolicy(str, Enum):
+    """구독자 큐가 가득 찼을 때 처리"""
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+
+
+def member_key(event: EventRecord) -> Optional[Hashable]:
+    """(이벤트 타입, 회원) 단위 병합 키"""
+    if event.member_serial_number is None:
+        return None
+    return event.event_type, event.member_serial_number
+
+
+class Subscription:
+    """구독자 하나의 큐와 전달 태스크"""
+
+    def __init__(self, name: str, handler: EventHandler, event_types: Optional[Collection[EventType]],
+                 queue_size: int, batch_size: int, max_delay: float, overflow: OverflowPolicy,
+                 coalesce_key: Optional[CoalesceKey]):
+        if queue_size < 1 or batch_size < 1:
+            raise ValueError("큐 크기와 배치 크기는 1 이상이어야 합니다.")
+        self.name = name
+        self.handler = handler
+        self.event_types = frozenset(event_types) if event_types else None
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.max_delay = max_delay
+        self.overflow = OverflowPolicy(overflow)
+        self.coalesce_key = coalesce_key
+        # 키 → (이벤트, 대기 시작 시각). 병합하지 않는 이벤트는 일련번호 키
+        self._pending: "OrderedDict[Hashable, Tuple[EventRecord, float]]" = OrderedDict()
+        self._sequence = itertools.count()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._not_full: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._closing = False
+        self.counters = {"published": 0, "delivered": 0, "batches": 0, "coalesced": 0, "dropped": 0, "errors": 0}
+        self.last_lag_seconds = 0.0
+        self.max_lag_seconds = 0.0
+
+    def accepts(self, event: EventRecord) -> bool:
+        return self.event_types is None or event.event_type in self.event_types
+
+    @property
+    def depth(self) -> int:
+        return len(self._pending)
+
+    def start(self):
+        if self._task is None:
+            self._closing = False
+            self._wakeup = asyncio.Event()
+            self._not_full = asyncio.Event()
+            self._not_full.set()
+            self._task = asyncio.create_task(self._run(), name=f"event-bus:{self.name}")
+
+    async def put(self, event: EventRecord):
+        if self._task is None:
+            self.start()
+        key = self.coalesce_key(event) if self.coalesce_key is not None else None
+        if key is not None:
+            entry = self._pending.get(key)
+            if entry is not None:
+                # 같은 키가 대기 중이면 큐 위치와 대기 시작 시각은 그대로 두고 이벤트만 최신으로 교체
+                self._pending[key] = (event, entry[1])
+                self.counters["published"] += 1
+                self.counters["coalesced"] += 1
+                return
+        else:
+            key = next(self._sequence)
+        while len(self._pending) >= self.queue_size:
+            if self.overflow is OverflowPolicy.DROP_NEWEST:
+                self.counters["dropped"] += 1
+                return
+            if self.overflow is OverflowPolicy.DROP_OLDEST:
+                self._pending.popitem(last=False)
+                self.counters["dropped"] += 1
+                break
+            self._not_full.clear()
+            await self._not_full.wait()
+        self._pending[key] = (event, time.monotonic())
+        self.counters["published"] += 1
+        if len(self._pending) == 1 or len(self._pending) >= self.batch_size:
+            self._wakeup.set()
+
+    def _take(self) -> Tuple[List[EventRecord], float]:
+        """큐 앞에서 최대 batch_size 개 (가장 오래 기다린 이벤트의 대기 시작 시각과 함께)"""
+        events = []
+        oldest = time.monotonic()
+        for _ in range(min(self.batch_size, len(self._pending))):
+            _, (event, enqueued) = self._pending.popitem(last=False)
+            events.append(event)
+            oldest = min(oldest, enqueued)
+        self._not_full.set()
+        return events, oldest
+
+    async def _run(self):
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            if len(self._pending) < self.batch_size and not self._closing and self.max_delay > 0:
+                # 짧게 기다려 뒤따르는 이벤트까지 한 배치로 묶고 같은 키는 병합
+                await asyncio.sleep(self.max_delay)
+            while self._pending:
+                events, oldest = self._take()
+                lag = time.monotonic() - oldest
+                self.last_lag_seconds = lag
+                self.max_lag_seconds = max(self.max_lag_seconds, lag)
+                try:
+                    result = self.handler(events)
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception:
+                    # 구독자 오류가 전달 태스크를 멈추지 않도록 기록만 함
+                    self.counters["errors"] += 1
+                    logger.exception(f"이벤트 구독자 '{self.name}' 처리 중 오류가 발생했습니다.")
+                self.counters["batches"] += 1
+                self.counters["delivered"] += len(events)
+            if self._closing:
+                return
+
+    async def close(self, timeout: float):
+        """남은 이벤트를 전달한 뒤 종료 (timeout 을 넘기면 취소)"""
+        if self._task is None:
+            return
+        self._closing = True
+        self._wakeup.set()
+        try:
+            await asyncio.wait_for(self._task, timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"이벤트 구독자 '{self.name}' 종료 시간 초과, 남은 이벤트 {self.depth}건을 버립니다.")
+        self._task = None
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return dict(self.counters, depth=self.depth, queue_size=self.queue_size, overflow=self.overflow.value,
+                    last_lag_ms=round(self.last_lag_seconds * 1000, 3),
+                    max_lag_ms=round(self.max_lag_seconds * 1000, 3))
+
+
+class EventBus:
+    """프로세스 내 pub/sub 버스 (구독자별 큐 + 마이크로 배치 + 키별 병합)"""
+
+    def __init__(self, queue_size: int = 10000, batch_size: int = 256, max_delay: float = 0.01,
+                 overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST, close_timeout: float = 5.0):
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.max_delay = max_delay
+        self.overflow = OverflowPolicy(overflow)
+        self.close_timeout = close_timeout
+        self._subscriptions: Dict[str, Subscription] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # 다른 스레드에서 예약했지만 아직 큐에 넣지 않은 발행 (종료 시 먼저 기다림)
+        self._inflight: Set[concurrent.futures.Future] = set()
+        self.threadsafe_dropped = 0
+
+    def subscribe(self, name: str, handler: EventHandler, event_types: Optional[Collection[EventType]] = None,
+                  queue_size: Optional[int] = None, batch_size: Optional[int] = None,
+                  max_delay: Optional[float] = None, overflow: Optional[OverflowPolicy] = None,
+                  coalesce_key: Optional[CoalesceKey] = None) -> Subscription:
+        """구독 등록 (생략한 설정은 버스 기본값. 전달 태스크는 시작 시 또는 첫 이벤트 때 시작)"""
+        if name in self._subscriptions:
+            raise ValueError(f"이미 등록된 구독자입니다: {name}")
+        subscription = Subscription(
+            name, handler, event_types,
+            queue_size=queue_size or self.queue_size,
+            batch_size=batch_size or self.batch_size,
+            max_delay=self.max_delay if max_delay is None else max_delay,
+            overflow=overflow or self.overflow,
+            coalesce_key=coalesce_key,
+        )
+        self._subscriptions[name] = subscription
+        return subscription
+
+    async def unsubscribe(self, name: str):
+        subscription = self._subscriptions.pop(name, None)
+        if subscription is not None:
+            await subscription.close(self.close_timeout)
+
+    def start(self):
+        """현재 이벤트 루프에서 구독자 전달 태스크 시작"""
+        self._loop = asyncio.get_running_loop()
+        for subscription in self._subscriptions.values():
+            subscription.start()
+
+    @property
+    def running(self) -> bool:
+        return self._loop is not None
+
+    async def publish(self, events: Iterable[EventRecord]):
+        """이벤트를 받는 구독자 큐에 넣기 (block 정책 구독자의 큐가 가득 차면 자리가 날 때까지 대기)"""
+        if self._loop is None:
+            self.start()
+        for event in events:
+            for subscription in list(self._subscriptions.values()):
+                if subscription.accepts(event):
+                    await subscription.put(event)
+
+    def publish_threadsafe(self, events: List[EventRecord]):
+        """다른 스레드(이벤트 로그 쓰기 스레드 등)에서 발행. 기다리지 않으며 발행 순서는 유지됨"""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            self.threadsafe_dropped += len(events)
+            return
+        try:
+            future = asyncio.run_coroutine_threadsafe(self.publish(events), loop)
+        except RuntimeError:
+            self.threadsafe_dropped += len(events)
+            return
+        self._inflight.add(future)
+        future.add_done_callback(self._inflight.discard)
+
+    async def close(self):
+        """모든 구독자의 남은 이벤트를 전달한 뒤 종료"""
+        if self._inflight:
+            await asyncio.gather(*(asyncio.wrap_future(f) for f in list(self._inflight)), return_exceptions=True)
+        await asyncio.gather(*(s.close(self.close_timeout) for s in self._subscriptions.values()))
+        self._loop = None
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "threadsafe_dropped": self.threadsafe_dropped,
+            "subscribers": {name: s.stats for name, s in self._subscriptions.items()},
+        }
+
+    def collect_metrics(self) -> List[MetricFamily]:
+        """메트릭 저장소 수집기: 구독자별 큐 깊이 / 지연 / 카운터"""
+        subscriptions = list(self._subscriptions.values())
+
+        def per_subscriber(value: Callable[[Subscription], float]) -> List[Tuple[Dict[str, str], float]]:
+            return [({"subscriber": s.name}, value(s)) for s in subscriptions]
+
+        families = [
+            ("event_bus_queue_depth", "gauge", "구독자 큐에서 전달을 기다리는 이벤트 수",
+             per_subscriber(lambda s: s.depth)),
+            ("event_bus_lag_seconds", "gauge", "마지막 배치의 발행 → 전달 시작 지연(초)",
+             per_subscriber(lambda s: s.last_lag_seconds)),
+            ("event_bus_max_lag_seconds", "gauge", "발행 → 전달 시작 최대 지연(초)",
+             per_subscriber(lambda s: s.max_lag_seconds)),
+        ]
+        for counter, description in (("published", "구독자 큐에 들어온 이벤트 수"),
+                                     ("delivered", "구독자에게 전달한 이벤트 수"),
+                                     ("coalesced", "같은 키로 병합된 이벤트 수"),
+                                     ("dropped", "큐가 가득 차 버린 이벤트 수"),
+                                     ("errors", "구독자 처리 오류 수")):
+            families.append((f"event_bus_{counter}_total", "counter", description,
+                             per_subscriber(lambda s, c=counter: s.counters[c])))
+        return families
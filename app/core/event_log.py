@@ -0,0 +1,417 @@
+"""
+HealthSync AI 이벤트 로그 (EventStore 저장 엔진)
+
+- 추가 전용(append-only) 세그먼트 파일에 기록하고 일정 크기마다 새 세그먼트로 교체
+- 그룹 커밋: 여러 이벤트를 한 번의 write + fsync 로 기록 (GroupCommitWriter)
+- aggregate_id → (세그먼트, 오프셋) 메모리 인덱스
+- 세그먼트별 이벤트 타입 / 생성 시각 범위를 보관하여 재생 시 필요한 세그먼트만 mmap 으로 읽기
+- 기록 / 재생되는 이벤트는 내부 레코드(EventRecord). EventStore 모델도 그대로 기록할 수 있음
+
+레코드 형식 (little-endian):
+    [payload 길이 u32][crc32 u32][payload]
+    payload = [event_id i64][타입 코드 u8][created_at µs i64][회원 번호 i64 (-1 = 없음)]
+              [aggregate_id 길이 u16][service_name 길이 u16][aggregate_id][service_name][event_data]
+"""
+import asyncio
+import logging
+import mmap
+import os
+import re
+import struct
+import threading
+import zlib
+from array import array
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from app.models.common import EventStore, EventType
+from app.models.records import EventRecord
+
+logger = logging.getLogger(__name__)
+
+# 커밋된 이벤트 묶음을 받는 리스너 (쓰기 스레드에서 호출되므로 짧고 스레드 안전해야 함)
+EventListener = Callable[[List[EventRecord]], None]
+
+_FRAME = struct.Struct("<II")
+_HEADER = struct.Struct("<qBqqHH")
+_SEGMENT_NAME = re.compile(r"^events-(\d{8})\.log$")
+_EPOCH = datetime(1970, 1, 1)
+_NO_MEMBER = -1
+
+# 타입 코드는 EventType 선언 순서 (새 타입은 끝에 추가)
+_TYPE_CODES: Dict[EventType, int] = {event_type: code for code, event_type in enumerate(EventType)}
+_CODE_TYPES: Tuple[EventType, ...] = tuple(EventType)
+
+# 인덱스 항목: (세그먼트 번호 << 40) | 오프셋
+_OFFSET_BITS = 40
+_OFFSET_MASK = (1 << _OFFSET_BITS) - 1
+
+
+def _to_micros(value: datetime) -> int:
+    delta = value - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def _encode(event: EventRecord) -> bytes:
+    aggregate = event.aggregate_id.encode("utf-8")
+    service = event.service_name.encode("utf-8")
+    member = _NO_MEMBER if event.member_serial_number is None else event.member_serial_number
+    payload = b"".join((
+        _HEADER.pack(event.event_id, _TYPE_CODES[event.event_type], _to_micros(event.created_at),
+                     member, len(aggregate), len(service)),
+        aggregate, service, event.event_data.encode("utf-8"),
+    ))
+    return _FRAME.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+class _SegmentInfo:
+    """세그먼트 메타데이터 (재생 시 건너뛰기 판단용)"""
+
+    __slots__ = ("number", "path", "size", "type_mask", "min_time", "max_time", "first_id", "last_id", "_map", "_map_size")
+
+    def __init__(self, number: int, path: str):
+        self.number = number
+        self.path = path
+        self.size = 0
+        self.type_mask = 0
+        self.min_time: Optional[int] = None
+        self.max_time: Optional[int] = None
+        self.first_id: Optional[int] = None
+        self.last_id: Optional[int] = None
+        self._map: Optional[mmap.mmap] = None
+        self._map_size = 0
+
+    def observe(self, event_id: int, type_code: int, created_us: int):
+        self.type_mask |= 1 << type_code
+        self.min_time = created_us if self.min_time is None else min(self.min_time, created_us)
+        self.max_time = created_us if self.max_time is None else max(self.max_time, created_us)
+        self.first_id = event_id if self.first_id is None else self.first_id
+        self.last_id = event_id
+
+    def view(self) -> Optional[mmap.mmap]:
+        """현재 크기까지의 읽기 전용 mmap (세그먼트가 커지면 다시 매핑)"""
+        if self.size == 0:
+            return None
+        if self._map is None or self._map_size != self.size:
+            # 이전 매핑은 닫지 않고 교체 (읽는 중인 쪽이 참조를 놓으면 해제됨)
+            with open(self.path, "rb") as f:
+                self._map = mmap.mmap(f.fileno(), self.size, access=mmap.ACCESS_READ)
+            self._map_size = self.size
+        return self._map
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+
+class EventLog:
+    """세그먼트 기반 추가 전용 이벤트 로그"""
+
+    def __init__(self, directory: str, segment_max_bytes: int = 64 * 1024 * 1024, fsync: bool = True):
+        self.directory = directory
+        self.segment_max_bytes = segment_max_bytes
+        self.fsync = fsync
+        self._lock = threading.RLock()
+        self._segments: List[_SegmentInfo] = []
+        self._index: Dict[str, array] = {}
+        self._next_id = 1
+        self._file = None
+        self._listeners: List[EventListener] = []
+        os.makedirs(directory, exist_ok=True)
+        self._recover()
+
+    # 복구 / 인덱스 ---------------------------------------------------------------
+    def _recover(self):
+        """기존 세그먼트를 순서대로 스캔하여 인덱스 재구성. 마지막 세그먼트의 잘린 꼬리는 제거"""
+        numbers = sorted(int(m.group(1)) for m in map(_SEGMENT_NAME.match, os.listdir(self.directory)) if m)
+        for position, number in enumerate(numbers):
+            segment = _SegmentInfo(number, self._segment_path(number))
+            segment.size = os.path.getsize(segment.path)
+            valid_end = self._index_segment(segment)
+            if valid_end < segment.size:
+                if position != len(numbers) - 1:
+                    raise ValueError(f"이벤트 로그 세그먼트가 손상되었습니다: {segment.path}")
+                segment.close()
+                with open(segment.path, "r+b") as f:
+                    f.truncate(valid_end)
+                segment.size = valid_end
+            self._segments.append(segment)
+        if not self._segments:
+            self._segments.append(_SegmentInfo(1, self._segment_path(1)))
+        self._file = open(self._segments[-1].path, "ab")
+
+    def _index_segment(self, segment: _SegmentInfo) -> int:
+        """세그먼트 레코드를 인덱스에 반영하고 마지막 정상 레코드의 끝 위치 반환"""
+        valid_end = 0
+        for offset, event_id, type_code, created_us, aggregate_id, payload in self._iter_frames(segment):
+            self._add_to_index(segment, offset, event_id, type_code, created_us, aggregate_id)
+            valid_end = offset + _FRAME.size + len(payload)
+        return valid_end
+
+    def _add_to_index(self, segment: _SegmentInfo, offset: int, event_id: int, type_code: int,
+                      created_us: int, aggregate_id: str):
+        entries = self._index.get(aggregate_id)
+        if entries is None:
+            entries = self._index[aggregate_id] = array("Q")
+        entries.append((segment.number << _OFFSET_BITS) | offset)
+        segment.observe(event_id, type_code, created_us)
+        self._next_id = max(self._next_id, event_id + 1)
+
+    def _iter_frames(self, segment: _SegmentInfo) -> Iterator[Tuple[int, int, int, int, str, bytes]]:
+        """(오프셋, event_id, 타입 코드, 생성 µs, aggregate_id, payload) 순회. CRC 가 맞지 않는 지점에서 멈춤"""
+        with self._lock:
+            view, size = segment.view(), segment.size
+        if view is None:
+            return
+        offset = 0
+        while offset + _FRAME.size <= size:
+            length, checksum = _FRAME.unpack_from(view, offset)
+            start = offset + _FRAME.size
+            if start + length > size:
+                break
+            payload = view[start:start + length]
+            if zlib.crc32(payload) != checksum:
+                break
+            event_id, type_code, created_us, _, aggregate_len, _ = _HEADER.unpack_from(payload, 0)
+            aggregate_id = payload[_HEADER.size:_HEADER.size + aggregate_len].decode("utf-8")
+            yield offset, event_id, type_code, created_us, aggregate_id, payload
+            offset = start + length
+
+    def _segment_path(self, number: int) -> str:
+        return os.path.join(self.directory, f"events-{number:08d}.log")
+
+    # 쓰기 --------------------------------------------------------------------
+    def append_batch(self, events: Sequence[Union[EventStore, EventRecord]]) -> List[EventRecord]:
+        """이벤트 묶음을 한 번의 write/fsync 로 기록. event_id 는 로그가 발급한 값으로 교체됨
+
+        event_id / 오프셋은 지역 변수로 먼저 정하고, 기록이 성공한 뒤에만 _next_id / 세그먼트 크기 / 인덱스에 반영
+        (실패하면 파일을 기록 전 크기로 되돌리므로 번호나 오프셋이 어긋나지 않음)
+        """
+        if not events:
+            return []
+        committed: List[EventRecord] = []
+        try:
+            with self._lock:
+                frames: List[bytes] = []
+                pending: List[Tuple[int, EventRecord]] = []
+                segment = self._segments[-1]
+                offset = segment.size
+                next_id = self._next_id
+                for event in events:
+                    if isinstance(event, EventStore):
+                        event = EventRecord.from_model(event)
+                    event = event.replace(event_id=next_id)
+                    next_id += 1
+                    frame = _encode(event)
+                    if offset > 0 and offset + len(frame) > self.segment_max_bytes:
+                        self._write(segment, frames, pending)
+                        committed.extend(e for _, e in pending)
+                        segment = self._rotate()
+                        frames, pending, offset = [], [], 0
+                    frames.append(frame)
+                    pending.append((offset, event))
+                    offset += len(frame)
+                self._write(segment, frames, pending)
+                committed.extend(e for _, e in pending)
+        finally:
+            # 세그먼트 교체 전에 커밋된 앞부분은 뒷부분이 실패해도 리스너에 전달
+            if committed:
+                self._notify(committed)
+        return committed
+
+    def append(self, event: Union[EventStore, EventRecord]) -> EventRecord:
+        return self.append_batch([event])[0]
+
+    def add_listener(self, listener: EventListener):
+        """커밋 후 호출될 리스너 등록 (캐시 무효화 등)"""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: EventListener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify(self, events: List[EventRecord]):
+        for listener in list(self._listeners):
+            try:
+                listener(events)
+            except Exception:
+                # 리스너 오류가 이미 커밋된 쓰기를 실패로 만들지 않도록 기록만 함
+                logger.exception("이벤트 리스너 처리 중 오류가 발생했습니다.")
+
+    def _write(self, segment: _SegmentInfo, frames: List[bytes], pending: List[Tuple[int, EventRecord]]):
+        if not frames:
+            return
+        try:
+            self._file.write(b"".join(frames))
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+        except BaseException:
+            self._rollback(segment)
+            raise
+        segment.size += sum(len(f) for f in frames)
+        for offset, event in pending:
+            self._add_to_index(segment, offset, event.event_id, _TYPE_CODES[event.event_type],
+                               _to_micros(event.created_at), event.aggregate_id)
+
+    def _rollback(self, segment: _SegmentInfo):
+        """실패한 기록의 일부가 파일에 남았으면 마지막 커밋 위치로 잘라냄"""
+        try:
+            self._file.close()
+        except OSError:
+            # 버퍼에 남은 바이트를 비우다 실패해도 아래에서 잘라냄
+            pass
+        with open(segment.path, "r+b") as f:
+            f.truncate(segment.size)
+        self._file = open(segment.path, "ab")
+
+    def _rotate(self) -> _SegmentInfo:
+        self._file.close()
+        segment = _SegmentInfo(self._segments[-1].number + 1, self._segment_path(self._segments[-1].number + 1))
+        self._segments.append(segment)
+        self._file = open(segment.path, "ab")
+        return segment
+
+    # 읽기 --------------------------------------------------------------------
+    @staticmethod
+    def _decode(payload: bytes) -> EventRecord:
+        event_id, type_code, created_us, member, aggregate_len, service_len = _HEADER.unpack_from(payload, 0)
+        position = _HEADER.size
+        aggregate_id = payload[position:position + aggregate_len].decode("utf-8")
+        position += aggregate_len
+        service_name = payload[position:position + service_len].decode("utf-8")
+        position += service_len
+        return EventRecord(
+            event_id,
+            aggregate_id,
+            _CODE_TYPES[type_code],
+            payload[position:].decode("utf-8"),
+            None if member == _NO_MEMBER else member,
+            service_name,
+            _EPOCH + timedelta(microseconds=created_us),
+        )
+
+    def _read_at(self, segment: _SegmentInfo, offset: int) -> EventRecord:
+        with self._lock:
+            view = segment.view()
+        length, _ = _FRAME.unpack_from(view, offset)
+        start = offset + _FRAME.size
+        return self._decode(view[start:start + length])
+
+    def replay_aggregate(self, aggregate_id: str) -> Iterator[EventRecord]:
+        """집계 하나의 이벤트를 기록 순서대로 재생 (인덱스가 가리키는 위치만 읽음)"""
+        with self._lock:
+            entries = list(self._index.get(aggregate_id, ()))
+            segments = {s.number: s for s in self._segments}
+        for entry in entries:
+            yield self._read_at(segments[entry >> _OFFSET_BITS], entry & _OFFSET_MASK)
+
+    def replay(self, event_type: Optional[EventType] = None, since: Optional[datetime] = None,
+               until: Optional[datetime] = None) -> Iterator[EventRecord]:
+        """이벤트 타입 / 생성 시각 범위 재생. 해당 타입이 없거나 시간 범위가 겹치지 않는 세그먼트는 읽지 않음"""
+        type_code = None if event_type is None else _TYPE_CODES[event_type]
+        since_us = None if since is None else _to_micros(since)
+        until_us = None if until is None else _to_micros(until)
+        with self._lock:
+            segments = list(self._segments)
+        for segment in segments:
+            if segment.size == 0:
+                continue
+            if type_code is not None and not segment.type_mask & (1 << type_code):
+                continue
+            if since_us is not None and segment.max_time < since_us:
+                continue
+            if until_us is not None and segment.min_time > until_us:
+                continue
+            for _, _, code, created_us, _, payload in self._iter_frames(segment):
+                if type_code is not None and code != type_code:
+                    continue
+                if (since_us is not None and created_us < since_us) or (until_us is not None and created_us > until_us):
+                    continue
+                yield self._decode(payload)
+
+    # 상태 --------------------------------------------------------------------
+    @property
+    def segment_count(self) -> int:
+        return len(self._segments)
+
+    def aggregate_count(self) -> int:
+        return len(self._index)
+
+    def event_count(self, aggregate_id: Optional[str] = None) -> int:
+        if aggregate_id is not None:
+            return len(self._index.get(aggregate_id, ()))
+        return sum(len(entries) for entries in self._index.values())
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            for segment in self._segments:
+                segment.close()
+
+
+class GroupCommitWriter:
+    """동시에 들어온 append 요청을 모아 한 번에 커밋하는 비동기 작성기"""
+
+    def __init__(self, log: EventLog, max_batch: int = 512, max_delay: float = 0.005):
+        self.log = log
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._pending: List[Tuple[Union[EventStore, EventRecord], asyncio.Future]] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._closing = False
+        self.batches_committed = 0
+        self.events_committed = 0
+
+    async def start(self):
+        if self._task is None:
+            self._closing = False
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    async def append(self, event: Union[EventStore, EventRecord]) -> EventRecord:
+        """이벤트 기록 요청. 그룹 커밋이 끝나면 발급된 event_id 가 담긴 이벤트 반환"""
+        if self._task is None:
+            await self.start()
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((event, future))
+        if len(self._pending) >= self.max_batch or len(self._pending) == 1:
+            self._wakeup.set()
+        return await future
+
+    async def _run(self):
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            if len(self._pending) < self.max_batch and not self._closing:
+                # 짧게 기다려 뒤따르는 요청까지 한 배치로 묶음
+                await asyncio.sleep(self.max_delay)
+            while self._pending:
+                batch, self._pending = self._pending[:self.max_batch], self._pending[self.max_batch:]
+                try:
+                    stored = await asyncio.to_thread(self.log.append_batch, [event for event, _ in batch])
+                except Exception as e:
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_exception(e)
+                    continue
+                self.batches_committed += 1
+                self.events_committed += len(stored)
+                for (_, future), event in zip(batch, stored):
+                    if not future.done():
+                        future.set_result(event)
+            if self._closing:
+                return
+
+    async def close(self):
+        """남은 요청을 모두 커밋한 뒤 종료"""
+        if self._task is None:
+            return
+        self._closing = True
+        self._wakeup.set()
+        await self._task
+        self._task = None
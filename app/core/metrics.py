@@ -0,0 +1,188 @@
+"""
+HealthSync AI 요청 메트릭
+
+BaseHTTPMiddleware 를 거치지 않는 순수 ASGI 미들웨어로 요청마다
+- 라우트(경로 템플릿)별 지연 시간 히스토그램
+- (메서드, 라우트, 상태 코드)별 요청 수
+- 처리 중인 요청 수 게이지
+를 기록하고 Prometheus 텍스트 형식으로 내보냅니다.
+모든 갱신은 이벤트 루프 스레드에서만 일어나므로 잠금 없이 워커(프로세스)별로 누적합니다.
+요청 로그는 매 요청이 아니라 설정한 비율로만 표본 기록합니다 (5xx 는 항상 기록).
+"""
+import bisect
+import logging
+import random
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger("HealthSync_AI.access")
+
+# 초 단위 히스토그램 상한 (Prometheus 기본값)
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0,
+)
+# 라우트에 매칭되지 않은 요청 (임의 경로로 라벨 수가 늘어나지 않도록 하나로 묶음)
+UNMATCHED_ROUTE = "<unmatched>"
+
+_METRIC_PREFIX = "healthsync"
+
+# 추가 메트릭 수집기: 렌더링 때 호출되어 (이름, 타입, 설명, [(레이블, 값)]) 목록 반환 (이름에 접두사 자동 추가)
+MetricFamily = Tuple[str, str, str, Sequence[Tuple[Dict[str, str], float]]]
+Collector = Callable[[], Iterable[MetricFamily]]
+
+
+class LatencyHistogram:
+    """고정 버킷 히스토그램 (버킷별 개수, 누적은 출력 시 계산)"""
+
+    __slots__ = ("bounds", "counts", "total", "count")
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, seconds: float):
+        self.counts[bisect.bisect_left(self.bounds, seconds)] += 1
+        self.total += seconds
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        result, running = [], 0
+        for bound, count in zip(self.bounds, self.counts):
+            running += count
+            result.append((repr(bound), running))
+        result.append(("+Inf", self.count))
+        return result
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(**labels: str) -> str:
+    return ",".join(f'{name}="{_escape(str(value))}"' for name, value in labels.items())
+
+
+class MetricsRegistry:
+    """워커 하나의 요청 메트릭 저장소"""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.requests: Dict[Tuple[str, str, int], int] = {}
+        self.latency: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self.in_flight = 0
+        self.started_at = time.time()
+        self.collectors: List[Collector] = []
+
+    def add_collector(self, collector: Collector):
+        """렌더링 때 함께 내보낼 수집기 등록 (이벤트 버스 큐 깊이 등)"""
+        self.collectors.append(collector)
+
+    def remove_collector(self, collector: Collector):
+        if collector in self.collectors:
+            self.collectors.remove(collector)
+
+    def observe(self, method: str, route: str, status_code: int, seconds: float):
+        key = (method, route, status_code)
+        self.requests[key] = self.requests.get(key, 0) + 1
+        histogram = self.latency.get((method, route))
+        if histogram is None:
+            histogram = self.latency[(method, route)] = LatencyHistogram(self.buckets)
+        histogram.observe(seconds)
+
+    def reset(self):
+        self.requests.clear()
+        self.latency.clear()
+        self.in_flight = 0
+
+    def render(self) -> str:
+        """Prometheus 텍스트 노출 형식 (version 0.0.4)"""
+        lines = [
+            f"# HELP {_METRIC_PREFIX}_http_requests_total 처리한 HTTP 요청 수",
+            f"# TYPE {_METRIC_PREFIX}_http_requests_total counter",
+        ]
+        for (method, route, status_code), count in sorted(self.requests.items()):
+            lines.append(f"{_METRIC_PREFIX}_http_requests_total"
+                         f"{{{_labels(method=method, route=route, status=status_code)}}} {count}")
+
+        name = f"{_METRIC_PREFIX}_http_request_duration_seconds"
+        lines += [f"# HELP {name} HTTP 요청 처리 시간(초)", f"# TYPE {name} histogram"]
+        for (method, route), histogram in sorted(self.latency.items()):
+            labels = _labels(method=method, route=route)
+            for bound, count in histogram.cumulative():
+                lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f"{name}_sum{{{labels}}} {histogram.total!r}")
+            lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+
+        lines += [
+            f"# HELP {_METRIC_PREFIX}_http_requests_in_flight 처리 중인 HTTP 요청 수",
+            f"# TYPE {_METRIC_PREFIX}_http_requests_in_flight gauge",
+            f"{_METRIC_PREFIX}_http_requests_in_flight {self.in_flight}",
+            f"# HELP {_METRIC_PREFIX}_process_start_time_seconds 프로세스 시작 시각 (unix time)",
+            f"# TYPE {_METRIC_PREFIX}_process_start_time_seconds gauge",
+            f"{_METRIC_PREFIX}_process_start_time_seconds {self.started_at!r}",
+        ]
+        for collector in list(self.collectors):
+            for name, kind, description, samples in collector():
+                name = f"{_METRIC_PREFIX}_{name}"
+                lines += [f"# HELP {name} {description}", f"# TYPE {name} {kind}"]
+                for labels, value in samples:
+                    lines.append(f"{name}{{{_labels(**labels)}}} {value!r}" if labels else f"{name} {value!r}")
+        return "\n".join(lines) + "\n"
+
+
+# 워커별 전역 메트릭 저장소
+metrics_registry = MetricsRegistry()
+
+
+def _route_template(scope: Scope) -> str:
+    """라우팅 후 scope 에 기록된 라우트의 경로 템플릿 (/users/{user_id} 형태)"""
+    route = scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """요청 메트릭 수집 + X-Process-Time / X-Service 응답 헤더 (순수 ASGI)"""
+
+    def __init__(self, app: ASGIApp, registry: Optional[MetricsRegistry] = None, service_name: str = "",
+                 log_sample_rate: float = 0.0):
+        self.app = app
+        self.registry = registry if registry is not None else metrics_registry
+        self.service_name = service_name
+        self.log_sample_rate = log_sample_rate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        registry = self.registry
+        started = time.perf_counter()
+        status_code = 500
+        registry.in_flight += 1
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers["X-Process-Time"] = str(round(time.perf_counter() - started, 4))
+                headers["X-Service"] = self.service_name
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            registry.in_flight -= 1
+            method = scope["method"]
+            route = _route_template(scope)
+            registry.observe(method, route, status_code, elapsed)
+            if status_code >= 500:
+                logger.warning("%s %s - Status: %d - Time: %.4fs", method, scope["path"], status_code, elapsed)
+            elif self.log_sample_rate and random.random() < self.log_sample_rate:
+                logger.info("%s %s - Status: %d - Time: %.4fs", method, scope["path"], status_code, elapsed)
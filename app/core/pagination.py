@@ -0,0 +1,90 @@
+"""
+HealthSync AI 커서(keyset) 페이지네이션
+
+OFFSET / COUNT 대신 마지막으로 본 행의 정렬 키를 커서로 넘겨 다음 페이지를
+"(정렬 키) > 커서 키" 조건의 인덱스 범위 조회로 가져옵니다. 페이지 깊이와 관계없이 비용이 일정합니다.
+- 커서: base64url(JSON [범위, 키...]) + "." + HMAC-SHA256 서명 (클라이언트는 내용을 해석하거나 바꿀 수 없음)
+- 범위(scope)를 커서에 함께 서명하여 다른 목록(다른 세션 / 회원)의 커서 재사용을 막음
+- 전체 수는 정확한 COUNT 대신 캐시 등에서 얻을 수 있는 추정치만 선택적으로 제공
+"""
+import base64
+import hashlib
+import hmac
+import json
+from typing import Any, Callable, List, Optional, Sequence, Tuple, TypeVar
+
+from app.models.common import CursorPage
+
+T = TypeVar("T")
+
+# 서명 길이 (바이트). 위조 방지에는 충분하고 URL 길이는 짧게 유지
+_SIGNATURE_BYTES = 16
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(text: str) -> bytes:
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+
+class CursorCodec:
+    """커서 서명 / 검증"""
+
+    def __init__(self, secret: str):
+        self._key = hashlib.sha256(f"cursor:{secret}".encode("utf-8")).digest()
+
+    def _sign(self, body: bytes) -> bytes:
+        return hmac.new(self._key, body, hashlib.sha256).digest()[:_SIGNATURE_BYTES]
+
+    def encode(self, scope: str, key: Sequence[Any]) -> str:
+        body = json.dumps([scope, *key], ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        return f"{_b64encode(body)}.{_b64encode(self._sign(body))}"
+
+    def verify(self, cursor: str) -> List[Any]:
+        """서명 확인 후 [범위, 키...] 반환. 형식이 틀리거나 서명이 맞지 않으면 ValueError"""
+        try:
+            body_text, signature_text = cursor.split(".", 1)
+            body, signature = _b64decode(body_text), _b64decode(signature_text)
+        except ValueError as e:
+            raise ValueError("잘못된 페이지 커서입니다.") from e
+        if not hmac.compare_digest(signature, self._sign(body)):
+            raise ValueError("잘못된 페이지 커서입니다.")
+        return json.loads(body)
+
+    def decode(self, scope: str, cursor: str) -> Tuple[Any, ...]:
+        """서명과 범위를 확인하고 정렬 키 반환. 올바르지 않으면 ValueError"""
+        values = self.verify(cursor)
+        if not values or values[0] != scope:
+            raise ValueError("다른 목록의 페이지 커서입니다.")
+        return tuple(values[1:])
+
+
+class PageParams:
+    """목록 요청의 커서 / 페이지 크기 (의존성으로 주입)"""
+
+    __slots__ = ("cursor", "limit", "codec")
+
+    def __init__(self, cursor: Optional[str], limit: int, codec: CursorCodec):
+        self.cursor = cursor
+        self.limit = limit
+        self.codec = codec
+
+    def after(self, scope: str) -> Optional[Tuple[Any, ...]]:
+        """커서가 가리키는 마지막 행의 정렬 키 (첫 페이지면 None)"""
+        return self.codec.decode(scope, self.cursor) if self.cursor else None
+
+    @property
+    def fetch_size(self) -> int:
+        """다음 페이지 존재 여부 확인을 위해 한 행 더 조회"""
+        return self.limit + 1
+
+    def page(self, rows: List[T], scope: str, key: Callable[[T], Sequence[Any]],
+             total_estimate: Optional[int] = None) -> CursorPage:
+        """fetch_size 만큼 조회한 행 → 페이지 (마지막 행의 키로 다음 커서 생성. 키 값은 JSON 기본 타입이어야 함)"""
+        has_next = len(rows) > self.limit
+        items = rows[:self.limit]
+        next_cursor = self.codec.encode(scope, key(items[-1])) if has_next else None
+        return CursorPage(items=items, next_cursor=next_cursor, has_next=has_next, limit=self.limit,
+                          total_estimate=total_estimate)
@@ -0,0 +1,295 @@
+"""
+HealthSync AI 멀티 프로세스(pre-fork) 서버
+
+부모 프로세스가 앱을 한 번 import 하고(preload) 읽기 전용 데이터를 공유 메모리에 올린 뒤 작업 프로세스 N 개를 fork 합니다.
+- import 된 모듈 / 컴파일된 조회 구조는 copy-on-write 로 공유 (fork 직전 gc.freeze 로 GC 가 페이지를 건드리지 않게 함)
+- 소켓: 부모가 연 리스닝 소켓 하나를 상속 (기본) 또는 작업 프로세스별 SO_REUSEPORT 소켓 (커널이 연결 분배)
+- 재활용: 요청 수(+지터) 또는 고유 메모리(RSS - 공유 페이지) 한도를 넘은 작업 프로세스는 진행 중 요청을 마치고 종료, 부모가 새로 fork
+- 순차 재시작 (SIGHUP): 작업 프로세스마다 새 프로세스가 준비되면 기존 프로세스를 정상 종료
+- 종료 (SIGTERM / SIGINT): 모든 작업 프로세스에 SIGTERM, graceful_timeout 후 남은 프로세스는 SIGKILL
+앱의 startup / shutdown 이벤트는 작업 프로세스마다 실행됩니다.
+
+작업 프로세스끼리 공유하지 않는 단일 작성자 상태가 있어 run.py 는 SERVER_WRITERS_ENABLED=false 일 때만 여러 개를 fork 합니다.
+- 이벤트 로그: event_id 발급 / 세그먼트 교체 / 색인이 프로세스마다 따로 (POST /health/checkup/sync)
+- 원본 저장소 manifest: 잠금 없이 다시 씀 (PUT /health/checkup/uploads/{file_id})
+- 코호트 스케치 / 동기화 지문 색인 파일: 같은 {path}.tmp 로 저장 (업로드 / 동기화 후 종료 시)
+- 업로드 상태: 프로세스 메모리에 있어 다른 작업 프로세스로 간 요청은 404 (/health/checkup/uploads*)
+위 엔드포인트는 작업 프로세스에서 503 으로 응답하며, 단일 프로세스 서버(python run.py)가 따로 처리합니다.
+"""
+import gc
+import logging
+import os
+import random
+import select
+import signal
+import socket
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import uvicorn
+from uvicorn.importer import import_from_string
+
+logger = logging.getLogger(__name__)
+
+_POLL_SECONDS = 0.5
+_READY_TIMEOUT_SECONDS = 60.0
+
+
+class _WorkerServer(uvicorn.Server):
+    """준비 완료 알림과 메모리 한도 재활용을 더한 uvicorn 서버"""
+
+    def __init__(self, config: uvicorn.Config, ready_fd: int, max_memory_mb: int):
+        super().__init__(config)
+        self._ready_fd: Optional[int] = ready_fd
+        self._max_memory = max_memory_mb * 1024 * 1024
+        self._process = None
+
+    def _private_memory(self) -> int:
+        """작업 프로세스 고유 메모리 (RSS 에서 부모와 공유 중인 페이지 제외)"""
+        if self._process is None:
+            import psutil
+            self._process = psutil.Process()
+        info = self._process.memory_info()
+        return info.rss - getattr(info, "shared", 0)
+
+    async def on_tick(self, counter: int) -> bool:
+        if self._ready_fd is not None and self.started:
+            os.write(self._ready_fd, b"1")
+            os.close(self._ready_fd)
+            self._ready_fd = None
+        # 메모리 확인은 1초에 한 번
+        if self._max_memory and counter % 10 == 0 and not self.should_exit:
+            private = self._private_memory()
+            if private > self._max_memory:
+                logger.warning(f"작업 프로세스 {os.getpid()} 메모리 한도 초과 ({private / 1024 / 1024:.0f}MB), 재활용합니다.")
+                self.should_exit = True
+        return await super().on_tick(counter)
+
+
+class _Worker:
+    """부모가 관리하는 작업 프로세스 정보"""
+
+    __slots__ = ("pid", "slot", "ready_fd", "ready", "retiring")
+
+    def __init__(self, pid: int, slot: int, ready_fd: int):
+        self.pid = pid
+        self.slot = slot
+        self.ready_fd = ready_fd
+        self.ready = False
+        self.retiring = False
+
+
+class PreforkServer:
+    """preload + fork 방식 멀티 프로세스 서버"""
+
+    def __init__(self, app: str, host: str, port: int, workers: int, reuse_port: bool = False,
+                 max_requests: int = 0, max_requests_jitter: int = 0, max_memory_mb: int = 0,
+                 graceful_timeout: float = 30.0, log_level: str = "info",
+                 preload: Optional[str] = None, uvicorn_options: Optional[Dict[str, Any]] = None):
+        if workers < 1:
+            raise ValueError("작업 프로세스 수는 1 이상이어야 합니다.")
+        if reuse_port and not hasattr(socket, "SO_REUSEPORT"):
+            raise ValueError("이 플랫폼은 SO_REUSEPORT 를 지원하지 않습니다.")
+        self.app_path = app
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.reuse_port = reuse_port
+        self.max_requests = max_requests
+        self.max_requests_jitter = max_requests_jitter
+        self.max_memory_mb = max_memory_mb
+        self.graceful_timeout = graceful_timeout
+        self.log_level = log_level
+        self.preload_path = preload
+        self.uvicorn_options = uvicorn_options or {}
+        self._app: Any = None
+        self._shared: Any = None
+        self._socket: Optional[socket.socket] = None
+        self._workers: Dict[int, _Worker] = {}
+        self._stopping = False
+        self._reload_requested = False
+
+    # 소켓 --------------------------------------------------------------------
+    def _bind(self) -> socket.socket:
+        family = socket.AF_INET6 if ":" in self.host else socket.AF_INET
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if self.reuse_port:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        sock.bind((self.host, self.port))
+        sock.listen(2048)
+        sock.set_inheritable(True)
+        return sock
+
+    # 작업 프로세스 -------------------------------------------------------------
+    def _spawn(self, slot: int) -> _Worker:
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            code = 1
+            try:
+                self._worker_main(write_fd)
+                code = 0
+            except BaseException:
+                logger.exception("작업 프로세스 오류")
+            finally:
+                os._exit(code)
+        os.close(write_fd)
+        worker = _Worker(pid, slot, read_fd)
+        self._workers[pid] = worker
+        logger.info(f"작업 프로세스 {slot} 시작 (pid {pid})")
+        return worker
+
+    def _worker_main(self, ready_fd: int):
+        # 종료 신호는 uvicorn 이 처리, 순차 재시작 신호는 부모 전용
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(sig, signal.SIG_DFL)
+        signal.signal(signal.SIGHUP, signal.SIG_IGN)
+        for worker in self._workers.values():
+            self._close_ready_fd(worker)
+        sock = self._socket if self._socket is not None else self._bind()
+        limit = None
+        if self.max_requests > 0:
+            limit = self.max_requests + random.randint(0, max(self.max_requests_jitter, 0))
+        config = uvicorn.Config(self._app, host=self.host, port=self.port, log_level=self.log_level,
+                                limit_max_requests=limit, **self.uvicorn_options)
+        _WorkerServer(config, ready_fd, self.max_memory_mb).run(sockets=[sock])
+
+    def _reap(self):
+        """종료된 작업 프로세스 회수. 재활용 / 비정상 종료는 같은 자리에 새로 fork"""
+        while self._workers:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            worker = self._workers.pop(pid, None)
+            if worker is None:
+                continue
+            self._close_ready_fd(worker)
+            code = os.waitstatus_to_exitcode(status)
+            if worker.retiring or self._stopping:
+                continue
+            if code == 0:
+                logger.info(f"작업 프로세스 {worker.slot} 재활용 (pid {pid})")
+            else:
+                logger.warning(f"작업 프로세스 {worker.slot} 비정상 종료 (pid {pid}, 코드 {code})")
+                time.sleep(min(_POLL_SECONDS, 0.1))
+            self._spawn(worker.slot)
+
+    @staticmethod
+    def _close_ready_fd(worker: _Worker):
+        if worker.ready_fd >= 0:
+            os.close(worker.ready_fd)
+            worker.ready_fd = -1
+
+    def _poll_ready(self, timeout: float):
+        """준비 완료 알림 대기 (pipe 에 1바이트, 준비 전에 종료되면 EOF)"""
+        pending = {w.ready_fd: w for w in self._workers.values() if w.ready_fd >= 0}
+        if not pending:
+            time.sleep(timeout)
+            return
+        readable, _, _ = select.select(list(pending), [], [], timeout)
+        for fd in readable:
+            worker = pending[fd]
+            worker.ready = os.read(fd, 1) == b"1"
+            self._close_ready_fd(worker)
+
+    def _rolling_restart(self):
+        """작업 프로세스를 하나씩 교체 (새 프로세스가 준비된 뒤 기존 프로세스 종료)"""
+        logger.info("작업 프로세스 순차 재시작")
+        for old in [w for w in self._workers.values() if not w.retiring]:
+            if self._stopping:
+                return
+            if old.pid not in self._workers:
+                continue
+            new = self._spawn(old.slot)
+            deadline = time.monotonic() + _READY_TIMEOUT_SECONDS
+            while not new.ready and new.pid in self._workers and time.monotonic() < deadline and not self._stopping:
+                self._poll_ready(_POLL_SECONDS)
+                self._reap()
+            if not new.ready:
+                logger.warning(f"작업 프로세스 {old.slot} 교체 실패, 순차 재시작을 중단합니다.")
+                return
+            old.retiring = True
+            self._signal(old.pid, signal.SIGTERM)
+
+    # 부모 프로세스 -------------------------------------------------------------
+    @staticmethod
+    def _signal(pid: int, sig: int):
+        try:
+            os.kill(pid, sig)
+        except ProcessLookupError:
+            pass
+
+    def _install_signal_handlers(self):
+        def stop(signum, frame):
+            self._stopping = True
+
+        def reload(signum, frame):
+            self._reload_requested = True
+
+        signal.signal(signal.SIGTERM, stop)
+        signal.signal(signal.SIGINT, stop)
+        signal.signal(signal.SIGHUP, reload)
+
+    def _preload(self):
+        """앱 import 와 읽기 전용 데이터 준비 (fork 전 한 번)"""
+        started = time.perf_counter()
+        self._app = import_from_string(self.app_path)
+        if self.preload_path:
+            preload: Callable[[], Any] = import_from_string(self.preload_path)
+            self._shared = preload()
+        # fork 후 작업 프로세스의 GC 가 preload 객체를 훑으며 공유 페이지를 복사하지 않도록 고정
+        gc.collect()
+        gc.freeze()
+        logger.info(f"preload 완료 ({(time.perf_counter() - started) * 1000:.0f}ms, "
+                    f"공유 메모리 {getattr(self._shared, 'nbytes', 0) / 1024 / 1024:.1f}MB)")
+
+    def _shutdown(self):
+        for worker in self._workers.values():
+            self._signal(worker.pid, signal.SIGTERM)
+        deadline = time.monotonic() + self.graceful_timeout
+        while self._workers and time.monotonic() < deadline:
+            self._reap()
+            time.sleep(0.05)
+        for worker in list(self._workers.values()):
+            logger.warning(f"작업 프로세스 {worker.slot} 강제 종료 (pid {worker.pid})")
+            self._signal(worker.pid, signal.SIGKILL)
+        while self._workers:
+            try:
+                pid, _ = os.waitpid(-1, 0)
+            except ChildProcessError:
+                break
+            self._workers.pop(pid, None)
+
+    def run(self):
+        logging.basicConfig(level=self.log_level.upper(),
+                            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+        self._preload()
+        if not self.reuse_port:
+            self._socket = self._bind()
+        self._install_signal_handlers()
+        for slot in range(self.workers):
+            self._spawn(slot)
+        logger.info(f"멀티 프로세스 서버 시작: http://{self.host}:{self.port} (작업 프로세스 {self.workers}개, "
+                    f"{'SO_REUSEPORT' if self.reuse_port else '공유 소켓'})")
+        try:
+            while not self._stopping:
+                self._reap()
+                if self._reload_requested:
+                    self._reload_requested = False
+                    self._rolling_restart()
+                self._poll_ready(_POLL_SECONDS)
+        finally:
+            self._stopping = True
+            self._shutdown()
+            if self._socket is not None:
+                self._socket.close()
+            logger.info("멀티 프로세스 서버 종료")
+
+    @property
+    def worker_pids(self) -> List[int]:
+        return list(self._workers)
@@ -0,0 +1,109 @@
+"""
+HealthSync AI 저장소(Repository) 계층
+
+자주 발생하는 작은 쓰기(미션 완료, 채팅 메시지)는 Database 쓰기 배치 큐를 거쳐
+한 트랜잭션으로 묶여 커밋됩니다.
+조회 결과는 저장된(이미 검증된) 값이므로 pydantic 모델 대신 내부 레코드(app.models.records)로 반환합니다.
+"""
+from datetime import date
+from typing import List, Optional, Tuple, Union
+
+from app.core.database import Database
+from app.models.goal import MissionCompletionHistory
+from app.models.intelligence import ChatMessage
+from app.models.records import ChatMessageRecord, MissionCompletionRecord
+
+
+class MissionCompletionRepository:
+    """미션 완료 이력 저장소"""
+
+    INSERT = ("INSERT INTO mission_completion_history (completion_id, mission_id, member_serial_number, "
+              "completion_date, daily_target_count, daily_completed_count, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)")
+
+    def __init__(self, database: Database):
+        self.database = database
+
+    async def add(self, completion: Union[MissionCompletionHistory, MissionCompletionRecord]) -> int:
+        """완료 이력 기록 (배치 커밋). completion_id 가 0 이하이면 자동 발급"""
+        return await self.database.enqueue_write(self.INSERT, (
+            completion.completion_id if completion.completion_id > 0 else None,
+            completion.mission_id,
+            completion.member_serial_number,
+            completion.completion_date.isoformat(),
+            completion.daily_target_count,
+            completion.daily_completed_count,
+            completion.created_at.isoformat(),
+        ))
+
+    async def list_by_member(self, member_serial_number: int, start: Optional[date] = None,
+                             end: Optional[date] = None) -> List[MissionCompletionRecord]:
+        """회원의 기간별 완료 이력 (member_serial_number, completion_date 인덱스 사용)"""
+        rows = await self.database.fetch_all(
+            "SELECT * FROM mission_completion_history WHERE member_serial_number = ? "
+            "AND completion_date >= ? AND completion_date <= ? ORDER BY completion_date, completion_id",
+            (member_serial_number, (start or date.min).isoformat(), (end or date.max).isoformat()),
+        )
+        return [MissionCompletionRecord.from_row(row) for row in rows]
+
+    async def page_by_member(self, member_serial_number: int, after: Optional[Tuple[str, int]], limit: int,
+                             start: Optional[date] = None, end: Optional[date] = None) -> List[MissionCompletionRecord]:
+        """(completion_date, completion_id) 키셋 페이지. after 는 이전 페이지 마지막 행의 키"""
+        sql = ("SELECT * FROM mission_completion_history WHERE member_serial_number = ? "
+               "AND completion_date >= ? AND completion_date <= ?")
+        params = [member_serial_number, (start or date.min).isoformat(), (end or date.max).isoformat()]
+        if after is not None:
+            sql += " AND (completion_date, completion_id) > (?, ?)"
+            params += [after[0], after[1]]
+        rows = await self.database.fetch_all(sql + " ORDER BY completion_date, completion_id LIMIT ?", (*params, limit))
+        return [MissionCompletionRecord.from_row(row) for row in rows]
+
+
+class ChatMessageRepository:
+    """채팅 메시지 저장소"""
+
+    INSERT = ("INSERT INTO chat_message (message_id, session_id, member_serial_number, message_type, "
+              "message_content, response_content, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)")
+
+    def __init__(self, database: Database):
+        self.database = database
+
+    async def add(self, session_id: str, message: Union[ChatMessage, ChatMessageRecord]) -> int:
+        """메시지 기록 (배치 커밋). message_id 가 0 이하이면 자동 발급"""
+        return await self.database.enqueue_write(self.INSERT, (
+            message.message_id if message.message_id > 0 else None,
+            session_id,
+            message.member_serial_number,
+            message.message_type.value,
+            message.message_content,
+            message.response_content,
+            message.created_at.isoformat(),
+        ))
+
+    async def list_recent(self, session_id: str, limit: int = 50) -> List[ChatMessageRecord]:
+        """세션의 최근 메시지 (오래된 순)"""
+        rows = await self.database.fetch_all(
+            "SELECT * FROM chat_message WHERE session_id = ? ORDER BY message_id DESC LIMIT ?",
+            (session_id, limit),
+        )
+        return [ChatMessageRecord.from_row(row) for row in reversed(rows)]
+
+    async def page_by_session(self, session_id: str, before: Optional[int], limit: int) -> List[ChatMessageRecord]:
+        """세션 메시지 키셋 페이지 (최신순). before 는 이전 페이지 마지막 message_id"""
+        rows = await self.database.fetch_all(
+            "SELECT * FROM chat_message WHERE session_id = ? AND message_id < ? ORDER BY message_id DESC LIMIT ?",
+            (session_id, before if before is not None else 2 ** 63 - 1, limit),
+        )
+        return [ChatMessageRecord.from_row(row) for row in rows]
+
+    async def page_by_member(self, member_serial_number: int, before: Optional[int], limit: int) -> List[ChatMessageRecord]:
+        """회원 전체 메시지 키셋 페이지 (최신순, ix_chat_message_member 인덱스 사용)"""
+        rows = await self.database.fetch_all(
+            "SELECT * FROM chat_message WHERE member_serial_number = ? AND message_id < ? "
+            "ORDER BY message_id DESC LIMIT ?",
+            (member_serial_number, before if before is not None else 2 ** 63 - 1, limit),
+        )
+        return [ChatMessageRecord.from_row(row) for row in rows]
+
+    async def count(self, session_id: str) -> int:
+        row = await self.database.fetch_one("SELECT COUNT(*) FROM chat_message WHERE session_id = ?", (session_id,))
+        return row[0]
@@ -0,0 +1,40 @@
+"""
+HealthSync AI 응답 직렬화
+
+컨트롤러가 만든 응답 모델(BaseResponse, ErrorResponse)을 pydantic-core 직렬화기로 바로 JSON 바이트로 씁니다.
+FastAPI 기본 경로(response_model 재검증 → jsonable_encoder 로 dict 변환 → json.dumps)를 거치지 않으므로
+큰 이력 응답에서 중간 dict/list 생성과 CPU 사용이 줄어듭니다.
+- 모델: 클래스별로 한 번 만들어진 __pydantic_serializer__ 사용
+- dict / list 등: pydantic_core.to_json (datetime, Decimal, Enum, 중첩 모델 네이티브 처리)
+- numpy 배열 / 스칼라처럼 직렬화기가 모르는 값은 .tolist() / .item() / str 로 대체
+"""
+from typing import Any
+
+import pydantic_core
+from pydantic import BaseModel
+from starlette.responses import JSONResponse
+
+
+def _fallback(value: Any) -> Any:
+    # 원소가 여럿인 ndarray 의 .item() 은 ValueError 이므로 tolist 먼저 (numpy 스칼라는 tolist 도 파이썬 스칼라)
+    tolist = getattr(value, "tolist", None)
+    if callable(tolist):
+        return tolist()
+    item = getattr(value, "item", None)
+    if callable(item):
+        return item()
+    return str(value)
+
+
+def dump_json(content: Any) -> bytes:
+    """응답 내용 → JSON 바이트"""
+    if isinstance(content, BaseModel):
+        return content.__pydantic_serializer__.to_json(content, fallback=_fallback)
+    return pydantic_core.to_json(content, fallback=_fallback)
+
+
+class ModelJSONResponse(JSONResponse):
+    """pydantic 모델 / 일반 값을 바로 바이트로 직렬화하는 JSON 응답"""
+
+    def render(self, content: Any) -> bytes:
+        return dump_json(content)
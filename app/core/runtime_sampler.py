@@ -0,0 +1,189 @@
+"""
+HealthSync AI 런타임 샘플러
+
+백그라운드 태스크가 고정 주기로
+- 이벤트 루프 지연 (예정 깨어남 시각 대비 실제 깨어남 시각)
+- GC 세대별 수집 횟수와 정지 시간 (gc.callbacks)
+- RSS, CPU 사용률, 열린 FD 수, 스레드 수 (프로세스 객체 하나를 재사용)
+를 측정해 최근 샘플 링 버퍼에 보관합니다.
+상태 확인 요청은 마지막 샘플만 읽으므로 O(1) 이고 시스템 호출이 없습니다.
+psutil 은 첫 샘플을 측정할 때 가져오므로 서버 기동 경로에 포함되지 않습니다.
+"""
+import asyncio
+import gc
+import logging
+import os
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_GENERATIONS = 3
+
+
+class RuntimeSample(NamedTuple):
+    """런타임 샘플 하나 (수집 횟수 / 정지 시간은 직전 샘플 이후 구간 값)"""
+    timestamp: float
+    loop_lag_ms: float
+    rss_mb: float
+    cpu_percent: float
+    open_fds: int
+    threads: int
+    gc_collections: Tuple[int, ...]
+    gc_pause_ms: float
+    gc_max_pause_ms: float
+
+    def as_dict(self) -> Dict[str, Any]:
+        data = self._asdict()
+        data["gc_collections"] = list(self.gc_collections)
+        return data
+
+
+class GCMonitor:
+    """gc.callbacks 로 세대별 수집 횟수와 정지 시간 누적 (drain 시 구간 값 반환 후 초기화)"""
+
+    def __init__(self):
+        self._started: Optional[float] = None
+        self._collections = [0] * _GENERATIONS
+        self._pause = 0.0
+        self._max_pause = 0.0
+        self._installed = False
+
+    def _callback(self, phase: str, info: Dict[str, Any]):
+        if phase == "start":
+            self._started = time.perf_counter()
+        elif self._started is not None:
+            pause = time.perf_counter() - self._started
+            self._started = None
+            self._collections[info["generation"]] += 1
+            self._pause += pause
+            self._max_pause = max(self._max_pause, pause)
+
+    def install(self):
+        if not self._installed:
+            gc.callbacks.append(self._callback)
+            self._installed = True
+
+    def uninstall(self):
+        if self._installed:
+            gc.callbacks.remove(self._callback)
+            self._installed = False
+
+    def drain(self) -> Tuple[Tuple[int, ...], float, float]:
+        """(세대별 수집 횟수, 정지 시간 합(ms), 최대 정지 시간(ms))"""
+        collections, pause, max_pause = tuple(self._collections), self._pause, self._max_pause
+        self._collections = [0] * _GENERATIONS
+        self._pause = self._max_pause = 0.0
+        return collections, pause * 1000, max_pause * 1000
+
+
+class RuntimeSampler:
+    """주기적 런타임 샘플링과 최근 샘플 링 버퍼"""
+
+    def __init__(self, interval: float = 1.0, history_size: int = 300):
+        if interval <= 0:
+            raise ValueError("샘플링 주기는 0보다 커야 합니다.")
+        self.interval = interval
+        self._history: Deque[RuntimeSample] = deque(maxlen=history_size)
+        self._process = None
+        self._gc = GCMonitor()
+        self._task: Optional[asyncio.Task] = None
+        self._last_lag_ms = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def latest(self) -> Optional[RuntimeSample]:
+        return self._history[-1] if self._history else None
+
+    def history(self) -> List[RuntimeSample]:
+        return list(self._history)
+
+    def start(self):
+        """실행 중인 이벤트 루프에 샘플링 태스크 시작"""
+        if self.running:
+            return
+        self._gc.install()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._gc.uninstall()
+
+    def _get_process(self):
+        """프로세스 객체 (첫 사용 시 psutil 로드)"""
+        if self._process is None:
+            import psutil
+            self._process = psutil.Process()
+            # 첫 cpu_percent 호출은 기준점만 잡고 0 을 반환하므로 미리 한 번 호출
+            self._process.cpu_percent(None)
+        return self._process
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self._last_lag_ms = max(loop.time() - expected, 0.0) * 1000
+            try:
+                self.sample()
+            except Exception:
+                logger.exception("런타임 샘플 수집 실패")
+
+    def sample(self) -> RuntimeSample:
+        """현재 값을 측정해 링 버퍼에 추가 (루프 지연은 마지막 측정값 사용)"""
+        import psutil
+        process = self._get_process()
+        with process.oneshot():
+            rss = process.memory_info().rss
+            cpu = process.cpu_percent(None)
+            threads = process.num_threads()
+            try:
+                fds = process.num_fds() if os.name == "posix" else process.num_handles()
+            except (psutil.Error, AttributeError):
+                fds = -1
+        collections, pause_ms, max_pause_ms = self._gc.drain()
+        sample = RuntimeSample(
+            timestamp=time.time(),
+            loop_lag_ms=round(self._last_lag_ms, 3),
+            rss_mb=round(rss / 1024 / 1024, 2),
+            cpu_percent=cpu,
+            open_fds=fds,
+            threads=threads,
+            gc_collections=collections,
+            gc_pause_ms=round(pause_ms, 3),
+            gc_max_pause_ms=round(max_pause_ms, 3),
+        )
+        self._history.append(sample)
+        return sample
+
+    def current(self) -> RuntimeSample:
+        """마지막 샘플 (아직 없으면 즉시 한 번 측정)"""
+        return self.latest or self.sample()
+
+    def summary(self) -> Dict[str, Any]:
+        """링 버퍼 구간 요약"""
+        samples = self._history
+        if not samples:
+            return {"samples": 0}
+        lags = [s.loop_lag_ms for s in samples]
+        return {
+            "samples": len(samples),
+            "window_seconds": round(samples[-1].timestamp - samples[0].timestamp, 3),
+            "interval_seconds": self.interval,
+            "loop_lag_ms": {"avg": round(sum(lags) / len(lags), 3), "max": max(lags)},
+            "rss_mb": {"min": min(s.rss_mb for s in samples), "max": max(s.rss_mb for s in samples)},
+            "cpu_percent_avg": round(sum(s.cpu_percent for s in samples) / len(samples), 2),
+            "gc_collections": [sum(s.gc_collections[g] for s in samples) for g in range(_GENERATIONS)],
+            "gc_pause_ms": round(sum(s.gc_pause_ms for s in samples), 3),
+            "gc_max_pause_ms": max(s.gc_max_pause_ms for s in samples),
+        }
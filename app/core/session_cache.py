@@ -0,0 +1,215 @@
+"""
+HealthSync AI 세션 캐시
+
+직렬화된 값(bytes)을 키별 TTL 과 함께 보관하는 캐시 백엔드입니다.
+- LocalSessionCache: 프로세스 내 LRU + TTL, 전체 바이트 예산 초과 시 가장 오래 안 쓴 항목부터 제거
+- RedisSessionCache: Redis 호환 클라이언트(get/set(ex)/delete) 래퍼, 여러 워커가 캐시를 공유할 때 사용
+- InMemoryRedis: redis 패키지 없이 RedisSessionCache 를 검증하기 위한 로컬 대체 클라이언트
+모든 백엔드는 스레드/태스크 어디서 호출해도 안전하며 hit/miss/eviction 카운터를 제공합니다.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# 항목별 부가 비용 (키 문자열 + 관리 구조체 추정치)
+_ENTRY_OVERHEAD = 96
+
+
+class CacheStats:
+    """캐시 카운터"""
+
+    __slots__ = ("hits", "misses", "evictions", "expirations", "sets")
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.sets = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "sets": self.sets,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+class LocalSessionCache:
+    """바이트 예산 LRU + 항목별 TTL 캐시"""
+
+    backend_name = "memory"
+
+    def __init__(self, max_bytes: int, default_ttl: float, clock: Callable[[], float] = time.monotonic):
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key → (value, 만료 시각, 차지하는 바이트)
+        self._entries: "OrderedDict[str, Tuple[bytes, float, int]]" = OrderedDict()
+        self._bytes = 0
+        self.counters = CacheStats()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.counters.misses += 1
+                return None
+            if entry[1] <= self._clock():
+                self._remove(key)
+                self.counters.expirations += 1
+                self.counters.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.counters.hits += 1
+            return entry[0]
+
+    def ttl(self, key: str) -> Optional[float]:
+        """남은 TTL(초). 없거나 만료되었으면 None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            remaining = entry[1] - self._clock() if entry else 0
+            return remaining if remaining > 0 else None
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None):
+        size = len(value) + len(key) + _ENTRY_OVERHEAD
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if size > self.max_bytes:
+                # 예산보다 큰 값은 캐시하지 않음
+                return
+            self._entries[key] = (value, self._clock() + (ttl if ttl is not None else self.default_ttl), size)
+            self._bytes += size
+            self.counters.sets += 1
+            self._evict()
+
+    def delete(self, key: str):
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _remove(self, key: str):
+        _, _, size = self._entries.pop(key)
+        self._bytes -= size
+
+    def _evict(self):
+        """만료 항목을 먼저, 그래도 예산을 넘으면 LRU 순서로 제거"""
+        if self._bytes <= self.max_bytes:
+            return
+        now = self._clock()
+        for key in [k for k, entry in self._entries.items() if entry[1] <= now]:
+            self._remove(key)
+            self.counters.expirations += 1
+        while self._bytes > self.max_bytes:
+            key = next(iter(self._entries))
+            self._remove(key)
+            self.counters.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = self.counters.as_dict()
+            stats.update(backend=self.backend_name, entries=len(self._entries),
+                         bytes=self._bytes, max_bytes=self.max_bytes)
+            return stats
+
+
+class RedisSessionCache:
+    """Redis 호환 클라이언트 기반 캐시 (만료와 메모리 제한은 서버 설정을 따름)"""
+
+    backend_name = "redis"
+
+    def __init__(self, client: Any, default_ttl: float, prefix: str = "healthsync:session:"):
+        self.client = client
+        self.default_ttl = default_ttl
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self.counters = CacheStats()
+
+    @classmethod
+    def from_url(cls, url: str, default_ttl: float) -> "RedisSessionCache":
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError("Redis 캐시를 사용하려면 redis 패키지를 설치해야 합니다.") from e
+        return cls(redis.Redis.from_url(url), default_ttl)
+
+    def get(self, key: str) -> Optional[bytes]:
+        value = self.client.get(self.prefix + key)
+        with self._lock:
+            if value is None:
+                self.counters.misses += 1
+            else:
+                self.counters.hits += 1
+        return value
+
+    def ttl(self, key: str) -> Optional[float]:
+        remaining = self.client.ttl(self.prefix + key)
+        return float(remaining) if remaining is not None and remaining > 0 else None
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None):
+        seconds = max(int(ttl if ttl is not None else self.default_ttl), 1)
+        self.client.set(self.prefix + key, value, ex=seconds)
+        with self._lock:
+            self.counters.sets += 1
+
+    def delete(self, key: str):
+        self.client.delete(self.prefix + key)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = self.counters.as_dict()
+        stats.update(backend=self.backend_name)
+        return stats
+
+
+class InMemoryRedis:
+    """redis.Redis 의 get/set/delete/ttl 일부만 흉내 낸 로컬 클라이언트"""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._data: Dict[str, Tuple[bytes, Optional[float]]] = {}
+
+    def get(self, name: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._data.get(name)
+            if entry is None:
+                return None
+            if entry[1] is not None and entry[1] <= self._clock():
+                del self._data[name]
+                return None
+            return entry[0]
+
+    def set(self, name: str, value: bytes, ex: Optional[int] = None) -> bool:
+        with self._lock:
+            self._data[name] = (bytes(value), self._clock() + ex if ex else None)
+        return True
+
+    def delete(self, *names: str) -> int:
+        with self._lock:
+            return sum(self._data.pop(name, None) is not None for name in names)
+
+    def ttl(self, name: str) -> int:
+        """redis 규약: 키 없음 -2, 만료 없음 -1"""
+        with self._lock:
+            entry = self._data.get(name)
+            if entry is None or (entry[1] is not None and entry[1] <= self._clock()):
+                return -2
+            return -1 if entry[1] is None else int(entry[1] - self._clock() + 0.999)
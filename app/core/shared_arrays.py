@@ -0,0 +1,71 @@
+"""
+HealthSync AI 읽기 전용 공유 배열
+
+멀티 프로세스 서버의 부모 프로세스가 fork 전에 큰 읽기 전용 배열(정상치 구간표, 미션 가중치 행렬,
+코호트 스케치)을 익명 공유 메모리(mmap) 한 영역에 모으고, 각 구조가 그 영역의 읽기 전용 뷰를 쓰도록 바꿉니다.
+- 작업 프로세스는 같은 물리 페이지를 공유 (참조 카운트 갱신으로 페이지가 복사되는 일반 객체와 달리 복사되지 않음)
+- 뷰는 writeable=False 이므로 제자리 수정은 오류. 갱신은 새 배열을 만들어 교체하는 기존 방식 그대로 동작
+  (해당 작업 프로세스만 개인 사본을 가지게 됨)
+"""
+import mmap
+from typing import Dict, Iterator, Mapping, Protocol
+
+import numpy as np
+
+_ALIGNMENT = 64
+
+
+class SharedArrayExporter(Protocol):
+    """공유 메모리로 옮길 수 있는 구조"""
+
+    def export_arrays(self) -> Dict[str, np.ndarray]:
+        """이름 → 공유할 배열"""
+
+    def attach_arrays(self, arrays: Mapping[str, np.ndarray]):
+        """export_arrays 와 같은 이름의 (공유 메모리) 배열로 내부 배열 교체"""
+
+
+class SharedArrayStore(Mapping[str, np.ndarray]):
+    """이름 → 읽기 전용 ndarray (하나의 익명 공유 mmap 영역)"""
+
+    def __init__(self, arrays: Mapping[str, np.ndarray]):
+        layout = []
+        offset = 0
+        for name, array in arrays.items():
+            array = np.ascontiguousarray(array)
+            offset = -(-offset // _ALIGNMENT) * _ALIGNMENT
+            layout.append((name, array, offset))
+            offset += array.nbytes
+        self.nbytes = offset
+        # fork 로 상속되는 MAP_SHARED 익명 매핑 (이름 / 정리 프로세스 불필요)
+        self._buffer = mmap.mmap(-1, max(offset, 1))
+        self._arrays: Dict[str, np.ndarray] = {}
+        for name, array, start in layout:
+            view = np.ndarray(array.shape, array.dtype, buffer=self._buffer, offset=start)
+            view[...] = array
+            view.flags.writeable = False
+            self._arrays[name] = view
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self._arrays[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._arrays)
+
+    def __len__(self) -> int:
+        return len(self._arrays)
+
+    def scoped(self, prefix: str) -> Dict[str, np.ndarray]:
+        """'prefix/' 로 시작하는 배열 (접두사 제거)"""
+        head = f"{prefix}/"
+        return {name[len(head):]: array for name, array in self._arrays.items() if name.startswith(head)}
+
+
+def share_read_only(exporters: Mapping[str, SharedArrayExporter]) -> SharedArrayStore:
+    """구조별 배열을 공유 메모리 한 영역에 모은 뒤 각 구조가 공유 뷰를 쓰도록 교체"""
+    arrays = {f"{prefix}/{name}": array for prefix, exporter in exporters.items()
+              for name, array in exporter.export_arrays().items()}
+    store = SharedArrayStore(arrays)
+    for prefix, exporter in exporters.items():
+        exporter.attach_arrays(store.scoped(prefix))
+    return store
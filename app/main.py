@@ -3,12 +3,20 @@ HealthSync AI - FastAPI 메인 애플리케이션 (MVC 패턴)
 """
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import RedirectResponse, JSONResponse
+from fastapi.responses import RedirectResponse
+from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
 from app.views.status_views import status_router
+from app.views.health_views import health_router
+from app.views.history_views import history_router
+from app.controllers.health_controller import health_controller
 from app.config.settings import settings
+from app.core.dependencies import (close_database, close_event_bus, close_event_log, close_runtime_sampler,
+                                   get_diagnosis_cache, get_event_bus, get_runtime_sampler)
+from app.core.metrics import MetricsMiddleware
+from app.core.responses import ModelJSONResponse
 from app.models.base import ErrorResponse
-import time
+import asyncio
 import logging
 from datetime import datetime
 
@@ -35,26 +43,18 @@ app = FastAPI(
     """,
     version=settings.app_version,
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ModelJSONResponse
 )
 
-# 요청 처리 시간 미들웨어
-@app.middleware("http")
-async def add_process_time_header(request: Request, call_next):
-    start_time = time.time()
-    logger.info(f"📥 Request: {request.method} {request.url.path}")
-    
-    response = await call_next(request)
-    
-    process_time = time.time() - start_time
-    response.headers["X-Process-Time"] = str(round(process_time, 4))
-    response.headers["X-Service"] = settings.app_name
-    
-    logger.info(f"📤 Response: {request.method} {request.url.path} - Status: {response.status_code} - Time: {process_time:.4f}s")
-    return response
+# 요청 메트릭 / 처리 시간 헤더 미들웨어 (순수 ASGI)
+app.add_middleware(MetricsMiddleware, service_name=settings.app_name,
+                   log_sample_rate=settings.request_log_sample_rate)
 
 # API 라우터 등록
 app.include_router(status_router, prefix=settings.api_v1_prefix)
+app.include_router(health_router, prefix=settings.api_v1_prefix)
+app.include_router(history_router, prefix=settings.api_v1_prefix)
 
 @app.get("/", include_in_schema=False)
 async def root():
@@ -64,21 +64,35 @@ async def root():
 # 예외 처리
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
-    return JSONResponse(
+    return ModelJSONResponse(
         status_code=422,
         content=ErrorResponse(
             error_code="VALIDATION_ERROR",
             message="입력 데이터 검증에 실패했습니다.",
-            details={"errors": exc.errors()},
+            details={"errors": jsonable_encoder(exc.errors())},
             timestamp=datetime.now()
-        ).dict()
+        )
     )
 
+def preload_shared_state():
+    """멀티 프로세스 서버: fork 전 부모 프로세스에서 읽기 전용 조회 데이터를 만들어 공유 메모리에 올림"""
+    from app.core.shared_arrays import share_read_only
+    return share_read_only({"cohort": health_controller.cohort_service})
+
 @app.on_event("startup")
 async def startup_event():
+    get_runtime_sampler().start()
+    # HEALTH_DATA_SYNCED 로 회원별 진단 캐시를 무효화하는 구독자는 버스 시작 전에 등록
+    get_diagnosis_cache()
+    get_event_bus().start()
     logger.info(f"🚀 {settings.app_name} v{settings.app_version} 서비스 시작")
     logger.info(f"📝 API 문서: http://{settings.host}:{settings.port}/docs")
 
 @app.on_event("shutdown")
 async def shutdown_event():
+    await close_runtime_sampler()
+    await asyncio.to_thread(health_controller.save_state)
+    await close_event_log()
+    await close_event_bus()
+    await close_database()
     logger.info("🛑 HealthSync AI 서비스 종료")
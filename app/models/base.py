@@ -15,11 +15,6 @@ class BaseResponse(BaseModel, Generic[T]):
     message: str = Field(default="", description="응답 메시지")
     data: Optional[T] = Field(default=None, description="응답 데이터")
     timestamp: datetime = Field(default_factory=datetime.now, description="응답 시간")
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
 
 class ErrorResponse(BaseModel):
     """에러 응답 모델"""
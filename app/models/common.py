@@ -4,9 +4,11 @@ HealthSync AI 공통 모델
 """
 from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Generic, List, TypeVar
 from enum import Enum
 
+T = TypeVar("T")
+
 
 class EventType(str, Enum):
     """이벤트 타입"""
@@ -18,6 +20,14 @@ class EventType(str, Enum):
     NOTIFICATION_SENT = "notification_sent"
 
 
+class ChartResolution(str, Enum):
+    """차트 시계열 해상도"""
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+    YEAR = "year"
+
+
 class EventStore(BaseModel):
     """이벤트 저장소"""
     event_id: int = Field(..., description="이벤트 ID")
@@ -45,11 +55,6 @@ class APIResponse(BaseModel):
     data: Optional[Dict[str, Any]] = Field(default=None, description="응답 데이터")
     timestamp: datetime = Field(default_factory=datetime.now, description="응답 시각")
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
-
 
 class PaginatedResponse(BaseModel):
     """페이지네이션 응답"""
@@ -59,4 +64,13 @@ class PaginatedResponse(BaseModel):
     size: int = Field(..., description="페이지 크기")
     pages: int = Field(..., description="전체 페이지 수")
     has_next: bool = Field(..., description="다음 페이지 존재 여부")
-    has_prev: bool = Field(..., description="이전 페이지 존재 여부")
\ No newline at end of file
+    has_prev: bool = Field(..., description="이전 페이지 존재 여부")
+
+
+class CursorPage(BaseModel, Generic[T]):
+    """커서 페이지네이션 응답 (전체 수는 추정치이며 없을 수 있음)"""
+    items: List[T] = Field(..., description="아이템 목록")
+    next_cursor: Optional[str] = Field(default=None, description="다음 페이지 커서")
+    has_next: bool = Field(..., description="다음 페이지 존재 여부")
+    limit: int = Field(..., description="페이지 크기")
+    total_estimate: Optional[int] = Field(default=None, description="전체 수 추정치")
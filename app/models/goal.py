@@ -56,6 +56,19 @@ class MissionCompletionHistory(BaseModel):
     daily_completed_count: int = Field(..., description="일일 완료 횟수")
     created_at: datetime = Field(default_factory=datetime.now, description="생성일시")
 
+class MissionCatalogItem(BaseModel):
+    """추천 대상 미션 카탈로그 항목"""
+    mission_id: str = Field(..., description="미션 ID")
+    title: str = Field(..., description="미션 제목")
+    description: str = Field(..., description="미션 설명")
+    category: MissionCategory = Field(..., description="미션 카테고리")
+    difficulty: DifficultyLevel = Field(..., description="난이도")
+    health_benefit: str = Field(..., description="건강상 이점")
+    estimated_time_minutes: int = Field(..., description="예상 소요 시간(분)")
+    occupation_categories: List[str] = Field(default_factory=list, description="대상 직업 카테고리 (비어 있으면 공통)")
+    risk_weights: Dict[str, float] = Field(default_factory=dict, description="위험 요인별 개선 가중치")
+    base_score: float = Field(default=0.0, description="기본 점수")
+
 class MissionSelectionRequest(BaseModel):
     """미션 선택 요청"""
     user_id: str = Field(..., description="사용자 ID")
@@ -112,6 +112,21 @@ class HealthSyncResponse(BaseModel):
     message: str = Field(..., description="응답 메시지")
     is_ready_for_analysis: bool = Field(..., description="분석 준비 여부")
     synced_at: datetime = Field(..., description="동기화 일시")
+    new_records: int = Field(default=0, description="새로 추가된 (회원, 기준 년도) 검진 수")
+    changed_records: int = Field(default=0, description="내용이 바뀐 검진 수")
+    unchanged_records: int = Field(default=0, description="이전 동기화와 같아 건너뛴 검진 수")
+    duplicate_records: int = Field(default=0, description="같은 요청에서 기준 년도가 반복되어 건너뛴 검진 수")
+    synced_years: List[int] = Field(default_factory=list, description="이번에 반영된 기준 년도")
+
+class CohortPercentileResponse(BaseModel):
+    """코호트 백분위 응답"""
+    metric: str = Field(..., description="검사 항목")
+    value: float = Field(..., description="검사 값")
+    percentile: Optional[float] = Field(default=None, description="코호트 내 백분위 (값 이하 비율 %)")
+    cohort_median: Optional[float] = Field(default=None, description="코호트 중앙값")
+    cohort_size: int = Field(..., description="코호트 표본 수")
+    scope: str = Field(..., description="비교 범위 (region / national / none)")
+    cohort: Dict[str, Any] = Field(..., description="코호트 정보")
 
 class HealthHistoryResponse(BaseModel):
     """건강검진 이력 응답"""
@@ -132,4 +147,35 @@ class FileUploadResponse(BaseModel):
     file_id: str = Field(..., description="파일 ID")
     upload_url: str = Field(..., description="업로드 URL")
     status: str = Field(..., description="업로드 상태")
-    message: str = Field(..., description="응답 메시지")
\ No newline at end of file
+    message: str = Field(..., description="응답 메시지")
+
+class CheckupPipelineStats(BaseModel):
+    """건강검진 일괄 변환 결과"""
+    rows_read: int = Field(default=0, description="읽은 원본 행 수")
+    rows_written: int = Field(default=0, description="저장된 처리 행 수")
+    rows_skipped: int = Field(default=0, description="회원 미확인 등으로 제외된 행 수")
+    chunks: int = Field(default=0, description="처리한 청크 수")
+    elapsed_seconds: float = Field(default=0.0, description="소요 시간(초)")
+    rows_per_second: float = Field(default=0.0, description="초당 처리 행 수")
+
+class RecordLinkageStats(BaseModel):
+    """원본 건강검진 → 회원 매칭 결과"""
+    rows: int = Field(default=0, description="매칭을 시도한 원본 행 수")
+    matched: int = Field(default=0, description="회원 한 명으로 확정된 행 수")
+    ambiguous: int = Field(default=0, description="후보 회원이 여럿이라 확정하지 못한 행 수")
+    unmatched: int = Field(default=0, description="후보 회원이 없거나 성별이 맞지 않는 행 수")
+    elapsed_seconds: float = Field(default=0.0, description="소요 시간(초)")
+    rows_per_second: float = Field(default=0.0, description="초당 처리 행 수")
+
+class CheckupUploadProgress(BaseModel):
+    """건강검진 파일 업로드 진행 상태"""
+    file_id: str = Field(..., description="파일 ID")
+    user_id: str = Field(..., description="사용자 ID")
+    file_name: str = Field(..., description="파일명")
+    file_type: str = Field(..., description="파일 형식")
+    status: UploadStatus = Field(default=UploadStatus.PENDING, description="업로드 상태")
+    bytes_received: int = Field(default=0, description="수신 바이트 수")
+    records_parsed: int = Field(default=0, description="해석된 레코드 수")
+    error: Optional[str] = Field(default=None, description="실패 사유")
+    started_at: datetime = Field(default_factory=datetime.now, description="업로드 시작 일시")
+    completed_at: Optional[datetime] = Field(default=None, description="업로드 완료 일시")
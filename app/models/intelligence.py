@@ -6,6 +6,7 @@ from pydantic import BaseModel, Field
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from enum import Enum
+from app.models.goal import MissionCategory, DifficultyLevel
 
 class MessageRole(str, Enum):
     """메시지 역할"""
@@ -0,0 +1,158 @@
+"""
+HealthSync AI 내부 레코드 타입
+
+서비스 계층이 직접 만들었거나 저장소에서 읽은(이미 신뢰하는) 데이터를 담는 __slots__ 데이터클래스입니다.
+필드 이름 / 순서는 대응하는 pydantic 모델과 같고 (_bind 에서 확인), 모델 → 레코드 변환은 검증 없이 속성만 복사합니다.
+- 들어올 때 (API 요청, 외부 파일): pydantic 모델로 검증한 뒤 from_model
+- 나갈 때 (API 응답): to_model 로 pydantic 모델 생성 (검증 포함. pydantic 2 에서는 model_construct 보다 빠름)
+- 인스턴스별 __dict__ 가 없고 생성 시 검증이 없어 배치 작업의 메모리 / CPU 사용이 줄어듭니다.
+"""
+import dataclasses
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal
+from operator import attrgetter
+from typing import Any, Dict, Mapping, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+
+from app.models.common import EventStore, EventType
+from app.models.goal import MissionCompletionHistory
+from app.models.health import HealthCheckup
+from app.models.intelligence import ChatMessage, MessageType
+
+R = TypeVar("R", bound="_Record")
+
+
+class _Record:
+    """레코드 공통 변환 (하위 클래스는 _bind 로 대응 모델과 연결)"""
+
+    __slots__ = ()
+    _model: Type[BaseModel]
+    _fields: Tuple[str, ...]
+    _getter: attrgetter
+
+    @classmethod
+    def from_model(cls: Type[R], model: BaseModel) -> R:
+        """검증된 pydantic 모델 → 레코드 (검증 없음)"""
+        return cls(*cls._getter(model))
+
+    def to_model(self) -> BaseModel:
+        """레코드 → pydantic 모델 (API 경계)"""
+        return self._model.model_validate(self.as_dict())
+
+    def as_dict(self) -> Dict[str, Any]:
+        return dict(zip(self._fields, self._getter(self)))
+
+    def replace(self: R, **changes: Any) -> R:
+        return dataclasses.replace(self, **changes)
+
+
+def _bind(record: Type[R], model: Type[BaseModel]) -> Type[R]:
+    names = tuple(f.name for f in dataclasses.fields(record))
+    if names != tuple(model.model_fields):
+        raise TypeError(f"{record.__name__} 필드가 {model.__name__} 과 다릅니다.")
+    record._model = model
+    record._fields = names
+    record._getter = attrgetter(*names)
+    return record
+
+
+@dataclass(slots=True)
+class CheckupRecord(_Record):
+    """건강검진 결과 (HealthCheckup)"""
+    checkup_id: int
+    member_serial_number: int
+    raw_id: int
+    reference_year: int
+    age: int
+    height: int
+    weight: int
+    bmi: Optional[Decimal]
+    waist_circumference: int
+    visual_acuity_left: Optional[Decimal] = None
+    visual_acuity_right: Optional[Decimal] = None
+    hearing_left: Optional[int] = None
+    hearing_right: Optional[int] = None
+    systolic_bp: Optional[int] = None
+    diastolic_bp: Optional[int] = None
+    fasting_glucose: Optional[int] = None
+    total_cholesterol: Optional[int] = None
+    triglyceride: Optional[int] = None
+    hdl_cholesterol: Optional[int] = None
+    ldl_cholesterol: Optional[int] = None
+    hemoglobin: Optional[Decimal] = None
+    urine_protein: Optional[int] = None
+    serum_creatinine: Optional[Decimal] = None
+    ast: Optional[int] = None
+    alt: Optional[int] = None
+    gamma_gtp: Optional[int] = None
+    smoking_status: Optional[int] = None
+    drinking_status: Optional[int] = None
+    processed_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=datetime.now)
+
+
+@dataclass(slots=True)
+class MissionCompletionRecord(_Record):
+    """미션 완료 이력 (MissionCompletionHistory)"""
+    completion_id: int
+    mission_id: int
+    member_serial_number: int
+    completion_date: date
+    daily_target_count: int
+    daily_completed_count: int
+    created_at: datetime = field(default_factory=datetime.now)
+
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> "MissionCompletionRecord":
+        """mission_completion_history 행 → 레코드 (날짜는 ISO 문자열로 저장됨)"""
+        return cls(row["completion_id"], row["mission_id"], row["member_serial_number"],
+                   date.fromisoformat(row["completion_date"]), row["daily_target_count"],
+                   row["daily_completed_count"], datetime.fromisoformat(row["created_at"]))
+
+
+@dataclass(slots=True)
+class ChatMessageRecord(_Record):
+    """채팅 메시지 (ChatMessage)"""
+    message_id: int
+    member_serial_number: int
+    message_type: MessageType
+    message_content: str
+    response_content: Optional[str] = None
+    created_at: datetime = field(default_factory=datetime.now)
+
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> "ChatMessageRecord":
+        """chat_message 행 → 레코드"""
+        return cls(row["message_id"], row["member_serial_number"], MessageType(row["message_type"]),
+                   row["message_content"], row["response_content"], datetime.fromisoformat(row["created_at"]))
+
+    def as_json(self) -> Dict[str, Any]:
+        """JSON 으로 바로 쓸 수 있는 dict (ChatMessage.model_dump(mode="json") 과 같은 형태)"""
+        return {
+            "message_id": self.message_id,
+            "member_serial_number": self.member_serial_number,
+            "message_type": self.message_type.value,
+            "message_content": self.message_content,
+            "response_content": self.response_content,
+            "created_at": self.created_at.isoformat(),
+        }
+
+
+@dataclass(slots=True)
+class EventRecord(_Record):
+    """이벤트 (EventStore)"""
+    event_id: int
+    aggregate_id: str
+    event_type: EventType
+    event_data: str
+    member_serial_number: Optional[int] = None
+    service_name: str = ""
+    created_at: datetime = field(default_factory=datetime.now)
+
+
+_bind(CheckupRecord, HealthCheckup)
+_bind(MissionCompletionRecord, MissionCompletionHistory)
+_bind(ChatMessageRecord, ChatMessage)
+_bind(EventRecord, EventStore)
@@ -0,0 +1,217 @@
+"""
+HealthSync AI 차트 데이터 서비스
+
+지표별 시계열을 일/주/월/년 해상도로 미리 집계해 두고,
+요청 시 해당 해상도의 집계값을 기간으로 잘라 LTTB 로 점 개수 예산에 맞춰 반환합니다.
+- 건강검진: 회원별 검진 이력(컬럼형 저장소)에서 최초 조회 시 한 번 집계
+- 미션: 미션 통계 집계(일별 목표/완료)에서 집계, 기록이 바뀐 미션만 다시 집계
+건강검진 이력 응답(HealthHistoryResponse)도 같은 회원 이력으로 여기서 만듭니다.
+"""
+import threading
+from datetime import date
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.core.checkup_store import CheckupColumnStore, ColumnBatch
+from app.models.common import ChartResolution
+from app.models.health import HealthHistoryResponse
+from app.services.base_service import BaseService
+from app.utils.downsample import lttb_indices
+
+if TYPE_CHECKING:
+    from app.services.mission_stats_service import MissionAggregate
+
+HEALTH_CHART_METRICS: Tuple[str, ...] = (
+    "weight", "bmi", "waist_circumference", "systolic_bp", "diastolic_bp", "fasting_glucose",
+    "total_cholesterol", "triglyceride", "hdl_cholesterol", "ldl_cholesterol", "hemoglobin",
+    "serum_creatinine", "ast", "alt", "gamma_gtp",
+)
+OVERALL_MISSION_METRIC = "overall"
+
+
+def bucket_start(days: np.ndarray, resolution: ChartResolution) -> np.ndarray:
+    """날짜(datetime64[D]) → 해당 해상도 버킷의 시작일 (주는 월요일 시작)"""
+    days = days.astype("datetime64[D]")
+    if resolution == ChartResolution.DAY:
+        return days
+    if resolution == ChartResolution.WEEK:
+        # 1970-01-01 은 목요일 → 월요일까지 3일 보정
+        offset = days.astype(np.int64)
+        return (offset - (offset + 3) % 7).astype("datetime64[D]")
+    unit = "datetime64[M]" if resolution == ChartResolution.MONTH else "datetime64[Y]"
+    return days.astype(unit).astype("datetime64[D]")
+
+
+def _aggregate(keys: np.ndarray, values: np.ndarray, weights: np.ndarray):
+    """정렬된 키별 가중 평균 → (키, 값, 가중치 합)"""
+    if len(keys) == 0:
+        return keys, values, weights
+    starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+    weight_sum = np.add.reduceat(weights, starts)
+    value_sum = np.add.reduceat(values * weights, starts)
+    return keys[starts], value_sum / weight_sum, weight_sum
+
+
+class MetricSeries:
+    """지표 하나의 해상도별 사전 집계 시계열 (버킷 값 = 가중 평균)"""
+
+    __slots__ = ("levels",)
+
+    def __init__(self, days: np.ndarray, values: np.ndarray, weights: Optional[np.ndarray] = None):
+        days = np.asarray(days, dtype="datetime64[D]")
+        values = np.asarray(values, dtype=np.float64)
+        weights = np.ones(len(values)) if weights is None else np.asarray(weights, dtype=np.float64)
+        keep = ~np.isnan(values) & (weights > 0)
+        order = np.argsort(days[keep], kind="stable")
+        days, values, weights = days[keep][order], values[keep][order], weights[keep][order]
+        self.levels: Dict[ChartResolution, Tuple[np.ndarray, np.ndarray]] = {}
+        for resolution in ChartResolution:
+            keys, level_values, _ = _aggregate(bucket_start(days, resolution), values, weights)
+            self.levels[resolution] = (keys, level_values)
+
+    def query(self, resolution: ChartResolution, start: Optional[date] = None, end: Optional[date] = None,
+              max_points: int = 200) -> Dict[str, object]:
+        """해상도별 집계값을 기간으로 자른 뒤 max_points 이하로 다운샘플링"""
+        keys, values = self.levels[resolution]
+        lo = 0 if start is None else np.searchsorted(keys, bucket_start(np.array([start], dtype="datetime64[D]"), resolution)[0])
+        hi = len(keys) if end is None else np.searchsorted(keys, np.datetime64(end, "D"), side="right")
+        keys, values = keys[lo:hi], values[lo:hi]
+        index = lttb_indices(keys.astype(np.int64), values, max_points)
+        return {
+            "x": np.datetime_as_string(keys[index]).tolist(),
+            "y": np.round(values[index], 2).tolist(),
+            "source_points": int(len(keys)),
+        }
+
+
+class ChartService(BaseService):
+    """차트 시계열 사전 집계 및 조회 서비스"""
+
+    def __init__(self, store: Optional[CheckupColumnStore] = None):
+        super().__init__()
+        self._store = store
+        self._lock = threading.Lock()
+        self._health: Dict[int, Dict[str, MetricSeries]] = {}
+        self._missions: Dict[Tuple[int, int], Tuple[int, MetricSeries]] = {}
+        self._mission_totals: Dict[int, Tuple[tuple, MetricSeries]] = {}
+
+    @property
+    def store(self) -> CheckupColumnStore:
+        """가공 건강검진 컬럼형 저장소 (첫 조회 시 열기)"""
+        if self._store is None:
+            self._store = CheckupColumnStore.for_checkups(self.settings.checkup_store_dir)
+        return self._store
+
+    def _max_points(self, max_points: Optional[int]) -> int:
+        return min(max(max_points or self.settings.chart_max_points, 2), self.settings.chart_point_limit)
+
+    @staticmethod
+    def _render(series: Dict[str, MetricSeries], resolution: ChartResolution, start: Optional[date],
+                end: Optional[date], max_points: int) -> Dict[str, object]:
+        return {
+            "resolution": resolution.value,
+            "max_points": max_points,
+            "series": {name: s.query(resolution, start, end, max_points) for name, s in series.items()},
+        }
+
+    # 건강검진 ----------------------------------------------------------------
+    def index_checkups(self, batch: ColumnBatch, metrics: Sequence[str] = HEALTH_CHART_METRICS):
+        """검진 배치(회원 전체 이력)를 회원 × 지표 시계열로 집계. 검진일은 기준 년도 1월 1일로 봄"""
+        if len(batch) == 0:
+            return
+        batch = batch.take(batch.sort_order())
+        members = np.asarray(batch.column("member_serial_number"))
+        days = (np.asarray(batch.column("reference_year")) - 1970).astype("datetime64[Y]").astype("datetime64[D]")
+        columns = {metric: batch.as_float(metric) for metric in metrics if metric in batch.schema}
+        starts = np.flatnonzero(np.concatenate(([True], members[1:] != members[:-1])))
+        ends = np.append(starts[1:], len(members))
+        indexed = {
+            int(members[lo]): {metric: MetricSeries(days[lo:hi], values[lo:hi]) for metric, values in columns.items()}
+            for lo, hi in zip(starts, ends)
+        }
+        with self._lock:
+            self._health.update(indexed)
+
+    def invalidate_members(self, member_serial_numbers: Iterable[int]):
+        """검진 데이터가 바뀐 회원의 집계 제거 (다음 조회 시 다시 집계)"""
+        with self._lock:
+            for member in member_serial_numbers:
+                self._health.pop(int(member), None)
+
+    def health_chart_data(self, member_serial_number: int, metrics: Optional[Sequence[str]] = None,
+                          resolution: ChartResolution = ChartResolution.YEAR, start: Optional[date] = None,
+                          end: Optional[date] = None, max_points: Optional[int] = None) -> Dict[str, object]:
+        """HealthHistoryResponse.chart_data 생성"""
+        series = self._health.get(member_serial_number)
+        if series is None:
+            self.index_checkups(self.store.history(member_serial_number))
+            series = self._health.setdefault(member_serial_number, {})
+        if metrics is not None:
+            unknown = [m for m in metrics if m not in HEALTH_CHART_METRICS]
+            if unknown:
+                raise ValueError(f"지원하지 않는 차트 지표입니다: {', '.join(unknown)}")
+            series = {m: series[m] for m in metrics if m in series}
+        return self._render(series, resolution, start, end, self._max_points(max_points))
+
+    def build_health_history_response(self, member_serial_number: int, metrics: Optional[Sequence[str]] = None,
+                                      resolution: ChartResolution = ChartResolution.YEAR,
+                                      start: Optional[date] = None, end: Optional[date] = None,
+                                      max_points: Optional[int] = None) -> HealthHistoryResponse:
+        """회원 검진 이력 + 차트 응답 생성 (검진 기록은 기간에 걸친 기준 년도만)"""
+        history = self.store.history(member_serial_number)
+        if len(history) == 0:
+            raise LookupError("건강검진 기록이 없습니다.")
+        if member_serial_number not in self._health:
+            self.index_checkups(history)
+        years = np.asarray(history.column("reference_year"))
+        keep = np.ones(len(years), dtype=bool)
+        if start is not None:
+            keep &= years >= start.year
+        if end is not None:
+            keep &= years <= end.year
+        checkups = history.take(np.flatnonzero(keep)).to_models()
+        return HealthHistoryResponse(
+            user_info={
+                "member_serial_number": member_serial_number,
+                "checkup_count": len(history),
+                "reference_years": years.tolist(),
+            },
+            checkup_records=[checkup.model_dump() for checkup in checkups],
+            chart_data=self.health_chart_data(member_serial_number, metrics, resolution, start, end, max_points),
+        )
+
+    # 미션 --------------------------------------------------------------------
+    @staticmethod
+    def _mission_arrays(aggregate: "MissionAggregate"):
+        target = np.frombuffer(aggregate.daily_target, dtype=np.int32).astype(np.float64)
+        completed = np.minimum(np.frombuffer(aggregate.daily_completed, dtype=np.int32), target)
+        days = np.datetime64(aggregate.origin, "D") + np.arange(len(target))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rate = completed / target * 100
+        return days, rate, target
+
+    def _mission_series(self, member_serial_number: int, aggregate: "MissionAggregate") -> MetricSeries:
+        key = (member_serial_number, aggregate.mission_id)
+        cached = self._missions.get(key)
+        if cached is not None and cached[0] == aggregate.version:
+            return cached[1]
+        series = MetricSeries(*self._mission_arrays(aggregate))
+        self._missions[key] = (aggregate.version, series)
+        return series
+
+    def mission_chart_data(self, member_serial_number: int, aggregates: Dict[int, "MissionAggregate"],
+                           resolution: ChartResolution = ChartResolution.DAY, start: Optional[date] = None,
+                           end: Optional[date] = None, max_points: Optional[int] = None) -> Dict[str, object]:
+        """MissionHistoryResponse.chart_data 생성 (달성률 %, 버킷 값은 목표 횟수 가중)"""
+        with self._lock:
+            series = {f"mission_{mission_id}": self._mission_series(member_serial_number, aggregate)
+                      for mission_id, aggregate in sorted(aggregates.items())}
+            if aggregates:
+                versions = tuple((m, a.version) for m, a in sorted(aggregates.items()))
+                cached = self._mission_totals.get(member_serial_number)
+                if cached is None or cached[0] != versions:
+                    parts = [self._mission_arrays(a) for a in aggregates.values()]
+                    cached = self._mission_totals[member_serial_number] = (versions, MetricSeries(*(np.concatenate(p) for p in zip(*parts))))
+                series[OVERALL_MISSION_METRIC] = cached[1]
+        return self._render(series, resolution, start, end, self._max_points(max_points))
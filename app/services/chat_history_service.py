@@ -0,0 +1,121 @@
+"""
+HealthSync AI 채팅 이력 서비스
+
+세션별 최근 메시지(chat_history_window 개)와 전체 메시지 수를 세션 캐시에 보관하여
+대화 턴마다 저장소를 읽지 않도록 합니다.
+- 쓰기: 세션 잠금 안에서 저장소에 먼저 기록(write-through)한 뒤 캐시된 이력에 이어 붙이고 TTL 을 연장
+- 읽기: 캐시 미스일 때만 저장소 조회, 같은 세션의 동시 미스는 한 번만 조회
+"""
+import asyncio
+import json
+import weakref
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Optional, Union
+
+from app.core.pagination import PageParams
+from app.core.repositories import ChatMessageRepository
+from app.models.common import CursorPage
+from app.models.intelligence import ChatHistoryResponse, ChatMessage
+from app.models.records import ChatMessageRecord
+from app.services.base_service import BaseService
+
+
+class ChatHistoryService(BaseService):
+    """채팅 세션 이력 캐시 서비스"""
+
+    def __init__(self, repository: ChatMessageRepository, cache: Any, window: Optional[int] = None):
+        super().__init__()
+        self.repository = repository
+        self.cache = cache
+        self.window = window or self.settings.chat_history_window
+        self._session_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+    def _session_lock(self, session_id: str) -> asyncio.Lock:
+        lock = self._session_locks.get(session_id)
+        if lock is None:
+            lock = self._session_locks[session_id] = asyncio.Lock()
+        return lock
+
+    async def _cache_call(self, fn: Callable, *args):
+        """원격 캐시(redis)는 네트워크 I/O 이므로 스레드에서 호출"""
+        if self.cache.backend_name == "redis":
+            return await asyncio.to_thread(fn, *args)
+        return fn(*args)
+
+    @staticmethod
+    def _encode(entry: Dict[str, Any]) -> bytes:
+        return json.dumps(entry, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    @staticmethod
+    def _decode(value: bytes) -> Dict[str, Any]:
+        return json.loads(value)
+
+    async def _load(self, session_id: str) -> Dict[str, Any]:
+        """캐시된 세션 이력, 없으면 저장소에서 읽어 캐시"""
+        value = await self._cache_call(self.cache.get, session_id)
+        if value is not None:
+            return self._decode(value)
+        lock = self._session_lock(session_id)
+        contended = lock.locked()
+        async with lock:
+            if contended:
+                # 대기하는 동안 먼저 들어간 태스크가 채웠을 수 있음
+                value = await self._cache_call(self.cache.get, session_id)
+                if value is not None:
+                    return self._decode(value)
+            messages = await self.repository.list_recent(session_id, self.window)
+            entry = {
+                "total": await self.repository.count(session_id),
+                "messages": [m.as_json() for m in messages],
+            }
+            await self._cache_call(self.cache.set, session_id, self._encode(entry))
+            return entry
+
+    async def get_history(self, session_id: str, limit: Optional[int] = None) -> ChatHistoryResponse:
+        """세션 최근 이력 조회 (limit 이 캐시 창보다 크면 저장소에서 직접 조회)"""
+        limit = limit or self.window
+        if limit > self.window:
+            messages = [m.as_json() for m in await self.repository.list_recent(session_id, limit)]
+            total = await self.repository.count(session_id)
+            expiration = None
+        else:
+            entry = await self._load(session_id)
+            messages, total = entry["messages"][-limit:], entry["total"]
+            remaining = await self._cache_call(self.cache.ttl, session_id)
+            expiration = (datetime.now() + timedelta(seconds=remaining)).isoformat() if remaining else None
+        return ChatHistoryResponse(session_id=session_id, messages=messages,
+                                   total_message_count=total, cache_expiration=expiration)
+
+    async def get_page(self, session_id: str, params: PageParams) -> CursorPage:
+        """세션 전체 이력 커서 페이지 (최신순). 전체 수는 캐시에 있을 때만 추정치로 제공 (COUNT 조회 없음)"""
+        scope = f"chat:{session_id}"
+        after = params.after(scope)
+        rows = await self.repository.page_by_session(session_id, after[0] if after else None, params.fetch_size)
+        value = await self._cache_call(self.cache.get, session_id)
+        total = self._decode(value)["total"] if value is not None else None
+        return params.page([m.to_model() for m in rows], scope, lambda m: (m.message_id,), total)
+
+    async def append(self, session_id: str, message: Union[ChatMessage, ChatMessageRecord]) -> ChatMessageRecord:
+        """메시지 기록 (저장소 write-through 후 캐시 갱신). 발급된 message_id 가 담긴 레코드 반환"""
+        if isinstance(message, ChatMessage):
+            message = ChatMessageRecord.from_model(message)
+        # 기록부터 캐시 갱신까지 세션 잠금을 유지 (그 사이 캐시 미스 조회가 새 행을 읽어 두 번 반영되지 않도록)
+        async with self._session_lock(session_id):
+            message_id = await self.repository.add(session_id, message)
+            saved = message.replace(message_id=message_id)
+            value = await self._cache_call(self.cache.get, session_id)
+            if value is not None:
+                entry = self._decode(value)
+                # 다른 프로세스가 같은 원격 캐시를 채운 경우 이미 들어 있을 수 있음
+                if all(m["message_id"] != message_id for m in entry["messages"]):
+                    entry["messages"] = (entry["messages"] + [saved.as_json()])[-self.window:]
+                    entry["total"] += 1
+                    await self._cache_call(self.cache.set, session_id, self._encode(entry))
+        return saved
+
+    async def invalidate(self, session_id: str):
+        await self._cache_call(self.cache.delete, session_id)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return self.cache.stats
@@ -0,0 +1,141 @@
+"""
+HealthSync AI 건강검진 일괄 변환 서비스 (HealthCheckupRaw → HealthCheckup)
+"""
+import time
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+import numpy as np
+
+from app.core.checkup_store import CHECKUP_SCHEMA, RAW_SCHEMA, CheckupColumnStore, ColumnBatch, encode_value
+from app.models.health import CheckupPipelineStats
+from app.services.base_service import BaseService
+from app.utils.checkup_csv import iter_csv_batches
+
+# 원본 배치 → 회원 일련번호 배열 (미확인은 -1)
+MemberResolver = Callable[[ColumnBatch], np.ndarray]
+
+UNRESOLVED_MEMBER = -1
+
+# 0 이하 값을 측정 누락으로 보고 null 처리하는 검사 항목
+_POSITIVE_MEASUREMENTS = (
+    "systolic_bp", "diastolic_bp", "fasting_glucose", "total_cholesterol", "triglyceride",
+    "hdl_cholesterol", "ldl_cholesterol", "hemoglobin", "serum_creatinine", "ast", "alt", "gamma_gtp",
+)
+
+
+class MappingMemberResolver:
+    """raw_id → 회원 일련번호 매핑 기반 회원 확인 (정렬 배열 + searchsorted)"""
+
+    def __init__(self, mapping: Dict[int, int]):
+        raw_ids = np.fromiter(mapping.keys(), dtype=np.int64, count=len(mapping))
+        members = np.fromiter(mapping.values(), dtype=np.int64, count=len(mapping))
+        order = np.argsort(raw_ids)
+        self._raw_ids = raw_ids[order]
+        self._members = members[order]
+
+    @classmethod
+    def from_csv(cls, path: str) -> "MappingMemberResolver":
+        """raw_id,member_serial_number 두 컬럼 CSV 로부터 생성"""
+        data = np.loadtxt(path, delimiter=",", skiprows=1, dtype=np.int64, ndmin=2)
+        return cls(dict(zip(data[:, 0].tolist(), data[:, 1].tolist())))
+
+    def __call__(self, raw: ColumnBatch) -> np.ndarray:
+        raw_ids = np.asarray(raw.column("raw_id"), dtype=np.int64)
+        result = np.full(len(raw_ids), UNRESOLVED_MEMBER, dtype=np.int64)
+        if len(self._raw_ids) == 0:
+            return result
+        positions = np.clip(np.searchsorted(self._raw_ids, raw_ids), 0, len(self._raw_ids) - 1)
+        found = self._raw_ids[positions] == raw_ids
+        result[found] = self._members[positions[found]]
+        return result
+
+
+def compute_bmi_fixed(height_cm: np.ndarray, weight_kg: np.ndarray, scale: int) -> Tuple[np.ndarray, np.ndarray]:
+    """BMI(kg/m²) 고정소수점 배열과 유효 마스크 계산 (정수 연산, 반올림)"""
+    height = np.asarray(height_cm, dtype=np.int64)
+    weight = np.asarray(weight_kg, dtype=np.int64)
+    valid = (height > 0) & (weight > 0)
+    h2 = np.where(valid, height * height, 1)
+    numerator = weight * 10_000 * scale
+    bmi = (2 * numerator + h2) // (2 * h2)
+    return np.where(valid, bmi, 0), valid
+
+
+class CheckupPipelineService(BaseService):
+    """원본 건강검진 추출본을 청크 단위 벡터 연산으로 처리하여 컬럼형 저장소에 기록"""
+
+    def __init__(self, store: Optional[CheckupColumnStore] = None, resolver: Optional[MemberResolver] = None,
+                 chunk_size: Optional[int] = None):
+        super().__init__()
+        self.store = store if store is not None else CheckupColumnStore.for_checkups(self.settings.checkup_store_dir)
+        self.resolver = resolver if resolver is not None else MappingMemberResolver({})
+        self.chunk_size = chunk_size or self.settings.pipeline_chunk_size
+        self._next_checkup_id = self._max_checkup_id() + 1
+
+    def _max_checkup_id(self) -> int:
+        ids = [int(np.max(batch.column("checkup_id"))) for batch in self.store.scan() if len(batch)]
+        return max(ids, default=0)
+
+    def transform(self, raw: ColumnBatch, processed_at: Optional[datetime] = None) -> Tuple[ColumnBatch, int]:
+        """원본 배치 하나를 처리 배치로 변환. (처리 배치, 제외 행 수) 반환"""
+        if raw.schema is not RAW_SCHEMA:
+            raise ValueError("HealthCheckupRaw 배치만 변환할 수 있습니다.")
+        members = np.asarray(self.resolver(raw), dtype=np.int64)
+        keep = np.flatnonzero(members != UNRESOLVED_MEMBER)
+        skipped = len(raw) - len(keep)
+        if skipped:
+            raw = raw.take(keep)
+            members = members[keep]
+
+        n = len(raw)
+        now = encode_value(CHECKUP_SCHEMA["processed_at"], processed_at or datetime.now())
+        arrays: Dict[str, np.ndarray] = {
+            "checkup_id": np.arange(self._next_checkup_id, self._next_checkup_id + n, dtype=np.int64),
+            "member_serial_number": members,
+            "processed_at": np.full(n, now, dtype=np.int64),
+            "created_at": np.full(n, now, dtype=np.int64),
+        }
+        masks: Dict[str, np.ndarray] = {}
+        for spec in CHECKUP_SCHEMA.columns:
+            if spec.name in arrays or spec.name not in RAW_SCHEMA:
+                continue
+            values = np.asarray(raw.column(spec.name))
+            arrays[spec.name] = values
+            if spec.nullable:
+                mask = raw.valid(spec.name)
+                if spec.name in _POSITIVE_MEASUREMENTS:
+                    mask &= values > 0
+                masks[spec.name] = mask
+
+        bmi_spec = CHECKUP_SCHEMA["bmi"]
+        arrays["bmi"], masks["bmi"] = compute_bmi_fixed(arrays["height"], arrays["weight"], bmi_spec.scale)
+
+        self._next_checkup_id += n
+        return ColumnBatch.from_arrays(CHECKUP_SCHEMA, arrays, masks), skipped
+
+    def run_batches(self, batches: Iterable[ColumnBatch],
+                    on_chunk: Optional[Callable[[CheckupPipelineStats], None]] = None) -> CheckupPipelineStats:
+        """원본 배치 스트림 처리. 청크마다 저장소에 세그먼트로 기록"""
+        stats = CheckupPipelineStats()
+        started = time.perf_counter()
+        for raw in batches:
+            processed, skipped = self.transform(raw)
+            self.store.append(processed)
+            stats.rows_read += len(processed) + skipped
+            stats.rows_written += len(processed)
+            stats.rows_skipped += skipped
+            stats.chunks += 1
+            stats.elapsed_seconds = time.perf_counter() - started
+            stats.rows_per_second = stats.rows_read / stats.elapsed_seconds if stats.elapsed_seconds else 0.0
+            if on_chunk:
+                on_chunk(stats)
+        stats.elapsed_seconds = time.perf_counter() - started
+        stats.rows_per_second = stats.rows_read / stats.elapsed_seconds if stats.elapsed_seconds else 0.0
+        self.log_operation("checkup_pipeline", **stats.model_dump())
+        return stats
+
+    def run_file(self, path: str, encoding: str = "utf-8-sig",
+                 on_chunk: Optional[Callable[[CheckupPipelineStats], None]] = None) -> CheckupPipelineStats:
+        """원본 CSV 추출본 파일 처리"""
+        return self.run_batches(iter_csv_batches(path, self.chunk_size, RAW_SCHEMA, encoding), on_chunk)
@@ -0,0 +1,236 @@
+"""
+HealthSync AI 건강검진 파일 스트리밍 업로드 서비스
+
+요청 본문(raw chunked 또는 multipart/form-data)을 청크 단위로 받아
+- 고정 크기 버퍼를 거쳐 디스크에 스풀하고
+- 동시에 CSV 레코드를 증분 해석하여 원본 컬럼형 저장소에 세그먼트로 기록(stage)하고
+- 파일 끝까지 성공하면 manifest 에 한 번에 반영(commit), 실패하면 기록한 세그먼트를 지웁니다.
+스풀 파일은 수신 중에만 유지하고 commit / 실패 후 삭제합니다 (원본은 저장소 세그먼트에 남음).
+파일 크기와 무관하게 업로드 1건당 메모리 사용량은 버퍼 + 파싱 청크 크기로 제한됩니다.
+완료 / 실패한 업로드 상태는 upload_retention_seconds 동안만 보관합니다.
+"""
+import asyncio
+import os
+import uuid
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Callable, Dict, List, Optional, Set
+
+from multipart.multipart import MultipartParser, parse_options_header
+
+from app.core.checkup_store import CheckupColumnStore, ColumnBatch
+from app.models.health import CheckupUploadProgress, UploadStatus
+from app.services.base_service import BaseService
+from app.utils.checkup_csv import CheckupCsvParser
+
+SUPPORTED_FILE_TYPES = ("csv", "text/csv")
+
+# 저장된 원본 배치를 받는 후속 처리 (코호트 스케치 갱신 등, 업로드 commit 후 업로드 스레드에서 호출)
+BatchListener = Callable[[ColumnBatch], None]
+
+
+class _UploadSink:
+    """업로드 1건의 수신 처리 (버퍼 → 디스크 스풀, 증분 파싱 → 저장소)"""
+
+    def __init__(self, progress: CheckupUploadProgress, spool_path: str, store: CheckupColumnStore,
+                 buffer_bytes: int, chunk_rows: int, max_bytes: int, listeners: List[BatchListener] = ()):
+        self.progress = progress
+        self.spool_path = spool_path
+        self.store = store
+        self.listeners = listeners
+        self.buffer_bytes = buffer_bytes
+        self.max_bytes = max_bytes
+        self.parser = CheckupCsvParser(chunk_rows)
+        self.staged = []
+        self._buffer = bytearray()
+        self._file = open(spool_path, "wb")
+
+    def write(self, data: bytes):
+        """청크 하나 처리 (스레드풀에서 실행)"""
+        if self.progress.bytes_received + len(data) > self.max_bytes:
+            raise ValueError(f"업로드 가능한 최대 크기({self.max_bytes:,} bytes)를 초과했습니다.")
+        self.progress.bytes_received += len(data)
+        self._buffer += data
+        if len(self._buffer) >= self.buffer_bytes:
+            self._flush_buffer()
+        self._store(self.parser.feed(data))
+
+    def finish(self):
+        self._flush_buffer()
+        self._store(self.parser.close())
+        self._file.close()
+        self.store.commit(self.staged)
+        # commit 이후에는 실패해도 abort 가 반영된 세그먼트를 지우지 않도록 비움
+        committed, self.staged = self.staged, []
+        self._remove_spool()
+        for segment in committed:
+            if segment is not None:
+                for listener in self.listeners:
+                    listener(segment.batch)
+
+    def abort(self):
+        self._file.close()
+        self.store.discard(self.staged)
+        self.staged = []
+        self._remove_spool()
+
+    def _remove_spool(self):
+        if os.path.exists(self.spool_path):
+            os.remove(self.spool_path)
+
+    def _flush_buffer(self):
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._buffer.clear()
+
+    def _store(self, batches):
+        for batch in batches:
+            self.staged.append(self.store.stage(batch))
+            self.progress.records_parsed += len(batch)
+
+
+class _MultipartFileReader:
+    """multipart 본문에서 첫 번째 파일 파트의 데이터만 골라냄"""
+
+    def __init__(self, boundary: bytes):
+        self.pending: List[bytes] = []
+        self.found = False
+        self._in_file = False
+        self._done = False
+        self._header_field = b""
+        self._header_value = b""
+        self._headers: Dict[bytes, bytes] = {}
+        self.parser = MultipartParser(boundary, {
+            "on_part_begin": self._on_part_begin,
+            "on_part_data": self._on_part_data,
+            "on_part_end": self._on_part_end,
+            "on_header_field": self._on_header_field,
+            "on_header_value": self._on_header_value,
+            "on_header_end": self._on_header_end,
+            "on_headers_finished": self._on_headers_finished,
+        })
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        self.parser.write(chunk)
+        pending, self.pending = self.pending, []
+        return pending
+
+    def _on_part_begin(self):
+        self._headers = {}
+
+    def _on_header_field(self, data: bytes, start: int, end: int):
+        self._header_field += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int):
+        self._header_value += data[start:end]
+
+    def _on_header_end(self):
+        self._headers[self._header_field.lower()] = self._header_value
+        self._header_field = b""
+        self._header_value = b""
+
+    def _on_headers_finished(self):
+        _, options = parse_options_header(self._headers.get(b"content-disposition", b""))
+        self._in_file = not self._done and b"filename" in options
+        self.found = self.found or self._in_file
+
+    def _on_part_data(self, data: bytes, start: int, end: int):
+        if self._in_file:
+            self.pending.append(data[start:end])
+
+    def _on_part_end(self):
+        if self._in_file:
+            self._done = True
+        self._in_file = False
+
+
+class CheckupUploadService(BaseService):
+    """건강검진 파일 업로드 관리 서비스"""
+
+    def __init__(self, store: Optional[CheckupColumnStore] = None, upload_dir: Optional[str] = None,
+                 batch_listeners: List[BatchListener] = ()):
+        super().__init__()
+        self._store = store
+        self.upload_dir = upload_dir or self.settings.upload_dir
+        self.batch_listeners = list(batch_listeners)
+        self._uploads: Dict[str, CheckupUploadProgress] = {}
+        self._receiving: Set[str] = set()
+        self.retention = timedelta(seconds=self.settings.upload_retention_seconds)
+
+    @property
+    def store(self) -> CheckupColumnStore:
+        """원본 컬럼형 저장소 (첫 업로드 시 열기)"""
+        if self._store is None:
+            self._store = CheckupColumnStore.for_raw(self.settings.raw_checkup_store_dir)
+        return self._store
+
+    def create_upload(self, user_id: str, file_name: str, file_type: str) -> CheckupUploadProgress:
+        """업로드 생성 (file_id 발급)"""
+        if file_type.lower() not in SUPPORTED_FILE_TYPES:
+            raise ValueError(f"지원하지 않는 파일 형식입니다: {file_type}")
+        self._evict_expired()
+        progress = CheckupUploadProgress(file_id=uuid.uuid4().hex, user_id=user_id,
+                                         file_name=file_name, file_type=file_type)
+        self._uploads[progress.file_id] = progress
+        self.log_operation("create_upload", user_id=user_id, file_id=progress.file_id)
+        return progress
+
+    def _evict_expired(self):
+        """보관 기간이 지난 완료 / 실패 업로드와 본문이 오지 않은 업로드 상태 제거 (수신 중인 업로드는 유지)"""
+        cutoff = datetime.now() - self.retention
+        expired = [file_id for file_id, progress in self._uploads.items()
+                   if file_id not in self._receiving and (progress.completed_at or progress.started_at) < cutoff]
+        for file_id in expired:
+            del self._uploads[file_id]
+
+    def get_progress(self, file_id: str, user_id: str) -> CheckupUploadProgress:
+        """업로드 진행 상태 조회"""
+        progress = self._uploads.get(file_id)
+        if progress is None or progress.user_id != user_id:
+            raise LookupError(f"업로드를 찾을 수 없습니다: {file_id}")
+        return progress
+
+    async def receive(self, file_id: str, user_id: str, stream: AsyncIterator[bytes],
+                      content_type: str = "") -> CheckupUploadProgress:
+        """요청 본문 스트림 수신. multipart 이면 첫 번째 파일 파트만 처리"""
+        progress = self.get_progress(file_id, user_id)
+        if progress.status != UploadStatus.PENDING or file_id in self._receiving:
+            raise ValueError("이미 수신 중이거나 완료된 업로드입니다.")
+
+        reader = None
+        media_type, options = parse_options_header(content_type)
+        if media_type == b"multipart/form-data":
+            if b"boundary" not in options:
+                raise ValueError("multipart 경계(boundary)가 없습니다.")
+            reader = _MultipartFileReader(options[b"boundary"])
+
+        self._receiving.add(file_id)
+        sink = None
+        try:
+            # 스풀 디렉터리 / 파일 생성 실패(ENOSPC, EACCES 등)도 실패로 기록하고 수신 중 표시를 해제
+            os.makedirs(self.upload_dir, exist_ok=True)
+            sink = _UploadSink(progress, os.path.join(self.upload_dir, f"{file_id}.csv"), self.store,
+                               self.settings.upload_buffer_bytes, self.settings.upload_parse_chunk_rows,
+                               self.settings.upload_max_bytes, self.batch_listeners)
+            async for chunk in stream:
+                for data in (reader.feed(chunk) if reader else (chunk,)):
+                    if data:
+                        await asyncio.to_thread(sink.write, data)
+            if reader is not None and not reader.found:
+                raise ValueError("multipart 본문에 파일 파트가 없습니다.")
+            await asyncio.to_thread(sink.finish)
+        except BaseException as e:
+            # 연결 끊김 / 요청 취소도 실패로 처리하고 stage 한 세그먼트 삭제
+            if sink is not None:
+                await asyncio.to_thread(sink.abort)
+            progress.status = UploadStatus.FAILED
+            progress.error = str(e) or "업로드가 중단되었습니다."
+            progress.completed_at = datetime.now()
+            raise
+        finally:
+            self._receiving.discard(file_id)
+
+        progress.status = UploadStatus.SUCCESS
+        progress.completed_at = datetime.now()
+        self.log_operation("receive_upload", user_id=user_id, file_id=file_id,
+                           bytes_received=progress.bytes_received, records_parsed=progress.records_parsed)
+        return progress
@@ -0,0 +1,236 @@
+"""
+HealthSync AI 코호트 백분위 서비스
+
+(나이대, 성별, 지역) 코호트 × 검사 항목별 KLL 분위수 스케치를 유지합니다.
+- 구축: 원본 검진 컬럼형 저장소를 한 번 스캔하며 배치 단위로 코호트를 나눠 스케치에 추가
+- 갱신: 새 검진 배치가 들어오면 같은 방식으로 해당 코호트 스케치에만 추가
+- 조회: 스케치의 정렬 뷰에서 searchsorted 한 번 (모집단 정렬 없음)
+- 갱신(업로드 스레드)과 조회(이벤트 루프)는 같은 잠금으로 보호, 저장 파일은 비동기 핸들러에서 스레드로 불러옴
+- 지역 코호트 표본이 적으면 (나이대, 성별) 전국 코호트로 대체
+"""
+import asyncio
+import os
+import struct
+import threading
+from typing import Dict, Iterable, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.core.checkup_store import RAW_SCHEMA, CheckupColumnStore, ColumnBatch
+from app.models.health import HealthCheckupRaw
+from app.services.base_service import BaseService
+from app.utils.quantile_sketch import KLLSketch
+
+COHORT_METRICS: Tuple[str, ...] = (
+    "systolic_bp", "diastolic_bp", "fasting_glucose", "total_cholesterol", "ldl_cholesterol",
+    "hdl_cholesterol", "triglyceride", "weight", "waist_circumference", "hemoglobin",
+    "ast", "alt", "gamma_gtp",
+)
+# 지역 구분 없는 (나이대, 성별) 코호트
+ALL_REGIONS = -1
+
+# (나이대 시작, 성별 코드, 지역 코드)
+CohortKey = Tuple[int, int, int]
+
+_FILE_MAGIC = b"COH1"
+_FILE_HEADER = struct.Struct("<4sI")
+_ENTRY_HEADER = struct.Struct("<iiiHI")
+
+
+class CohortStatsService(BaseService):
+    """코호트별 검사 수치 분위수 스케치 관리"""
+
+    def __init__(self, band_years: Optional[int] = None, min_samples: Optional[int] = None,
+                 sketch_k: Optional[int] = None):
+        super().__init__()
+        self.band_years = band_years or self.settings.cohort_age_band_years
+        self.min_samples = self.settings.cohort_min_samples if min_samples is None else min_samples
+        self.sketch_k = sketch_k or self.settings.cohort_sketch_k
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._sketches: Dict[CohortKey, Dict[str, KLLSketch]] = {}
+        self._loaded = False
+        self._dirty = False
+
+    def _ensure_loaded(self):
+        """첫 사용 시 저장된 스케치 불러오기 (업로드 스레드와 요청이 동시에 와도 한 번만)"""
+        if self._loaded:
+            return
+        with self._load_lock:
+            if not self._loaded:
+                self.load()
+                self._loaded = True
+
+    async def ensure_loaded(self):
+        """저장된 스케치를 스레드에서 불러오기 (비동기 핸들러에서 조회 전에 호출, 파일 읽기로 이벤트 루프를 막지 않음)"""
+        if not self._loaded:
+            await asyncio.to_thread(self._ensure_loaded)
+
+    def age_band(self, age: int) -> int:
+        return age // self.band_years * self.band_years
+
+    def cohort_count(self) -> int:
+        with self._lock:
+            return len(self._sketches)
+
+    # 구축 / 갱신 ----------------------------------------------------------------
+    def ingest_batch(self, batch: ColumnBatch, metrics: Sequence[str] = COHORT_METRICS):
+        """원본 검진 배치를 코호트별로 나눠 스케치에 추가"""
+        if len(batch) == 0:
+            return
+        self._ensure_loaded()
+        bands = np.asarray(batch.column("age")) // self.band_years * self.band_years
+        genders = np.asarray(batch.column("gender_code"))
+        regions = np.asarray(batch.column("region_code"))
+        columns = {metric: batch.as_float(metric) for metric in metrics if metric in batch.schema}
+        # 지역 코호트와 전국 코호트를 같은 방식으로 분할
+        for region_values in (regions, np.full(len(batch), ALL_REGIONS)):
+            keys = np.stack((bands, genders, region_values), axis=1).astype(np.int64)
+            unique, inverse = np.unique(keys, axis=0, return_inverse=True)
+            inverse = inverse.reshape(-1)
+            order = np.argsort(inverse, kind="stable")
+            bounds = np.searchsorted(inverse[order], np.arange(len(unique) + 1))
+            with self._lock:
+                for group, key in enumerate(map(tuple, unique.tolist())):
+                    rows = order[bounds[group]:bounds[group + 1]]
+                    sketches = self._sketches.setdefault(key, {})
+                    for metric, values in columns.items():
+                        sketch = sketches.get(metric)
+                        if sketch is None:
+                            sketch = sketches[metric] = KLLSketch(self.sketch_k)
+                        sketch.update_many(values[rows])
+                self._dirty = True
+
+    def ingest_store(self, store: CheckupColumnStore, save: bool = True) -> int:
+        """원본 저장소 전체를 한 번 스캔하여 처음부터 다시 구축. 처리한 행 수 반환
+
+        저장된 스케치는 불러오지 않고 비움 (이미 반영된 행을 두 번 세지 않도록)
+        """
+        with self._load_lock, self._lock:
+            self._sketches = {}
+            self._loaded = True
+        rows = 0
+        for batch in store.scan():
+            self.ingest_batch(batch)
+            rows += len(batch)
+        if save:
+            self.save()
+        self.log_operation("ingest_cohort_store", rows=rows, cohorts=self.cohort_count())
+        return rows
+
+    def add_checkups(self, checkups: Iterable[HealthCheckupRaw]):
+        """개별 검진 추가"""
+        self.ingest_batch(ColumnBatch.from_models(RAW_SCHEMA, list(checkups)))
+
+    # 조회 --------------------------------------------------------------------
+    def sketch_for(self, age: int, gender_code: int, region_code: int, metric: str) -> Tuple[Optional[KLLSketch], str]:
+        """지역 코호트, 표본이 부족하면 전국 코호트 스케치 (반환된 스케치를 읽는 동안은 _lock 을 잡아야 함)"""
+        self._ensure_loaded()
+        with self._lock:
+            return self._find_sketch(age, gender_code, region_code, metric)
+
+    def _find_sketch(self, age: int, gender_code: int, region_code: int,
+                     metric: str) -> Tuple[Optional[KLLSketch], str]:
+        band = self.age_band(age)
+        for region, scope in ((region_code, "region"), (ALL_REGIONS, "national")):
+            sketch = self._sketches.get((band, gender_code, region), {}).get(metric)
+            if sketch is not None and sketch.count >= self.min_samples:
+                return sketch, scope
+        return None, "none"
+
+    def percentile(self, age: int, gender_code: int, region_code: int, metric: str, value: float) -> Dict[str, object]:
+        """value 가 코호트에서 몇 백분위인지 (value 이하 비율 %)"""
+        if metric not in COHORT_METRICS:
+            raise ValueError(f"코호트 비교를 지원하지 않는 항목입니다: {metric}")
+        self._ensure_loaded()
+        # 업로드 스레드가 같은 스케치를 갱신 중일 수 있으므로 조회와 순위 계산을 한 잠금 안에서
+        with self._lock:
+            sketch, scope = self._find_sketch(age, gender_code, region_code, metric)
+            percentile = round(sketch.rank(value) * 100, 1) if sketch is not None else None
+            median = sketch.quantile(0.5) if sketch is not None else None
+            size = sketch.count if sketch is not None else 0
+        band = self.age_band(age)
+        return {
+            "metric": metric,
+            "value": value,
+            "percentile": percentile,
+            "cohort_median": median,
+            "cohort_size": size,
+            "scope": scope,
+            "cohort": {"age_band": f"{band}-{band + self.band_years - 1}", "gender_code": gender_code,
+                       "region_code": region_code if scope == "region" else None},
+        }
+
+    def compare(self, checkup: HealthCheckupRaw, metrics: Sequence[str] = COHORT_METRICS) -> Dict[str, Dict[str, object]]:
+        """검진 결과의 항목별 코호트 백분위 (값이 없는 항목 제외)"""
+        values = checkup.model_dump()
+        return {metric: self.percentile(checkup.age, checkup.gender_code, checkup.region_code, metric,
+                                        float(values[metric]))
+                for metric in metrics if values.get(metric) is not None}
+
+    # 공유 메모리 (멀티 프로세스 서버) -----------------------------------------------
+    def export_arrays(self) -> Dict[str, np.ndarray]:
+        """코호트 / 항목별 스케치 배열 (이름: 나이대/성별/지역/항목/배열)"""
+        self._ensure_loaded()
+        with self._lock:
+            return {f"{band}/{gender}/{region}/{metric}/{name}": array
+                    for (band, gender, region), sketches in self._sketches.items()
+                    for metric, sketch in sketches.items()
+                    for name, array in sketch.export_arrays().items()}
+
+    def attach_arrays(self, arrays: Mapping[str, np.ndarray]):
+        with self._lock:
+            for (band, gender, region), sketches in self._sketches.items():
+                for metric, sketch in sketches.items():
+                    prefix = f"{band}/{gender}/{region}/{metric}/"
+                    sketch.attach_arrays({name: arrays[prefix + name] for name in ("levels", "sorted", "cumulative")})
+
+    # 저장 --------------------------------------------------------------------
+    def save(self, path: Optional[str] = None):
+        """전체 스케치를 하나의 바이너리 파일로 저장 (임시 파일 후 교체)"""
+        path = path or self.settings.cohort_sketch_path
+        with self._lock:
+            entries = [(key, metric, sketch.to_bytes()) for key, sketches in self._sketches.items()
+                       for metric, sketch in sketches.items()]
+            self._dirty = False
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_FILE_HEADER.pack(_FILE_MAGIC, len(entries)))
+            for (band, gender, region), metric, payload in entries:
+                name = metric.encode("ascii")
+                f.write(_ENTRY_HEADER.pack(band, gender, region, len(name), len(payload)))
+                f.write(name)
+                f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def save_if_dirty(self):
+        """마지막 저장 이후 추가된 검진이 있을 때만 저장 (종료 시 호출)"""
+        if self._dirty:
+            self.save()
+
+    def load(self, path: Optional[str] = None) -> bool:
+        """저장된 스케치 불러오기. 파일이 없으면 False"""
+        path = path or self.settings.cohort_sketch_path
+        if not os.path.exists(path):
+            return False
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, count = _FILE_HEADER.unpack_from(data, 0)
+        if magic != _FILE_MAGIC:
+            raise ValueError(f"코호트 스케치 파일 형식이 아닙니다: {path}")
+        sketches: Dict[CohortKey, Dict[str, KLLSketch]] = {}
+        offset = _FILE_HEADER.size
+        for _ in range(count):
+            band, gender, region, name_length, payload_length = _ENTRY_HEADER.unpack_from(data, offset)
+            offset += _ENTRY_HEADER.size
+            metric = data[offset:offset + name_length].decode("ascii")
+            offset += name_length
+            sketches.setdefault((band, gender, region), {})[metric] = \
+                KLLSketch.from_bytes(data[offset:offset + payload_length])
+            offset += payload_length
+        with self._lock:
+            self._sketches = sketches
+        return True
@@ -0,0 +1,163 @@
+"""
+HealthSync AI 건강 진단 결과 캐시 서비스
+
+AI 건강 진단(HealthDiagnosisResponse)을 입력 내용의 정규화 해시로 캐시합니다.
+- 키: 정규화한 검진 값 + 직업 + 진단 모델 버전의 SHA-256
+- 같은 키의 동시 요청은 진행 중인 계산 하나를 공유 (single-flight)
+- 항목 수 상한을 넘으면 LRU 순서로 제거
+- HEALTH_DATA_SYNCED 이벤트가 커밋되면 해당 회원의 결과를 무효화
+"""
+import asyncio
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from decimal import Decimal
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Mapping, Optional, Set, Union
+
+from pydantic import BaseModel
+
+from app.models.common import EventType
+from app.models.health import HealthCheckup
+from app.models.intelligence import HealthDiagnosisResponse
+from app.models.records import CheckupRecord, EventRecord
+from app.services.base_service import BaseService
+
+# 진단 결과에 영향을 주지 않는 식별자 / 처리 시각 필드
+_EXCLUDED_FIELDS = frozenset({"checkup_id", "raw_id", "member_serial_number", "processed_at", "created_at"})
+
+CheckupInput = Union[HealthCheckup, CheckupRecord, Mapping[str, Any]]
+
+
+def _normalize_value(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        # 1.50 / 1.5 처럼 표기만 다른 값을 같은 값으로
+        normalized = value.normalize()
+        return format(normalized, "f") if normalized != 0 else "0"
+    if isinstance(value, float):
+        return format(Decimal(repr(value)).normalize(), "f")
+    return value
+
+
+def normalize_checkup(checkup: CheckupInput) -> Dict[str, Any]:
+    """진단 입력에 쓰이는 검진 값만 골라 정규화 (None 항목은 제외)"""
+    if isinstance(checkup, BaseModel):
+        values = checkup.model_dump()
+    elif isinstance(checkup, CheckupRecord):
+        values = checkup.as_dict()
+    else:
+        values = dict(checkup)
+    return {name: _normalize_value(value) for name, value in values.items()
+            if name not in _EXCLUDED_FIELDS and value is not None}
+
+
+def normalize_occupation(occupation: Optional[str]) -> str:
+    return " ".join((occupation or "").split()).casefold()
+
+
+def diagnosis_cache_key(checkups: Iterable[CheckupInput], occupation: Optional[str], model_version: str) -> str:
+    """정규화된 입력의 정렬 JSON 해시 (검진 순서는 기준 년도 기준으로 고정)"""
+    normalized = sorted((normalize_checkup(c) for c in checkups), key=lambda c: c.get("reference_year", 0))
+    payload = json.dumps({"checkups": normalized, "occupation": normalize_occupation(occupation),
+                          "model_version": model_version},
+                         sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class DiagnosisCacheService(BaseService):
+    """건강 진단 결과 캐시"""
+
+    def __init__(self, max_entries: Optional[int] = None, model_version: Optional[str] = None):
+        super().__init__()
+        self.max_entries = max_entries or self.settings.diagnosis_cache_max_entries
+        self.model_version = model_version or self.settings.diagnosis_model_version
+        # 이벤트 리스너는 이벤트 로그 쓰기 스레드에서 호출되므로 스레드 락으로 보호
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._member_keys: Dict[int, Set[str]] = {}
+        self._generations: Dict[int, int] = {}
+        self._inflight: Dict[str, "asyncio.Task[HealthDiagnosisResponse]"] = {}
+        self.counters = {"hits": 0, "misses": 0, "coalesced": 0, "evictions": 0, "invalidations": 0}
+
+    def key_for(self, checkups: Iterable[CheckupInput], occupation: Optional[str]) -> str:
+        return diagnosis_cache_key(checkups, occupation, self.model_version)
+
+    def get(self, key: str) -> Optional[HealthDiagnosisResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    async def get_or_compute(self, member_serial_number: int, checkups: List[CheckupInput], occupation: Optional[str],
+                             compute: Callable[[], Awaitable[HealthDiagnosisResponse]]) -> HealthDiagnosisResponse:
+        """캐시된 진단 결과, 없으면 compute() 결과 (같은 키의 동시 요청은 한 번만 계산)"""
+        key = self.key_for(checkups, occupation)
+        result = self.get(key)
+        if result is not None:
+            self.counters["hits"] += 1
+            return result
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.counters["coalesced"] += 1
+        else:
+            self.counters["misses"] += 1
+            generation = self._generations.get(member_serial_number, 0)
+            # 계산은 첫 요청과 분리된 태스크로 실행 (첫 요청이 취소되어도 다른 대기자에게 영향 없음)
+            inflight = asyncio.ensure_future(self._compute(member_serial_number, key, compute, generation))
+            # 모든 대기자가 취소된 뒤 실패해도 '예외를 가져가지 않았다'는 경고가 남지 않도록 소비
+            inflight.add_done_callback(lambda task: task.cancelled() or task.exception())
+            self._inflight[key] = inflight
+        # 첫 요청을 포함한 모든 대기자는 shield 로 기다려 자신의 취소가 공유 계산을 취소하지 않도록 함
+        return await asyncio.shield(inflight)
+
+    async def _compute(self, member_serial_number: int, key: str,
+                       compute: Callable[[], Awaitable[HealthDiagnosisResponse]],
+                       generation: int) -> HealthDiagnosisResponse:
+        try:
+            result = await compute()
+        finally:
+            self._inflight.pop(key, None)
+        self._store(member_serial_number, key, result, generation)
+        return result
+
+    def _store(self, member_serial_number: int, key: str, result: HealthDiagnosisResponse, generation: int):
+        with self._lock:
+            # 계산 중 동기화 이벤트가 들어왔다면 이전 데이터 기반 결과이므로 저장하지 않음
+            if self._generations.get(member_serial_number, 0) != generation:
+                return
+            self._entries[key] = (member_serial_number, result)
+            self._entries.move_to_end(key)
+            self._member_keys.setdefault(member_serial_number, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                old_key, (old_member, _) = self._entries.popitem(last=False)
+                keys = self._member_keys.get(old_member)
+                if keys is not None:
+                    keys.discard(old_key)
+                    if not keys:
+                        del self._member_keys[old_member]
+                self.counters["evictions"] += 1
+
+    def invalidate_member(self, member_serial_number: int) -> int:
+        """회원의 캐시된 진단 결과 제거. 제거된 항목 수 반환"""
+        with self._lock:
+            self._generations[member_serial_number] = self._generations.get(member_serial_number, 0) + 1
+            keys = self._member_keys.pop(member_serial_number, set())
+            for key in keys:
+                self._entries.pop(key, None)
+            self.counters["invalidations"] += len(keys)
+            return len(keys)
+
+    def on_events(self, events: List[EventRecord]):
+        """이벤트 로그 리스너: 건강 데이터 동기화 시 해당 회원 무효화"""
+        for event in events:
+            if event.event_type == EventType.HEALTH_DATA_SYNCED and event.member_serial_number is not None:
+                self.invalidate_member(event.member_serial_number)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self.counters, entries=len(self._entries), max_entries=self.max_entries,
+                        inflight=len(self._inflight), model_version=self.model_version)
@@ -0,0 +1,247 @@
+"""
+HealthSync AI 건강 점수 / 위험 레벨 엔진
+
+하나의 규칙표(SCORE_RULES)를 두 가지 경로로 평가합니다.
+- 단일 경로: API 요청 시 검진 한 건을 bisect 로 평가
+- 배치 경로: 컬럼형 검진 배치 전체를 np.searchsorted 로 평가 (야간 전체 재계산, 동기화 직후 재계산)
+두 경로 모두 검사값을 고정소수점 정수(DECIMAL_SCALE 배)로 바꿔 정수 연산만 하므로 결과가 항상 같습니다.
+점수 = 100 - 항목별 감점 합 (0 미만은 0), 위험 레벨은 점수 구간으로 결정합니다.
+"""
+import bisect
+import time
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.core.checkup_store import DECIMAL_SCALE, CheckupColumnStore, ColumnBatch, to_fixed
+from app.models.health import RiskLevel
+from app.services.base_service import BaseService
+from app.services.checkup_pipeline_service import compute_bmi_fixed
+
+MAX_SCORE = 100
+
+# 위험 레벨 코드 (배열 값) ↔ RiskLevel. 점수가 경계 이상이면 다음 레벨
+RISK_LEVEL_CODES: Tuple[RiskLevel, ...] = (RiskLevel.CRITICAL, RiskLevel.HIGH, RiskLevel.MEDIUM, RiskLevel.LOW)
+RISK_SCORE_EDGES: Tuple[int, ...] = (40, 60, 80)
+
+MALE, FEMALE = 1, 2
+
+
+class ScoreRule(NamedTuple):
+    """검사 항목 하나의 감점 규칙: edges[i-1] <= 값 < edges[i] 이면 penalties[i] 감점"""
+    field: str
+    name: str
+    edges: Tuple[float, ...]
+    penalties: Tuple[int, ...]
+    gender_edges: Optional[Dict[int, Tuple[float, ...]]] = None
+
+
+SCORE_RULES: Tuple[ScoreRule, ...] = (
+    ScoreRule("bmi", "BMI", (18.5, 23, 25, 30), (3, 0, 3, 6, 10)),
+    ScoreRule("waist_circumference", "허리둘레", (85, 95), (0, 5, 8), {MALE: (90, 100), FEMALE: (85, 95)}),
+    ScoreRule("systolic_bp", "수축기 혈압", (120, 130, 140, 160), (0, 2, 5, 10, 15)),
+    ScoreRule("diastolic_bp", "이완기 혈압", (80, 85, 90, 100), (0, 2, 5, 8, 12)),
+    ScoreRule("fasting_glucose", "공복혈당", (70, 100, 126), (3, 0, 5, 12)),
+    ScoreRule("total_cholesterol", "총 콜레스테롤", (200, 240), (0, 3, 6)),
+    ScoreRule("ldl_cholesterol", "LDL 콜레스테롤", (130, 160, 190), (0, 3, 6, 9)),
+    ScoreRule("hdl_cholesterol", "HDL 콜레스테롤", (40, 60), (6, 2, 0)),
+    ScoreRule("triglyceride", "중성지방", (150, 200, 500), (0, 3, 6, 9)),
+    ScoreRule("hemoglobin", "혈색소", (12, 15.5), (4, 0, 2), {MALE: (13, 16.5), FEMALE: (12, 15.5)}),
+    ScoreRule("urine_protein", "요단백", (2, 3), (0, 2, 6)),
+    ScoreRule("serum_creatinine", "혈청크레아티닌", (1.5,), (0, 6)),
+    ScoreRule("ast", "AST", (40, 80), (0, 3, 6)),
+    ScoreRule("alt", "ALT", (40, 80), (0, 3, 6)),
+    ScoreRule("gamma_gtp", "감마지티피", (63, 126), (0, 3, 6)),
+    ScoreRule("smoking_status", "흡연", (2, 3), (0, 3, 10)),
+    ScoreRule("drinking_status", "음주", (1,), (0, 3)),
+)
+
+
+class _CompiledRule:
+    """고정소수점 경계로 변환된 규칙 (단일 경로용 튜플, 배치 경로용 배열 동시 보관)"""
+
+    __slots__ = ("field", "name", "edges", "penalties", "gender_edges", "edge_array", "penalty_array", "gender_arrays")
+
+    def __init__(self, rule: ScoreRule):
+        if len(rule.penalties) != len(rule.edges) + 1:
+            raise ValueError(f"감점 구간 수가 경계 수 + 1 이 아닙니다: {rule.field}")
+        self.field = rule.field
+        self.name = rule.name
+        self.edges = tuple(to_fixed(edge) for edge in rule.edges)
+        self.penalties = tuple(rule.penalties)
+        self.gender_edges: Dict[int, Tuple[int, ...]] = {}
+        for gender, edges in (rule.gender_edges or {}).items():
+            if len(edges) != len(rule.edges):
+                raise ValueError(f"성별 경계 수가 공통 경계 수와 다릅니다: {rule.field}")
+            self.gender_edges[gender] = tuple(to_fixed(edge) for edge in edges)
+        self.edge_array = np.array(self.edges, dtype=np.int64)
+        self.penalty_array = np.array(self.penalties, dtype=np.int32)
+        self.gender_arrays = {gender: np.array(edges, dtype=np.int64) for gender, edges in self.gender_edges.items()}
+
+    def penalty(self, value: int, gender_code: Optional[int]) -> int:
+        edges = self.gender_edges.get(gender_code, self.edges)
+        return self.penalties[bisect.bisect_right(edges, value)]
+
+    def penalty_many(self, values: np.ndarray, genders: Optional[np.ndarray]) -> np.ndarray:
+        index = np.searchsorted(self.edge_array, values, side="right")
+        if genders is not None:
+            for gender, edges in self.gender_arrays.items():
+                selected = genders == gender
+                if selected.any():
+                    index[selected] = np.searchsorted(edges, values[selected], side="right")
+        return self.penalty_array[index]
+
+
+class HealthScore(NamedTuple):
+    """검진 한 건의 점수 결과"""
+    score: int
+    risk_level: RiskLevel
+    evaluated_items: int
+    deductions: Dict[str, int]
+
+    @property
+    def concerns(self) -> List[str]:
+        """감점이 큰 순서의 항목명"""
+        return [name for name, points in sorted(self.deductions.items(), key=lambda x: -x[1]) if points > 0]
+
+
+class BatchScores(NamedTuple):
+    """배치 점수 결과 (행 순서 = 입력 배치 순서)"""
+    scores: np.ndarray
+    risk_codes: np.ndarray
+    evaluated_items: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+    def risk_levels(self) -> List[RiskLevel]:
+        """위험 레벨 코드 배열 → RiskLevel 목록 (API 경계용)"""
+        return [RISK_LEVEL_CODES[code] for code in self.risk_codes.tolist()]
+
+
+def risk_level_for(score: int) -> RiskLevel:
+    return RISK_LEVEL_CODES[bisect.bisect_right(RISK_SCORE_EDGES, score)]
+
+
+def _scalar_fixed(value) -> int:
+    """단일 경로 검사값 → 고정소수점 정수 (배치 저장 형식과 같은 반올림)"""
+    if isinstance(value, int):
+        return value * DECIMAL_SCALE
+    return to_fixed(value)
+
+
+def _scalar_bmi(checkup) -> Optional[int]:
+    """BMI 고정소수점 값. 검진에 BMI 가 없으면 신장/체중으로 계산 (compute_bmi_fixed 와 같은 정수식)"""
+    bmi = getattr(checkup, "bmi", None)
+    if bmi is not None:
+        return _scalar_fixed(bmi)
+    height, weight = getattr(checkup, "height", None), getattr(checkup, "weight", None)
+    if not height or not weight or height <= 0 or weight <= 0:
+        return None
+    h2 = height * height
+    return (2 * weight * 10_000 * DECIMAL_SCALE + h2) // (2 * h2)
+
+
+class HealthScoreEngine:
+    """컴파일된 규칙표와 단일 / 배치 평가"""
+
+    def __init__(self, rules: Sequence[ScoreRule] = SCORE_RULES):
+        self.rules = [_CompiledRule(rule) for rule in rules]
+
+    # 단일 경로 ----------------------------------------------------------------
+    def score(self, checkup, gender_code: Optional[int] = None) -> HealthScore:
+        """HealthCheckup / HealthCheckupRaw / CheckupRecord 한 건 평가. gender_code 가 없으면 검진의 성별 코드 사용"""
+        if gender_code is None:
+            gender_code = getattr(checkup, "gender_code", None)
+        deductions: Dict[str, int] = {}
+        total = 0
+        for rule in self.rules:
+            if rule.field == "bmi":
+                value = _scalar_bmi(checkup)
+            else:
+                raw = getattr(checkup, rule.field, None)
+                value = None if raw is None else _scalar_fixed(raw)
+            if value is None:
+                continue
+            points = rule.penalty(value, gender_code)
+            deductions[rule.name] = points
+            total += points
+        score = max(MAX_SCORE - total, 0)
+        return HealthScore(score, risk_level_for(score), len(deductions), deductions)
+
+    # 배치 경로 ----------------------------------------------------------------
+    @staticmethod
+    def _fixed_column(batch: ColumnBatch, field: str) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+        """배치 컬럼 → (고정소수점 int64 배열, 유효 마스크). 컬럼이 없으면 (None, None)"""
+        if field not in batch.schema:
+            return None, None
+        spec = batch.schema[field]
+        values = np.asarray(batch.column(field), dtype=np.int64)
+        if spec.kind == "fixed":
+            if DECIMAL_SCALE % spec.scale:
+                raise ValueError(f"지원하지 않는 고정소수점 배율입니다: {field} (scale={spec.scale})")
+            return values * (DECIMAL_SCALE // spec.scale), batch.valid(field)
+        return values * DECIMAL_SCALE, batch.valid(field)
+
+    def _batch_values(self, batch: ColumnBatch, field: str) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+        if field != "bmi":
+            return self._fixed_column(batch, field)
+        # 저장된 BMI 우선, 없으면 신장/체중으로 계산 (원본 배치에는 BMI 컬럼이 없음)
+        derived, derived_valid = compute_bmi_fixed(batch.column("height"), batch.column("weight"), DECIMAL_SCALE)
+        stored, stored_valid = self._fixed_column(batch, "bmi")
+        if stored is None:
+            return derived, derived_valid
+        return np.where(stored_valid, stored, derived), stored_valid | derived_valid
+
+    def score_batch(self, batch: ColumnBatch, gender_codes: Optional[Sequence[int]] = None) -> BatchScores:
+        """컬럼형 검진 배치 전체 평가. 성별 코드는 인자 → 배치의 gender_code 컬럼 순으로 사용"""
+        n = len(batch)
+        if gender_codes is None and "gender_code" in batch.schema:
+            gender_codes = batch.column("gender_code")
+        genders = None if gender_codes is None else np.asarray(gender_codes)
+        total = np.zeros(n, dtype=np.int32)
+        evaluated = np.zeros(n, dtype=np.int8)
+        for rule in self.rules:
+            values, valid = self._batch_values(batch, rule.field)
+            if values is None:
+                continue
+            penalties = rule.penalty_many(values, genders)
+            total += np.where(valid, penalties, 0).astype(np.int32)
+            evaluated += valid
+        scores = np.maximum(MAX_SCORE - total, 0).astype(np.int16)
+        risk_codes = np.searchsorted(np.array(RISK_SCORE_EDGES), scores, side="right").astype(np.int8)
+        return BatchScores(scores, risk_codes, evaluated)
+
+
+class HealthScoreService(BaseService):
+    """건강 점수 / 위험 레벨 서비스"""
+
+    def __init__(self, engine: Optional[HealthScoreEngine] = None):
+        super().__init__()
+        self.engine = engine or HealthScoreEngine()
+
+    def score(self, checkup, gender_code: Optional[int] = None) -> HealthScore:
+        """API 용 단일 검진 평가"""
+        return self.engine.score(checkup, gender_code)
+
+    def score_batch(self, batch: ColumnBatch, gender_codes: Optional[Sequence[int]] = None) -> BatchScores:
+        """동기화 / 업로드 직후 배치 평가"""
+        return self.engine.score_batch(batch, gender_codes)
+
+    def iter_store_scores(self, store: CheckupColumnStore) -> Iterator[Tuple[ColumnBatch, BatchScores]]:
+        """저장소 세그먼트별 (배치, 점수) 순회 (야간 전체 재계산)"""
+        rows = 0
+        started = time.perf_counter()
+        for batch in store.scan():
+            yield batch, self.engine.score_batch(batch)
+            rows += len(batch)
+        elapsed = time.perf_counter() - started
+        self.log_operation("score_checkup_store", rows=rows, elapsed_seconds=round(elapsed, 3),
+                           rows_per_second=round(rows / elapsed) if elapsed else 0)
+
+    def risk_distribution(self, store: CheckupColumnStore) -> Dict[str, int]:
+        """저장소 전체의 위험 레벨별 검진 수"""
+        counts = np.zeros(len(RISK_LEVEL_CODES), dtype=np.int64)
+        for _, result in self.iter_store_scores(store):
+            counts += np.bincount(result.risk_codes, minlength=len(RISK_LEVEL_CODES))
+        return {level.value: int(count) for level, count in zip(RISK_LEVEL_CODES, counts)}
@@ -0,0 +1,327 @@
+"""
+HealthSync AI 건강검진 변경분 동기화 서비스
+
+(회원, 기준 년도) 검진마다 내용 지문(64비트 해시)을 보관하고, 동기화 때 들어온 검진의 지문과 비교해
+새로 생기거나 바뀐 검진만 처리합니다.
+- 지문: 식별자 / 처리 시각을 뺀 검사값 컬럼을 벡터 연산으로 섞은 값 (null 은 별도 값)
+- 지문 색인: 저장된 정렬 배열 + 이후 변경분 dict (searchsorted 조회, 저장 시 병합)
+- 변경분만 컬럼형 저장소에 기록 → 점수 재계산 → HEALTH_DATA_SYNCED 이벤트 (이벤트 버스 구독자가 후속 처리)
+  → 이벤트가 커밋된 뒤에 지문 색인 갱신 (발행이 실패하면 다음 동기화에서 같은 변경분을 다시 처리)
+- 발행 전인 변경분 지문을 따로 두어 재시도 때는 저장소에 다시 기록하지 않고 발행만 다시 시도
+- 동기화마다 생기는 작은 세그먼트는 일정 개수가 쌓이면 병합
+- 바뀐 검진이 없으면 저장 / 재계산 / 이벤트 없이 바로 응답
+처리 비용은 회원의 전체 이력이 아니라 이번에 들어온 검진 수와 그중 바뀐 검진 수에 비례합니다.
+"""
+import asyncio
+import json
+import os
+import threading
+import weakref
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.core.checkup_store import CHECKUP_SCHEMA, CheckupColumnStore, ColumnBatch
+from app.models.common import EventType
+from app.models.health import HealthCheckup, HealthSyncResponse
+from app.models.records import EventRecord
+from app.services.base_service import BaseService
+from app.services.health_score_service import BatchScores, HealthScoreService
+
+if TYPE_CHECKING:
+    from app.core.event_log import GroupCommitWriter
+
+# 지문 계산에서 제외하는 컬럼 (다시 추출 / 처리할 때마다 바뀌는 값)
+FINGERPRINT_EXCLUDED = frozenset({"checkup_id", "raw_id", "processed_at", "created_at"})
+FINGERPRINT_FIELDS: Tuple[str, ...] = tuple(
+    spec.name for spec in CHECKUP_SCHEMA.columns if spec.name not in FINGERPRINT_EXCLUDED and spec.kind != "str"
+)
+
+_YEAR_BITS = 16
+_SEED = np.uint64(0x9E3779B97F4A7C15)
+_NULL = np.uint64(0xA5A5A5A5A5A5A5A5)
+_MIX_1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX_2 = np.uint64(0x94D049BB133111EB)
+
+
+def _mix(x: np.ndarray) -> np.ndarray:
+    """splitmix64 최종 혼합 (uint64 배열, 오버플로는 모듈로 2^64)"""
+    x = (x ^ (x >> np.uint64(30))) * _MIX_1
+    x = (x ^ (x >> np.uint64(27))) * _MIX_2
+    return x ^ (x >> np.uint64(31))
+
+
+def checkup_fingerprints(batch: ColumnBatch) -> np.ndarray:
+    """검진 배치의 행별 내용 지문 (uint64)"""
+    fingerprints = np.full(len(batch), _SEED, dtype=np.uint64)
+    with np.errstate(over="ignore"):
+        for position, name in enumerate(FINGERPRINT_FIELDS, start=1):
+            values = np.asarray(batch.column(name)).astype(np.int64).view(np.uint64)
+            if batch.schema[name].nullable:
+                values = np.where(batch.valid(name), values, _NULL)
+            fingerprints = _mix(fingerprints ^ (values + np.uint64(position) * _SEED))
+    return fingerprints
+
+
+def member_year_keys(members: np.ndarray, years: np.ndarray) -> np.ndarray:
+    """(회원 일련번호, 기준 년도) → int64 색인 키"""
+    return (np.asarray(members, dtype=np.int64) << _YEAR_BITS) | np.asarray(years, dtype=np.int64)
+
+
+class FingerprintIndex:
+    """(회원, 기준 년도) 키 → 마지막으로 동기화된 검진 지문"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._keys = np.empty(0, dtype=np.int64)
+        self._values = np.empty(0, dtype=np.uint64)
+        # 마지막 저장 이후 갱신분 (저장 / compact 시 정렬 배열로 병합)
+        self._recent: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+
+    def _contains(self, keys: np.ndarray) -> np.ndarray:
+        if len(self._keys) == 0:
+            return np.zeros(len(keys), dtype=bool)
+        positions = np.clip(np.searchsorted(self._keys, keys), 0, len(self._keys) - 1)
+        return self._keys[positions] == keys
+
+    def lookup(self, keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """키별 (지문, 존재 여부)"""
+        keys = np.asarray(keys, dtype=np.int64)
+        values = np.zeros(len(keys), dtype=np.uint64)
+        with self._lock:
+            found = self._contains(keys)
+            if found.any():
+                positions = np.searchsorted(self._keys, keys[found])
+                values[found] = self._values[positions]
+            if self._recent:
+                for i, key in enumerate(keys.tolist()):
+                    value = self._recent.get(key)
+                    if value is not None:
+                        values[i] = value
+                        found[i] = True
+        return values, found
+
+    def update(self, keys: np.ndarray, values: np.ndarray):
+        with self._lock:
+            self._recent.update(zip(np.asarray(keys, dtype=np.int64).tolist(),
+                                    np.asarray(values, dtype=np.uint64).tolist()))
+            self._dirty = True
+
+    def _compact(self):
+        """변경분을 정렬 배열에 병합 (잠금 안에서 호출)"""
+        if not self._recent:
+            return
+        keys = np.concatenate([np.fromiter(self._recent.keys(), np.int64, len(self._recent)), self._keys])
+        values = np.concatenate([np.fromiter(self._recent.values(), np.uint64, len(self._recent)), self._values])
+        # 같은 키는 앞쪽(변경분)이 남도록 안정 정렬 후 첫 항목 선택
+        order = np.argsort(keys, kind="stable")
+        keys, values = keys[order], values[order]
+        first = np.append(True, keys[1:] != keys[:-1])
+        self._keys, self._values = keys[first], values[first]
+        self._recent = {}
+
+    def rebuild(self, store: CheckupColumnStore):
+        """저장소 전체에서 색인 재구성 (색인 파일이 없을 때 한 번. 세그먼트 순서상 최신 행이 남음)"""
+        keys, values = [], []
+        for batch in store.scan():
+            if len(batch):
+                keys.append(member_year_keys(batch.column("member_serial_number"), batch.column("reference_year")))
+                values.append(checkup_fingerprints(batch))
+        with self._lock:
+            if keys:
+                self._recent = dict(zip(np.concatenate(keys).tolist(), np.concatenate(values).tolist()))
+                self._compact()
+            self._dirty = True
+
+    def save(self, path: Optional[str] = None):
+        """정렬 배열 두 개를 .npz 로 저장 (임시 파일 후 교체)"""
+        path = path or self.path
+        with self._lock:
+            self._compact()
+            keys, values = self._keys, self._values
+            self._dirty = False
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(f, keys=keys, values=values)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def save_if_dirty(self):
+        if self._dirty and self.path:
+            self.save()
+
+    def load(self, path: Optional[str] = None) -> bool:
+        """저장된 색인 불러오기. 파일이 없으면 False"""
+        path = path or self.path
+        if not path or not os.path.exists(path):
+            return False
+        with np.load(path) as data:
+            keys, values = data["keys"].astype(np.int64), data["values"].astype(np.uint64)
+        with self._lock:
+            self._keys, self._values = keys, values
+            self._recent = {}
+            self._dirty = False
+        return True
+
+
+class SyncDelta(NamedTuple):
+    """들어온 검진 배치와 지문 색인의 비교 결과"""
+    changed: np.ndarray      # 새로 생기거나 바뀐 행 위치
+    new_count: int
+    changed_count: int
+    unchanged_count: int
+    duplicate_count: int     # 같은 배치에서 뒤에 같은 (회원, 년도) 가 다시 나와 건너뛴 행
+    keys: np.ndarray
+    fingerprints: np.ndarray
+
+
+class HealthSyncService(BaseService):
+    """회원 건강검진 변경분 동기화"""
+
+    def __init__(self, store: Optional[CheckupColumnStore] = None, index: Optional[FingerprintIndex] = None,
+                 score_service: Optional[HealthScoreService] = None,
+                 event_writer: Optional["GroupCommitWriter"] = None):
+        super().__init__()
+        self.store = store if store is not None else CheckupColumnStore.for_checkups(self.settings.checkup_store_dir)
+        self.score_service = score_service or HealthScoreService()
+        self.event_writer = event_writer
+        if index is None:
+            index = FingerprintIndex(self.settings.health_sync_fingerprint_path)
+            if not index.load() and len(self.store):
+                index.rebuild(self.store)
+        self.index = index
+        # 같은 회원 검진이 동시에 동기화되어 변경분 판정이 겹치지 않도록 직렬화
+        self._apply_lock = threading.Lock()
+        # 저장소에는 기록했지만 이벤트 발행 전인 (회원, 년도) 키 → 지문 (발행 재시도 때 같은 행을 다시 기록하지 않음)
+        self._unpublished: Dict[int, int] = {}
+        # 회원별 동기화 (기록 → 발행 → 색인 갱신) 직렬화
+        self._member_locks: "weakref.WeakValueDictionary[int, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+    def _member_lock(self, member_serial_number: int) -> asyncio.Lock:
+        lock = self._member_locks.get(member_serial_number)
+        if lock is None:
+            lock = self._member_locks[member_serial_number] = asyncio.Lock()
+        return lock
+
+    def diff(self, batch: ColumnBatch) -> SyncDelta:
+        """들어온 검진 중 새로 생기거나 내용이 바뀐 행 찾기 (색인은 바꾸지 않음)"""
+        keys = member_year_keys(batch.column("member_serial_number"), batch.column("reference_year"))
+        fingerprints = checkup_fingerprints(batch)
+        stored, found = self.index.lookup(keys)
+        changed_mask = ~found | (stored != fingerprints)
+        # 같은 배치에 같은 (회원, 년도) 가 여러 번 있으면 마지막 행만 반영 (나머지는 중복으로 따로 셈)
+        duplicates = 0
+        if len(keys) > 1:
+            last = np.zeros(len(keys), dtype=bool)
+            last[len(keys) - 1 - np.unique(keys[::-1], return_index=True)[1]] = True
+            changed_mask &= last
+            duplicates = len(keys) - int(np.count_nonzero(last))
+        changed = np.flatnonzero(changed_mask)
+        new_count = int(np.count_nonzero(~found[changed]))
+        return SyncDelta(changed, new_count, len(changed) - new_count, len(batch) - len(changed) - duplicates,
+                         duplicates, keys, fingerprints)
+
+    def apply(self, batch: ColumnBatch) -> Tuple[SyncDelta, ColumnBatch]:
+        """변경분을 저장소에 기록. (비교 결과, 반영할 변경분 배치) 반환. 색인은 mark_synced 로 따로 갱신
+
+        발행이 실패해 아직 색인에 없는 변경분이 같은 내용으로 다시 들어오면 저장소에는 다시 기록하지 않습니다.
+        """
+        if batch.schema is not CHECKUP_SCHEMA:
+            raise ValueError("HealthCheckup 배치만 동기화할 수 있습니다.")
+        with self._apply_lock:
+            delta = self.diff(batch)
+            if len(delta.changed) == 0:
+                return delta, ColumnBatch.empty(CHECKUP_SCHEMA)
+            changed = batch.take(delta.changed)
+            keys = delta.keys[delta.changed].tolist()
+            fingerprints = delta.fingerprints[delta.changed].tolist()
+            written = np.fromiter((self._unpublished.get(key) == fingerprint
+                                   for key, fingerprint in zip(keys, fingerprints)), bool, len(keys))
+            if not written.all():
+                self.store.append(changed.take(np.flatnonzero(~written)) if written.any() else changed)
+                self._unpublished.update(zip(keys, fingerprints))
+                self._compact_if_needed()
+        return delta, changed
+
+    def _compact_if_needed(self):
+        """동기화로 쌓인 작은 세그먼트가 기준 개수에 이르면 병합 (_apply_lock 안에서 호출)"""
+        rows = self.settings.health_sync_compact_rows
+        if self.store.small_segment_count(rows) >= self.settings.health_sync_compact_segments:
+            merged = self.store.compact(rows)
+            self.log_operation("compact_store", merged_segments=merged, segments=self.store.segment_count)
+
+    def mark_synced(self, delta: SyncDelta):
+        """반영이 끝난 (이벤트까지 커밋된) 변경분의 지문을 색인에 기록"""
+        keys, fingerprints = delta.keys[delta.changed], delta.fingerprints[delta.changed]
+        self.index.update(keys, fingerprints)
+        with self._apply_lock:
+            for key, fingerprint in zip(keys.tolist(), fingerprints.tolist()):
+                if self._unpublished.get(key) == fingerprint:
+                    del self._unpublished[key]
+
+    async def sync_member(self, member_serial_number: int,
+                          checkups: Sequence[HealthCheckup]) -> HealthSyncResponse:
+        """회원 한 명의 검진 목록 동기화. 바뀐 검진이 있을 때만 점수 재계산 + HEALTH_DATA_SYNCED 발행"""
+        if any(c.member_serial_number != member_serial_number for c in checkups):
+            raise ValueError("다른 회원의 검진 기록이 포함되어 있습니다.")
+        batch = ColumnBatch.from_models(CHECKUP_SCHEMA, checkups)
+        async with self._member_lock(member_serial_number):
+            delta, changed = await asyncio.to_thread(self.apply, batch)
+            synced_at = datetime.now()
+
+            if len(changed) == 0:
+                self.log_operation("sync_member", member_serial_number=member_serial_number,
+                                   unchanged=delta.unchanged_count, duplicates=delta.duplicate_count)
+                return HealthSyncResponse(
+                    sync_status="unchanged" if checkups else "empty",
+                    message="변경된 건강검진 데이터가 없습니다." if checkups else "동기화할 건강검진 데이터가 없습니다.",
+                    is_ready_for_analysis=False,
+                    synced_at=synced_at,
+                    unchanged_records=delta.unchanged_count,
+                    duplicate_records=delta.duplicate_count,
+                )
+
+            scores = self.score_service.score_batch(changed)
+            years = np.asarray(changed.column("reference_year")).tolist()
+            await self._publish(member_serial_number, years, scores, delta)
+            self.mark_synced(delta)
+        self.log_operation("sync_member", member_serial_number=member_serial_number, new=delta.new_count,
+                           changed=delta.changed_count, unchanged=delta.unchanged_count,
+                           duplicates=delta.duplicate_count)
+        return HealthSyncResponse(
+            sync_status="synced",
+            message=f"{len(years)}개 년도의 건강검진 데이터가 반영되었습니다.",
+            # 검사값이 하나라도 평가된 검진이 반영되었을 때 분석 가능
+            is_ready_for_analysis=bool(np.any(scores.evaluated_items > 0)),
+            synced_at=synced_at,
+            new_records=delta.new_count,
+            changed_records=delta.changed_count,
+            unchanged_records=delta.unchanged_count,
+            duplicate_records=delta.duplicate_count,
+            synced_years=sorted(years),
+        )
+
+    async def _publish(self, member_serial_number: int, years: List[int], scores: BatchScores,
+                       delta: SyncDelta):
+        if self.event_writer is None:
+            return
+        data = {
+            "reference_years": years,
+            "health_scores": scores.scores.tolist(),
+            "risk_levels": [level.value for level in scores.risk_levels()],
+            "new_records": delta.new_count,
+            "changed_records": delta.changed_count,
+        }
+        await self.event_writer.append(EventRecord(
+            0, f"member-{member_serial_number}", EventType.HEALTH_DATA_SYNCED, json.dumps(data),
+            member_serial_number, "health",
+        ))
+
+    def save_if_dirty(self):
+        """마지막 저장 이후 갱신된 지문이 있으면 저장 (종료 시 호출)"""
+        self.index.save_if_dirty()
@@ -0,0 +1,80 @@
+"""
+HealthSync AI 미션 완료 이력 서비스
+
+회원의 미션 완료 기록을 (completion_date, completion_id) 키셋 커서로 페이지 단위 조회합니다.
+조회 기간도 커서 범위에 넣어 서명하므로 기간을 바꾸면 이전 커서는 쓸 수 없습니다.
+완료 기록은 저장소에 먼저 기록(write-through)한 뒤 미션 통계 누적 집계에 반영합니다.
+회원의 누적 집계는 그 회원의 첫 기록 / 조회 때 저장소 이력으로 한 번 채웁니다.
+"""
+import asyncio
+from datetime import date, timedelta
+from typing import Optional, Set, Union
+
+from app.core.pagination import PageParams
+from app.core.repositories import MissionCompletionRepository
+from app.models.common import ChartResolution, CursorPage
+from app.models.goal import MissionCompletionHistory, MissionHistoryResponse
+from app.models.records import MissionCompletionRecord
+from app.services.base_service import BaseService
+from app.services.mission_stats_service import MissionStatsService
+
+
+class MissionHistoryService(BaseService):
+    """미션 완료 이력 기록 / 조회 서비스"""
+
+    def __init__(self, repository: MissionCompletionRepository, stats: Optional[MissionStatsService] = None):
+        super().__init__()
+        self.repository = repository
+        self.stats = stats if stats is not None else MissionStatsService()
+        self._loaded: Set[int] = set()
+        # 같은 회원의 이력이 동시에 여러 번 적재되지 않도록 직렬화
+        self._load_lock = asyncio.Lock()
+
+    async def _ensure_loaded(self, member_serial_number: int):
+        """회원의 저장된 완료 이력을 통계 집계에 한 번 적재"""
+        if member_serial_number in self._loaded:
+            return
+        async with self._load_lock:
+            if member_serial_number not in self._loaded:
+                self.stats.load_history(await self.repository.list_by_member(member_serial_number))
+                self._loaded.add(member_serial_number)
+
+    async def record_completion(self, completion: Union[MissionCompletionHistory, MissionCompletionRecord]
+                                ) -> MissionCompletionRecord:
+        """완료 기록 (저장소 write-through 후 통계 반영). 발급된 completion_id 가 담긴 레코드 반환"""
+        if isinstance(completion, MissionCompletionHistory):
+            completion = MissionCompletionRecord.from_model(completion)
+        if completion.daily_target_count < 0 or completion.daily_completed_count < 0:
+            raise ValueError("일일 목표 / 완료 횟수는 0 이상이어야 합니다.")
+        # 적재를 먼저 끝내야 새 기록이 적재 조회와 직접 반영으로 두 번 들어가지 않음
+        await self._ensure_loaded(completion.member_serial_number)
+        completion_id = await self.repository.add(completion)
+        saved = completion.replace(completion_id=completion_id)
+        self.stats.record_completion(saved)
+        self.log_operation("record_completion", member_serial_number=saved.member_serial_number,
+                           mission_id=saved.mission_id, completion_id=completion_id)
+        return saved
+
+    async def get_stats(self, member_serial_number: int, start: Optional[date] = None, end: Optional[date] = None,
+                        resolution: ChartResolution = ChartResolution.DAY,
+                        max_points: Optional[int] = None) -> MissionHistoryResponse:
+        """기간 달성 통계 + 차트 (기본 조회 기간은 오늘까지 최근 30일)"""
+        end = end or date.today()
+        start = start or end - timedelta(days=29)
+        if start > end:
+            raise ValueError("조회 시작일이 종료일보다 늦습니다.")
+        await self._ensure_loaded(member_serial_number)
+        return self.stats.build_history_response(member_serial_number, start, end, resolution=resolution,
+                                                 max_points=max_points)
+
+    async def get_page(self, member_serial_number: int, params: PageParams, start: Optional[date] = None,
+                       end: Optional[date] = None) -> CursorPage:
+        """기간 내 완료 이력 커서 페이지 (날짜 오름차순)"""
+        if start is not None and end is not None and start > end:
+            raise ValueError("조회 시작일이 종료일보다 늦습니다.")
+        scope = f"mission:{member_serial_number}:{start or ''}:{end or ''}"
+        after = params.after(scope)
+        rows = await self.repository.page_by_member(member_serial_number, after, params.fetch_size, start, end)
+        # 커서에는 JSON 값만 들어가므로 날짜는 저장 형식과 같은 ISO 문자열로
+        return params.page([r.to_model() for r in rows], scope,
+                           lambda m: (m.completion_date.isoformat(), m.completion_id))
@@ -0,0 +1,232 @@
+"""
+HealthSync AI 미션 추천 서비스
+
+미션 카탈로그를 (MissionCategory, DifficultyLevel, 직업 카테고리) 버킷별 가중치 행렬로 미리 인덱싱하고,
+요청 시에는 해당하는 버킷만 골라 회원 위험 요인 벡터와의 행렬곱으로 점수를 매긴 뒤 힙으로 상위 k개를 뽑습니다.
+점수가 같으면 카테고리 → 난이도 열거 순서, 같은 버킷 안에서는 카탈로그 순서가 앞선 미션이 먼저입니다.
+카탈로그가 바뀌면 새 인덱스를 만든 뒤 참조만 교체하므로 조회 중인 요청은 항상 완전한 인덱스를 봅니다.
+"""
+import heapq
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.models.goal import DifficultyLevel, MissionCatalogItem, MissionCategory
+from app.models.health import HealthCheckup
+from app.models.intelligence import MissionRecommendationResponse, RecommendedMission
+from app.models.user import OccupationType
+from app.services.base_service import BaseService
+
+# 위험 요인 (0 = 정상, 1 = 기준 이상으로 높음). 마지막 'base' 는 모든 회원 1
+RISK_FACTORS: Tuple[str, ...] = (
+    "obesity", "abdominal_obesity", "blood_pressure", "blood_sugar",
+    "cholesterol", "liver", "smoking", "drinking", "base",
+)
+RISK_FACTOR_NAMES: Dict[str, str] = {
+    "obesity": "비만", "abdominal_obesity": "복부비만", "blood_pressure": "혈압", "blood_sugar": "혈당",
+    "cholesterol": "콜레스테롤", "liver": "간 기능", "smoking": "흡연", "drinking": "음주",
+}
+_FACTOR_INDEX = {name: i for i, name in enumerate(RISK_FACTORS)}
+_SMOKING_RISK = {1: 0.0, 2: 0.3, 3: 1.0}
+
+# 직업 카테고리가 카탈로그에 없는 경우 사용하는 공통 버킷
+COMMON_OCCUPATION = "*"
+# 직업 전용 미션 가산점
+OCCUPATION_MATCH_BONUS = 0.5
+
+BucketKey = Tuple[MissionCategory, DifficultyLevel, str]
+
+
+def _excess(value, normal: float, high: float) -> float:
+    """normal 이하 0, high 이상 1 사이 선형"""
+    if value is None:
+        return 0.0
+    return min(max((float(value) - normal) / (high - normal), 0.0), 1.0)
+
+
+def risk_vector(checkup: HealthCheckup) -> np.ndarray:
+    """검진 결과 → 위험 요인 벡터 (RISK_FACTORS 순서)"""
+    bmi = checkup.bmi
+    if bmi is None and checkup.height:
+        bmi = checkup.weight / (checkup.height / 100) ** 2
+    vector = np.zeros(len(RISK_FACTORS))
+    vector[_FACTOR_INDEX["obesity"]] = _excess(bmi, 23, 30)
+    vector[_FACTOR_INDEX["abdominal_obesity"]] = _excess(checkup.waist_circumference, 85, 100)
+    vector[_FACTOR_INDEX["blood_pressure"]] = max(_excess(checkup.systolic_bp, 120, 160),
+                                                  _excess(checkup.diastolic_bp, 80, 100))
+    vector[_FACTOR_INDEX["blood_sugar"]] = _excess(checkup.fasting_glucose, 100, 126)
+    vector[_FACTOR_INDEX["cholesterol"]] = max(
+        _excess(checkup.total_cholesterol, 200, 240), _excess(checkup.ldl_cholesterol, 130, 160),
+        _excess(checkup.triglyceride, 150, 200),
+        _excess(-checkup.hdl_cholesterol, -60, -40) if checkup.hdl_cholesterol is not None else 0.0)
+    vector[_FACTOR_INDEX["liver"]] = max(_excess(checkup.ast, 40, 80), _excess(checkup.alt, 40, 80),
+                                         _excess(checkup.gamma_gtp, 63, 126))
+    vector[_FACTOR_INDEX["smoking"]] = _SMOKING_RISK.get(checkup.smoking_status, 0.0)
+    vector[_FACTOR_INDEX["drinking"]] = 1.0 if checkup.drinking_status else 0.0
+    vector[_FACTOR_INDEX["base"]] = 1.0
+    return vector
+
+
+class _Bucket:
+    """버킷 하나의 후보 미션과 가중치 행렬 (행 = 미션, 열 = 위험 요인)"""
+
+    __slots__ = ("missions", "weights", "bonus")
+
+    def __init__(self, missions: List[MissionCatalogItem], occupation: str):
+        self.missions = missions
+        self.weights = np.zeros((len(missions), len(RISK_FACTORS)))
+        self.bonus = np.zeros(len(missions))
+        for row, mission in enumerate(missions):
+            self.weights[row, _FACTOR_INDEX["base"]] = mission.base_score
+            for factor, weight in mission.risk_weights.items():
+                self.weights[row, _FACTOR_INDEX[factor]] = weight
+            if occupation != COMMON_OCCUPATION and occupation in mission.occupation_categories:
+                self.bonus[row] = OCCUPATION_MATCH_BONUS
+
+
+class MissionIndex:
+    """불변 추천 인덱스 (교체 방식으로만 갱신)"""
+
+    def __init__(self, catalog: Iterable[MissionCatalogItem], version: int = 0):
+        self.version = version
+        catalog = list(catalog)
+        for mission in catalog:
+            unknown = set(mission.risk_weights) - set(RISK_FACTOR_NAMES)
+            if unknown:
+                raise ValueError(f"알 수 없는 위험 요인입니다 ({mission.mission_id}): {', '.join(sorted(unknown))}")
+        self.size = len(catalog)
+        self.occupations = {c for m in catalog for c in m.occupation_categories}
+        grouped: Dict[BucketKey, List[MissionCatalogItem]] = {}
+        for mission in catalog:
+            # 공통 미션은 모든 직업 버킷에, 직업 전용 미션은 해당 직업 버킷에만
+            targets = mission.occupation_categories or list(self.occupations) + [COMMON_OCCUPATION]
+            for occupation in targets:
+                grouped.setdefault((mission.category, mission.difficulty, occupation), []).append(mission)
+        self.buckets: Dict[BucketKey, _Bucket] = {key: _Bucket(missions, key[2]) for key, missions in grouped.items()}
+
+    @staticmethod
+    def _array_prefix(key: BucketKey) -> str:
+        category, difficulty, occupation = key
+        return f"{category.value}/{difficulty.value}/{occupation}"
+
+    def export_arrays(self) -> Dict[str, np.ndarray]:
+        """버킷별 가중치 행렬 / 직업 가산점 (이름: 카테고리/난이도/직업/weights|bonus)"""
+        return {f"{self._array_prefix(key)}/{name}": getattr(bucket, name)
+                for key, bucket in self.buckets.items() for name in ("weights", "bonus")}
+
+    def attach_arrays(self, arrays: Mapping[str, np.ndarray]):
+        for key, bucket in self.buckets.items():
+            prefix = self._array_prefix(key)
+            bucket.weights = arrays[f"{prefix}/weights"]
+            bucket.bonus = arrays[f"{prefix}/bonus"]
+
+    def top_k(self, risk: np.ndarray, occupation: str, k: int,
+              categories: Optional[Sequence[MissionCategory]] = None,
+              difficulties: Optional[Sequence[DifficultyLevel]] = None,
+              exclude_ids: Iterable[str] = ()) -> List[Tuple[float, MissionCatalogItem]]:
+        occupation = occupation if occupation in self.occupations else COMMON_OCCUPATION
+        exclude = set(exclude_ids)
+        heap: List[Tuple[float, int, MissionCatalogItem]] = []
+        sequence = 0
+        for category in categories or MissionCategory:
+            for difficulty in difficulties or DifficultyLevel:
+                bucket = self.buckets.get((category, difficulty, occupation))
+                if bucket is None:
+                    continue
+                scores = bucket.weights @ risk + bucket.bonus
+                # 버킷 안에서는 partition 으로 구한 k(+제외 수)번째 점수 이상만 힙에 넣음
+                # (경계 동점은 모두 포함하고 카탈로그 순서로 넣어 동점 순위가 항상 같도록)
+                limit = min(len(scores), k + len(exclude))
+                if limit < len(scores):
+                    candidates = np.flatnonzero(scores >= -np.partition(-scores, limit - 1)[limit - 1])
+                else:
+                    candidates = range(len(scores))
+                for row in candidates:
+                    mission = bucket.missions[row]
+                    if mission.mission_id in exclude:
+                        continue
+                    sequence += 1
+                    item = (float(scores[row]), -sequence, mission)
+                    if len(heap) < k:
+                        heapq.heappush(heap, item)
+                    elif item[:2] > heap[0][:2]:
+                        heapq.heapreplace(heap, item)
+        return [(score, mission) for score, _, mission in sorted(heap, key=lambda x: x[:2], reverse=True)]
+
+
+class MissionRecommendationService(BaseService):
+    """미션 추천 서비스"""
+
+    def __init__(self, catalog: Iterable[MissionCatalogItem] = (), occupation_types: Iterable[OccupationType] = ()):
+        super().__init__()
+        self._occupations: Dict[str, str] = {}
+        self.load_occupation_types(occupation_types)
+        self._index = MissionIndex(catalog)
+
+    @property
+    def index(self) -> MissionIndex:
+        return self._index
+
+    def load_catalog(self, catalog: Iterable[MissionCatalogItem]):
+        """카탈로그 교체. 새 인덱스를 완성한 뒤 참조만 바꿈 (조회 중인 요청은 이전 인덱스 사용)"""
+        index = MissionIndex(catalog, self._index.version + 1)
+        self._index = index
+        self.log_operation("reload_mission_index", version=index.version, mission_count=index.size,
+                           bucket_count=len(index.buckets))
+
+    def export_arrays(self) -> Dict[str, np.ndarray]:
+        return self._index.export_arrays()
+
+    def attach_arrays(self, arrays: Mapping[str, np.ndarray]):
+        """현재 인덱스를 공유 배열로 교체 (카탈로그를 다시 불러오면 새 인덱스는 개인 사본)"""
+        self._index.attach_arrays(arrays)
+
+    def load_occupation_types(self, occupation_types: Iterable[OccupationType]):
+        """직업 코드/직업명 → 직업 카테고리 매핑 교체"""
+        mapping: Dict[str, str] = {}
+        for occupation in occupation_types:
+            mapping[occupation.occupation_code] = occupation.category
+            mapping[occupation.occupation_name] = occupation.category
+        self._occupations = mapping
+
+    def occupation_category(self, occupation: str) -> str:
+        return self._occupations.get(occupation, occupation)
+
+    def recommend(self, checkup: HealthCheckup, occupation: str, k: int = 5,
+                  categories: Optional[Sequence[MissionCategory]] = None,
+                  difficulties: Optional[Sequence[DifficultyLevel]] = None,
+                  exclude_ids: Iterable[str] = ()) -> MissionRecommendationResponse:
+        """회원 검진 결과와 직업 기준 상위 k개 미션 추천"""
+        if k <= 0:
+            raise ValueError("추천 개수는 1 이상이어야 합니다.")
+        index = self._index
+        risk = risk_vector(checkup)
+        occupation_category = self.occupation_category(occupation)
+        ranked = index.top_k(risk, occupation_category, k, categories, difficulties, exclude_ids)
+        missions = [
+            RecommendedMission(
+                mission_id=mission.mission_id,
+                title=mission.title,
+                description=mission.description,
+                category=mission.category,
+                difficulty=mission.difficulty,
+                health_benefit=mission.health_benefit,
+                occupation_relevance=(f"{occupation_category} 직군 맞춤 미션"
+                                      if occupation_category in mission.occupation_categories else "공통 미션"),
+                estimated_time_minutes=mission.estimated_time_minutes,
+            )
+            for _, mission in ranked
+        ]
+        return MissionRecommendationResponse(
+            missions=missions,
+            recommendation_reason=self._reason(risk),
+            total_recommended=len(missions),
+        )
+
+    @staticmethod
+    def _reason(risk: np.ndarray) -> str:
+        factors = [(risk[_FACTOR_INDEX[name]], label) for name, label in RISK_FACTOR_NAMES.items()]
+        concerns = [label for value, label in sorted(factors, reverse=True) if value > 0][:3]
+        if not concerns:
+            return "검진 결과가 전반적으로 양호하여 건강 유지에 도움이 되는 미션을 추천합니다."
+        return f"{', '.join(concerns)} 관리가 필요하여 개선 효과가 큰 미션을 우선 추천합니다."
@@ -0,0 +1,254 @@
+"""
+HealthSync AI 미션 통계 서비스
+
+회원 × 미션별 누적 집계를 완료 기록마다 O(1) 로 갱신하고,
+기간 달성률 / 연속 달성 / 최고 연속 달성을 원본 이력 조회 없이 누적합(prefix sum)으로 계산합니다.
+(과거 날짜가 뒤늦게 기록되는 경우에만 해당 날짜 이후 구간을 다시 계산합니다.)
+"""
+import threading
+from array import array
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from app.models.common import ChartResolution
+from app.models.goal import MissionCompletionHistory, MissionHistoryResponse
+from app.models.records import MissionCompletionRecord
+from app.services.base_service import BaseService
+from app.services.chart_service import ChartService
+
+
+# 검증된 API 입력 또는 저장소에서 읽은 레코드
+Completion = Union[MissionCompletionHistory, MissionCompletionRecord]
+
+
+def _rate(completed: int, target: int) -> float:
+    """달성률(%) - 일일 목표를 넘긴 완료 횟수는 목표치까지만 반영"""
+    return round(completed / target * 100, 1) if target > 0 else 0.0
+
+
+class PeriodStats:
+    """기간 집계 결과"""
+
+    __slots__ = ("completed", "target", "achieved_days", "tracked_days")
+
+    def __init__(self, completed: int = 0, target: int = 0, achieved_days: int = 0, tracked_days: int = 0):
+        self.completed = completed
+        self.target = target
+        self.achieved_days = achieved_days
+        self.tracked_days = tracked_days
+
+    @property
+    def achievement_rate(self) -> float:
+        return _rate(self.completed, self.target)
+
+    def add(self, other: "PeriodStats"):
+        self.completed += other.completed
+        self.target += other.target
+        self.achieved_days += other.achieved_days
+        self.tracked_days += other.tracked_days
+
+
+class MissionAggregate:
+    """회원 1명 × 미션 1개의 누적 집계 (일 단위 누적합 + 주/월 버킷 + 연속 달성)"""
+
+    def __init__(self, mission_id: int, origin: date):
+        self.mission_id = mission_id
+        self.origin = origin
+        # 일별 원본 값과 누적합 (index = origin 으로부터의 일수, 누적합은 index + 1 위치)
+        self.daily_completed = array("i")
+        self.daily_target = array("i")
+        self.completed_prefix = array("q", [0])
+        self.target_prefix = array("q", [0])
+        self.achieved_prefix = array("q", [0])
+        self.weekly: Dict[Tuple[int, int], List[int]] = {}
+        self.monthly: Dict[Tuple[int, int], List[int]] = {}
+        self.current_streak = 0
+        self.best_streak = 0
+        # 마지막 날이 다시 기록될 때 되돌리기 위한 직전 상태
+        self._streak_before_last = 0
+        self._best_before_last = 0
+        # 기록될 때마다 증가 (차트 시계열 캐시 무효화용)
+        self.version = 0
+
+    @property
+    def last_date(self) -> Optional[date]:
+        return self.origin + timedelta(days=len(self.daily_target) - 1) if self.daily_target else None
+
+    # 갱신 --------------------------------------------------------------------
+    def record(self, day: date, target: int, completed: int):
+        """해당 날짜의 일일 목표/완료 횟수 기록 (같은 날짜는 덮어씀)"""
+        if day < self.origin:
+            self._rebase(day)
+        index = (day - self.origin).days
+        self.version += 1
+        if index < len(self.daily_target) - 1:
+            self._set_past(index, target, completed)
+            return
+        if index == len(self.daily_target) - 1:
+            self._undo_last()
+        else:
+            # 빈 날짜는 목표 0 으로 채움 (연속 달성은 끊김)
+            for _ in range(index - len(self.daily_target)):
+                self._append(0, 0)
+        self._streak_before_last = self.current_streak
+        self._best_before_last = self.best_streak
+        self._append(target, completed)
+
+    def _append(self, target: int, completed: int):
+        capped = min(completed, target)
+        achieved = 1 if target > 0 and completed >= target else 0
+        self.daily_target.append(target)
+        self.daily_completed.append(completed)
+        self.completed_prefix.append(self.completed_prefix[-1] + capped)
+        self.target_prefix.append(self.target_prefix[-1] + target)
+        self.achieved_prefix.append(self.achieved_prefix[-1] + achieved)
+        self._bucket(len(self.daily_target) - 1, capped, target)
+        self.current_streak = self.current_streak + 1 if achieved else 0
+        self.best_streak = max(self.best_streak, self.current_streak)
+
+    def _undo_last(self):
+        index = len(self.daily_target) - 1
+        capped = min(self.daily_completed[index], self.daily_target[index])
+        self._bucket(index, -capped, -self.daily_target[index])
+        for values in (self.daily_target, self.daily_completed, self.completed_prefix,
+                       self.target_prefix, self.achieved_prefix):
+            values.pop()
+        self.current_streak = self._streak_before_last
+        self.best_streak = self._best_before_last
+
+    def _bucket(self, index: int, completed: int, target: int):
+        day = self.origin + timedelta(days=index)
+        iso = day.isocalendar()
+        for buckets, key in ((self.weekly, (iso[0], iso[1])), (self.monthly, (day.year, day.month))):
+            bucket = buckets.setdefault(key, [0, 0])
+            bucket[0] += completed
+            bucket[1] += target
+
+    def _set_past(self, index: int, target: int, completed: int):
+        """과거 날짜 수정 - 해당 날짜 이후를 다시 누적"""
+        days = list(zip(self.daily_target, self.daily_completed))
+        days[index] = (target, completed)
+        self._replay(self.origin, days)
+
+    def _rebase(self, new_origin: date):
+        days = [(0, 0)] * (self.origin - new_origin).days + list(zip(self.daily_target, self.daily_completed))
+        self._replay(new_origin, days)
+
+    def _replay(self, origin: date, days: List[Tuple[int, int]]):
+        version = self.version
+        self.__init__(self.mission_id, origin)
+        self.version = version
+        for target, completed in days[:-1]:
+            self._append(target, completed)
+        if days:
+            self._streak_before_last = self.current_streak
+            self._best_before_last = self.best_streak
+            self._append(*days[-1])
+
+    # 조회 --------------------------------------------------------------------
+    def period(self, start: Optional[date] = None, end: Optional[date] = None) -> PeriodStats:
+        """[start, end] 기간 집계 (누적합 차이로 O(1))"""
+        size = len(self.daily_target)
+        lo = 0 if start is None else max((start - self.origin).days, 0)
+        hi = size if end is None else min((end - self.origin).days + 1, size)
+        if hi <= lo:
+            return PeriodStats()
+        return PeriodStats(
+            completed=self.completed_prefix[hi] - self.completed_prefix[lo],
+            target=self.target_prefix[hi] - self.target_prefix[lo],
+            achieved_days=self.achieved_prefix[hi] - self.achieved_prefix[lo],
+            tracked_days=hi - lo,
+        )
+
+    def week(self, day: date) -> Tuple[int, int]:
+        iso = day.isocalendar()
+        return tuple(self.weekly.get((iso[0], iso[1]), (0, 0)))
+
+    def month(self, year: int, month: int) -> Tuple[int, int]:
+        return tuple(self.monthly.get((year, month), (0, 0)))
+
+    def streak_as_of(self, today: date) -> int:
+        """오늘 기준 연속 달성 (마지막 기록이 어제 이전이면 끊긴 것으로 봄)"""
+        last = self.last_date
+        if last is None or (today - last).days > 1:
+            return 0
+        return self.current_streak
+
+
+class MissionStatsService(BaseService):
+    """미션 달성 통계 서비스 (회원 × 미션별 누적 집계 관리)"""
+
+    def __init__(self, chart_service: Optional[ChartService] = None):
+        super().__init__()
+        self._lock = threading.Lock()
+        self._aggregates: Dict[int, Dict[int, MissionAggregate]] = {}
+        self.charts = chart_service if chart_service is not None else ChartService()
+
+    def record_completion(self, completion: Completion) -> MissionAggregate:
+        """완료 기록 반영 (O(1))"""
+        with self._lock:
+            missions = self._aggregates.setdefault(completion.member_serial_number, {})
+            aggregate = missions.get(completion.mission_id)
+            if aggregate is None:
+                aggregate = missions[completion.mission_id] = MissionAggregate(completion.mission_id, completion.completion_date)
+            aggregate.record(completion.completion_date, completion.daily_target_count, completion.daily_completed_count)
+            return aggregate
+
+    def load_history(self, completions: Iterable[Completion]):
+        """기존 이력으로 집계 초기화 (기동 시 1회)"""
+        for completion in sorted(completions, key=lambda c: (c.completion_date, c.completion_id)):
+            self.record_completion(completion)
+
+    def get_aggregates(self, member_serial_number: int) -> Dict[int, MissionAggregate]:
+        return self._aggregates.get(member_serial_number, {})
+
+    def build_history_response(self, member_serial_number: int, start: date, end: date,
+                               today: Optional[date] = None,
+                               resolution: ChartResolution = ChartResolution.DAY,
+                               max_points: Optional[int] = None) -> MissionHistoryResponse:
+        """미션 이력 응답 생성 (원본 이력 스캔 없이 집계만 사용)"""
+        today = today or date.today()
+        total, period = PeriodStats(), PeriodStats()
+        best_streak = 0
+        mission_stats = []
+        aggregates = self.get_aggregates(member_serial_number)
+        for mission_id, aggregate in sorted(aggregates.items()):
+            mission_total = aggregate.period()
+            mission_period = aggregate.period(start, end)
+            total.add(mission_total)
+            period.add(mission_period)
+            best_streak = max(best_streak, aggregate.best_streak)
+            mission_stats.append({
+                "mission_id": mission_id,
+                "current_streak": aggregate.streak_as_of(today),
+                "best_streak": aggregate.best_streak,
+                "total_achievement_rate": mission_total.achievement_rate,
+                "period_achievement_rate": mission_period.achievement_rate,
+                "period_completed_count": mission_period.completed,
+                "period_target_count": mission_period.target,
+                "period_achieved_days": mission_period.achieved_days,
+            })
+
+        return MissionHistoryResponse(
+            total_achievement_rate=total.achievement_rate,
+            period_achievement_rate=period.achievement_rate,
+            best_streak=best_streak,
+            mission_stats=mission_stats,
+            chart_data=self.charts.mission_chart_data(member_serial_number, aggregates, resolution,
+                                                      start, end, max_points),
+            period={"start": start.isoformat(), "end": end.isoformat()},
+            insights=self._insights(mission_stats, period),
+        )
+
+    @staticmethod
+    def _insights(mission_stats: List[dict], period: PeriodStats) -> List[str]:
+        if not mission_stats:
+            return ["아직 기록된 미션이 없습니다. 오늘 첫 미션을 시작해 보세요!"]
+        insights = [f"조회 기간 달성률은 {period.achievement_rate}% 입니다."]
+        best = max(mission_stats, key=lambda s: s["period_achievement_rate"])
+        worst = min(mission_stats, key=lambda s: s["period_achievement_rate"])
+        if best["period_achievement_rate"] > 0:
+            insights.append(f"미션 {best['mission_id']} 의 달성률이 가장 높습니다 ({best['period_achievement_rate']}%).")
+        if worst is not best and worst["period_achievement_rate"] < 50:
+            insights.append(f"미션 {worst['mission_id']} 는 달성률이 {worst['period_achievement_rate']}% 로 낮아요. 목표를 조정해 보세요.")
+        return insights
@@ -0,0 +1,264 @@
+"""
+HealthSync AI 건강 정상치 기준 서비스
+
+HealthNormalRange 의 자유 텍스트 범위(normal/warning/danger)를 한 번만 해석해서
+(건강항목 코드, 성별 코드)별 정렬 구간표로 컴파일하고,
+검사값 컬럼 전체를 np.searchsorted 한 번으로 RangeStatus 코드로 분류합니다.
+범위 데이터가 바뀌면 다음 조회 시 구간표를 자동으로 다시 컴파일합니다.
+"""
+import logging
+import re
+import threading
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.core.checkup_store import ColumnBatch
+from app.models.health import HealthNormalRange, RangeStatus
+from app.services.base_service import BaseService
+
+logger = logging.getLogger(__name__)
+
+# 분류 코드 (배열 값) ↔ RangeStatus
+STATUS_UNKNOWN = -1
+RANGE_STATUS_CODES: Tuple[RangeStatus, ...] = (RangeStatus.NORMAL, RangeStatus.WARNING, RangeStatus.DANGER)
+_STATUS_CODE = {status: code for code, status in enumerate(RANGE_STATUS_CODES)}
+
+COMMON_GENDER = 0
+
+# (하한, 상한) 반개구간 [lo, hi)
+Interval = Tuple[float, float]
+
+_NUMBER = r"[-+]?\d+(?:\.\d+)?"
+_BETWEEN = re.compile(rf"^({_NUMBER})\s*(?:-|~|–)\s*({_NUMBER})$")
+_PREFIX = re.compile(rf"^(<=|>=|≤|≥|<|>|=<|=>)\s*({_NUMBER})$")
+_SUFFIX = re.compile(rf"^({_NUMBER})\s*(미만|이하|초과|이상)$")
+_EXACT = re.compile(rf"^({_NUMBER})$")
+_SPLIT = re.compile(r"\s*(?:,|;|또는|\bor\b)\s*")
+_UNIT = re.compile(r"[a-zA-Z%µμ㎎㎗㎜㎏]+(?:/[a-zA-Z]+)?|\s+")
+# 요단백 등 정성 검사 표기 → 검진 자료의 등급 코드 (1: 음성, 2: 약양성(±), 3~6: 1+~4+)
+_QUALITATIVE = (("약양성", "2"), ("±", "2"), ("음성", "1"), ("양성", "3이상"))
+_GRADE = re.compile(r"([1-4])\s*\+")
+
+
+def _next_step(token: str) -> float:
+    """표기 자릿수 기준 다음 값 ('139' → 140, '12.9' → 13.0).
+    검사 기준표의 '120-139', '140 이상' 처럼 표기 단위로 끊긴 범위 사이에 빈틈이 없도록 함"""
+    decimals = len(token.split(".")[1]) if "." in token else 0
+    return round(float(token) + 10 ** -decimals, decimals)
+
+
+def _qualitative_to_code(part: str) -> str:
+    """'음성', '±', '1+ 이상' 같은 정성 표기를 등급 코드 숫자 표기로 변환 ('1+ 이상' → '3 이상')"""
+    for token, code in _QUALITATIVE:
+        part = part.replace(token, code)
+    return _GRADE.sub(lambda match: str(int(match.group(1)) + 2), part)
+
+
+def parse_range_text(text: Optional[str]) -> List[Interval]:
+    """'90-120', '120 미만', '≥140', '<90 또는 >140', '음성', '1+ 이상' 형태의 범위 텍스트를 [lo, hi) 구간 목록으로 변환"""
+    if not text or not text.strip():
+        return []
+    intervals: List[Interval] = []
+    for part in _SPLIT.split(text.strip()):
+        part = _UNIT.sub("", _qualitative_to_code(part))
+        if not part:
+            continue
+        match = _BETWEEN.match(part)
+        if match:
+            lo, hi = sorted((match.group(1), match.group(2)), key=float)
+            intervals.append((float(lo), _next_step(hi)))
+            continue
+        match = _PREFIX.match(part)
+        if match:
+            op, token = match.group(1), match.group(2)
+            if op == "<":
+                intervals.append((-np.inf, float(token)))
+            elif op in ("<=", "≤", "=<"):
+                intervals.append((-np.inf, _next_step(token)))
+            elif op == ">":
+                intervals.append((_next_step(token), np.inf))
+            else:
+                intervals.append((float(token), np.inf))
+            continue
+        match = _SUFFIX.match(part)
+        if match:
+            token, word = match.group(1), match.group(2)
+            intervals.append({
+                "미만": (-np.inf, float(token)),
+                "이하": (-np.inf, _next_step(token)),
+                "초과": (_next_step(token), np.inf),
+                "이상": (float(token), np.inf),
+            }[word])
+            continue
+        match = _EXACT.match(part)
+        if match:
+            token = match.group(1)
+            intervals.append((float(token), _next_step(token)))
+            continue
+        raise ValueError(f"해석할 수 없는 범위 표현입니다: {text!r}")
+    return intervals
+
+
+class CompiledRange:
+    """하나의 (항목, 성별)에 대한 계단 함수: edges[i] <= x < edges[i+1] → codes[i]"""
+
+    __slots__ = ("edges", "codes")
+
+    def __init__(self, edges: np.ndarray, codes: np.ndarray):
+        self.edges = edges
+        self.codes = codes
+
+    @classmethod
+    def compile(cls, labelled: Iterable[Tuple[int, Interval]]) -> "CompiledRange":
+        labelled = list(labelled)
+        edges = np.unique(np.array([edge for _, interval in labelled for edge in interval], dtype=np.float64))
+        codes = np.full(max(len(edges) - 1, 0), STATUS_UNKNOWN, dtype=np.int8)
+        if len(codes):
+            # 모든 경계가 edges 에 있으므로 각 기본 구간은 왼쪽 끝점의 포함 여부로 결정됨
+            starts = edges[:-1]
+            for code, (lo, hi) in labelled:
+                covered = (starts >= lo) & (starts < hi)
+                # 구간이 겹치면 더 심각한 상태를 우선
+                codes[covered] = np.maximum(codes[covered], code)
+        return cls(edges, codes)
+
+    def classify(self, values: np.ndarray) -> np.ndarray:
+        values = np.asarray(values, dtype=np.float64)
+        if len(self.codes) == 0:
+            return np.full(values.shape, STATUS_UNKNOWN, dtype=np.int8)
+        index = np.searchsorted(self.edges, values, side="right") - 1
+        inside = (index >= 0) & (index < len(self.codes)) & ~np.isnan(values)
+        return np.where(inside, self.codes[np.clip(index, 0, len(self.codes) - 1)], STATUS_UNKNOWN).astype(np.int8)
+
+
+class NormalRangeTable:
+    """컴파일된 정상치 구간표"""
+
+    def __init__(self, ranges: Iterable[HealthNormalRange], version: int = 0):
+        self.version = version
+        self._tables: Dict[Tuple[str, int], CompiledRange] = {}
+        self.items: Dict[str, HealthNormalRange] = {}
+        # 해석할 수 없는 범위 텍스트가 있어 제외한 기준 ID (한 행 때문에 전체 구간표가 실패하지 않도록)
+        self.skipped: List[int] = []
+        grouped: Dict[Tuple[str, int], List[Tuple[int, Interval]]] = {}
+        for item in ranges:
+            try:
+                labelled = [(_STATUS_CODE[status], interval)
+                            for status, text in ((RangeStatus.NORMAL, item.normal_range),
+                                                 (RangeStatus.WARNING, item.warning_range),
+                                                 (RangeStatus.DANGER, item.danger_range))
+                            for interval in parse_range_text(text)]
+            except ValueError as e:
+                logger.warning("정상치 기준 제외 (range_id=%s, %s): %s", item.range_id, item.health_item_code, e)
+                self.skipped.append(item.range_id)
+                continue
+            if labelled:
+                grouped.setdefault((item.health_item_code, item.gender_code), []).extend(labelled)
+            self.items.setdefault(item.health_item_code, item)
+        self._tables = {key: CompiledRange.compile(labelled) for key, labelled in grouped.items()}
+
+    def lookup(self, item_code: str, gender_code: int = COMMON_GENDER) -> Optional[CompiledRange]:
+        """성별 전용 구간표, 없으면 공통(0) 구간표"""
+        return self._tables.get((item_code, gender_code)) or self._tables.get((item_code, COMMON_GENDER))
+
+    def classify(self, item_code: str, values: Sequence[float],
+                 gender_codes: Optional[Sequence[int]] = None) -> np.ndarray:
+        """검사값 컬럼 분류. 결과는 RANGE_STATUS_CODES 인덱스 (분류 불가 = -1)"""
+        values = np.asarray(values, dtype=np.float64)
+        if gender_codes is None:
+            table = self.lookup(item_code)
+            return table.classify(values) if table else np.full(values.shape, STATUS_UNKNOWN, dtype=np.int8)
+
+        genders = np.asarray(gender_codes)
+        result = np.full(values.shape, STATUS_UNKNOWN, dtype=np.int8)
+        for gender in np.unique(genders):
+            table = self.lookup(item_code, int(gender))
+            if table is not None:
+                selected = genders == gender
+                result[selected] = table.classify(values[selected])
+        return result
+
+    def classify_batch(self, batch: ColumnBatch, gender_codes: Optional[Sequence[int]] = None,
+                       item_codes: Optional[Iterable[str]] = None) -> Dict[str, np.ndarray]:
+        """배치의 모든 검사 항목 분류. 항목 코드는 HealthCheckup 필드명과 같은 것으로 간주"""
+        if gender_codes is None and "gender_code" in batch.schema:
+            gender_codes = np.asarray(batch.column("gender_code"))
+        item_codes = item_codes or self.items.keys()
+        return {code: self.classify(code, batch.as_float(code), gender_codes)
+                for code in item_codes if code in batch.schema}
+
+    def export_arrays(self) -> Dict[str, np.ndarray]:
+        """구간표 배열 (이름: 항목코드/성별/edges|codes)"""
+        return {f"{code}/{gender}/{name}": getattr(table, name)
+                for (code, gender), table in self._tables.items() for name in CompiledRange.__slots__}
+
+    def attach_arrays(self, arrays: Mapping[str, np.ndarray]):
+        self._tables = {(code, gender): CompiledRange(arrays[f"{code}/{gender}/edges"], arrays[f"{code}/{gender}/codes"])
+                        for code, gender in self._tables}
+
+    @staticmethod
+    def to_status(codes: np.ndarray) -> List[Optional[RangeStatus]]:
+        """분류 코드 배열 → RangeStatus 목록 (API 경계용)"""
+        return [RANGE_STATUS_CODES[c] if c >= 0 else None for c in np.asarray(codes).tolist()]
+
+
+class NormalRangeService(BaseService):
+    """정상치 기준 관리 및 분류 서비스"""
+
+    def __init__(self, ranges: Iterable[HealthNormalRange] = ()):
+        super().__init__()
+        self._lock = threading.Lock()
+        self._ranges: Dict[int, HealthNormalRange] = {r.range_id: r for r in ranges}
+        self._version = 0
+        self._table: Optional[NormalRangeTable] = None
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def replace_all(self, ranges: Iterable[HealthNormalRange]):
+        """전체 기준 교체"""
+        with self._lock:
+            self._ranges = {r.range_id: r for r in ranges}
+            self._version += 1
+
+    def upsert(self, ranges: Iterable[HealthNormalRange]):
+        """기준 추가/수정"""
+        with self._lock:
+            for item in ranges:
+                self._ranges[item.range_id] = item
+            self._version += 1
+
+    def remove(self, range_id: int):
+        """기준 삭제"""
+        with self._lock:
+            if self._ranges.pop(range_id, None) is not None:
+                self._version += 1
+
+    @property
+    def table(self) -> NormalRangeTable:
+        """현재 버전의 컴파일된 구간표 (변경 후 첫 조회 시 재컴파일)"""
+        table = self._table
+        if table is not None and table.version == self._version:
+            return table
+        with self._lock:
+            if self._table is None or self._table.version != self._version:
+                self._table = NormalRangeTable(self._ranges.values(), self._version)
+                self.log_operation("compile_normal_ranges", version=self._version, range_count=len(self._ranges),
+                                   skipped=len(self._table.skipped))
+            return self._table
+
+    def export_arrays(self) -> Dict[str, np.ndarray]:
+        return self.table.export_arrays()
+
+    def attach_arrays(self, arrays: Mapping[str, np.ndarray]):
+        """현재 버전 구간표를 공유 배열로 교체 (기준이 바뀌면 다음 조회 시 개인 사본으로 재컴파일)"""
+        self.table.attach_arrays(arrays)
+
+    def classify(self, item_code: str, values: Sequence[float],
+                 gender_codes: Optional[Sequence[int]] = None) -> np.ndarray:
+        return self.table.classify(item_code, values, gender_codes)
+
+    def classify_batch(self, batch: ColumnBatch, gender_codes: Optional[Sequence[int]] = None) -> Dict[str, np.ndarray]:
+        return self.table.classify_batch(batch, gender_codes)
@@ -0,0 +1,321 @@
+"""
+HealthSync AI 배치 알림 발송 서비스
+
+BatchNotificationRequest 의 대상 사용자 목록을 청크로 나눠 제한된 수의 asyncio 워커가 발송합니다.
+- 배압: 청크 큐 크기를 제한하여 생산자가 워커보다 앞서 나가지 않도록 함
+- 재시도: 사용자별로 full jitter 지수 백오프, 재시도 불가 오류나 한도 초과 시 dead-letter 파일에 기록
+- 체크포인트: 완료된 청크 번호와 카운터를 주기적으로 원자적으로 저장 → 중단된 실행은 남은 청크만 이어서 발송
+  (체크포인트 직전에 처리된 청크는 재개 시 다시 발송될 수 있음: at-least-once)
+"""
+import asyncio
+import hashlib
+import json
+import os
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Protocol, Set
+
+from app.models.intelligence import BatchNotificationRequest, BatchNotificationResponse, NotificationType
+from app.services.base_service import BaseService
+
+_NEXT_SCHEDULE: Dict[NotificationType, timedelta] = {
+    NotificationType.DAILY_ENCOURAGEMENT: timedelta(days=1),
+    NotificationType.WEEKLY_SUMMARY: timedelta(days=7),
+}
+
+
+class DeliveryError(Exception):
+    """발송 실패. retryable=False 이면 재시도 없이 dead-letter 처리"""
+
+    def __init__(self, message: str, retryable: bool = True):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+class DeliverySink(Protocol):
+    async def deliver(self, user_id: str, notification_type: NotificationType, trigger_time: datetime) -> None:
+        ...
+
+
+class FakeDeliverySink:
+    """로컬 발송 대상 (처리량 측정용). 지연과 일시/영구 실패를 흉내 냄"""
+
+    def __init__(self, latency: float = 0.0, failure_rate: float = 0.0,
+                 permanent_failures: Optional[Set[str]] = None, seed: Optional[int] = None):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.permanent_failures = permanent_failures or set()
+        self._random = random.Random(seed)
+        self.delivered = 0
+        self.attempts = 0
+
+    async def deliver(self, user_id: str, notification_type: NotificationType, trigger_time: datetime) -> None:
+        self.attempts += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if user_id in self.permanent_failures:
+            raise DeliveryError(f"수신할 수 없는 사용자입니다: {user_id}", retryable=False)
+        if self.failure_rate and self._random.random() < self.failure_rate:
+            raise DeliveryError("일시적인 발송 실패")
+        self.delivered += 1
+
+
+class DispatchProgress:
+    """실행 중 카운터. 실시간 값과 별도로 완료된 청크까지의 값(committed)을 체크포인트에 저장"""
+
+    COUNTERS = ("processed", "succeeded", "failed", "retried")
+
+    def __init__(self, run_id: str, total: int, chunk_size: int):
+        self.run_id = run_id
+        self.total = total
+        self.chunk_size = chunk_size
+        self.completed_chunks: Set[int] = set()
+        self.live = dict.fromkeys(self.COUNTERS, 0)
+        self.committed = dict.fromkeys(self.COUNTERS, 0)
+        self.started_at = time.perf_counter()
+        self.resumed = False
+
+    @property
+    def chunk_count(self) -> int:
+        return (self.total + self.chunk_size - 1) // self.chunk_size
+
+    def add(self, counter: str, amount: int = 1):
+        self.live[counter] += amount
+
+    def commit_chunk(self, index: int, tally: Dict[str, int]):
+        """청크 완료: 완료 목록과 저장용 카운터를 함께 갱신 (중단된 청크의 부분 결과는 저장되지 않음)"""
+        self.completed_chunks.add(index)
+        for counter, amount in tally.items():
+            self.committed[counter] += amount
+
+    def restore(self, completed_chunks: Set[int], counters: Dict[str, int]):
+        self.completed_chunks = completed_chunks
+        self.live = dict(counters)
+        self.committed = dict(counters)
+        self.resumed = True
+
+    def as_dict(self) -> Dict[str, object]:
+        elapsed = time.perf_counter() - self.started_at
+        return dict(
+            self.live,
+            run_id=self.run_id,
+            total=self.total,
+            completed_chunks=len(self.completed_chunks),
+            chunk_count=self.chunk_count,
+            resumed=self.resumed,
+            users_per_second=round(self.live["processed"] / elapsed, 1) if elapsed > 0 else 0.0,
+        )
+
+
+class NotificationDispatchService(BaseService):
+    """배치 알림 발송 엔진"""
+
+    def __init__(self, sink: DeliverySink, checkpoint_dir: Optional[str] = None, chunk_size: Optional[int] = None,
+                 concurrency: Optional[int] = None, max_retries: Optional[int] = None,
+                 retry_base_delay: Optional[float] = None, retry_max_delay: Optional[float] = None):
+        super().__init__()
+        self.sink = sink
+        self.checkpoint_dir = checkpoint_dir or self.settings.notification_checkpoint_dir
+        self.chunk_size = chunk_size or self.settings.notification_chunk_size
+        self.concurrency = concurrency or self.settings.notification_concurrency
+        self.max_retries = self.settings.notification_max_retries if max_retries is None else max_retries
+        self.retry_base_delay = (self.settings.notification_retry_base_ms / 1000
+                                 if retry_base_delay is None else retry_base_delay)
+        self.retry_max_delay = (self.settings.notification_retry_max_ms / 1000
+                                if retry_max_delay is None else retry_max_delay)
+        self._runs: Dict[str, DispatchProgress] = {}
+        self._random = random.Random()
+
+    # 실행 식별 / 체크포인트 -------------------------------------------------------
+    @staticmethod
+    def run_id_for(request: BatchNotificationRequest) -> str:
+        """같은 요청(종류, 트리거 시각, 대상 목록)이면 같은 실행 ID → 재개 가능"""
+        digest = hashlib.sha256(f"{request.notification_type.value}|{request.trigger_time.isoformat()}".encode())
+        for user_id in request.target_users:
+            digest.update(b"\0" + user_id.encode("utf-8"))
+        return digest.hexdigest()[:24]
+
+    def _checkpoint_path(self, run_id: str) -> str:
+        return os.path.join(self.checkpoint_dir, f"{run_id}.checkpoint.json")
+
+    def dead_letter_path(self, run_id: str) -> str:
+        return os.path.join(self.checkpoint_dir, f"{run_id}.dead-letter.jsonl")
+
+    def _load_checkpoint(self, run_id: str, total: int) -> DispatchProgress:
+        path = self._checkpoint_path(run_id)
+        if not os.path.exists(path):
+            return DispatchProgress(run_id, total, self.chunk_size)
+        with open(path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+        # 청크 번호가 어긋나지 않도록 체크포인트의 청크 크기를 그대로 사용
+        progress = DispatchProgress(run_id, total, state["chunk_size"])
+        progress.restore(set(state["completed_chunks"]), state["counters"])
+        return progress
+
+    @staticmethod
+    def _checkpoint_state(progress: DispatchProgress) -> Dict[str, object]:
+        """이벤트 루프에서 스냅샷 (워커가 갱신 중인 집합을 스레드에서 읽지 않도록)"""
+        return {
+            "run_id": progress.run_id,
+            "chunk_size": progress.chunk_size,
+            "total": progress.total,
+            "completed_chunks": sorted(progress.completed_chunks),
+            "counters": dict(progress.committed),
+            "saved_at": datetime.now().isoformat(),
+        }
+
+    def _write_checkpoint(self, state: Dict[str, object]):
+        """임시 파일에 쓰고 rename 하여 중간에 죽어도 이전 체크포인트가 남도록 함"""
+        path = self._checkpoint_path(state["run_id"])
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    async def _save_checkpoint(self, progress: DispatchProgress):
+        await asyncio.to_thread(self._write_checkpoint, self._checkpoint_state(progress))
+
+    def _write_dead_letters(self, run_id: str, entries: List[Dict[str, object]]):
+        with open(self.dead_letter_path(run_id), "a", encoding="utf-8") as f:
+            for entry in entries:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def get_progress(self, run_id: str) -> Dict[str, object]:
+        progress = self._runs.get(run_id)
+        if progress is None:
+            raise LookupError(f"발송 실행을 찾을 수 없습니다: {run_id}")
+        return progress.as_dict()
+
+    # 발송 --------------------------------------------------------------------
+    async def _deliver(self, user_id: str, request: BatchNotificationRequest, progress: DispatchProgress,
+                       tally: Dict[str, int]) -> Optional[Dict[str, object]]:
+        """사용자 1명 발송. 최종 실패 시 dead-letter 항목 반환"""
+        attempt = 0
+        while True:
+            try:
+                await self.sink.deliver(user_id, request.notification_type, request.trigger_time)
+                return None
+            except Exception as e:
+                retryable = getattr(e, "retryable", True)
+                if not retryable or attempt >= self.max_retries:
+                    return {"user_id": user_id, "error": str(e), "attempts": attempt + 1,
+                            "failed_at": datetime.now().isoformat()}
+                # full jitter: [0, min(max, base * 2^attempt)] 사이 임의 대기
+                delay = min(self.retry_max_delay, self.retry_base_delay * (2 ** attempt))
+                await asyncio.sleep(self._random.uniform(0, delay))
+                attempt += 1
+                progress.add("retried")
+                tally["retried"] += 1
+
+    async def _worker(self, queue: asyncio.Queue, request: BatchNotificationRequest, progress: DispatchProgress,
+                      on_chunk_done):
+        while True:
+            chunk = await queue.get()
+            try:
+                if chunk is None:
+                    return
+                index, users = chunk
+                tally = dict.fromkeys(DispatchProgress.COUNTERS, 0)
+                dead_letters = []
+                for user_id in users:
+                    dead_letter = await self._deliver(user_id, request, progress, tally)
+                    outcome = "succeeded" if dead_letter is None else "failed"
+                    for counter in ("processed", outcome):
+                        progress.add(counter)
+                        tally[counter] += 1
+                    if dead_letter is not None:
+                        dead_letters.append(dead_letter)
+                if dead_letters:
+                    await asyncio.to_thread(self._write_dead_letters, progress.run_id, dead_letters)
+                progress.commit_chunk(index, tally)
+                await on_chunk_done()
+            finally:
+                queue.task_done()
+
+    @staticmethod
+    async def _put(queue: asyncio.Queue, item, workers: List[asyncio.Task]):
+        """큐가 가득 차 있으면 워커 종료와 경쟁시키며 대기 (워커가 모두 오류로 끝나도 영원히 막히지 않도록)"""
+        if not queue.full():
+            queue.put_nowait(item)
+            return
+        put = asyncio.ensure_future(queue.put(item))
+        try:
+            await asyncio.wait([put, *workers], return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            if not put.done():
+                put.cancel()
+        if put.done() and not put.cancelled():
+            return
+        # 종료 신호 전에 끝난 워커는 오류로 중단된 것
+        for worker in workers:
+            if worker.done() and not worker.cancelled() and worker.exception() is not None:
+                raise worker.exception()
+        raise RuntimeError("발송 워커가 비정상 종료되었습니다.")
+
+    async def dispatch(self, request: BatchNotificationRequest, run_id: Optional[str] = None,
+                       checkpoint_interval: Optional[float] = None) -> BatchNotificationResponse:
+        """배치 발송 실행 (같은 run_id 의 체크포인트가 있으면 남은 청크만 발송)"""
+        run_id = run_id or self.run_id_for(request)
+        if run_id in self._runs:
+            raise ValueError(f"이미 실행 중인 발송입니다: {run_id}")
+        # 첫 await 전에 실행을 등록해 같은 run_id 의 동시 호출이 함께 시작되지 않도록 함 (체크포인트 로드 전까지는 빈 진행 상태)
+        self._runs[run_id] = DispatchProgress(run_id, len(request.target_users), self.chunk_size)
+        try:
+            os.makedirs(self.checkpoint_dir, exist_ok=True)
+            progress = await asyncio.to_thread(self._load_checkpoint, run_id, len(request.target_users))
+        except BaseException:
+            self._runs.pop(run_id, None)
+            raise
+        self._runs[run_id] = progress
+        interval = self.settings.notification_checkpoint_interval_ms / 1000 if checkpoint_interval is None \
+            else checkpoint_interval
+        last_saved = time.monotonic()
+        save_lock = asyncio.Lock()
+
+        async def on_chunk_done():
+            nonlocal last_saved
+            if time.monotonic() - last_saved < interval or save_lock.locked():
+                return
+            async with save_lock:
+                last_saved = time.monotonic()
+                await self._save_checkpoint(progress)
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency * 2)
+        workers = [asyncio.create_task(self._worker(queue, request, progress, on_chunk_done))
+                   for _ in range(self.concurrency)]
+        self.log_operation("dispatch_start", run_id=run_id, total=progress.total, resumed=progress.resumed,
+                           remaining_chunks=progress.chunk_count - len(progress.completed_chunks))
+        try:
+            for index in range(progress.chunk_count):
+                if index in progress.completed_chunks:
+                    continue
+                start = index * progress.chunk_size
+                # 큐가 가득 차면 여기서 대기 (배압)
+                await self._put(queue, (index, request.target_users[start:start + progress.chunk_size]), workers)
+            for _ in workers:
+                await self._put(queue, None, workers)
+            await asyncio.gather(*workers)
+        except BaseException:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            # 중단 시점까지의 진행 상황 저장 → 같은 요청으로 다시 호출하면 재개
+            await self._save_checkpoint(progress)
+            raise
+        finally:
+            self._runs.pop(run_id, None)
+
+        checkpoint = self._checkpoint_path(run_id)
+        if os.path.exists(checkpoint):
+            os.remove(checkpoint)
+        self.log_operation("dispatch_complete", **progress.as_dict())
+        step = _NEXT_SCHEDULE.get(request.notification_type)
+        return BatchNotificationResponse(
+            processed_count=progress.live["processed"],
+            success_count=progress.live["succeeded"],
+            failed_count=progress.live["failed"],
+            next_scheduled_time=request.trigger_time + step if step else None,
+        )
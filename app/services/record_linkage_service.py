@@ -0,0 +1,243 @@
+"""
+HealthSync AI 원본 건강검진 → 등록 회원 매칭 서비스
+
+HealthCheckupRaw 에는 회원 일련번호가 없고 이름 / 생년월일 / 성별 / 지역 코드만 있습니다.
+- 색인: 등록 회원의 정규화한 (이름, 생년월일) 을 64비트 키로 만들어 정렬 배열로 보관
+- 조회: 원본 행 키를 searchsorted 로 찾아 후보 구간 확인 (행마다 회원 전체를 훑지 않음)
+  - 후보 1명: 성별이 알려져 있고 다르면 미매칭, 아니면 매칭
+  - 후보 여럿: 성별 → 지역 코드 순으로 좁혀 1명이면 매칭, 여럿이면 모호, 없으면 미매칭
+- 병렬: 큰 배치는 chunk_rows 단위로 나눠 프로세스 풀에서 처리 (색인은 작업 프로세스 시작 시 한 번 전달)
+파이프라인의 MemberResolver 로 그대로 쓸 수 있고 (미확인은 -1), 매칭 / 모호 / 미매칭 건수를 누적합니다.
+"""
+import csv
+import hashlib
+import os
+import re
+import time
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from functools import lru_cache
+from typing import Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from app.core.checkup_store import RAW_SCHEMA, ColumnBatch, StringColumn
+from app.models.health import RecordLinkageStats
+from app.models.user import User
+from app.services.base_service import BaseService
+from app.services.checkup_pipeline_service import UNRESOLVED_MEMBER
+
+# 행별 매칭 상태 코드
+LINK_UNMATCHED, LINK_MATCHED, LINK_AMBIGUOUS = 0, 1, 2
+# 회원 색인에서 성별 / 지역을 모르는 값
+UNKNOWN_CODE = -1
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_DATE_STRIDE = np.uint64(0x9E3779B97F4A7C15)
+# 이름 비교에서 무시하는 공백 / 구두점 (가운뎃점, 하이픈 등)
+_NAME_NOISE = re.compile(r"[\s.\-_·ㆍ'\"()]+")
+
+
+def normalize_name(name: str) -> str:
+    """전각 / 호환 문자 통일(NFKC), 공백 / 구두점 제거, 대소문자 무시"""
+    return _NAME_NOISE.sub("", unicodedata.normalize("NFKC", name)).casefold()
+
+
+@lru_cache(maxsize=1 << 16)
+def _name_hash(name: str) -> int:
+    # 같은 이름이 자주 반복되므로 정규화 + 해시 결과를 캐시
+    return int.from_bytes(hashlib.blake2b(normalize_name(name).encode("utf-8"), digest_size=8).digest(), "little")
+
+
+@lru_cache(maxsize=1 << 16)
+def _encoded_name_hash(name: bytes) -> int:
+    return _name_hash(name.decode("utf-8"))
+
+
+def _name_hashes(names: Union[StringColumn, Iterable[str]], count: int) -> np.ndarray:
+    if isinstance(names, StringColumn):
+        # 행마다 numpy 슬라이스 → str 로 바꾸지 않고 bytes 한 덩어리에서 잘라 캐시 조회
+        offsets, data = names.compact()
+        buffer = data.tobytes()
+        bounds = offsets.tolist()
+        return np.fromiter((_encoded_name_hash(buffer[start:stop]) for start, stop in zip(bounds, bounds[1:])),
+                           dtype=np.uint64, count=count)
+    return np.fromiter((_name_hash(name) for name in names), dtype=np.uint64, count=count)
+
+
+def link_keys(names: Union[StringColumn, Iterable[str]], birth_days: np.ndarray) -> np.ndarray:
+    """(정규화 이름, 생년월일) → int64 연결 키. 생년월일은 1970-01-01 기준 일수"""
+    birth_days = np.asarray(birth_days, dtype=np.int64)
+    hashes = _name_hashes(names, len(birth_days))
+    with np.errstate(over="ignore"):
+        keys = hashes * _DATE_STRIDE + birth_days.view(np.uint64)
+    return keys.view(np.int64)
+
+
+class LinkageIndex(NamedTuple):
+    """연결 키 정렬 순서의 회원 배열"""
+    keys: np.ndarray
+    members: np.ndarray
+    gender_codes: np.ndarray
+    region_codes: np.ndarray
+
+    @classmethod
+    def build(cls, members: Sequence[int], names: Sequence[str], birth_days: Sequence[int],
+              gender_codes: Optional[Sequence[int]] = None,
+              region_codes: Optional[Sequence[int]] = None) -> "LinkageIndex":
+        n = len(members)
+        keys = link_keys(names, np.asarray(birth_days, dtype=np.int64))
+        unknown = np.full(n, UNKNOWN_CODE, dtype=np.int32)
+        genders = unknown if gender_codes is None else np.asarray(gender_codes, dtype=np.int32)
+        regions = unknown if region_codes is None else np.asarray(region_codes, dtype=np.int32)
+        order = np.argsort(keys, kind="stable")
+        return cls(keys[order], np.asarray(members, dtype=np.int64)[order], genders[order], regions[order])
+
+    def resolve(self, names: Union[StringColumn, Iterable[str]], birth_days: np.ndarray, gender_codes: np.ndarray,
+                region_codes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """원본 행별 (회원 일련번호 또는 -1, 매칭 상태 코드)"""
+        keys = link_keys(names, birth_days)
+        genders = np.asarray(gender_codes, dtype=np.int32)
+        regions = np.asarray(region_codes, dtype=np.int32)
+        n = len(keys)
+        members = np.full(n, UNRESOLVED_MEMBER, dtype=np.int64)
+        status = np.full(n, LINK_UNMATCHED, dtype=np.int8)
+        if n == 0 or len(self.keys) == 0:
+            return members, status
+        lo = np.searchsorted(self.keys, keys, side="left")
+        hi = np.searchsorted(self.keys, keys, side="right")
+        counts = hi - lo
+
+        # 후보 1명 (대부분): 벡터 연산으로 성별 확인
+        single = np.flatnonzero(counts == 1)
+        positions = lo[single]
+        candidate_genders = self.gender_codes[positions]
+        consistent = (candidate_genders == UNKNOWN_CODE) | (candidate_genders == genders[single])
+        members[single[consistent]] = self.members[positions[consistent]]
+        status[single[consistent]] = LINK_MATCHED
+
+        # 후보 여럿 (동명이인 + 같은 생년월일): 성별 → 지역 순으로 좁힘
+        for row in np.flatnonzero(counts > 1).tolist():
+            candidates = np.arange(lo[row], hi[row])
+            candidate_genders = self.gender_codes[candidates]
+            candidates = candidates[(candidate_genders == UNKNOWN_CODE) | (candidate_genders == genders[row])]
+            if len(candidates) > 1:
+                same_region = candidates[self.region_codes[candidates] == regions[row]]
+                if len(same_region):
+                    candidates = same_region
+            # 같은 회원이 색인에 중복된 경우는 한 명으로 봄
+            found = np.unique(self.members[candidates])
+            if len(found) == 1:
+                members[row] = found[0]
+                status[row] = LINK_MATCHED
+            elif len(found) > 1:
+                status[row] = LINK_AMBIGUOUS
+        return members, status
+
+
+# 작업 프로세스 전역 색인 (풀 초기화 때 한 번 설정)
+_worker_index: Optional[LinkageIndex] = None
+
+
+def _init_worker(index: LinkageIndex):
+    global _worker_index
+    _worker_index = index
+
+
+def _resolve_chunk(chunk: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]):
+    offsets, data, birth_days, gender_codes, region_codes = chunk
+    return _worker_index.resolve(StringColumn(offsets, data), birth_days, gender_codes, region_codes)
+
+
+class RecordLinkageService(BaseService):
+    """원본 건강검진 → 등록 회원 일괄 매칭 (CheckupPipelineService 의 MemberResolver)"""
+
+    def __init__(self, index: LinkageIndex, workers: Optional[int] = None, chunk_rows: Optional[int] = None):
+        super().__init__()
+        self.index = index
+        self.workers = workers if workers is not None else (self.settings.linkage_workers or os.cpu_count() or 1)
+        self.chunk_rows = chunk_rows or self.settings.linkage_chunk_rows
+        self.stats = RecordLinkageStats()
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    @classmethod
+    def from_users(cls, users: Iterable[User], **kwargs) -> "RecordLinkageService":
+        """등록 회원 모델로 색인 생성 (성별 / 지역 정보 없음)"""
+        users = list(users)
+        return cls(LinkageIndex.build([u.member_serial_number for u in users], [u.name for u in users],
+                                      [u.birth_date.toordinal() - _EPOCH_ORDINAL for u in users]), **kwargs)
+
+    @classmethod
+    def from_csv(cls, path: str, encoding: str = "utf-8-sig", **kwargs) -> "RecordLinkageService":
+        """member_serial_number,name,birth_date[,gender_code,region_code] CSV 로 색인 생성 (빈 값은 모름)"""
+        members: List[int] = []
+        names: List[str] = []
+        birth_days: List[int] = []
+        genders: List[int] = []
+        regions: List[int] = []
+        with open(path, "r", encoding=encoding, newline="") as f:
+            for row in csv.DictReader(f):
+                members.append(int(row["member_serial_number"]))
+                names.append(row["name"])
+                birth_days.append(date.fromisoformat(row["birth_date"].strip()).toordinal() - _EPOCH_ORDINAL)
+                genders.append(int(row.get("gender_code") or UNKNOWN_CODE))
+                regions.append(int(row.get("region_code") or UNKNOWN_CODE))
+        return cls(LinkageIndex.build(members, names, birth_days, genders, regions), **kwargs)
+
+    def _executor(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                             initargs=(self.index,))
+        return self._pool
+
+    def link(self, raw: ColumnBatch) -> Tuple[np.ndarray, np.ndarray]:
+        """원본 배치 매칭. (회원 일련번호 배열 (미확인 -1), 상태 코드 배열)"""
+        if raw.schema is not RAW_SCHEMA:
+            raise ValueError("HealthCheckupRaw 배치만 매칭할 수 있습니다.")
+        started = time.perf_counter()
+        names = raw.column("name")
+        birth_days = np.asarray(raw.column("birth_date"))
+        genders = np.asarray(raw.column("gender_code"))
+        regions = np.asarray(raw.column("region_code"))
+        n = len(raw)
+        if self.workers <= 1 or n <= self.chunk_rows:
+            members, status = self.index.resolve(names, birth_days, genders, regions)
+        else:
+            # 청크별 이름 컬럼은 해당 구간 bytes 만 잘라 전달
+            chunks = []
+            for start in range(0, n, self.chunk_rows):
+                stop = min(start + self.chunk_rows, n)
+                offsets, data = names.slice(start, stop).compact()
+                chunks.append((offsets, data, birth_days[start:stop], genders[start:stop], regions[start:stop]))
+            results = list(self._executor().map(_resolve_chunk, chunks))
+            members = np.concatenate([m for m, _ in results])
+            status = np.concatenate([s for _, s in results])
+        self._record(status, time.perf_counter() - started)
+        return members, status
+
+    def __call__(self, raw: ColumnBatch) -> np.ndarray:
+        return self.link(raw)[0]
+
+    def _record(self, status: np.ndarray, elapsed: float):
+        counts = np.bincount(status, minlength=3)
+        stats = self.stats
+        stats.rows += len(status)
+        stats.unmatched += int(counts[LINK_UNMATCHED])
+        stats.matched += int(counts[LINK_MATCHED])
+        stats.ambiguous += int(counts[LINK_AMBIGUOUS])
+        stats.elapsed_seconds += elapsed
+        stats.rows_per_second = stats.rows / stats.elapsed_seconds if stats.elapsed_seconds else 0.0
+
+    def close(self):
+        """프로세스 풀 종료 후 누적 매칭 결과 기록"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        self.log_operation("record_linkage", **self.stats.model_dump())
+
+    def __enter__(self) -> "RecordLinkageService":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,96 @@
+"""
+HealthSync AI 건강검진 CSV 파서
+
+바이트 청크를 받는 즉시 레코드를 해석하는 증분 파서입니다.
+첫 줄은 헤더(HealthCheckupRaw 필드명)로 간주하며, chunk_size 행이 모일 때마다
+ColumnBatch 하나를 만들어 반환하므로 파일 크기와 무관하게 메모리 사용량이 일정합니다.
+(따옴표 안의 줄바꿈은 지원하지 않습니다.)
+"""
+import codecs
+import csv
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+from app.core.checkup_store import RAW_SCHEMA, ColumnBatch, ColumnSchema
+
+DEFAULT_READ_SIZE = 1024 * 1024
+
+
+class CheckupCsvParser:
+    """증분 CSV 파서 (feed → ColumnBatch 목록)"""
+
+    def __init__(self, chunk_size: int, schema: ColumnSchema = RAW_SCHEMA, encoding: str = "utf-8-sig"):
+        if chunk_size <= 0:
+            raise ValueError("chunk_size 는 1 이상이어야 합니다.")
+        self.schema = schema
+        self.chunk_size = chunk_size
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._pending = ""
+        self._header: Optional[List[str]] = None
+        self._positions: Dict[str, int] = {}
+        self._rows: List[List[str]] = []
+        self.total_rows = 0
+
+    def feed(self, data: bytes) -> List[ColumnBatch]:
+        """바이트 청크 입력. 완성된 배치 목록 반환"""
+        text = self._pending + self._decoder.decode(data)
+        cut = text.rfind("\n")
+        if cut < 0:
+            self._pending = text
+            return []
+        self._pending = text[cut + 1:]
+        return self._consume(text[:cut + 1].splitlines())
+
+    def close(self) -> List[ColumnBatch]:
+        """남은 입력 처리 후 마지막 배치 반환"""
+        tail = self._pending + self._decoder.decode(b"", final=True)
+        self._pending = ""
+        batches = self._consume(tail.splitlines()) if tail.strip() else []
+        if self._rows:
+            batches.append(self._flush())
+        return batches
+
+    def _consume(self, lines: List[str]) -> List[ColumnBatch]:
+        batches = []
+        reader = csv.reader(lines)
+        if self._header is None:
+            for row in reader:
+                if any(cell.strip() for cell in row):
+                    self._set_header(row)
+                    break
+        for row in reader:
+            if row:
+                self._rows.append(row)
+            if len(self._rows) >= self.chunk_size:
+                batches.append(self._flush())
+        return batches
+
+    def _set_header(self, row: List[str]):
+        self._header = [h.strip() for h in row]
+        self._positions = {name: i for i, name in enumerate(self._header) if name in self.schema}
+        if self.schema.key_field not in self._positions:
+            raise ValueError(f"헤더에 필수 컬럼이 없습니다: {self.schema.key_field}")
+
+    def _flush(self) -> ColumnBatch:
+        rows, self._rows = self._rows, []
+        width = len(self._header)
+        if any(len(row) != width for row in rows):
+            raise ValueError(f"{self.total_rows + 1}번째 레코드 이후에 컬럼 수가 헤더와 다른 줄이 있습니다.")
+        transposed = list(zip(*rows))
+        columns = {name: transposed[position] for name, position in self._positions.items()}
+        batch = ColumnBatch.from_strings(self.schema, columns, len(rows), defaults={"created_at": datetime.now()})
+        self.total_rows += len(rows)
+        return batch
+
+
+def iter_csv_batches(path: str, chunk_size: int, schema: ColumnSchema = RAW_SCHEMA,
+                     encoding: str = "utf-8-sig", read_size: int = DEFAULT_READ_SIZE) -> Iterator[ColumnBatch]:
+    """CSV 파일을 read_size 단위로 읽어 chunk_size 행짜리 배치로 순회"""
+    parser = CheckupCsvParser(chunk_size, schema, encoding)
+    with open(path, "rb") as f:
+        while True:
+            data = f.read(read_size)
+            if not data:
+                break
+            yield from parser.feed(data)
+    yield from parser.close()
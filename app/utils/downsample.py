@@ -0,0 +1,48 @@
+"""
+HealthSync AI 시계열 다운샘플링 유틸리티
+
+LTTB(Largest-Triangle-Three-Buckets): 버킷마다 이전 선택점과 다음 버킷 평균점으로 만든
+삼각형 면적이 가장 큰 점을 골라 극값과 추세 모양을 유지한 채 점 개수를 줄입니다.
+"""
+import numpy as np
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """선택된 점의 인덱스 반환 (x 는 오름차순, 첫 점과 마지막 점은 항상 포함)"""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    size = len(x)
+    if threshold >= size or size <= 2:
+        return np.arange(size)
+    if threshold < 3:
+        return np.array([0, size - 1])[:max(threshold, 1)]
+
+    # 첫/마지막 점을 뺀 나머지를 (threshold - 2)개 버킷으로 분할
+    bounds = np.linspace(1, size - 1, threshold - 1).astype(np.int64)
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = size - 1
+
+    # 다음 버킷 평균점은 누적합으로 한 번에 계산
+    cx = np.concatenate(([0.0], np.cumsum(x)))
+    cy = np.concatenate(([0.0], np.cumsum(y)))
+    next_lo = bounds[1:]
+    next_hi = np.append(bounds[2:], size)
+    counts = next_hi - next_lo
+    avg_x = (cx[next_hi] - cx[next_lo]) / counts
+    avg_y = (cy[next_hi] - cy[next_lo]) / counts
+
+    previous = 0
+    for bucket in range(threshold - 2):
+        lo, hi = bounds[bucket], bounds[bucket + 1]
+        px, py = x[previous], y[previous]
+        area = np.abs((px - avg_x[bucket]) * (y[lo:hi] - py) - (px - x[lo:hi]) * (avg_y[bucket] - py))
+        previous = lo + int(np.argmax(area))
+        selected[bucket + 1] = previous
+    return selected
+
+
+def lttb(x: np.ndarray, y: np.ndarray, threshold: int):
+    """(x, y) 를 threshold 개 점으로 다운샘플링"""
+    index = lttb_indices(x, y, threshold)
+    return np.asarray(x)[index], np.asarray(y)[index]
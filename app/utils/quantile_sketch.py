@@ -0,0 +1,167 @@
+"""
+HealthSync AI 스트리밍 분위수 스케치 (KLL)
+
+값을 모두 저장하지 않고 레벨별 압축 버퍼만 유지하여 순위/분위수를 근사합니다.
+- 레벨 h 의 값은 가중치 2^h, 버퍼가 용량을 넘으면 정렬 후 짝/홀 위치 중 하나만 다음 레벨로 올림
+- 같은 k 의 스케치끼리 병합 가능 (코호트 합치기, 병렬 구축)
+- 순위 조회는 정렬된 뷰(값, 누적 가중치)를 캐시해 두고 searchsorted 한 번으로 처리
+- 직렬화: 헤더 + 레벨 크기 + float32 값 (k=200 이면 수 KB)
+"""
+import struct
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+_MAGIC = b"KLL1"
+_HEADER = struct.Struct("<4sHqddH")
+_CAPACITY_DECAY = 2 / 3
+
+
+class KLLSketch:
+    """KLL 분위수 스케치"""
+
+    __slots__ = ("k", "count", "min_value", "max_value", "levels", "_rng", "_view")
+
+    def __init__(self, k: int = 200, seed: Optional[int] = None):
+        if k < 8:
+            raise ValueError("KLL 스케치의 k 는 8 이상이어야 합니다.")
+        self.k = k
+        self.count = 0
+        self.min_value = np.inf
+        self.max_value = -np.inf
+        self.levels: List[np.ndarray] = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+        self._view: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - 1 - level
+        return max(2, int(np.ceil(self.k * _CAPACITY_DECAY ** depth)))
+
+    # 갱신 --------------------------------------------------------------------
+    def update(self, value: float):
+        self.update_many(np.array([value], dtype=np.float64))
+
+    def update_many(self, values: Sequence[float]):
+        """값 묶음 추가 (NaN 은 무시)"""
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+        self.count += len(values)
+        self.min_value = min(self.min_value, float(values.min()))
+        self.max_value = max(self.max_value, float(values.max()))
+        self.levels[0] = np.concatenate((self.levels[0], values))
+        self._compress()
+
+    def merge(self, other: "KLLSketch"):
+        """다른 스케치 병합 (같은 k 권장, 정확도는 작은 k 를 따름)"""
+        if other.count == 0:
+            return
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, values in enumerate(other.levels):
+            self.levels[level] = np.concatenate((self.levels[level], values))
+        self.count += other.count
+        self.min_value = min(self.min_value, other.min_value)
+        self.max_value = max(self.max_value, other.max_value)
+        self._compress()
+
+    def _compress(self):
+        """전체 크기가 총 용량을 넘는 동안 용량을 넘은 가장 낮은 레벨 하나씩 압축 (lazy KLL)"""
+        self._view = None
+        while sum(len(v) for v in self.levels) > sum(self._capacity(h) for h in range(len(self.levels))):
+            level = next(h for h, v in enumerate(self.levels) if len(v) >= self._capacity(h))
+            if level + 1 == len(self.levels):
+                self.levels.append(np.empty(0))
+            buffer = np.sort(self.levels[level])
+            # 홀수 개면 하나는 현재 레벨에 남기고 나머지 짝수 개를 절반으로 압축
+            keep = buffer[:len(buffer) % 2]
+            promoted = buffer[len(keep):][int(self._rng.integers(2))::2]
+            self.levels[level] = keep
+            self.levels[level + 1] = np.concatenate((self.levels[level + 1], promoted))
+
+    # 조회 --------------------------------------------------------------------
+    def _sorted_view(self) -> Tuple[np.ndarray, np.ndarray]:
+        if self._view is None:
+            values = np.concatenate(self.levels)
+            weights = np.concatenate([np.full(len(v), 1 << h, dtype=np.int64) for h, v in enumerate(self.levels)])
+            order = np.argsort(values, kind="stable")
+            self._view = (values[order], np.cumsum(weights[order]))
+        return self._view
+
+    def rank(self, value: float) -> float:
+        """value 이하인 비율 (0~1)"""
+        if self.count == 0:
+            return float("nan")
+        if value < self.min_value:
+            return 0.0
+        if value >= self.max_value:
+            return 1.0
+        values, cumulative = self._sorted_view()
+        index = int(np.searchsorted(values, value, side="right"))
+        return float(cumulative[index - 1]) / float(cumulative[-1]) if index else 0.0
+
+    def ranks(self, values: Sequence[float]) -> np.ndarray:
+        """여러 값의 순위를 한 번에 계산"""
+        values = np.asarray(values, dtype=np.float64)
+        if self.count == 0:
+            return np.full(values.shape, np.nan)
+        sorted_values, cumulative = self._sorted_view()
+        index = np.searchsorted(sorted_values, values, side="right")
+        result = np.where(index > 0, cumulative[np.maximum(index - 1, 0)] / cumulative[-1], 0.0)
+        result[values >= self.max_value] = 1.0
+        return result
+
+    def quantile(self, q: float) -> float:
+        """q 분위수 (0~1)"""
+        if self.count == 0:
+            return float("nan")
+        if q <= 0:
+            return self.min_value
+        if q >= 1:
+            return self.max_value
+        values, cumulative = self._sorted_view()
+        index = int(np.searchsorted(cumulative, q * cumulative[-1], side="left"))
+        return float(values[min(index, len(values) - 1)])
+
+    # 공유 메모리 -----------------------------------------------------------------
+    def export_arrays(self) -> Dict[str, np.ndarray]:
+        """레벨 값과 정렬 뷰 (작업 프로세스가 정렬 뷰를 각자 만들지 않도록 함께 공유)"""
+        values, cumulative = self._sorted_view()
+        return {"levels": np.concatenate(self.levels), "sorted": values, "cumulative": cumulative}
+
+    def attach_arrays(self, arrays: Mapping[str, np.ndarray]):
+        """레벨 / 정렬 뷰를 공유 배열의 구간으로 교체 (갱신 시에는 새 배열이 만들어지므로 공유 영역은 수정되지 않음)"""
+        levels = arrays["levels"]
+        bounds = np.concatenate(([0], np.cumsum([len(v) for v in self.levels], dtype=np.int64)))
+        self.levels = [levels[bounds[i]:bounds[i + 1]] for i in range(len(self.levels))]
+        self._view = (arrays["sorted"], arrays["cumulative"])
+
+    # 직렬화 -------------------------------------------------------------------
+    def to_bytes(self) -> bytes:
+        sizes = np.array([len(v) for v in self.levels], dtype=np.uint32)
+        values = np.concatenate(self.levels).astype(np.float32)
+        header = _HEADER.pack(_MAGIC, self.k, self.count, self.min_value, self.max_value, len(self.levels))
+        return header + sizes.tobytes() + values.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes, seed: Optional[int] = None) -> "KLLSketch":
+        magic, k, count, min_value, max_value, level_count = _HEADER.unpack_from(data, 0)
+        if magic != _MAGIC:
+            raise ValueError("KLL 스케치 형식이 아닙니다.")
+        offset = _HEADER.size
+        sizes = np.frombuffer(data, dtype=np.uint32, count=level_count, offset=offset)
+        offset += sizes.nbytes
+        values = np.frombuffer(data, dtype=np.float32, count=int(sizes.sum()), offset=offset).astype(np.float64)
+        sketch = cls(k, seed)
+        sketch.count, sketch.min_value, sketch.max_value = count, min_value, max_value
+        bounds = np.concatenate(([0], np.cumsum(sizes, dtype=np.int64)))
+        sketch.levels = [values[bounds[i]:bounds[i + 1]] for i in range(level_count)] or [np.empty(0)]
+        return sketch
+
+    @property
+    def byte_size(self) -> int:
+        return _HEADER.size + 4 * len(self.levels) + 4 * sum(len(v) for v in self.levels)
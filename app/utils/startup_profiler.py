@@ -0,0 +1,165 @@
+"""
+HealthSync AI 기동 시간 프로파일러
+
+새 인터프리터에서 측정하므로 현재 프로세스에 이미 로드된 모듈의 영향을 받지 않습니다.
+- 모듈별 import 시간: python -X importtime 출력 (자체 시간 / 하위 포함 누적 시간)
+- 첫 요청까지의 시간: uvicorn 프로세스 실행 시점부터 상태 확인 엔드포인트가 200 을 반환할 때까지
+"""
+import http.client
+import os
+import socket
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, NamedTuple, Optional
+
+# 서버 기동 경로에 있으면 안 되는 무거운 모듈 (첫 요청 시 필요한 곳에서 로드)
+DEFERRED_MODULES = ("numpy", "psutil")
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class ImportTiming(NamedTuple):
+    """모듈 하나의 import 시간 (마이크로초)"""
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+class StartupProfile(NamedTuple):
+    """기동 시간 측정 결과"""
+    imports: List[ImportTiming]
+    import_seconds: float
+    ready_seconds: Optional[float]
+
+    def top_modules(self, limit: int = 20) -> List[ImportTiming]:
+        """자체 import 시간이 긴 모듈 순"""
+        return sorted(self.imports, key=lambda t: t.self_us, reverse=True)[:limit]
+
+    def by_package(self) -> Dict[str, int]:
+        """최상위 패키지별 자체 import 시간 합 (마이크로초, 긴 순)"""
+        totals: Dict[str, int] = defaultdict(int)
+        for timing in self.imports:
+            totals[timing.module.split(".", 1)[0]] += timing.self_us
+        return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+
+def _child_env() -> Dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, (_PROJECT_ROOT, env.get("PYTHONPATH"))))
+    return env
+
+
+def parse_importtime(output: str) -> List[ImportTiming]:
+    """-X importtime 출력 (import time: self | cumulative | 들여쓴 모듈명) 파싱"""
+    timings = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # 헤더 행
+        name = parts[2].rstrip()
+        stripped = name.lstrip()
+        timings.append(ImportTiming(stripped, int(parts[0]), int(parts[1]), (len(name) - len(stripped) - 1) // 2))
+    return timings
+
+
+def measure_imports(module: str = "app.main") -> List[ImportTiming]:
+    """새 인터프리터에서 module 을 import 하며 모듈별 import 시간 수집"""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=_PROJECT_ROOT, env=_child_env(), capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"{module} import 실패:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr)
+
+
+def measure_import_seconds(module: str = "app.main") -> Dict[str, object]:
+    """새 인터프리터에서 module import 소요 시간(초)과 로드된 지연 대상 모듈 목록"""
+    code = (
+        "import sys, time\n"
+        "started = time.perf_counter()\n"
+        f"import {module}\n"
+        "elapsed = time.perf_counter() - started\n"
+        f"loaded = [m for m in {DEFERRED_MODULES!r} if m in sys.modules]\n"
+        "print(elapsed, ','.join(loaded))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=_PROJECT_ROOT, env=_child_env(),
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"{module} import 실패:\n{result.stderr[-2000:]}")
+    elapsed, _, loaded = result.stdout.strip().splitlines()[-1].partition(" ")
+    return {"seconds": float(elapsed), "deferred_loaded": [m for m in loaded.split(",") if m]}
+
+
+def _free_port(host: str) -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+
+def _get_status(host: str, port: int, path: str) -> Optional[int]:
+    connection = http.client.HTTPConnection(host, port, timeout=1)
+    try:
+        connection.request("GET", path)
+        return connection.getresponse().status
+    except OSError:
+        return None
+    finally:
+        connection.close()
+
+
+def measure_ready_seconds(app: str = "app.main:app", path: str = "/api/v1/status/check",
+                          host: str = "127.0.0.1", timeout: float = 30.0) -> float:
+    """uvicorn 프로세스 실행부터 path 가 처음 200 을 반환할 때까지의 시간(초)"""
+    port = _free_port(host)
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", app, "--host", host, "--port", str(port), "--log-level", "warning"],
+        cwd=_PROJECT_ROOT, env=_child_env(), stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            if process.poll() is not None:
+                raise RuntimeError(f"서버가 기동 중 종료되었습니다:\n{process.stderr.read().decode()[-2000:]}")
+            if _get_status(host, port, path) == 200:
+                return time.perf_counter() - started
+            time.sleep(0.005)
+        raise TimeoutError(f"{timeout}초 안에 {path} 응답이 없습니다.")
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+        process.stderr.close()
+
+
+def profile_startup(module: str = "app.main", measure_ready: bool = True) -> StartupProfile:
+    """모듈별 import 시간 + import 소요 시간 + (선택) 첫 요청까지의 시간"""
+    imports = measure_imports(module)
+    import_seconds = measure_import_seconds(module)["seconds"]
+    ready_seconds = measure_ready_seconds(f"{module}:app") if measure_ready else None
+    return StartupProfile(imports, import_seconds, ready_seconds)
+
+
+def format_profile(profile: StartupProfile, limit: int = 20) -> str:
+    """프로파일 결과 → 출력용 문자열"""
+    lines = [f"⏱️ app import: {profile.import_seconds * 1000:.1f}ms"]
+    if profile.ready_seconds is not None:
+        lines.append(f"⏱️ 첫 요청 응답까지: {profile.ready_seconds * 1000:.1f}ms (프로세스 실행 기준)")
+    lines.append("")
+    lines.append(f"📦 패키지별 import 시간 (상위 {limit})")
+    for package, self_us in list(profile.by_package().items())[:limit]:
+        lines.append(f"  {self_us / 1000:9.1f}ms  {package}")
+    lines.append("")
+    lines.append(f"📄 모듈별 import 시간 (자체 시간 상위 {limit}, 괄호는 하위 포함 누적)")
+    for timing in profile.top_modules(limit):
+        lines.append(f"  {timing.self_us / 1000:9.1f}ms ({timing.cumulative_us / 1000:9.1f}ms)  {timing.module}")
+    loaded = [m for m in DEFERRED_MODULES if any(t.module == m for t in profile.imports)]
+    if loaded:
+        lines.append("")
+        lines.append(f"⚠️ 기동 경로에서 로드된 지연 대상 모듈: {', '.join(loaded)}")
+    return "\n".join(lines)
@@ -0,0 +1,18 @@
+"""
+HealthSync AI 이력 조회 뷰 (라우터 등록)
+"""
+from fastapi import APIRouter
+from app.controllers.history_controller import history_controller
+
+# 이력 조회 라우터 생성
+history_router = APIRouter(
+    prefix="/history",
+    tags=["📜 History"],
+    responses={
+        400: {"description": "잘못된 페이지 커서입니다."},
+        500: {"description": "서버 내부 오류가 발생했습니다."}
+    }
+)
+
+# 이력 조회 컨트롤러의 라우터 포함
+history_router.include_router(history_controller.router)
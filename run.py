@@ -1,12 +1,56 @@
 """
 HealthSync AI 서버 실행 스크립트
 """
+import argparse
 import uvicorn
-from app.main import app
 from app.config.settings import settings
 
+def profile_startup(limit: int, measure_ready: bool):
+    """기동 시간 프로파일 출력 (모듈별 import 시간, 첫 요청까지의 시간)"""
+    from app.utils.startup_profiler import format_profile, profile_startup as run_profile
+    print(f"🔍 {settings.app_name} 기동 시간 측정 중...")
+    print(format_profile(run_profile(measure_ready=measure_ready), limit=limit))
+
+def serve_prefork(workers: int):
+    """멀티 프로세스 서버 실행 (코드 변경 자동 재시작은 지원하지 않음, 순차 재시작은 SIGHUP)"""
+    from app.core.prefork import PreforkServer
+    print(f"🚀 {settings.app_name} 멀티 프로세스 서버 시작... (작업 프로세스 {workers}개)")
+    print(f"📍 주소: http://{settings.host}:{settings.port}")
+    PreforkServer(
+        "app.main:app",
+        host=settings.host,
+        port=settings.port,
+        workers=workers,
+        reuse_port=settings.server_reuse_port,
+        max_requests=settings.server_max_requests,
+        max_requests_jitter=settings.server_max_requests_jitter,
+        max_memory_mb=settings.server_max_memory_mb,
+        graceful_timeout=settings.server_graceful_timeout_seconds,
+        log_level=settings.log_level.lower(),
+        preload="app.main:preload_shared_state" if settings.server_share_read_only else None
+    ).run()
+
 def main():
     """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description=f"{settings.app_name} 서버 실행")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="서버를 띄우지 않고 모듈별 import 시간과 첫 요청까지의 시간 출력")
+    parser.add_argument("--top", type=int, default=20, help="프로파일 출력 모듈 수")
+    parser.add_argument("--no-ready", action="store_true", help="첫 요청까지의 시간 측정 생략")
+    parser.add_argument("--workers", type=int, default=settings.server_workers,
+                        help="작업 프로세스 수 (2 이상이면 preload 후 fork 하는 멀티 프로세스 모드)")
+    args = parser.parse_args()
+
+    if args.profile_startup:
+        profile_startup(args.top, measure_ready=not args.no_ready)
+        return
+    if args.workers > 1:
+        if settings.server_writers_enabled:
+            parser.error("작업 프로세스 2개 이상에서는 업로드 / 동기화 상태를 프로세스끼리 나눠 쓸 수 없습니다. "
+                         "SERVER_WRITERS_ENABLED=false 로 실행하고 해당 요청은 단일 프로세스 서버로 보내세요.")
+        serve_prefork(args.workers)
+        return
+
     print(f"🚀 {settings.app_name} 서버 시작...")
     print(f"📍 주소: http://{settings.host}:{settings.port}")
     print(f"📖 API 문서: http://{settings.host}:{settings.port}/docs")
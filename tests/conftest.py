@@ -0,0 +1,28 @@
+"""
+테스트 공통 설정
+"""
+import os
+
+import pytest
+
+_PERF_DIR = os.path.join(os.path.dirname(__file__), "perf")
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("perf", "성능 테스트")
+    group.addoption("--perf", action="store_true", default=False, help="tests/perf 성능 테스트 실행")
+    group.addoption("--perf-update-baseline", action="store_true", default=False,
+                    help="측정 결과로 tests/perf/baseline.json 갱신")
+    group.addoption("--perf-results", default=os.path.join(_PERF_DIR, "results.json"),
+                    help="측정 결과 JSON 경로")
+    group.addoption("--perf-tolerance", type=float, default=0.75,
+                    help="기준선 대비 허용 오차 (0.75 = 기기 속도 보정 후 75%% 까지 느려져도 통과)")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--perf") or config.getoption("--perf-update-baseline"):
+        return
+    skip = pytest.mark.skip(reason="성능 테스트는 --perf 옵션으로 실행")
+    for item in items:
+        if str(item.fspath).startswith(_PERF_DIR):
+            item.add_marker(skip)
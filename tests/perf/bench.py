@@ -0,0 +1,221 @@
+"""
+성능 테스트 공통 도구
+
+- 엔드포인트 부하: httpx.AsyncClient 로 ASGI 앱을 프로세스 안에서 호출하고 동시 요청 수별 지연 분포 / RPS 측정
+- 마이크로 벤치마크: timeit 방식 반복 측정 (최고 회차 기준 초당 처리량)
+- 호출별 지연: 단일 호출을 여러 번 재어 p50/p95/p99 분포 측정 (꼬리 지연이 중요한 요청 경로용)
+- 기준선 비교: 고정 작업의 실행 시간(보정값)으로 기기 속도 차이를 맞춘 뒤 허용 오차를 넘는 회귀만 보고
+"""
+import asyncio
+import gc
+import json
+import math
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import httpx
+import numpy as np
+
+# 낮을수록 좋은 지표 / 높을수록 좋은 지표
+LOWER_IS_BETTER = ("p50_ms", "p95_ms", "p99_ms")
+HIGHER_IS_BETTER = ("rps", "ops_per_sec")
+# 비교 대상 지표 (p50/p99 는 보고용)
+COMPARED_METRICS = ("p95_ms", "rps", "ops_per_sec")
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """최근접 순위(nearest-rank) 백분위"""
+    if not sorted_values:
+        return float("nan")
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def latency_summary(latencies: List[float], elapsed: float, errors: int = 0) -> Dict[str, Any]:
+    values = sorted(latencies)
+    return {
+        "requests": len(values),
+        "errors": errors,
+        "p50_ms": round(percentile(values, 50) * 1000, 3),
+        "p95_ms": round(percentile(values, 95) * 1000, 3),
+        "p99_ms": round(percentile(values, 99) * 1000, 3),
+        "max_ms": round(values[-1] * 1000, 3) if values else float("nan"),
+        "rps": round(len(values) / elapsed, 1) if elapsed else 0.0,
+    }
+
+
+async def _load_round(client: httpx.AsyncClient, method: str, url: str, concurrency: int, total_requests: int,
+                      **kwargs) -> Dict[str, Any]:
+    latencies: List[float] = []
+    errors = 0
+    remaining = total_requests
+
+    async def worker():
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            response = await client.request(method, url, **kwargs)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code >= 500:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latency_summary(latencies, time.perf_counter() - started, errors)
+
+
+async def run_load(client: httpx.AsyncClient, method: str, url: str, concurrency: int, total_requests: int,
+                   rounds: int = 5, warmup: int = 20, **kwargs) -> Dict[str, Any]:
+    """동시 작업자 concurrency 개가 total_requests 건을 나눠 호출 (rounds 회 지표별 중앙값, max_ms 는 최댓값).
+    5xx 는 오류로 집계"""
+    for _ in range(warmup):
+        await client.request(method, url, **kwargs)
+    results = [await _load_round(client, method, url, concurrency, total_requests, **kwargs) for _ in range(rounds)]
+    summary = {metric: round(float(np.median([r[metric] for r in results])), 3)
+               for metric in ("p50_ms", "p95_ms", "p99_ms", "rps")}
+    summary.update(requests=total_requests, errors=sum(r["errors"] for r in results),
+                   max_ms=max(r["max_ms"] for r in results), rounds=rounds)
+    return summary
+
+
+def _time_calls(fn: Callable[[], Any], repeat: int, min_time: float):
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        if time.perf_counter() - started >= min_time:
+            break
+        number *= 2
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        timings.append((time.perf_counter() - started) / number)
+    return timings, number
+
+
+def run_micro(fn: Callable[[], Any], items_per_call: int = 1, repeat: int = 5, min_time: float = 0.05) -> Dict[str, Any]:
+    """fn 반복 측정. 회차당 최소 min_time 초가 되도록 호출 횟수를 정하고 가장 빠른 회차 기준.
+    timeit 과 같이 측정 중에는 순환 GC 를 끔 (세션에 누적된 객체 수에 따라 결과가 흔들리지 않도록)"""
+    fn()
+    gc.collect()
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        timings, number = _time_calls(fn, repeat, min_time)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    best = min(timings)
+    return {
+        "per_call_us": round(best * 1e6, 3),
+        "median_call_us": round(sorted(timings)[len(timings) // 2] * 1e6, 3),
+        "ops_per_sec": round(items_per_call / best, 1),
+    }
+
+
+def run_calls(fn: Callable[[], Any], calls: int = 2_000, warmup: int = 50) -> Dict[str, Any]:
+    """fn 을 calls 번 호출하며 호출마다 지연 측정 (run_micro 와 같이 측정 중 순환 GC 끔)"""
+    for _ in range(warmup):
+        fn()
+    gc.collect()
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    latencies: List[float] = []
+    try:
+        started = time.perf_counter()
+        for _ in range(calls):
+            call_started = time.perf_counter()
+            fn()
+            latencies.append(time.perf_counter() - call_started)
+        elapsed = time.perf_counter() - started
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return latency_summary(latencies, elapsed)
+
+
+def calibrate() -> float:
+    """기기 속도 보정값: 고정 작업(순수 파이썬 + numpy) 실행 시간(초), 5회 중 최소"""
+    rng = np.random.default_rng(0)
+    array = rng.random(200_000)
+    best = float("inf")
+    for _ in range(5):
+        started = time.perf_counter()
+        total = 0
+        for i in range(200_000):
+            total += i * i % 7
+        np.sort(array)
+        json.dumps([{"i": i, "s": str(i)} for i in range(5_000)])
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+class PerfRecorder:
+    """측정 결과 수집, 기준선 비교, JSON 기록"""
+
+    def __init__(self, baseline_path: str, tolerance: float, update_baseline: bool = False):
+        self.baseline_path = baseline_path
+        self.tolerance = tolerance
+        self.update_baseline = update_baseline
+        self.calibration = calibrate()
+        self.results: Dict[str, Dict[str, Any]] = {}
+        self.baseline: Dict[str, Any] = {}
+        if os.path.exists(baseline_path):
+            with open(baseline_path, encoding="utf-8") as f:
+                self.baseline = json.load(f)
+
+    @property
+    def speed_factor(self) -> float:
+        """현재 기기가 기준선 기기보다 느린 배율 (>1 이면 느림)"""
+        base = self.baseline.get("calibration_seconds")
+        return self.calibration / base if base else 1.0
+
+    def record(self, name: str, metrics: Dict[str, Any], compared: Sequence[str] = COMPARED_METRICS,
+               tolerance_scale: float = 1.0) -> List[str]:
+        """결과 기록 후 기준선 대비 회귀 목록 반환 (기준선 갱신 중이거나 기준선에 없으면 빈 목록).
+        tolerance_scale 로 잡음이 큰 측정의 허용 오차를 넓힘"""
+        self.results[name] = metrics
+        base = self.baseline.get("benchmarks", {}).get(name)
+        if self.update_baseline or not base:
+            return []
+        regressions = []
+        factor, tolerance = self.speed_factor, self.tolerance * tolerance_scale
+        for metric in compared:
+            if metric not in metrics or metric not in base:
+                continue
+            current, expected = metrics[metric], base[metric]
+            if metric in LOWER_IS_BETTER:
+                limit = expected * factor * (1 + tolerance)
+                if current > limit:
+                    regressions.append(f"{name}.{metric}: {current} > {limit:.3f} (기준 {expected})")
+            elif metric in HIGHER_IS_BETTER:
+                limit = expected / factor / (1 + tolerance)
+                if current < limit:
+                    regressions.append(f"{name}.{metric}: {current} < {limit:.1f} (기준 {expected})")
+        return regressions
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "calibration_seconds": round(self.calibration, 6),
+            "speed_factor": round(self.speed_factor, 3),
+            "tolerance": self.tolerance,
+            "benchmarks": self.results,
+        }
+
+    def write(self, results_path: Optional[str]):
+        report = self.report()
+        if results_path:
+            os.makedirs(os.path.dirname(os.path.abspath(results_path)), exist_ok=True)
+            with open(results_path, "w", encoding="utf-8") as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+        if self.update_baseline and self.results:
+            baseline = {"calibration_seconds": report["calibration_seconds"],
+                        "benchmarks": {**self.baseline.get("benchmarks", {}), **self.results}}
+            with open(self.baseline_path, "w", encoding="utf-8") as f:
+                json.dump(baseline, f, ensure_ascii=False, indent=2, sort_keys=True)
+                f.write("\n")
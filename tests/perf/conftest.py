@@ -0,0 +1,37 @@
+"""
+성능 테스트 픽스처
+"""
+import os
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from tests.perf.bench import PerfRecorder
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+@pytest.fixture(scope="session")
+def perf_recorder(request):
+    config = request.config
+    recorder = PerfRecorder(BASELINE_PATH, config.getoption("--perf-tolerance"),
+                            config.getoption("--perf-update-baseline"))
+    yield recorder
+    recorder.write(config.getoption("--perf-results"))
+
+
+@pytest.fixture(scope="session")
+def asgi_app(tmp_path_factory):
+    """저장 파일 경로를 임시 디렉터리로 돌린 앱 (개발용 ./data 를 읽거나 쓰지 않음)"""
+    from app.config.settings import settings
+    data_dir = tmp_path_factory.mktemp("perf-data")
+    settings.cohort_sketch_path = str(data_dir / "cohort_sketches.bin")
+    from app.main import app
+    return app
+
+
+@pytest_asyncio.fixture
+async def client(asgi_app):
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=asgi_app), base_url="http://perf") as client:
+        yield client
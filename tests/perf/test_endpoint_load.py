@@ -0,0 +1,68 @@
+"""
+엔드포인트 부하 테스트 (동시 요청 수별 p50/p95/p99, RPS)
+
+프로세스 안 동시 호출은 이벤트 루프 스케줄링에 따라 지연 분포가 크게 흔들리므로
+지연 백분위는 보고만 하고, 여러 회차 중앙값 RPS 만 넓힌 허용 오차로 기준선과 비교합니다.
+(마이크로 벤치마크는 test_hot_paths 에서 기본 허용 오차로 비교)
+"""
+from datetime import date
+
+import pytest
+
+from app.core.metrics import metrics_registry
+from tests.perf.bench import run_load
+
+CONCURRENCY_LEVELS = (1, 8, 32)
+REQUESTS_PER_LEVEL = 300
+COMPARED = ("rps",)
+TOLERANCE_SCALE = 2.0
+
+ENDPOINTS = {
+    "status_check": ("GET", "/api/v1/status/check", {}),
+    "status_metrics": ("GET", "/api/v1/status/metrics", {}),
+    "cohort_percentile": ("GET", "/api/v1/health/cohort/percentile",
+                          {"params": {"metric": "systolic_bp", "value": 128, "age": 42, "gender_code": 1,
+                                      "region_code": 11, "user_id": "perf-user"}}),
+}
+
+
+@pytest.fixture(scope="module", autouse=True)
+def cohort_sketches(asgi_app):
+    """코호트 백분위 조회용 합성 검진 데이터"""
+    import numpy as np
+    from app.controllers.health_controller import health_controller
+    from app.models.health import HealthCheckupRaw
+
+    rng = np.random.default_rng(0)
+    checkups = [
+        HealthCheckupRaw(raw_id=i, reference_year=2024, birth_date=date(1982, 1, 1), name="perf",
+                         region_code=11, gender_code=1, age=int(rng.integers(40, 45)), height=172, weight=70,
+                         waist_circumference=84, systolic_bp=int(rng.normal(122, 12)))
+        for i in range(5_000)
+    ]
+    health_controller.cohort_service.add_checkups(checkups)
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    """이전 테스트가 남긴 라벨 시계열이 /status/metrics 렌더링 비용을 바꾸지 않도록 측정마다 초기화"""
+    metrics_registry.reset()
+    yield
+    metrics_registry.reset()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("concurrency", CONCURRENCY_LEVELS)
+@pytest.mark.parametrize("endpoint", sorted(ENDPOINTS))
+async def test_endpoint_load(client, perf_recorder, endpoint, concurrency):
+    method, url, kwargs = ENDPOINTS[endpoint]
+    name = f"endpoint.{endpoint}.c{concurrency}"
+    result = await run_load(client, method, url, concurrency, REQUESTS_PER_LEVEL, **kwargs)
+    assert result["errors"] == 0
+    regressions = perf_recorder.record(name, result, COMPARED, TOLERANCE_SCALE)
+    if regressions:
+        # 일시적인 잡음과 구분하기 위해 회귀가 보이면 한 번 더 측정
+        metrics_registry.reset()
+        result = await run_load(client, method, url, concurrency, REQUESTS_PER_LEVEL, **kwargs)
+        regressions = perf_recorder.record(name, result, COMPARED, TOLERANCE_SCALE)
+    assert not regressions, "\n".join(regressions)
@@ -0,0 +1,122 @@
+"""
+핫 패스 마이크로 벤치마크 (모델 검증, 정상치 구간 분류, 건강 점수, 응답 직렬화, 미션 추천 p99)
+"""
+from datetime import datetime
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from app.core.checkup_store import CHECKUP_SCHEMA, ColumnBatch
+from app.core.responses import dump_json
+from app.models.base import BaseResponse
+from app.models.goal import DifficultyLevel, MissionCatalogItem, MissionCategory
+from app.models.health import HealthCheckup, HealthNormalRange
+from app.services.health_score_service import HealthScoreEngine
+from app.services.mission_recommendation_service import RISK_FACTOR_NAMES, MissionRecommendationService
+from app.services.normal_range_service import NormalRangeTable
+from tests.perf.bench import run_calls, run_micro
+
+BATCH_ROWS = 100_000
+
+_CHECKUP_ROW = {
+    "checkup_id": 1, "member_serial_number": 1, "raw_id": 1, "reference_year": 2024, "age": 45,
+    "height": 172, "weight": 74, "bmi": "25.01", "waist_circumference": 88, "systolic_bp": 132,
+    "diastolic_bp": 84, "fasting_glucose": 104, "total_cholesterol": 212, "triglyceride": 160,
+    "hdl_cholesterol": 48, "ldl_cholesterol": 131, "hemoglobin": "14.2", "urine_protein": 1,
+    "serum_creatinine": "0.9", "ast": 28, "alt": 31, "gamma_gtp": 40, "smoking_status": 2,
+    "drinking_status": 1,
+}
+
+
+@pytest.fixture(scope="module")
+def checkup_batch() -> ColumnBatch:
+    rng = np.random.default_rng(1)
+    arrays = {}
+    for spec in CHECKUP_SCHEMA.columns:
+        if spec.kind == "fixed":
+            arrays[spec.name] = rng.integers(50, 3500, BATCH_ROWS)
+        else:
+            arrays[spec.name] = rng.integers(1, 250, BATCH_ROWS)
+    arrays["height"] = rng.integers(150, 190, BATCH_ROWS)
+    arrays["smoking_status"] = rng.integers(1, 4, BATCH_ROWS)
+    arrays["drinking_status"] = rng.integers(0, 2, BATCH_ROWS)
+    masks = {spec.name: rng.random(BATCH_ROWS) > 0.05 for spec in CHECKUP_SCHEMA.columns if spec.nullable}
+    return ColumnBatch.from_arrays(CHECKUP_SCHEMA, arrays, masks)
+
+
+@pytest.fixture(scope="module")
+def range_table() -> NormalRangeTable:
+    ranges = [
+        HealthNormalRange(range_id=1, health_item_code="systolic_bp", health_item_name="수축기 혈압", gender_code=0,
+                          unit="mmHg", normal_range="<120", warning_range="120-139", danger_range="≥140"),
+        HealthNormalRange(range_id=2, health_item_code="fasting_glucose", health_item_name="공복혈당", gender_code=0,
+                          unit="mg/dL", normal_range="70-99", warning_range="100-125", danger_range="126 이상"),
+        HealthNormalRange(range_id=3, health_item_code="hemoglobin", health_item_name="혈색소", gender_code=1,
+                          unit="g/dL", normal_range="13.0-16.5", warning_range="12.0-12.9", danger_range="<12.0"),
+    ]
+    return NormalRangeTable(ranges)
+
+
+def _check(perf_recorder, name, measure, **kwargs):
+    regressions = perf_recorder.record(f"micro.{name}", measure(), **kwargs)
+    if regressions:
+        # 일시적인 잡음과 구분하기 위해 회귀가 보이면 한 번 더 측정
+        regressions = perf_recorder.record(f"micro.{name}", measure(), **kwargs)
+    assert not regressions, "\n".join(regressions)
+
+
+def test_checkup_model_validation(perf_recorder):
+    _check(perf_recorder, "checkup_model_validate", lambda: run_micro(lambda: HealthCheckup.model_validate(_CHECKUP_ROW)))
+
+
+def test_range_classification(perf_recorder, range_table, checkup_batch):
+    genders = np.ones(len(checkup_batch), dtype=np.int32)
+    _check(perf_recorder, "range_classify_batch",
+           lambda: run_micro(lambda: range_table.classify_batch(checkup_batch, genders), items_per_call=len(checkup_batch)))
+
+
+def test_health_score_single(perf_recorder):
+    engine = HealthScoreEngine()
+    checkup = HealthCheckup.model_validate(_CHECKUP_ROW)
+    _check(perf_recorder, "health_score_single", lambda: run_micro(lambda: engine.score(checkup)))
+
+
+def test_health_score_batch(perf_recorder, checkup_batch):
+    engine = HealthScoreEngine()
+    _check(perf_recorder, "health_score_batch",
+           lambda: run_micro(lambda: engine.score_batch(checkup_batch), items_per_call=len(checkup_batch)))
+
+
+def test_response_serialization(perf_recorder):
+    rows = [{**_CHECKUP_ROW, "bmi": Decimal("25.01"), "processed_at": datetime(2024, 5, 1, 9, 30)} for _ in range(1_000)]
+    response = BaseResponse(data={"checkup_records": rows})
+    _check(perf_recorder, "history_response_dump", lambda: run_micro(lambda: dump_json(response), items_per_call=len(rows)))
+
+
+@pytest.fixture(scope="module")
+def recommendation_service() -> MissionRecommendationService:
+    """미션 3,000개 (카테고리 6 × 난이도 3, 직업 전용 30%) 카탈로그"""
+    rng = np.random.default_rng(2)
+    factors = list(RISK_FACTOR_NAMES)
+    occupations = [f"job{i}" for i in range(12)]
+    categories, difficulties = list(MissionCategory), list(DifficultyLevel)
+    catalog = [
+        MissionCatalogItem(
+            mission_id=f"m{i}", title=f"미션 {i}", description="설명", health_benefit="건강 개선",
+            category=categories[i % len(categories)], difficulty=difficulties[i // len(categories) % len(difficulties)],
+            estimated_time_minutes=10, base_score=float(rng.random()),
+            occupation_categories=[occupations[i % len(occupations)]] if rng.random() < 0.3 else [],
+            risk_weights={factor: float(rng.random()) for factor in rng.choice(factors, 3, replace=False)},
+        )
+        for i in range(3_000)
+    ]
+    return MissionRecommendationService(catalog)
+
+
+def test_mission_recommendation_p99(perf_recorder, recommendation_service):
+    checkup = HealthCheckup.model_validate(_CHECKUP_ROW)
+    # 요청 경로이므로 처리량보다 꼬리 지연(p99)을 기준선과 비교
+    _check(perf_recorder, "mission_recommend_top5",
+           lambda: run_calls(lambda: recommendation_service.recommend(checkup, "job3", k=5, exclude_ids=["m1", "m2"])),
+           compared=("p99_ms", "rps"))
@@ -0,0 +1,83 @@
+"""
+내부 레코드 vs pydantic 모델 벤치마크 (생성 CPU, 객체당 메모리)
+
+같은 기기에서 두 방식을 함께 측정해 비율로 비교하므로 기준선 없이도 결과가 안정적입니다.
+"""
+import gc
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from app.core.checkup_store import CHECKUP_SCHEMA, ColumnBatch
+from app.models.health import HealthCheckup
+from app.models.intelligence import ChatMessage
+from app.models.records import ChatMessageRecord, CheckupRecord
+from tests.perf.bench import run_micro
+from tests.perf.test_hot_paths import _CHECKUP_ROW
+
+MEMORY_ROWS = 20_000
+# 레코드가 모델 대비 최소한 이만큼은 가볍고 빨라야 함
+MIN_MEMORY_RATIO = 2.5
+MIN_SPEEDUP = 1.5
+
+_CHAT_ROW = {
+    "message_id": 1, "session_id": "session-1", "member_serial_number": 7, "message_type": "question",
+    "message_content": "요즘 혈압이 높게 나오는데 어떤 운동이 좋을까요?", "response_content": None,
+    "created_at": "2024-05-01T09:30:00.123456",
+}
+
+
+@pytest.fixture(scope="module")
+def stored_batch() -> ColumnBatch:
+    rng = np.random.default_rng(3)
+    arrays = {}
+    for spec in CHECKUP_SCHEMA.columns:
+        arrays[spec.name] = rng.integers(50, 3500, MEMORY_ROWS) if spec.kind == "fixed" else rng.integers(1, 250, MEMORY_ROWS)
+    return ColumnBatch.from_arrays(CHECKUP_SCHEMA, arrays)
+
+
+def _bytes_per_object(build) -> float:
+    """build() 가 만든 객체 목록이 유지하는 메모리 / 객체 수"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        objects = build()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return current / len(objects)
+
+
+def test_checkup_record_memory(perf_recorder, stored_batch):
+    model_bytes = _bytes_per_object(stored_batch.to_models)
+    record_bytes = _bytes_per_object(lambda: stored_batch.to_records(CheckupRecord))
+    perf_recorder.record("records.checkup_bytes_per_object",
+                         {"model": round(model_bytes, 1), "record": round(record_bytes, 1),
+                          "ratio": round(model_bytes / record_bytes, 2)})
+    assert model_bytes / record_bytes >= MIN_MEMORY_RATIO, f"모델 {model_bytes:.0f}B / 레코드 {record_bytes:.0f}B"
+
+
+def test_checkup_record_construction(perf_recorder):
+    row = HealthCheckup.model_validate(_CHECKUP_ROW).model_dump()
+    model = run_micro(lambda: HealthCheckup(**row))
+    record = run_micro(lambda: CheckupRecord(**row))
+    perf_recorder.record("records.checkup_construct", {"model_us": model["per_call_us"], "record_us": record["per_call_us"],
+                                                       "ops_per_sec": record["ops_per_sec"]})
+    assert model["per_call_us"] / record["per_call_us"] >= MIN_SPEEDUP
+
+
+def test_chat_row_conversion(perf_recorder):
+    model = run_micro(lambda: ChatMessage(**{k: v for k, v in _CHAT_ROW.items() if k != "session_id"}))
+    record = run_micro(lambda: ChatMessageRecord.from_row(_CHAT_ROW))
+    perf_recorder.record("records.chat_from_row", {"model_us": model["per_call_us"], "record_us": record["per_call_us"],
+                                                   "ops_per_sec": record["ops_per_sec"]})
+    assert model["per_call_us"] > record["per_call_us"]
+
+
+def test_record_model_round_trip(perf_recorder):
+    model = HealthCheckup.model_validate(_CHECKUP_ROW)
+    record = CheckupRecord.from_model(model)
+    result = run_micro(lambda: CheckupRecord.from_model(model).to_model())
+    perf_recorder.record("records.checkup_round_trip", result)
+    assert record.to_model() == model
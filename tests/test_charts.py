@@ -0,0 +1,190 @@
+"""
+차트 시계열 테스트 (LTTB 점 개수 예산, 해상도별 사전 집계, 건강검진 / 미션 이력 응답의 chart_data)
+"""
+import asyncio
+from datetime import date, datetime
+
+import numpy as np
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.controllers.health_controller import HealthController
+from app.controllers.history_controller import HistoryController
+from app.core.checkup_store import CheckupColumnStore
+from app.core.database import Database
+from app.core.dependencies import get_mission_history_service
+from app.core.repositories import MissionCompletionRepository
+from app.models.common import ChartResolution
+from app.models.health import HealthCheckup
+from app.models.records import MissionCompletionRecord
+from app.services.chart_service import ChartService, MetricSeries
+from app.services.health_sync_service import FingerprintIndex, HealthSyncService
+from app.services.mission_history_service import MissionHistoryService
+from app.services.mission_stats_service import MissionStatsService
+from app.utils.downsample import lttb, lttb_indices
+
+
+def _checkup(member: int, year: int, weight: int) -> HealthCheckup:
+    return HealthCheckup(checkup_id=year, member_serial_number=member, raw_id=year, reference_year=year, age=40,
+                         height=170, weight=weight, waist_circumference=85, systolic_bp=120 + year % 10,
+                         processed_at=datetime(2024, 5, 1))
+
+
+def test_lttb_keeps_endpoints_within_budget():
+    rng = np.random.default_rng(5)
+    x = np.arange(10_000, dtype=np.float64)
+    y = np.cumsum(rng.normal(0, 1, len(x)))
+    y[4_321] = 500.0
+    for threshold in (3, 10, 100, 999):
+        index = lttb_indices(x, y, threshold)
+        assert len(index) == threshold
+        assert index[0] == 0 and index[-1] == len(x) - 1
+        assert np.all(np.diff(index) > 0)
+        # 튀는 값(극값)은 살아남음
+        assert 4_321 in index
+
+    sampled_x, sampled_y = lttb(x, y, 50)
+    assert len(sampled_x) == len(sampled_y) == 50 and sampled_y[0] == y[0]
+
+
+def test_lttb_empty_and_short_series():
+    assert lttb_indices(np.array([]), np.array([]), 10).tolist() == []
+    assert lttb_indices(np.array([1.0]), np.array([2.0]), 10).tolist() == [0]
+    assert lttb_indices(np.arange(2.0), np.arange(2.0), 1).tolist() == [0, 1]
+    assert lttb_indices(np.arange(5.0), np.arange(5.0), 5).tolist() == [0, 1, 2, 3, 4]
+    assert lttb_indices(np.arange(5.0), np.arange(5.0), 2).tolist() == [0, 4]
+    assert lttb_indices(np.arange(5.0), np.arange(5.0), 1).tolist() == [0]
+
+
+def test_metric_series_resolutions():
+    # 2023-01-02 (월요일) 부터 2년간 매일 값 = 일련번호, 목표 가중치 1 / 2 번갈아
+    days = np.datetime64("2023-01-02") + np.arange(730)
+    values = np.arange(730, dtype=np.float64)
+    weights = np.where(np.arange(730) % 2, 2.0, 1.0)
+    values[10] = np.nan
+    series = MetricSeries(days, values, weights)
+
+    day = series.query(ChartResolution.DAY, max_points=5_000)
+    assert day["source_points"] == 729 and day["x"][0] == "2023-01-02"
+
+    week = series.query(ChartResolution.WEEK, max_points=5_000)
+    assert week["source_points"] == 105
+    assert all(np.datetime64(x).astype(object).weekday() == 0 for x in week["x"])
+    # 첫 주 (0..6, 가중치 1,2,1,2,1,2,1) 가중 평균
+    assert week["y"][0] == round(float(np.average(np.arange(7), weights=weights[:7])), 2)
+
+    month = series.query(ChartResolution.MONTH, max_points=5_000)
+    assert month["source_points"] == 24 and month["x"][:2] == ["2023-01-01", "2023-02-01"]
+    year = series.query(ChartResolution.YEAR, max_points=5_000)
+    assert year["x"] == ["2023-01-01", "2024-01-01"]
+
+    # 기간은 버킷 단위로 자르고, 점 개수 예산 안에서 끝점 유지
+    window = series.query(ChartResolution.MONTH, date(2023, 3, 15), date(2023, 6, 30))
+    assert window["x"] == ["2023-03-01", "2023-04-01", "2023-05-01", "2023-06-01"]
+    budget = series.query(ChartResolution.DAY, max_points=40)
+    assert len(budget["x"]) == 40 and budget["source_points"] == 729
+    assert (budget["x"][0], budget["x"][-1]) == (day["x"][0], day["x"][-1])
+
+    empty = MetricSeries(np.array([], dtype="datetime64[D]"), np.array([]))
+    for resolution in ChartResolution:
+        assert empty.query(resolution) == {"x": [], "y": [], "source_points": 0}
+
+
+def test_health_chart_data_and_history_response(tmp_path):
+    store = CheckupColumnStore.for_checkups(str(tmp_path))
+    store.append_models([_checkup(7, year, 70 + year % 10) for year in range(2010, 2024)])
+    service = ChartService(store)
+
+    chart = service.health_chart_data(7, ["weight"], max_points=5)
+    assert chart["resolution"] == "year" and list(chart["series"]) == ["weight"]
+    weight = chart["series"]["weight"]
+    assert len(weight["x"]) == 5 and weight["source_points"] == 14
+    assert (weight["x"][0], weight["x"][-1]) == ("2010-01-01", "2023-01-01")
+    with pytest.raises(ValueError):
+        service.health_chart_data(7, ["name"])
+
+    response = service.build_health_history_response(7, start=date(2020, 1, 1), max_points=2)
+    assert [r["reference_year"] for r in response.checkup_records] == [2020, 2021, 2022, 2023]
+    assert response.user_info["checkup_count"] == 14
+    assert response.chart_data["series"]["weight"]["x"] == ["2020-01-01", "2023-01-01"]
+    with pytest.raises(LookupError):
+        service.build_health_history_response(8)
+
+
+def test_health_history_endpoint_follows_sync(tmp_path):
+    controller = HealthController()
+    sync = HealthSyncService(CheckupColumnStore.for_checkups(str(tmp_path)), FingerprintIndex())
+    controller.__dict__["sync_service"] = sync
+    app = FastAPI()
+    app.include_router(controller.router)
+    with TestClient(app) as client:
+        assert client.get("/checkup/history/7", params={"user_id": "u1"}).status_code == 404
+        body = [_checkup(7, 2022, 70).model_dump(mode="json")]
+        assert client.post("/checkup/sync/7", params={"user_id": "u1"}, json=body).status_code == 200
+
+        first = client.get("/checkup/history/7", params={"user_id": "u1", "metrics": ["weight"]}).json()["data"]
+        assert first["chart_data"]["series"]["weight"]["y"] == [70.0]
+
+        body.append(_checkup(7, 2023, 75).model_dump(mode="json"))
+        assert client.post("/checkup/sync/7", params={"user_id": "u1"}, json=body).status_code == 200
+        second = client.get("/checkup/history/7", params={"user_id": "u1", "metrics": ["weight"]}).json()["data"]
+        assert second["chart_data"]["series"]["weight"]["y"] == [70.0, 75.0]
+        assert len(second["checkup_records"]) == 2
+        bad = client.get("/checkup/history/7", params={"user_id": "u1", "metrics": ["name"]})
+        assert bad.status_code == 400
+
+
+def test_mission_chart_data():
+    stats = MissionStatsService()
+    stats.load_history([MissionCompletionRecord(i, mission, 7, date(2024, 5, i), 2, completed)
+                        for i in range(1, 15) for mission, completed in ((1, 2), (2, i % 3))])
+    response = stats.build_history_response(7, date(2024, 5, 1), date(2024, 5, 14),
+                                            resolution=ChartResolution.WEEK, max_points=10)
+    series = response.chart_data["series"]
+    assert set(series) == {"mission_1", "mission_2", "overall"}
+    # 2024-05-01 은 수요일 → 4/29, 5/6, 5/13 주
+    assert series["mission_1"]["x"] == ["2024-04-29", "2024-05-06", "2024-05-13"]
+    assert series["mission_1"]["y"] == [100.0, 100.0, 100.0]
+    assert all(0 <= y <= 100 for y in series["overall"]["y"])
+
+    daily = stats.build_history_response(7, date(2024, 5, 1), date(2024, 5, 14), max_points=4)
+    assert all(len(s["x"]) == 4 for s in daily.chart_data["series"].values())
+    assert stats.build_history_response(8, date(2024, 5, 1), date(2024, 5, 14)).chart_data["series"] == {}
+
+
+async def _seed(path: str):
+    database = Database(path)
+    await database.connect()
+    try:
+        repository = MissionCompletionRepository(database)
+        for day in range(1, 8):
+            await repository.add(MissionCompletionRecord(0, 1, 7, date(2024, 5, day), 2, 2 if day != 4 else 0))
+    finally:
+        await database.close()
+
+
+def test_mission_stats_endpoint(tmp_path):
+    path = str(tmp_path / "healthsync.db")
+    asyncio.run(_seed(path))
+    database = Database(path)
+
+    async def service():
+        if not database.is_connected:
+            await database.connect()
+        return MissionHistoryService(MissionCompletionRepository(database))
+
+    app = FastAPI()
+    app.include_router(HistoryController().router)
+    app.dependency_overrides[get_mission_history_service] = service
+    with TestClient(app) as client:
+        response = client.get("/missions/7/stats", params={"user_id": "u1", "start_date": "2024-05-01",
+                                                           "end_date": "2024-05-07"})
+        assert response.status_code == 200, response.text
+        data = response.json()["data"]
+        assert (data["best_streak"], data["period_achievement_rate"]) == (3, 85.7)
+        assert data["chart_data"]["series"]["mission_1"]["y"][3] == 0.0
+        reversed_period = client.get("/missions/7/stats", params={"user_id": "u1", "start_date": "2024-05-07",
+                                                                  "end_date": "2024-05-01"})
+        assert reversed_period.status_code == 400
+        client.portal.call(database.close)
@@ -0,0 +1,63 @@
+"""
+채팅 이력 캐시 테스트 (기록 중 캐시 미스 조회와의 경쟁, 캐시 창 유지)
+"""
+import asyncio
+from typing import List, Optional
+
+import pytest
+
+from app.core.session_cache import LocalSessionCache
+from app.models.intelligence import MessageType
+from app.models.records import ChatMessageRecord
+from app.services.chat_history_service import ChatHistoryService
+
+
+class _SlowRepository:
+    """기록이 먼저 보인 뒤 한참 후에 message_id 를 돌려주는 저장소 (배치 커밋 후 응답 지연 재현)"""
+
+    def __init__(self):
+        self.rows: List[ChatMessageRecord] = []
+
+    async def add(self, session_id: str, message: ChatMessageRecord) -> int:
+        message_id = len(self.rows) + 1
+        self.rows.append(message.replace(message_id=message_id))
+        await asyncio.sleep(0.02)
+        return message_id
+
+    async def list_recent(self, session_id: str, limit: int = 50) -> List[ChatMessageRecord]:
+        return self.rows[-limit:]
+
+    async def count(self, session_id: str) -> int:
+        return len(self.rows)
+
+
+def _message(content: str, message_id: Optional[int] = 0) -> ChatMessageRecord:
+    return ChatMessageRecord(message_id, 7, MessageType.QUESTION, content)
+
+
+@pytest.mark.asyncio
+async def test_miss_during_append_is_not_counted_twice():
+    repository = _SlowRepository()
+    service = ChatHistoryService(repository, LocalSessionCache(1 << 20, 60), window=3)
+
+    append = asyncio.create_task(service.append("s1", _message("오늘 걸음 수는?")))
+    await asyncio.sleep(0.005)
+    history = await service.get_history("s1")
+    await append
+
+    again = await service.get_history("s1")
+    assert history.total_message_count == again.total_message_count == 1
+    assert [m["message_id"] for m in again.messages] == [1]
+
+
+@pytest.mark.asyncio
+async def test_cached_window_tracks_appends():
+    repository = _SlowRepository()
+    service = ChatHistoryService(repository, LocalSessionCache(1 << 20, 60), window=3)
+    await service.append("s1", _message("첫 질문"))
+    assert (await service.get_history("s1")).total_message_count == 1
+    for i in range(4):
+        await service.append("s1", _message(f"질문 {i}"))
+    history = await service.get_history("s1")
+    assert history.total_message_count == 5
+    assert [m["message_id"] for m in history.messages] == [3, 4, 5]
@@ -0,0 +1,83 @@
+"""
+건강검진 일괄 변환 테스트 (BMI 계산, 회원 미확인 행 제외, 청크 경계, 처리 통계)
+"""
+import gc
+from datetime import date, datetime
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from app.core.checkup_store import CHECKUP_SCHEMA, RAW_SCHEMA, CheckupColumnStore, ColumnBatch
+from app.models.health import HealthCheckupRaw
+from app.services.checkup_pipeline_service import CheckupPipelineService, MappingMemberResolver, compute_bmi_fixed
+
+COLUMNS = ("raw_id", "reference_year", "birth_date", "name", "region_code", "gender_code", "age", "height", "weight",
+           "waist_circumference", "systolic_bp")
+
+
+def _raw(raw_id: int, height: int = 172, weight: int = 70, systolic_bp=130) -> HealthCheckupRaw:
+    return HealthCheckupRaw(raw_id=raw_id, reference_year=2023, birth_date=date(1985, 3, 2), name=f"회원{raw_id}",
+                            region_code=11, gender_code=1, age=38, height=height, weight=weight,
+                            waist_circumference=84, systolic_bp=systolic_bp)
+
+
+def _service(tmp_path, mapping, chunk_size: int = 1_000) -> CheckupPipelineService:
+    store = CheckupColumnStore.for_checkups(str(tmp_path / "store"))
+    return CheckupPipelineService(store, MappingMemberResolver(mapping), chunk_size=chunk_size)
+
+
+def test_compute_bmi_fixed_rounds_and_masks_invalid():
+    bmi, valid = compute_bmi_fixed(np.array([172, 160, 0, 180]), np.array([70, 55, 60, 0]), 100)
+    # 70 / 1.72² = 23.661..., 55 / 1.6² = 21.484...
+    assert bmi.tolist() == [2366, 2148, 0, 0]
+    assert valid.tolist() == [True, True, False, False]
+
+
+def test_transform_derives_bmi_and_skips_unresolved(tmp_path):
+    service = _service(tmp_path, {1: 7, 3: 9, 4: 9})
+    raw = ColumnBatch.from_models(RAW_SCHEMA, [_raw(1), _raw(2), _raw(3, height=0), _raw(4, systolic_bp=0)])
+    processed, skipped = service.transform(raw, processed_at=datetime(2024, 5, 1))
+
+    assert skipped == 1 and len(processed) == 3 and processed.schema is CHECKUP_SCHEMA
+    assert processed.column("raw_id").tolist() == [1, 3, 4]
+    assert processed.column("member_serial_number").tolist() == [7, 9, 9]
+    assert processed.column("checkup_id").tolist() == [1, 2, 3]
+    # 신장 0 → BMI 없음, 0 이하 측정값 → 누락
+    assert processed.valid("bmi").tolist() == [True, False, True]
+    assert processed.valid("systolic_bp").tolist() == [True, True, False]
+    first = processed.to_models()[0]
+    assert first.bmi == Decimal("23.66") and first.processed_at == datetime(2024, 5, 1)
+
+    # 다음 배치는 이어지는 검진 ID, 처리 배치 스키마는 거부
+    assert service.transform(ColumnBatch.from_models(RAW_SCHEMA, [_raw(1)]))[0].column("checkup_id").tolist() == [4]
+    with pytest.raises(ValueError):
+        service.transform(processed)
+
+
+def test_run_file_across_chunk_boundaries(tmp_path):
+    path = tmp_path / "raw.csv"
+    rows = [_raw(i, weight=60 + i) for i in range(1, 8)]
+    lines = [",".join(COLUMNS)] + [",".join(str(getattr(row, c)) for c in COLUMNS) for row in rows]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    service = _service(tmp_path, {i: 100 + i for i in range(1, 8) if i != 4}, chunk_size=3)
+    progress = []
+
+    def on_chunk(stats):
+        # 서비스는 순환 GC 를 건드리지 않음 (CLI 에서만 끔)
+        assert gc.isenabled()
+        progress.append((stats.chunks, stats.rows_read, stats.rows_written, stats.rows_skipped))
+
+    stats = service.run_file(str(path), on_chunk=on_chunk)
+    assert progress == [(1, 3, 3, 0), (2, 6, 5, 1), (3, 7, 6, 1)]
+    assert (stats.rows_read, stats.rows_written, stats.rows_skipped, stats.chunks) == (7, 6, 1, 3)
+    assert stats.elapsed_seconds > 0
+    assert stats.rows_per_second == pytest.approx(stats.rows_read / stats.elapsed_seconds)
+
+    # 청크를 넘어도 검진 ID 가 끊기지 않고, 새 서비스는 저장된 최대 ID 다음부터 부여
+    checkups = sorted((m for b in service.store.scan() for m in b.to_models()), key=lambda m: m.checkup_id)
+    assert [m.checkup_id for m in checkups] == [1, 2, 3, 4, 5, 6]
+    assert [m.raw_id for m in checkups] == [1, 2, 3, 5, 6, 7]
+    assert [m.weight for m in checkups] == [61, 62, 63, 65, 66, 67]
+    assert CheckupPipelineService(service.store, MappingMemberResolver({1: 1}))._next_checkup_id == 7
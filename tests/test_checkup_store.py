@@ -0,0 +1,133 @@
+"""
+컬럼형 건강검진 저장소 테스트 (값 변환, 세그먼트 영속화, 여러 세그먼트에 걸친 이력, 작은 세그먼트 병합)
+"""
+import os
+from datetime import date, datetime
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from app.core.checkup_store import (
+    CHECKUP_SCHEMA, RAW_SCHEMA, Bitmap, CheckupColumnStore, ColumnBatch, StringColumn, from_fixed, to_fixed,
+)
+from app.models.health import HealthCheckup, HealthCheckupRaw
+
+
+def _checkup(member: int, year: int, **changes) -> HealthCheckup:
+    values = dict(checkup_id=member * 10_000 + year, member_serial_number=member, raw_id=year, reference_year=year,
+                  age=40, height=170, weight=70, waist_circumference=85, systolic_bp=120, hemoglobin=Decimal("14.25"),
+                  processed_at=datetime(2024, 5, 1, 9, 30))
+    values.update(changes)
+    return HealthCheckup(**values)
+
+
+def test_fixed_point_round_trip():
+    assert to_fixed(Decimal("14.255")) == 1426
+    assert from_fixed(1426) == Decimal("14.26")
+    assert to_fixed(0.1) == 10
+
+
+def test_bitmap_slice_and_string_take():
+    mask = np.array([True, False, True, True, False, True, False, True, True, False])
+    bitmap = Bitmap.from_mask(mask)
+    assert bitmap.slice(3, 9).to_mask().tolist() == mask[3:9].tolist()
+    assert bitmap.null_count() == 4
+
+    names = StringColumn.from_values(["김민준", "", "이서연", None])
+    assert list(names.take(np.array([2, 0, 3]))) == ["이서연", "김민준", ""]
+    assert list(names.slice(1, 3)) == ["", "이서연"]
+
+
+def test_models_round_trip_with_nulls():
+    raw = HealthCheckupRaw(raw_id=1, reference_year=2023, birth_date=date(1985, 3, 2), name="김민준", region_code=11,
+                           gender_code=1, age=38, height=172, weight=70, waist_circumference=84,
+                           visual_acuity_left=Decimal("0.9"), systolic_bp=None)
+    batch = ColumnBatch.from_models(RAW_SCHEMA, [raw])
+    assert batch.valid("systolic_bp").tolist() == [False]
+    assert np.isnan(batch.as_float("systolic_bp")[0]) and batch.as_float("visual_acuity_left")[0] == 0.9
+    restored = batch.to_models()[0]
+    assert restored.model_dump(exclude={"created_at"}) == raw.model_dump(exclude={"created_at"})
+
+
+def test_from_strings_rejects_missing_required_values():
+    with pytest.raises(ValueError):
+        ColumnBatch.from_strings(RAW_SCHEMA, {"raw_id": ["1"], "reference_year": [""]}, 1)
+
+
+def test_segments_persist_sorted_and_reload(tmp_path):
+    store = CheckupColumnStore.for_checkups(str(tmp_path))
+    store.append_models([_checkup(9, 2023), _checkup(3, 2022), _checkup(3, 2021), _checkup(5, 2023)])
+    assert store.segment_count == 1
+    segment = next(store.scan())
+    assert segment.column("member_serial_number").tolist() == [3, 3, 5, 9]
+    assert segment.column("reference_year").tolist()[:2] == [2021, 2022]
+
+    reopened = CheckupColumnStore.for_checkups(str(tmp_path))
+    assert len(reopened) == 4
+    history = reopened.history(3)
+    assert isinstance(history.column("age"), np.memmap)  # 단일 세그먼트 이력은 복사 없는 mmap 슬라이스
+    assert [c.reference_year for c in history.to_models()] == [2021, 2022]
+    assert history.to_models()[0].hemoglobin == Decimal("14.25")
+
+    with pytest.raises(ValueError):
+        CheckupColumnStore.for_raw(str(tmp_path))
+
+
+def test_history_across_segments_keeps_latest_year(tmp_path):
+    store = CheckupColumnStore.for_checkups(str(tmp_path))
+    store.append_models([_checkup(7, 2021), _checkup(7, 2022), _checkup(8, 2022)])
+    store.append_models([_checkup(7, 2023)])
+    store.append_models([_checkup(7, 2022, systolic_bp=150)])
+
+    history = store.history(7)
+    assert history.column("reference_year").tolist() == [2021, 2022, 2023]
+    assert history.column("systolic_bp").tolist() == [120, 150, 120]
+    assert store.get(7, 2022).column("systolic_bp").tolist() == [150]
+    assert len(store.get(7, 2020)) == 0 and len(store.history(99)) == 0
+
+
+def test_staged_segments_are_invisible_until_commit(tmp_path):
+    store = CheckupColumnStore.for_checkups(str(tmp_path))
+    store.append_models([_checkup(1, 2023)])
+    kept = store.stage(ColumnBatch.from_models(CHECKUP_SCHEMA, [_checkup(2, 2023)]))
+    dropped = store.stage(ColumnBatch.from_models(CHECKUP_SCHEMA, [_checkup(3, 2023)]))
+    assert len(store) == 1 and len(CheckupColumnStore.for_checkups(str(tmp_path))) == 1
+
+    store.discard([dropped])
+    store.commit([kept])
+    # commit 전에 중단된 기록 (manifest 에 없는 세그먼트 디렉터리)
+    store.stage(ColumnBatch.from_models(CHECKUP_SCHEMA, [_checkup(5, 2023)]))
+
+    reopened = CheckupColumnStore.for_checkups(str(tmp_path))
+    assert len(reopened) == 2 and len(reopened.history(3)) == 0
+    reopened.append_models([_checkup(4, 2023), _checkup(4, 2024)])
+    reopened.append_models([_checkup(6, 2023)])
+    assert len(CheckupColumnStore.for_checkups(str(tmp_path))) == 5
+    assert len(reopened.history(5)) == 0
+
+
+def test_compact_merges_small_segments(tmp_path):
+    store = CheckupColumnStore.for_checkups(str(tmp_path))
+    store.append_models([_checkup(7, 2021), _checkup(8, 2022)])
+    store.append_models([_checkup(7, 2022), _checkup(7, 2021, systolic_bp=130)])
+    store.append_models([_checkup(member, 2023) for member in range(100, 110)])
+    store.append_models([_checkup(7, 2022, systolic_bp=150)])
+    store.append_models([_checkup(7, 2022, systolic_bp=160), _checkup(8, 2022, weight=80)])
+    store.append_models([_checkup(9, 2024)])
+    before = {member: store.history(member).to_models() for member in (7, 8, 9, 100)}
+
+    # 10행 세그먼트는 병합 대상이 아니므로 앞 두 개, 뒤 세 개가 각각 하나로
+    assert store.compact(small_rows=5) == 3
+    assert store.segment_count == 3 and store.small_segment_count(5) == 2
+    assert len(store) == 3 + 10 + 3
+    assert {member: store.history(member).to_models() for member in (7, 8, 9, 100)} == before
+    assert store.get(7, 2022).column("systolic_bp").tolist() == [160]
+    assert store.get(7, 2021).column("systolic_bp").tolist() == [130]
+    assert store.compact(small_rows=5) == 0
+
+    reopened = CheckupColumnStore.for_checkups(str(tmp_path))
+    assert reopened.segment_count == 3
+    assert {member: reopened.history(member).to_models() for member in (7, 8, 9, 100)} == before
+    assert sorted(p.name for p in tmp_path.iterdir() if p.is_dir()) == \
+        sorted(os.path.basename(segment.path) for segment in reopened._segments)
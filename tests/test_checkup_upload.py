@@ -0,0 +1,145 @@
+"""
+건강검진 파일 스트리밍 업로드 테스트 (엔드포인트, 실패 시 롤백, 상태 보관 기간)
+"""
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.config.settings import settings
+from app.controllers.health_controller import HealthController
+from app.core.checkup_store import CheckupColumnStore
+from app.models.health import UploadStatus
+from app.services.checkup_upload_service import CheckupUploadService
+
+_HEADER = "raw_id,reference_year,birth_date,name,region_code,gender_code,age,height,weight,waist_circumference," \
+          "systolic_bp\n"
+
+
+def _csv(rows: int, start: int = 1) -> str:
+    return "".join(f"{i},2023,1985-03-02,회원{i},11,1,38,172,70,84,{118 + i % 30}\n" for i in range(start, start + rows))
+
+
+_CSV_5 = _csv(5)
+
+
+async def _stream(*chunks: bytes, error: Exception = None):
+    for chunk in chunks:
+        yield chunk
+    if error is not None:
+        raise error
+
+
+@pytest.fixture
+def upload_service(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "upload_parse_chunk_rows", 2)
+    received = []
+    service = CheckupUploadService(CheckupColumnStore.for_raw(str(tmp_path / "raw")), str(tmp_path / "uploads"),
+                                   batch_listeners=[received.append])
+    service.received = received
+    return service
+
+
+@pytest.mark.asyncio
+async def test_receive_commits_all_batches_at_end(upload_service, tmp_path):
+    progress = upload_service.create_upload("u1", "checkups.csv", "csv")
+    body = (_HEADER + _CSV_5).encode("utf-8")
+    await upload_service.receive(progress.file_id, "u1", _stream(body[:40], body[40:]))
+    assert (progress.status, progress.records_parsed) == (UploadStatus.SUCCESS, 5)
+    assert len(upload_service.store) == 5 and upload_service.store.segment_count == 3
+    assert sum(len(batch) for batch in upload_service.received) == 5
+    # 스풀 파일은 commit 후 삭제
+    assert list((tmp_path / "uploads").iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_failed_upload_leaves_store_untouched(upload_service, tmp_path):
+    store = upload_service.store
+    progress = upload_service.create_upload("u1", "checkups.csv", "csv")
+    # 배치 두 개가 stage 된 뒤 연결이 끊김
+    with pytest.raises(ConnectionError):
+        await upload_service.receive(progress.file_id, "u1", _stream((_HEADER + _CSV_5).encode("utf-8"),
+                                                                    error=ConnectionError("client disconnected")))
+    assert progress.status == UploadStatus.FAILED and progress.records_parsed == 4
+    assert len(store) == 0 and upload_service.received == []
+    assert list((tmp_path / "raw").iterdir()) == []
+
+    # 같은 파일을 새 업로드로 다시 보내도 중복 없이 한 번만 반영
+    retry = upload_service.create_upload("u1", "checkups.csv", "csv")
+    await upload_service.receive(retry.file_id, "u1", _stream((_HEADER + _CSV_5).encode("utf-8")))
+    assert len(CheckupColumnStore.for_raw(str(tmp_path / "raw"))) == 5
+
+
+@pytest.mark.asyncio
+async def test_parse_error_rolls_back(upload_service):
+    progress = upload_service.create_upload("u1", "checkups.csv", "csv")
+    body = _HEADER + _CSV_5 + "6,2023,1985-03-02,회원6,11\n"
+    with pytest.raises(ValueError):
+        await upload_service.receive(progress.file_id, "u1", _stream(body.encode("utf-8")))
+    assert progress.status == UploadStatus.FAILED and len(upload_service.store) == 0
+
+
+@pytest.mark.asyncio
+async def test_spool_failure_releases_upload(upload_service, tmp_path):
+    # 스풀 디렉터리 자리에 파일이 있어 makedirs 가 실패
+    upload_service.upload_dir = str(tmp_path / "blocked")
+    (tmp_path / "blocked").write_text("")
+    progress = upload_service.create_upload("u1", "checkups.csv", "csv")
+    with pytest.raises(OSError):
+        await upload_service.receive(progress.file_id, "u1", _stream((_HEADER + _CSV_5).encode("utf-8")))
+    assert progress.status == UploadStatus.FAILED and progress.file_id not in upload_service._receiving
+
+    upload_service.upload_dir = str(tmp_path / "uploads")
+    retry = upload_service.create_upload("u1", "checkups.csv", "csv")
+    await upload_service.receive(retry.file_id, "u1", _stream((_HEADER + _CSV_5).encode("utf-8")))
+    assert retry.status == UploadStatus.SUCCESS and len(upload_service.store) == 5
+
+
+def test_finished_uploads_expire(upload_service):
+    done = upload_service.create_upload("u1", "a.csv", "csv")
+    done.status, done.completed_at = UploadStatus.SUCCESS, datetime.now() - timedelta(hours=2)
+    abandoned = upload_service.create_upload("u1", "b.csv", "csv")
+    abandoned.started_at = datetime.now() - timedelta(hours=2)
+    fresh = upload_service.create_upload("u1", "c.csv", "csv")
+    assert fresh.file_id in upload_service._uploads
+    for expired in (done, abandoned):
+        with pytest.raises(LookupError):
+            upload_service.get_progress(expired.file_id, "u1")
+
+
+def test_upload_endpoints(upload_service):
+    controller = HealthController()
+    controller.__dict__["upload_service"] = upload_service
+    app = FastAPI()
+    app.include_router(controller.router, prefix="/health")
+    client = TestClient(app)
+
+    created = client.post("/health/checkup/uploads", params={"file_name": "checkups.csv", "user_id": "u1"})
+    assert created.status_code == 201
+    file_id = created.json()["data"]["file_id"]
+
+    files = {"file": ("checkups.csv", (_HEADER + _CSV_5).encode("utf-8"), "text/csv")}
+    uploaded = client.put(f"/health/checkup/uploads/{file_id}", params={"user_id": "u1"}, files=files)
+    assert uploaded.status_code == 200 and uploaded.json()["data"]["status"] == UploadStatus.SUCCESS.value
+
+    progress = client.get(f"/health/checkup/uploads/{file_id}", params={"user_id": "u1"}).json()["data"]
+    assert progress["records_parsed"] == 5
+    assert client.get(f"/health/checkup/uploads/{file_id}", params={"user_id": "u2"}).status_code == 404
+    assert client.put(f"/health/checkup/uploads/{file_id}", params={"user_id": "u1"}, files=files).status_code == 400
+    assert client.post("/health/checkup/uploads",
+                       params={"file_name": "a.pdf", "file_type": "pdf", "user_id": "u1"}).status_code == 400
+
+
+def test_upload_endpoints_refused_when_writers_disabled(upload_service, monkeypatch):
+    monkeypatch.setattr(settings, "server_writers_enabled", False)
+    controller = HealthController()
+    controller.__dict__["upload_service"] = upload_service
+    app = FastAPI()
+    app.include_router(controller.router, prefix="/health")
+    client = TestClient(app)
+
+    assert client.post("/health/checkup/uploads", params={"file_name": "a.csv", "user_id": "u1"}).status_code == 503
+    assert client.post("/health/checkup/sync/7", params={"user_id": "u1"}, json=[]).status_code == 503
+    assert upload_service._uploads == {}
+
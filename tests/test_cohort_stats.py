@@ -0,0 +1,103 @@
+"""
+KLL 분위수 스케치와 코호트 백분위 서비스 테스트 (순위 오차, 직렬화 / 병합, 저장 / 재구축, 전국 코호트 대체)
+"""
+from datetime import date
+
+import numpy as np
+import pytest
+
+from app.config.settings import settings
+from app.core.checkup_store import RAW_SCHEMA, CheckupColumnStore, ColumnBatch
+from app.models.health import HealthCheckupRaw
+from app.services.cohort_stats_service import CohortStatsService
+from app.utils.quantile_sketch import KLLSketch
+
+
+def _raw(raw_id: int, age: int = 42, region_code: int = 11, systolic_bp: int = 120) -> HealthCheckupRaw:
+    return HealthCheckupRaw(raw_id=raw_id, reference_year=2023, birth_date=date(1981, 3, 2), name=f"회원{raw_id}",
+                            region_code=region_code, gender_code=1, age=age, height=172,
+                            weight=70, waist_circumference=84, systolic_bp=systolic_bp)
+
+
+@pytest.fixture
+def sketch_path(tmp_path, monkeypatch):
+    path = str(tmp_path / "cohort_sketches.bin")
+    monkeypatch.setattr(settings, "cohort_sketch_path", path)
+    return path
+
+
+def test_rank_error_is_bounded():
+    values = np.random.default_rng(7).normal(120, 15, 100_000)
+    sketch = KLLSketch(200, seed=1)
+    for chunk in np.array_split(values, 50):
+        sketch.update_many(chunk)
+    assert sketch.count == len(values) and len(np.concatenate(sketch.levels)) < 2_000
+
+    probes = np.quantile(values, np.linspace(0.01, 0.99, 25))
+    exact = np.searchsorted(np.sort(values), probes, side="right") / len(values)
+    assert np.max(np.abs(sketch.ranks(probes) - exact)) < 0.02
+    assert abs(sketch.quantile(0.5) - np.median(values)) < 1.0
+    assert sketch.rank(values.min() - 1) == 0.0 and sketch.rank(values.max()) == 1.0
+
+
+def test_serialization_and_merge():
+    rng = np.random.default_rng(3)
+    left, right = KLLSketch(64, seed=1), KLLSketch(64, seed=2)
+    left.update_many(rng.uniform(0, 100, 20_000))
+    right.update_many(rng.uniform(100, 200, 20_000))
+
+    restored = KLLSketch.from_bytes(left.to_bytes())
+    assert (restored.count, restored.min_value, restored.max_value) == (left.count, left.min_value, left.max_value)
+    assert restored.byte_size == len(left.to_bytes())
+    assert abs(restored.rank(50) - left.rank(50)) < 1e-6
+    with pytest.raises(ValueError):
+        KLLSketch.from_bytes(b"XXXX" + left.to_bytes()[4:])
+
+    restored.merge(right)
+    assert restored.count == 40_000
+    assert abs(restored.rank(100) - 0.5) < 0.03 and abs(restored.quantile(0.75) - 150) < 6
+
+
+def test_service_save_load_and_fallback(sketch_path):
+    service = CohortStatsService(min_samples=30, sketch_k=64)
+    # 서울(11) 40명, 부산(26) 10명 → 부산은 전국 코호트로 대체
+    service.add_checkups([_raw(i, systolic_bp=100 + i) for i in range(40)])
+    service.add_checkups([_raw(100 + i, region_code=26, systolic_bp=140 + i) for i in range(10)])
+    service.save()
+
+    reloaded = CohortStatsService(min_samples=30, sketch_k=64)
+    seoul = reloaded.percentile(42, 1, 11, "systolic_bp", 119.0)
+    assert (seoul["scope"], seoul["cohort_size"], seoul["percentile"]) == ("region", 40, 50.0)
+    assert seoul["cohort"] == {"age_band": "40-44", "gender_code": 1, "region_code": 11}
+
+    busan = reloaded.percentile(42, 1, 26, "systolic_bp", 139.0)
+    assert (busan["scope"], busan["cohort_size"], busan["percentile"]) == ("national", 50, 80.0)
+    assert busan["cohort"]["region_code"] is None
+    assert reloaded.percentile(70, 1, 11, "systolic_bp", 120.0)["scope"] == "none"
+    with pytest.raises(ValueError):
+        reloaded.percentile(42, 1, 11, "name", 1.0)
+
+
+def test_ingest_store_rebuilds_without_double_counting(tmp_path, sketch_path):
+    store = CheckupColumnStore.for_raw(str(tmp_path / "raw"))
+    store.append(ColumnBatch.from_models(RAW_SCHEMA, [_raw(i, systolic_bp=100 + i) for i in range(40)]))
+
+    CohortStatsService(min_samples=1).ingest_store(store)
+    # 저장 파일이 있는 상태에서 다시 구축해도 한 번만 반영
+    service = CohortStatsService(min_samples=1)
+    assert service.ingest_store(store) == 40
+    assert service.percentile(42, 1, 11, "systolic_bp", 120.0)["cohort_size"] == 40
+    assert CohortStatsService(min_samples=1).percentile(42, 1, -1, "systolic_bp", 120.0)["cohort_size"] == 40
+
+
+@pytest.mark.asyncio
+async def test_ensure_loaded_reads_file_once(sketch_path):
+    writer = CohortStatsService(min_samples=1)
+    writer.add_checkups([_raw(i) for i in range(5)])
+    writer.save()
+
+    service = CohortStatsService(min_samples=1)
+    await service.ensure_loaded()
+    service.add_checkups([_raw(5)])
+    await service.ensure_loaded()
+    assert service.percentile(42, 1, 11, "systolic_bp", 120.0)["cohort_size"] == 6
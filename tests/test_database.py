@@ -0,0 +1,48 @@
+"""
+SQLite 비동기 접근 객체 테스트 (동시 연결, 배치 쓰기)
+"""
+import asyncio
+
+import pytest
+
+from app.core.database import Database
+
+
+@pytest.mark.asyncio
+async def test_concurrent_first_connect_opens_one_pool(tmp_path, monkeypatch):
+    database = Database(str(tmp_path / "healthsync.db"), pool_size=2)
+    opened = []
+    original_open = database._open
+    monkeypatch.setattr(database, "_open", lambda: opened.append(1) or original_open())
+    try:
+        await asyncio.gather(*(database.connect() for _ in range(5)))
+        # 쓰기 1 + 읽기 2
+        assert len(opened) == 3
+        rows = await asyncio.gather(*(database.enqueue_write(
+            "INSERT INTO chat_message (session_id, member_serial_number, message_type, message_content, created_at) "
+            "VALUES (?, ?, ?, ?, ?)", ("s1", 7, "user", f"안녕 {i}", "2024-05-01T09:00:00")) for i in range(10)))
+        assert len(set(rows)) == 10
+        assert (await database.fetch_one("SELECT COUNT(*) AS n FROM chat_message"))["n"] == 10
+    finally:
+        await database.close()
+
+
+@pytest.mark.asyncio
+async def test_writes_after_close_fail_fast(tmp_path):
+    database = Database(str(tmp_path / "healthsync.db"), pool_size=1)
+    await database.connect()
+    batcher = database._batcher
+    await database.close()
+    insert = ("INSERT INTO chat_message (session_id, member_serial_number, message_type, message_content, created_at) "
+              "VALUES (?, ?, ?, ?, ?)", ("s1", 7, "user", "안녕", "2024-05-01T09:00:00"))
+    with pytest.raises(RuntimeError):
+        await asyncio.wait_for(database.enqueue_write(*insert), 1)
+    with pytest.raises(RuntimeError):
+        await asyncio.wait_for(batcher.submit(*insert), 1)
+
+    # 다시 연결하면 새 배치 큐로 기록
+    await database.connect()
+    try:
+        assert await database.enqueue_write(*insert) == 1
+    finally:
+        await database.close()
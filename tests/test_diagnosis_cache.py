@@ -0,0 +1,82 @@
+"""
+건강 진단 결과 캐시 테스트 (single-flight 공유 계산과 취소, 동기화 이벤트 무효화)
+"""
+import asyncio
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.models.common import EventType
+from app.models.intelligence import HealthDiagnosisResponse
+from app.models.records import EventRecord
+from app.services.diagnosis_cache_service import DiagnosisCacheService
+
+_CHECKUPS = [{"reference_year": 2023, "systolic_bp": 128, "hemoglobin": "14.20"}]
+
+
+def _diagnosis(score: int) -> HealthDiagnosisResponse:
+    return HealthDiagnosisResponse(three_sentence_summary=["a", "b", "c"], health_score=score, risk_level="low",
+                                   occupation_considerations="", analysis_timestamp=datetime(2024, 5, 1),
+                                   confidence_score=0.9)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_does_not_cancel_followers():
+    cache = DiagnosisCacheService(max_entries=10, model_version="v1")
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.02)
+        return _diagnosis(82)
+
+    leader = asyncio.create_task(cache.get_or_compute(7, _CHECKUPS, "사무직", compute))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(cache.get_or_compute(7, _CHECKUPS, " 사무직 ", compute))
+    await asyncio.sleep(0.005)
+    leader.cancel()
+
+    assert (await follower).health_score == 82
+    assert leader.cancelled() and len(calls) == 1
+    assert cache.counters["coalesced"] == 1
+    # 첫 요청이 취소되었어도 공유 계산 결과는 캐시됨
+    assert (await cache.get_or_compute(7, _CHECKUPS, "사무직", compute)).health_score == 82
+    assert cache.counters["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failure_is_shared_and_not_cached():
+    cache = DiagnosisCacheService(max_entries=10, model_version="v1")
+
+    async def failing():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("model unavailable")
+
+    results = await asyncio.gather(*(cache.get_or_compute(7, _CHECKUPS, None, failing) for _ in range(3)),
+                                   return_exceptions=True)
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert cache.counters["misses"] == 1 and cache.get(cache.key_for(_CHECKUPS, None)) is None
+
+
+@pytest.mark.asyncio
+async def test_sync_event_during_compute_discards_stale_result():
+    cache = DiagnosisCacheService(max_entries=10, model_version="v1")
+
+    async def compute():
+        await asyncio.sleep(0.01)
+        return _diagnosis(70)
+
+    task = asyncio.create_task(cache.get_or_compute(7, _CHECKUPS, None, compute))
+    await asyncio.sleep(0)
+    cache.on_events([EventRecord(1, "member-7", EventType.HEALTH_DATA_SYNCED, "{}", 7, "test")])
+    assert (await task).health_score == 70
+    assert cache.get(cache.key_for(_CHECKUPS, None)) is None
+
+
+def test_app_startup_registers_invalidation_subscriber():
+    from app.main import app
+
+    with TestClient(app) as client:
+        events = client.get("/api/v1/status/events").json()["data"]
+    assert events["running"] and "diagnosis_cache" in events["subscribers"]
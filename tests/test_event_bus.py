@@ -0,0 +1,113 @@
+"""
+이벤트 버스 배치 / 병합 / 넘침 정책 테스트
+"""
+import asyncio
+
+import pytest
+
+from app.core.event_bus import EventBus, OverflowPolicy, member_key
+from app.core.event_log import EventLog
+from app.core.metrics import MetricsRegistry
+from app.models.common import EventType
+from app.models.records import EventRecord
+
+
+def _event(event_type: EventType, member: int, event_id: int = 0) -> EventRecord:
+    return EventRecord(event_id, f"member-{member}", event_type, "{}", member, "health")
+
+
+class _Collector:
+    def __init__(self):
+        self.batches = []
+
+    async def __call__(self, events):
+        self.batches.append(list(events))
+
+
+@pytest.mark.asyncio
+async def test_micro_batching_and_type_filter():
+    bus = EventBus(batch_size=50, max_delay=0.01)
+    collector = _Collector()
+    bus.subscribe("missions", collector, event_types={EventType.MISSION_COMPLETED})
+    bus.start()
+    events = [_event(EventType.MISSION_COMPLETED, member, member) for member in range(120)]
+    await bus.publish(events + [_event(EventType.HEALTH_DATA_SYNCED, 1)])
+    await bus.close()
+    assert [len(batch) for batch in collector.batches] == [50, 50, 20]
+    assert [e for batch in collector.batches for e in batch] == events
+
+
+@pytest.mark.asyncio
+async def test_coalescing_keeps_latest_event_per_key():
+    bus = EventBus(max_delay=0.02)
+    collector = _Collector()
+    subscription = bus.subscribe("rescoring", collector, coalesce_key=member_key)
+    bus.start()
+    await bus.publish([_event(EventType.MISSION_COMPLETED, 7, i) for i in range(10)])
+    await bus.publish([_event(EventType.MISSION_COMPLETED, 8, 100)])
+    await bus.close()
+    assert [(e.member_serial_number, e.event_id) for e in collector.batches[0]] == [(7, 9), (8, 100)]
+    assert subscription.counters["coalesced"] == 9
+    assert subscription.counters["delivered"] == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("policy, expected", [
+    (OverflowPolicy.DROP_OLDEST, [2, 3, 4]),
+    (OverflowPolicy.DROP_NEWEST, [0, 1, 2]),
+    (OverflowPolicy.BLOCK, [0, 1, 2, 3, 4]),
+])
+async def test_overflow_policies(policy, expected):
+    bus = EventBus(queue_size=3, batch_size=10, max_delay=0.01, overflow=policy)
+    collector = _Collector()
+    subscription = bus.subscribe("slow", collector)
+    await bus.publish([_event(EventType.NOTIFICATION_SENT, 1, i) for i in range(5)])
+    await bus.close()
+    assert [e.event_id for batch in collector.batches for e in batch] == expected
+    assert subscription.counters["dropped"] == 5 - len(expected)
+
+
+@pytest.mark.asyncio
+async def test_handler_error_does_not_stop_delivery():
+    bus = EventBus(batch_size=1, max_delay=0)
+    delivered = []
+
+    def handler(events):
+        if events[0].event_id == 1:
+            raise RuntimeError("boom")
+        delivered.extend(e.event_id for e in events)
+
+    subscription = bus.subscribe("flaky", handler)
+    await bus.publish([_event(EventType.GOAL_SETUP, 1, i) for i in range(3)])
+    await bus.close()
+    assert delivered == [0, 2]
+    assert subscription.counters["errors"] == 1
+
+
+@pytest.mark.asyncio
+async def test_event_log_commits_publish_from_writer_thread(tmp_path):
+    bus = EventBus(max_delay=0.005)
+    collector = _Collector()
+    bus.subscribe("all", collector)
+    bus.start()
+    log = EventLog(str(tmp_path), fsync=False)
+    log.add_listener(bus.publish_threadsafe)
+    try:
+        stored = await asyncio.to_thread(log.append_batch, [_event(EventType.HEALTH_DATA_SYNCED, 3)] * 3)
+        await bus.close()
+    finally:
+        log.close()
+    assert [e.event_id for batch in collector.batches for e in batch] == [e.event_id for e in stored]
+
+
+@pytest.mark.asyncio
+async def test_metrics_collector_renders_per_subscriber():
+    bus = EventBus(max_delay=0)
+    bus.subscribe("diagnosis_cache", lambda events: None)
+    await bus.publish([_event(EventType.HEALTH_DATA_SYNCED, 1)])
+    await bus.close()
+    registry = MetricsRegistry()
+    registry.add_collector(bus.collect_metrics)
+    text = registry.render()
+    assert 'healthsync_event_bus_delivered_total{subscriber="diagnosis_cache"} 1' in text
+    assert 'healthsync_event_bus_queue_depth{subscriber="diagnosis_cache"} 0' in text
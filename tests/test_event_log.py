@@ -0,0 +1,134 @@
+"""
+이벤트 로그 테스트 (잘린 / 손상된 마지막 레코드 복구, 세그먼트 교체, 인덱스 재생, 그룹 커밋)
+"""
+import asyncio
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.core.event_log import EventLog, GroupCommitWriter
+from app.models.common import EventType
+from app.models.records import EventRecord
+
+
+def _event(aggregate_id: str, event_type: EventType = EventType.MISSION_COMPLETED, data: str = "{}",
+           created_at: datetime = datetime(2024, 5, 1)) -> EventRecord:
+    return EventRecord(0, aggregate_id, event_type, data, 7, "test", created_at)
+
+
+def _last_segment(directory) -> str:
+    return os.path.join(directory, sorted(os.listdir(directory))[-1])
+
+
+def test_recover_truncates_torn_last_frame(tmp_path):
+    log = EventLog(str(tmp_path), fsync=False)
+    log.append_batch([_event("member-1"), _event("member-2"), _event("member-1", data='{"x": 1}')])
+    log.close()
+    path = _last_segment(tmp_path)
+    intact = os.path.getsize(path)
+    # 기록 도중 중단된 것처럼 마지막 레코드의 일부만 남김
+    with open(path, "r+b") as f:
+        f.truncate(intact - 5)
+
+    recovered = EventLog(str(tmp_path), fsync=False)
+    assert recovered.event_count() == 2 and recovered.event_count("member-1") == 1
+    assert os.path.getsize(path) < intact - 5
+    # 잘린 뒤에도 이어서 기록하고 event_id 는 마지막 정상 레코드 다음부터
+    assert recovered.append(_event("member-3")).event_id == 3
+    recovered.close()
+    reopened = EventLog(str(tmp_path), fsync=False)
+    assert [e.aggregate_id for e in reopened.replay()] == ["member-1", "member-2", "member-3"]
+    reopened.close()
+
+
+def test_recover_stops_at_crc_mismatch(tmp_path):
+    log = EventLog(str(tmp_path), fsync=False)
+    log.append_batch([_event("member-1"), _event("member-2", data='{"steps": 1000}')])
+    log.close()
+    path = _last_segment(tmp_path)
+    with open(path, "r+b") as f:
+        f.seek(-3, os.SEEK_END)
+        f.write(b"!!!")
+
+    recovered = EventLog(str(tmp_path), fsync=False)
+    assert [e.aggregate_id for e in recovered.replay()] == ["member-1"]
+    recovered.close()
+
+
+def test_corrupt_sealed_segment_is_an_error(tmp_path):
+    log = EventLog(str(tmp_path), segment_max_bytes=200, fsync=False)
+    log.append_batch([_event(f"member-{i}") for i in range(6)])
+    assert log.segment_count > 1
+    log.close()
+    first = os.path.join(tmp_path, sorted(os.listdir(tmp_path))[0])
+    with open(first, "r+b") as f:
+        f.truncate(os.path.getsize(first) - 1)
+    with pytest.raises(ValueError):
+        EventLog(str(tmp_path), segment_max_bytes=200, fsync=False)
+
+
+def test_rotation_index_and_filtered_replay(tmp_path):
+    log = EventLog(str(tmp_path), segment_max_bytes=160, fsync=False)
+    base = datetime(2024, 5, 1)
+    for day in range(10):
+        event_type = EventType.HEALTH_DATA_SYNCED if day % 3 == 0 else EventType.MISSION_COMPLETED
+        log.append(_event(f"member-{day % 2}", event_type, created_at=base + timedelta(days=day)))
+    assert log.segment_count > 2
+    assert [e.event_id for e in log.replay_aggregate("member-1")] == [2, 4, 6, 8, 10]
+    assert [e.event_id for e in log.replay(EventType.HEALTH_DATA_SYNCED)] == [1, 4, 7, 10]
+    window = log.replay(since=base + timedelta(days=2), until=base + timedelta(days=4))
+    assert [e.created_at.day for e in window] == [3, 4, 5]
+    log.close()
+
+    reopened = EventLog(str(tmp_path), segment_max_bytes=160, fsync=False)
+    assert reopened.event_count("member-0") == 5 and reopened.segment_count == log.segment_count
+    reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_group_commit_batches_concurrent_appends(tmp_path):
+    log = EventLog(str(tmp_path), fsync=False)
+    committed = []
+    log.add_listener(committed.extend)
+    writer = GroupCommitWriter(log, max_delay=0.01)
+    try:
+        stored = await asyncio.gather(*(writer.append(_event(f"member-{i}")) for i in range(20)))
+        assert sorted(e.event_id for e in stored) == list(range(1, 21))
+        assert writer.batches_committed < 20 and len(committed) == 20
+    finally:
+        await writer.close()
+        log.close()
+
+
+def _raise(error: Exception):
+    def fail(*args):
+        raise error
+    return fail
+
+
+def test_failed_write_keeps_ids_and_offsets(tmp_path, monkeypatch):
+    log = EventLog(str(tmp_path), fsync=True)
+    log.append(_event("member-1"))
+    path = _last_segment(tmp_path)
+    size = os.path.getsize(path)
+
+    monkeypatch.setattr(log._file, "write", _raise(OSError("disk full")))
+    with pytest.raises(OSError):
+        log.append(_event("member-2"))
+    assert os.path.getsize(path) == size
+
+    # 기록은 되었지만 fsync 가 실패 → 파일에 남은 바이트를 잘라냄
+    monkeypatch.setattr("app.core.event_log.os.fsync", _raise(OSError("I/O error")))
+    with pytest.raises(OSError):
+        log.append(_event("member-3"))
+    monkeypatch.undo()
+    assert os.path.getsize(path) == size and log.event_count() == 1
+
+    assert log.append(_event("member-4")).event_id == 2
+    assert [(e.event_id, e.aggregate_id) for e in log.replay()] == [(1, "member-1"), (2, "member-4")]
+    assert [e.event_id for e in log.replay_aggregate("member-4")] == [2]
+    log.close()
+    reopened = EventLog(str(tmp_path), fsync=False)
+    assert [e.aggregate_id for e in reopened.replay()] == ["member-1", "member-4"]
+    reopened.close()
@@ -0,0 +1,144 @@
+"""
+건강 점수 엔진 단일 / 배치 경로 일치 테스트
+"""
+import random
+from datetime import date
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from app.core.checkup_store import CHECKUP_SCHEMA, RAW_SCHEMA, ColumnBatch
+from app.models.health import HealthCheckup, HealthCheckupRaw, RiskLevel
+from app.services.health_score_service import (
+    RISK_LEVEL_CODES, SCORE_RULES, HealthScoreEngine, ScoreRule, risk_level_for,
+)
+
+_NULLABLE_INT = ("systolic_bp", "diastolic_bp", "fasting_glucose", "total_cholesterol", "triglyceride",
+                 "hdl_cholesterol", "ldl_cholesterol", "urine_protein", "ast", "alt", "gamma_gtp",
+                 "smoking_status", "drinking_status")
+
+
+def _boundary_or_random(rng: random.Random, field: str, low: int, high: int) -> int:
+    """절반은 규칙 경계값 근처, 절반은 범위 내 임의 값"""
+    rule = next((r for r in SCORE_RULES if r.field == field), None)
+    if rule is not None and rng.random() < 0.5:
+        edges = list(rule.edges) + [e for edges in (rule.gender_edges or {}).values() for e in edges]
+        return int(rng.choice(edges)) + rng.choice((-1, 0, 0, 1))
+    return rng.randint(low, high)
+
+
+def _measurements(rng: random.Random) -> dict:
+    values = {
+        "height": rng.choice((0, rng.randint(140, 195))),
+        "weight": rng.randint(40, 120),
+        "waist_circumference": _boundary_or_random(rng, "waist_circumference", 60, 120),
+        "hemoglobin": Decimal(rng.choice(("11.99", "12.00", "12.005", "13.0", "15.49", "15.5", "16.5", "17.2"))),
+        "serum_creatinine": Decimal(rng.choice(("0.8", "1.49", "1.5", "1.51", "2.3"))),
+    }
+    for field in _NULLABLE_INT:
+        values[field] = _boundary_or_random(rng, field, 0, 300)
+    values["smoking_status"] = rng.randint(1, 3)
+    values["drinking_status"] = rng.randint(0, 1)
+    # 일부 항목은 측정 누락
+    for field in _NULLABLE_INT + ("hemoglobin", "serum_creatinine"):
+        if rng.random() < 0.15:
+            values[field] = None
+    return values
+
+
+def _checkups(count: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    checkups = []
+    for i in range(count):
+        values = _measurements(rng)
+        bmi = None if rng.random() < 0.3 else Decimal(rng.choice(("18.49", "18.5", "22.99", "23.00", "24.995", "29.9", "30.0", "31.4")))
+        checkups.append(HealthCheckup(checkup_id=i + 1, member_serial_number=i + 1, raw_id=i + 1,
+                                      reference_year=2024, age=rng.randint(20, 80), bmi=bmi, **values))
+    return checkups
+
+
+def _raw_checkups(count: int, seed: int = 11) -> list:
+    rng = random.Random(seed)
+    return [
+        HealthCheckupRaw(raw_id=i + 1, reference_year=2024, birth_date=date(1980, 1, 1), name=f"회원{i}",
+                         region_code=rng.randint(11, 50), gender_code=rng.choice((1, 2)),
+                         age=rng.randint(20, 80), **_measurements(rng))
+        for i in range(count)
+    ]
+
+
+@pytest.fixture(scope="module")
+def engine() -> HealthScoreEngine:
+    return HealthScoreEngine()
+
+
+def _assert_parity(engine: HealthScoreEngine, models: list, batch: ColumnBatch, genders=None):
+    result = engine.score_batch(batch, genders)
+    assert len(result) == len(models)
+    for i, model in enumerate(models):
+        single = engine.score(model, None if genders is None else int(genders[i]))
+        assert single.score == int(result.scores[i]), (i, single, model)
+        assert single.risk_level == RISK_LEVEL_CODES[result.risk_codes[i]]
+        assert single.evaluated_items == int(result.evaluated_items[i])
+
+
+def test_processed_checkup_parity(engine):
+    checkups = _checkups(3000)
+    _assert_parity(engine, checkups, ColumnBatch.from_models(CHECKUP_SCHEMA, checkups))
+
+
+def test_processed_checkup_parity_with_gender(engine):
+    checkups = _checkups(2000, seed=3)
+    genders = np.random.default_rng(3).choice([1, 2, 9], size=len(checkups))
+    _assert_parity(engine, checkups, ColumnBatch.from_models(CHECKUP_SCHEMA, checkups), genders)
+
+
+def test_raw_checkup_parity_uses_gender_column_and_derived_bmi(engine):
+    raws = _raw_checkups(2000)
+    _assert_parity(engine, raws, ColumnBatch.from_models(RAW_SCHEMA, raws))
+
+
+def test_sliced_batch_parity(engine):
+    checkups = _checkups(500, seed=5)
+    batch = ColumnBatch.from_models(CHECKUP_SCHEMA, checkups).slice(100, 400)
+    _assert_parity(engine, checkups[100:400], batch)
+
+
+def test_empty_batch(engine):
+    result = engine.score_batch(ColumnBatch.empty(CHECKUP_SCHEMA))
+    assert len(result) == 0
+    assert result.risk_levels() == []
+
+
+def test_rule_boundaries(engine):
+    base = dict(checkup_id=1, member_serial_number=1, raw_id=1, reference_year=2024, age=40,
+                height=170, weight=65, waist_circumference=80)
+    assert engine.score(HealthCheckup(**base, systolic_bp=119)).deductions["수축기 혈압"] == 0
+    assert engine.score(HealthCheckup(**base, systolic_bp=120)).deductions["수축기 혈압"] == 2
+    assert engine.score(HealthCheckup(**base, systolic_bp=160)).deductions["수축기 혈압"] == 15
+    assert engine.score(HealthCheckup(**base, hdl_cholesterol=39)).deductions["HDL 콜레스테롤"] == 6
+    assert engine.score(HealthCheckup(**base, serum_creatinine=Decimal("1.49"))).deductions["혈청크레아티닌"] == 0
+    assert engine.score(HealthCheckup(**{**base, "waist_circumference": 88}), gender_code=1).deductions["허리둘레"] == 0
+    assert engine.score(HealthCheckup(**{**base, "waist_circumference": 88}), gender_code=2).deductions["허리둘레"] == 5
+
+
+def test_score_floor_and_risk_levels(engine):
+    worst = HealthCheckup(checkup_id=1, member_serial_number=1, raw_id=1, reference_year=2024, age=60,
+                          height=160, weight=110, waist_circumference=120, systolic_bp=190, diastolic_bp=120,
+                          fasting_glucose=250, total_cholesterol=300, ldl_cholesterol=220, hdl_cholesterol=30,
+                          triglyceride=600, hemoglobin=Decimal("10.0"), urine_protein=4,
+                          serum_creatinine=Decimal("2.5"), ast=120, alt=120, gamma_gtp=200,
+                          smoking_status=3, drinking_status=1)
+    result = engine.score(worst)
+    assert result.score == 0
+    assert result.risk_level == RiskLevel.CRITICAL
+    assert result.concerns[0] == "수축기 혈압"
+    assert [risk_level_for(s) for s in (0, 39, 40, 59, 60, 79, 80, 100)] == [
+        RiskLevel.CRITICAL, RiskLevel.CRITICAL, RiskLevel.HIGH, RiskLevel.HIGH,
+        RiskLevel.MEDIUM, RiskLevel.MEDIUM, RiskLevel.LOW, RiskLevel.LOW]
+
+
+def test_invalid_rule_rejected():
+    with pytest.raises(ValueError):
+        HealthScoreEngine([ScoreRule("ast", "AST", (40, 80), (0, 3))])
@@ -0,0 +1,162 @@
+"""
+건강검진 변경분 동기화 테스트 (지문, 색인, HEALTH_DATA_SYNCED 발행)
+"""
+import asyncio
+import json
+import threading
+from datetime import datetime
+
+import pytest
+
+from app.config.settings import settings
+from app.controllers import health_controller
+from app.core.checkup_store import CHECKUP_SCHEMA, CheckupColumnStore, ColumnBatch
+from app.core.event_log import EventLog, GroupCommitWriter
+from app.models.common import EventType
+from app.models.health import HealthCheckup
+from app.services import health_sync_service
+from app.services.health_sync_service import FingerprintIndex, HealthSyncService, checkup_fingerprints
+
+
+def _checkup(year: int, member: int = 7, **changes) -> HealthCheckup:
+    values = dict(checkup_id=year, member_serial_number=member, raw_id=year, reference_year=year, age=year - 1979,
+                  height=172, weight=74, waist_circumference=88, systolic_bp=128, diastolic_bp=82,
+                  fasting_glucose=98, hemoglobin="14.2", processed_at=datetime(2024, 5, 1))
+    values.update(changes)
+    return HealthCheckup(**values)
+
+
+def test_fingerprint_ignores_ids_and_timestamps():
+    base = _checkup(2023)
+    same = base.model_copy(update={"checkup_id": 99, "raw_id": 5, "processed_at": datetime(2025, 1, 1)})
+    changed = base.model_copy(update={"systolic_bp": 129})
+    missing = base.model_copy(update={"triglyceride": 0})
+    fingerprints = checkup_fingerprints(ColumnBatch.from_models(CHECKUP_SCHEMA, [base, same, changed, missing]))
+    assert fingerprints[0] == fingerprints[1]
+    assert len(set(fingerprints.tolist())) == 3
+
+
+@pytest.mark.asyncio
+async def test_sync_processes_only_changes(tmp_path):
+    store = CheckupColumnStore.for_checkups(str(tmp_path / "checkups"))
+    log = EventLog(str(tmp_path / "events"), fsync=False)
+    writer = GroupCommitWriter(log, max_delay=0)
+    service = HealthSyncService(store, FingerprintIndex(str(tmp_path / "fingerprints.npz")), event_writer=writer)
+    history = [_checkup(year) for year in (2021, 2022, 2023)]
+    try:
+        first = await service.sync_member(7, history)
+        assert (first.sync_status, first.new_records, first.is_ready_for_analysis) == ("synced", 3, True)
+
+        again = await service.sync_member(7, [c.model_copy(update={"processed_at": datetime.now()}) for c in history])
+        assert (again.sync_status, again.unchanged_records, again.is_ready_for_analysis) == ("unchanged", 3, False)
+        assert store.segment_count == 1
+
+        history[1] = _checkup(2022, systolic_bp=151)
+        delta = await service.sync_member(7, history + [_checkup(2024)])
+        assert (delta.new_records, delta.changed_records, delta.unchanged_records) == (1, 1, 2)
+        assert delta.synced_years == [2022, 2024]
+        assert len(store) == 5
+
+        stored = store.history(7)
+        assert stored.column("reference_year").tolist() == [2021, 2022, 2023, 2024]
+        assert stored.column("systolic_bp").tolist()[1] == 151
+
+        await writer.close()
+        events = list(log.replay(EventType.HEALTH_DATA_SYNCED))
+        assert len(events) == 2
+        assert json.loads(events[1].event_data)["reference_years"] == [2022, 2024]
+    finally:
+        await writer.close()
+        log.close()
+
+
+@pytest.mark.asyncio
+async def test_sync_rejects_other_members(tmp_path):
+    service = HealthSyncService(CheckupColumnStore.for_checkups(str(tmp_path)), FingerprintIndex())
+    with pytest.raises(ValueError):
+        await service.sync_member(7, [_checkup(2023, member=8)])
+
+
+def test_index_persists_and_rebuilds(tmp_path):
+    store = CheckupColumnStore.for_checkups(str(tmp_path / "checkups"))
+    service = HealthSyncService(store, FingerprintIndex(str(tmp_path / "fingerprints.npz")))
+    for checkups in ([_checkup(2022), _checkup(2023, member=8)], [_checkup(2022, weight=70)]):
+        delta, _ = service.apply(ColumnBatch.from_models(CHECKUP_SCHEMA, checkups))
+        service.mark_synced(delta)
+    service.save_if_dirty()
+
+    probe = ColumnBatch.from_models(CHECKUP_SCHEMA, [_checkup(2022, weight=70), _checkup(2023, member=8)])
+    for index in (FingerprintIndex(str(tmp_path / "fingerprints.npz")), FingerprintIndex()):
+        if not index.load():
+            index.rebuild(store)
+        delta = HealthSyncService(store, index).diff(probe)
+        assert len(delta.changed) == 0 and delta.unchanged_count == 2
+
+
+@pytest.mark.asyncio
+async def test_repeated_year_counts_as_duplicate(tmp_path):
+    service = HealthSyncService(CheckupColumnStore.for_checkups(str(tmp_path)), FingerprintIndex())
+    result = await service.sync_member(7, [_checkup(2022), _checkup(2022, systolic_bp=140), _checkup(2023)])
+    assert (result.new_records, result.unchanged_records, result.duplicate_records) == (2, 0, 1)
+    assert service.store.get(7, 2022).column("systolic_bp").tolist() == [140]
+
+    again = await service.sync_member(7, [_checkup(2022, systolic_bp=140), _checkup(2022, systolic_bp=140)])
+    assert (again.sync_status, again.unchanged_records, again.duplicate_records) == ("unchanged", 1, 1)
+
+
+class _FailingWriter:
+    """fail 이 켜져 있는 동안 기록에 실패하는 이벤트 작성기 (이벤트 로그 장애 재현)"""
+
+    def __init__(self):
+        self.fail = True
+        self.events = []
+
+    async def append(self, event):
+        if self.fail:
+            raise ConnectionError("event log unavailable")
+        self.events.append(event)
+        return event
+
+
+@pytest.mark.asyncio
+async def test_index_updates_only_after_event_commits(tmp_path):
+    writer = _FailingWriter()
+    service = HealthSyncService(CheckupColumnStore.for_checkups(str(tmp_path)), FingerprintIndex(),
+                                event_writer=writer)
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            await service.sync_member(7, [_checkup(2023)])
+    # 이벤트가 커밋되지 않았으므로 다시 보내면 같은 변경분을 다시 발행 (저장소에는 한 번만 기록)
+    writer.fail = False
+    retry = await service.sync_member(7, [_checkup(2023)])
+    assert (retry.sync_status, retry.new_records) == ("synced", 1) and len(writer.events) == 1
+    assert len(service.store) == 1 and service.store.segment_count == 1
+    assert (await service.sync_member(7, [_checkup(2023)])).sync_status == "unchanged"
+
+
+@pytest.mark.asyncio
+async def test_small_sync_segments_are_compacted(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "health_sync_compact_rows", 100)
+    monkeypatch.setattr(settings, "health_sync_compact_segments", 4)
+    service = HealthSyncService(CheckupColumnStore.for_checkups(str(tmp_path)), FingerprintIndex())
+    for weight in range(60, 70):
+        await service.sync_member(7, [_checkup(2023, weight=weight), _checkup(2024, weight=weight)])
+    assert service.store.segment_count < 4
+    assert service.store.history(7).column("weight").tolist() == [69, 69]
+
+
+@pytest.mark.asyncio
+async def test_controller_builds_service_off_the_event_loop(monkeypatch):
+    built = []
+
+    class _Service:
+        def __init__(self, event_writer=None):
+            built.append(threading.get_ident())
+
+    monkeypatch.setattr(health_sync_service, "HealthSyncService", _Service)
+    monkeypatch.setattr(health_controller, "get_event_writer", lambda: None)
+    controller = health_controller.HealthController()
+    services = await asyncio.gather(*(controller.get_sync_service() for _ in range(5)))
+    # 지문 색인 재구성이 포함된 생성은 한 번, 이벤트 루프 밖의 스레드에서
+    assert len(built) == 1 and built[0] != threading.get_ident()
+    assert all(service is services[0] for service in services)
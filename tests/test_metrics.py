@@ -0,0 +1,93 @@
+"""
+요청 메트릭 테스트 (라우트 템플릿 라벨, 5xx 집계, 처리 중 요청 게이지, 누적 버킷 / 라벨 이스케이프, 표본 로그)
+"""
+import logging
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+
+from app.core import metrics
+from app.core.metrics import UNMATCHED_ROUTE, MetricsMiddleware, MetricsRegistry
+
+
+def _app(registry: MetricsRegistry, log_sample_rate: float = 0.0) -> FastAPI:
+    router = APIRouter()
+
+    @router.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        return {"item_id": item_id, "in_flight": registry.in_flight}
+
+    @router.get("/boom")
+    async def boom():
+        raise RuntimeError("boom")
+
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+    app.add_middleware(MetricsMiddleware, registry=registry, service_name="test-service",
+                       log_sample_rate=log_sample_rate)
+    return app
+
+
+def test_route_template_labels_and_in_flight():
+    registry = MetricsRegistry()
+    with TestClient(_app(registry)) as client:
+        first = client.get("/api/items/1")
+        assert first.json()["in_flight"] == 1
+        assert first.headers["X-Service"] == "test-service" and float(first.headers["X-Process-Time"]) >= 0
+        client.get("/api/items/2")
+        client.get("/api/items/x")
+        # 매칭되지 않은 임의 경로는 하나의 라벨로
+        client.get("/no/such/path")
+        client.get("/another")
+
+    assert registry.requests == {
+        ("GET", "/api/items/{item_id}", 200): 2,
+        ("GET", "/api/items/{item_id}", 422): 1,
+        ("GET", UNMATCHED_ROUTE, 404): 2,
+    }
+    assert registry.latency[("GET", "/api/items/{item_id}")].count == 3
+    assert registry.in_flight == 0
+
+
+def test_unhandled_exception_counts_as_5xx():
+    registry = MetricsRegistry()
+    with TestClient(_app(registry), raise_server_exceptions=False) as client:
+        assert client.get("/api/boom").status_code == 500
+    assert registry.requests == {("GET", "/api/boom", 500): 1}
+    assert registry.in_flight == 0
+
+
+def test_render_cumulative_buckets_and_escaping():
+    registry = MetricsRegistry(buckets=(0.1, 1.0))
+    for seconds in (0.05, 0.1, 0.5, 5.0):
+        registry.observe("GET", "/a", 200, seconds)
+    registry.observe("POST", 'x"y\\z\nw', 201, 0.2)
+    registry.add_collector(lambda: [("queue_depth", "gauge", "큐 깊이", [({"topic": 'a"b'}, 3), ({}, 4)])])
+    text = registry.render()
+
+    name = "healthsync_http_request_duration_seconds"
+    assert f'{name}_bucket{{method="GET",route="/a",le="0.1"}} 2' in text
+    assert f'{name}_bucket{{method="GET",route="/a",le="1.0"}} 3' in text
+    assert f'{name}_bucket{{method="GET",route="/a",le="+Inf"}} 4' in text
+    assert f'{name}_sum{{method="GET",route="/a"}} 5.65' in text
+    assert f'{name}_count{{method="GET",route="/a"}} 4' in text
+    assert 'healthsync_http_requests_total{method="POST",route="x\\"y\\\\z\\nw",status="201"} 1' in text
+    assert 'healthsync_queue_depth{topic="a\\"b"} 3' in text and "healthsync_queue_depth 4\n" in text
+    assert "healthsync_http_requests_in_flight 0" in text and text.endswith("\n")
+
+    registry.reset()
+    assert registry.requests == {} and registry.latency == {}
+
+
+@pytest.mark.parametrize("rate, draw, logged", [(0.0, 0.0, False), (0.5, 0.3, True), (0.5, 0.7, False)])
+def test_request_logs_are_sampled(caplog, monkeypatch, rate, draw, logged):
+    monkeypatch.setattr(metrics.random, "random", lambda: draw)
+    with TestClient(_app(MetricsRegistry(), log_sample_rate=rate), raise_server_exceptions=False) as client:
+        with caplog.at_level(logging.INFO, logger=metrics.logger.name):
+            client.get("/api/items/1")
+            client.get("/api/boom")
+    records = [(r.levelno, r.getMessage().split(" - ")[0]) for r in caplog.records if r.name == metrics.logger.name]
+    # 5xx 는 표본과 관계없이 항상 경고로 기록
+    expected = [(logging.INFO, "GET /api/items/1")] if logged else []
+    assert records == expected + [(logging.WARNING, "GET /api/boom")]
@@ -0,0 +1,105 @@
+"""
+미션 추천 테스트 (상위 k 순서와 동점 처리, 제외 목록, 직업 가산점 / 공통 버킷 대체, 카탈로그 교체)
+"""
+import pytest
+
+from app.models.goal import DifficultyLevel, MissionCatalogItem, MissionCategory
+from app.models.health import HealthCheckup
+from app.models.user import OccupationType
+from app.services.mission_recommendation_service import MissionRecommendationService, risk_vector
+
+
+def _mission(mission_id: str, category: MissionCategory = MissionCategory.EXERCISE,
+             difficulty: DifficultyLevel = DifficultyLevel.BEGINNER, base_score: float = 0.0,
+             occupations=(), **risk_weights) -> MissionCatalogItem:
+    return MissionCatalogItem(mission_id=mission_id, title=f"미션 {mission_id}", description="설명",
+                              category=category, difficulty=difficulty, health_benefit="건강 개선",
+                              estimated_time_minutes=10, occupation_categories=list(occupations),
+                              risk_weights=risk_weights, base_score=base_score)
+
+
+# 혈압만 기준 이상 (위험 요인: blood_pressure = 1, base = 1)
+CHECKUP = HealthCheckup(checkup_id=1, member_serial_number=7, raw_id=1, reference_year=2024, age=45, height=172,
+                        weight=64, waist_circumference=80, systolic_bp=160, diastolic_bp=85, fasting_glucose=90)
+
+CATALOG = [
+    _mission("a", blood_pressure=0.9),
+    _mission("b", MissionCategory.NUTRITION, base_score=0.5),
+    _mission("c", difficulty=DifficultyLevel.INTERMEDIATE, blood_pressure=0.5),
+    _mission("d", blood_pressure=0.5),
+    _mission("e", blood_sugar=2.0),
+]
+
+
+def _ids(response):
+    return [m.mission_id for m in response.missions]
+
+
+def test_risk_vector_from_checkup():
+    risk = dict(zip(("obesity", "abdominal_obesity", "blood_pressure", "blood_sugar"), risk_vector(CHECKUP)))
+    assert risk == {"obesity": 0.0, "abdominal_obesity": 0.0, "blood_pressure": 1.0, "blood_sugar": 0.0}
+
+
+def test_top_k_order_and_ties():
+    service = MissionRecommendationService(CATALOG)
+    # 0.5 동점은 카테고리(운동 → 영양) → 난이도(초급 → 중급) 순서, 같은 버킷은 카탈로그 순서
+    assert _ids(service.recommend(CHECKUP, "office", k=10)) == ["a", "d", "c", "b", "e"]
+    assert _ids(service.recommend(CHECKUP, "office", k=2)) == ["a", "d"]
+    assert service.recommend(CHECKUP, "office", k=3).total_recommended == 3
+    assert "혈압" in service.recommend(CHECKUP, "office").recommendation_reason
+    with pytest.raises(ValueError):
+        service.recommend(CHECKUP, "office", k=0)
+
+    # 한 버킷 안에서 k 경계에 걸친 동점도 항상 카탈로그 순서
+    scores = [(i * 7) % 3 / 2 for i in range(60)]
+    ties = MissionRecommendationService([_mission(f"t{i}", base_score=score) for i, score in enumerate(scores)])
+    expected = [f"t{i}" for i in sorted(range(60), key=lambda i: (-scores[i], i))]
+    for k in (1, 3, 7, 15, 30):
+        assert _ids(ties.recommend(CHECKUP, "office", k=k)) == expected[:k]
+
+
+def test_filters_and_exclusions():
+    service = MissionRecommendationService(CATALOG)
+    assert _ids(service.recommend(CHECKUP, "office", k=2, exclude_ids=["a"])) == ["d", "c"]
+    only_nutrition = service.recommend(CHECKUP, "office", categories=[MissionCategory.NUTRITION])
+    assert _ids(only_nutrition) == ["b"]
+    assert _ids(service.recommend(CHECKUP, "office", difficulties=[DifficultyLevel.INTERMEDIATE])) == ["c"]
+
+    # 제외 목록이 후보보다 많으면 남은 후보만 (k 개보다 적게) 반환
+    assert _ids(service.recommend(CHECKUP, "office", k=3, exclude_ids=["a", "c", "d", "x", "y", "z"])) == ["b", "e"]
+    assert service.recommend(CHECKUP, "office", exclude_ids=[m.mission_id for m in CATALOG]).missions == []
+
+
+def test_occupation_bonus_and_common_fallback():
+    catalog = [
+        _mission("common", base_score=1.0),
+        _mission("desk", base_score=0.6, occupations=["office"]),
+        _mission("road", base_score=0.6, occupations=["driver"]),
+    ]
+    service = MissionRecommendationService(catalog, [
+        OccupationType(occupation_code="A01", occupation_name="사무직", category="office"),
+    ])
+    # 직업 전용 미션은 가산점(0.5)으로 공통 미션(1.0)보다 앞서고, 다른 직업 전용 미션은 후보가 아님
+    office = service.recommend(CHECKUP, "office")
+    assert _ids(office) == ["desk", "common"]
+    assert [m.occupation_relevance for m in office.missions] == ["office 직군 맞춤 미션", "공통 미션"]
+    assert _ids(service.recommend(CHECKUP, "A01")) == _ids(service.recommend(CHECKUP, "사무직")) == ["desk", "common"]
+    # 카탈로그에 없는 직업 카테고리는 공통 버킷
+    assert _ids(service.recommend(CHECKUP, "farmer")) == ["common"]
+
+
+def test_load_catalog_swaps_index():
+    service = MissionRecommendationService(CATALOG)
+    previous = service.index
+    assert previous.version == 0 and previous.size == 5
+
+    service.load_catalog([_mission("new", blood_pressure=2.0), _mission("a", base_score=0.1)])
+    assert service.index is not previous and service.index.version == 1
+    assert _ids(service.recommend(CHECKUP, "office")) == ["new", "a"]
+    # 교체 전 인덱스를 잡고 있던 요청은 이전 카탈로그를 그대로 봄
+    assert [m.mission_id for _, m in previous.top_k(risk_vector(CHECKUP), "office", 2)] == ["a", "d"]
+
+    # 잘못된 카탈로그는 교체하지 않음
+    with pytest.raises(ValueError):
+        service.load_catalog([_mission("bad", unknown_factor=1.0)])
+    assert service.index.version == 1 and _ids(service.recommend(CHECKUP, "office")) == ["new", "a"]
@@ -0,0 +1,152 @@
+"""
+미션 통계 누적 집계 테스트 (연속 달성, 주/월 합계, 기간 집계, 과거 날짜 수정 / 시작일 이전 기록, 완료 기록 경로)
+"""
+import asyncio
+from datetime import date
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.controllers.history_controller import HistoryController
+from app.core.database import Database
+from app.core.dependencies import get_mission_history_service
+from app.core.repositories import MissionCompletionRepository
+from app.models.records import MissionCompletionRecord
+from app.services.mission_history_service import MissionHistoryService
+from app.services.mission_stats_service import MissionAggregate, MissionStatsService
+
+# 2024-04-29 는 월요일 (ISO 18주는 4/29 ~ 5/5)
+WEEK = [(date(2024, 4, 29), 2, 2), (date(2024, 4, 30), 2, 2), (date(2024, 5, 1), 2, 1),
+        (date(2024, 5, 2), 2, 3), (date(2024, 5, 3), 2, 2), (date(2024, 5, 5), 2, 2)]
+
+
+def _aggregate(days) -> MissionAggregate:
+    aggregate = MissionAggregate(1, days[0][0])
+    for day, target, completed in days:
+        aggregate.record(day, target, completed)
+    return aggregate
+
+
+def _state(aggregate: MissionAggregate):
+    return (aggregate.origin, list(aggregate.daily_target), list(aggregate.daily_completed),
+            list(aggregate.completed_prefix), list(aggregate.target_prefix), list(aggregate.achieved_prefix),
+            aggregate.weekly, aggregate.monthly, aggregate.current_streak, aggregate.best_streak)
+
+
+def test_streaks_and_buckets():
+    aggregate = _aggregate(WEEK)
+    # 5/1 미달성으로 끊기고, 기록이 없는 5/4 는 목표 0 으로 채워져 다시 끊김
+    assert (aggregate.current_streak, aggregate.best_streak) == (1, 2)
+    assert aggregate.last_date == date(2024, 5, 5) and len(aggregate.daily_target) == 7
+    assert aggregate.streak_as_of(date(2024, 5, 6)) == 1 and aggregate.streak_as_of(date(2024, 5, 7)) == 0
+
+    # 목표를 넘긴 완료 횟수(5/2 의 3회)는 목표치까지만 합산
+    assert aggregate.week(date(2024, 5, 1)) == (11, 12)
+    assert aggregate.week(date(2024, 5, 6)) == (0, 0)
+    assert aggregate.month(2024, 4) == (4, 4) and aggregate.month(2024, 5) == (7, 8)
+
+    # 같은 날짜를 다시 기록하면 마지막 날을 되돌린 뒤 덮어씀
+    aggregate.record(date(2024, 5, 5), 2, 0)
+    assert (aggregate.current_streak, aggregate.best_streak, aggregate.month(2024, 5)) == (0, 2, (5, 8))
+    aggregate.record(date(2024, 5, 5), 2, 2)
+    assert _state(aggregate) == _state(_aggregate(WEEK))
+
+
+def test_period_uses_prefix_sums():
+    aggregate = _aggregate(WEEK)
+    total = aggregate.period()
+    assert (total.completed, total.target, total.achieved_days, total.tracked_days) == (11, 12, 5, 7)
+    assert total.achievement_rate == 91.7
+
+    window = aggregate.period(date(2024, 5, 1), date(2024, 5, 3))
+    assert (window.completed, window.target, window.achieved_days, window.tracked_days) == (5, 6, 2, 3)
+    # 기록 범위 밖은 잘라내고, 겹치지 않으면 빈 집계
+    clipped = aggregate.period(date(2024, 1, 1), date(2024, 4, 29))
+    assert (clipped.completed, clipped.target, clipped.tracked_days) == (2, 2, 1)
+    empty = aggregate.period(date(2024, 6, 1))
+    assert (empty.target, empty.tracked_days, empty.achievement_rate) == (0, 0, 0.0)
+
+
+def test_backfill_replays_from_changed_day():
+    aggregate = _aggregate(WEEK)
+    version = aggregate.version
+
+    # 과거 날짜 수정 (_set_past) → 이후 누적합 / 연속 달성 다시 계산
+    aggregate.record(date(2024, 5, 1), 2, 2)
+    fixed = [(day, target, 2 if day == date(2024, 5, 1) else completed) for day, target, completed in WEEK]
+    assert _state(aggregate) == _state(_aggregate(fixed))
+    assert (aggregate.best_streak, aggregate.current_streak, aggregate.week(date(2024, 5, 1))) == (5, 1, (12, 12))
+    assert aggregate.version == version + 1
+
+    # 시작일 이전 기록 (_rebase) → 시작일을 앞당기고 사이 날짜는 목표 0
+    aggregate.record(date(2024, 4, 27), 1, 1)
+    rebased = [(date(2024, 4, 27), 1, 1)] + fixed
+    assert _state(aggregate) == _state(_aggregate(rebased))
+    assert aggregate.origin == date(2024, 4, 27) and aggregate.last_date == date(2024, 5, 5)
+    assert aggregate.month(2024, 4) == (5, 5) and aggregate.week(date(2024, 4, 27)) == (1, 1)
+    assert aggregate.period(date(2024, 4, 29), date(2024, 5, 3)).completed == 10
+    assert aggregate.version == version + 2
+
+
+def test_service_keeps_member_mission_aggregates():
+    service = MissionStatsService()
+    service.load_history([MissionCompletionRecord(i, mission, 7, day, target, completed)
+                          for i, (day, target, completed) in enumerate(WEEK, start=1) for mission in (1, 2)])
+    service.record_completion(MissionCompletionRecord(99, 2, 7, date(2024, 5, 6), 2, 2))
+    aggregates = service.get_aggregates(7)
+    assert sorted(aggregates) == [1, 2] and service.get_aggregates(8) == {}
+    assert (aggregates[1].current_streak, aggregates[2].current_streak) == (1, 2)
+    assert aggregates[2].period().completed == 13
+
+
+async def _seed(path: str):
+    database = Database(path)
+    await database.connect()
+    try:
+        repository = MissionCompletionRepository(database)
+        for day, target, completed in WEEK[:3]:
+            await repository.add(MissionCompletionRecord(0, 1, 7, day, target, completed))
+    finally:
+        await database.close()
+
+
+@pytest.fixture
+def history_service(tmp_path):
+    path = str(tmp_path / "healthsync.db")
+    asyncio.run(_seed(path))
+    return MissionHistoryService(MissionCompletionRepository(Database(path)))
+
+
+def test_completion_endpoint_updates_stats(history_service):
+    database = history_service.repository.database
+
+    async def service():
+        if not database.is_connected:
+            await database.connect()
+        return history_service
+
+    app = FastAPI()
+    app.include_router(HistoryController().router)
+    app.dependency_overrides[get_mission_history_service] = service
+    with TestClient(app) as client:
+        for day, target, completed in WEEK[3:]:
+            response = client.post("/missions/7/completions", params={"user_id": "u1"}, json={
+                "completion_id": 0, "mission_id": 1, "member_serial_number": 7,
+                "completion_date": day.isoformat(), "daily_target_count": target,
+                "daily_completed_count": completed,
+            })
+            assert response.status_code == 201, response.text
+        assert response.json()["data"]["completion_id"] == 6
+
+        mismatched = client.post("/missions/8/completions", params={"user_id": "u1"}, json={
+            "completion_id": 0, "mission_id": 1, "member_serial_number": 7, "completion_date": "2024-05-06",
+            "daily_target_count": 2, "daily_completed_count": 2,
+        })
+        assert mismatched.status_code == 400
+        pages = client.get("/missions/7/completions", params={"user_id": "u1"}).json()["data"]
+        assert len(pages["items"]) == 6
+        client.portal.call(database.close)
+
+    # 저장된 앞 3일은 첫 기록 때 적재되고, 이후 기록은 바로 반영 (두 번 반영되지 않음)
+    assert _state(history_service.stats.get_aggregates(7)[1]) == _state(_aggregate(WEEK))
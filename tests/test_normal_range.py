@@ -0,0 +1,46 @@
+"""
+정상치 구간표 테스트 (범위 텍스트 해석, 정성 표기, 해석 불가 행 제외)
+"""
+import numpy as np
+import pytest
+
+from app.models.health import HealthNormalRange, RangeStatus
+from app.services.normal_range_service import (
+    RANGE_STATUS_CODES, STATUS_UNKNOWN, NormalRangeService, NormalRangeTable, parse_range_text,
+)
+
+
+def _range(range_id: int, code: str, normal: str, warning: str, danger: str, gender: int = 0) -> HealthNormalRange:
+    return HealthNormalRange(range_id=range_id, health_item_code=code, health_item_name=code, gender_code=gender,
+                             unit="", normal_range=normal, warning_range=warning, danger_range=danger)
+
+
+def test_parse_numeric_ranges_without_gaps():
+    assert parse_range_text("120-139") == [(120.0, 140.0)]
+    assert parse_range_text("<90 또는 >140 mmHg") == [(-np.inf, 90.0), (141.0, np.inf)]
+    assert parse_range_text("12.9 이하") == [(-np.inf, 13.0)]
+    with pytest.raises(ValueError):
+        parse_range_text("검사 안 함")
+
+
+def test_qualitative_tokens_map_to_grade_codes():
+    # 요단백 등급 코드: 1 음성, 2 약양성(±), 3~6 1+~4+
+    assert parse_range_text("음성") == [(1.0, 2.0)]
+    assert parse_range_text("±") == parse_range_text("약양성") == [(2.0, 3.0)]
+    assert parse_range_text("1+ 이상") == parse_range_text("양성") == [(3.0, np.inf)]
+
+    table = NormalRangeTable([_range(1, "urine_protein", "음성", "±", "1+ 이상")])
+    codes = table.classify("urine_protein", [1, 2, 3, 6])
+    assert NormalRangeTable.to_status(codes) == [RangeStatus.NORMAL, RangeStatus.WARNING, RangeStatus.DANGER,
+                                                 RangeStatus.DANGER]
+
+
+def test_unparseable_row_is_skipped_not_fatal():
+    service = NormalRangeService([
+        _range(1, "systolic_bp", "<120", "120-139", "≥140"),
+        _range(2, "hemoglobin", "별도 판정", "", ""),
+    ])
+    codes = service.classify("systolic_bp", [110, 135, 150])
+    assert [RANGE_STATUS_CODES[c] for c in codes] == [RangeStatus.NORMAL, RangeStatus.WARNING, RangeStatus.DANGER]
+    assert service.classify("hemoglobin", [14.0]).tolist() == [STATUS_UNKNOWN]
+    assert service.table.skipped == [2]
@@ -0,0 +1,49 @@
+"""
+배치 알림 발송 테스트 (중복 실행 방지, 워커 오류 시 중단, 체크포인트 재개)
+"""
+import asyncio
+import time
+from datetime import datetime
+
+import pytest
+
+from app.models.intelligence import BatchNotificationRequest, NotificationType
+from app.services.notification_dispatch_service import FakeDeliverySink, NotificationDispatchService
+
+
+def _request(users: int) -> BatchNotificationRequest:
+    return BatchNotificationRequest(trigger_time=datetime(2024, 5, 1, 9), target_users=[f"u{i}" for i in range(users)],
+                                    notification_type=NotificationType.DAILY_ENCOURAGEMENT)
+
+
+@pytest.mark.asyncio
+async def test_same_run_cannot_start_twice(tmp_path):
+    service = NotificationDispatchService(FakeDeliverySink(latency=0.001), str(tmp_path), chunk_size=5, concurrency=2)
+    results = await asyncio.gather(service.dispatch(_request(20)), service.dispatch(_request(20)),
+                                   return_exceptions=True)
+    assert sum(isinstance(r, ValueError) for r in results) == 1
+    finished = next(r for r in results if not isinstance(r, Exception))
+    assert finished.processed_count == 20
+
+
+@pytest.mark.asyncio
+async def test_worker_failure_stops_producer_and_keeps_checkpoint(tmp_path, monkeypatch):
+    sink = FakeDeliverySink(latency=0.001, permanent_failures={"u3"})
+    service = NotificationDispatchService(sink, str(tmp_path), chunk_size=1, concurrency=1, max_retries=0)
+
+    def broken_dead_letters(run_id, entries):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(service, "_write_dead_letters", broken_dead_letters)
+    started = time.monotonic()
+    with pytest.raises(OSError):
+        await asyncio.wait_for(service.dispatch(_request(50)), timeout=2)
+    # 생산자가 가득 찬 큐에서 막히지 않고 워커 오류로 바로 중단
+    assert time.monotonic() - started < 1 and service._runs == {}
+
+    # 같은 요청으로 다시 실행하면 완료된 청크는 건너뛰고 이어서 발송
+    monkeypatch.undo()
+    delivered = sink.delivered
+    resumed = await service.dispatch(_request(50))
+    assert resumed.processed_count == 50 and resumed.failed_count == 1
+    assert sink.delivered - delivered == 46
@@ -0,0 +1,120 @@
+"""
+커서 페이지네이션 테스트 (서명 / 범위 검증, 이력 목록 엔드포인트)
+"""
+import asyncio
+from datetime import date, datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.controllers.history_controller import HistoryController
+from app.core.database import Database
+from app.core.dependencies import get_chat_history_service, get_mission_history_service
+from app.core.pagination import CursorCodec, _b64decode, _b64encode
+from app.core.repositories import ChatMessageRepository, MissionCompletionRepository
+from app.core.session_cache import LocalSessionCache
+from app.models.intelligence import MessageType
+from app.models.records import ChatMessageRecord, MissionCompletionRecord
+from app.services.chat_history_service import ChatHistoryService
+from app.services.mission_history_service import MissionHistoryService
+
+
+def test_cursor_rejects_tampered_and_foreign_cursors():
+    codec = CursorCodec("secret")
+    cursor = codec.encode("chat:s1", (42,))
+    assert codec.decode("chat:s1", cursor) == (42,)
+
+    body, signature = cursor.split(".")
+    forged = _b64encode(_b64decode(body).replace(b"42", b"41"))
+    for bad in (f"{forged}.{signature}", f"{body}.{signature[:-2]}AA", "not-a-cursor", "%%%.!!!"):
+        with pytest.raises(ValueError):
+            codec.decode("chat:s1", bad)
+    with pytest.raises(ValueError):
+        codec.decode("chat:s2", cursor)
+    with pytest.raises(ValueError):
+        CursorCodec("other-secret").decode("chat:s1", cursor)
+
+
+async def _seed(path: str):
+    database = Database(path)
+    await database.connect()
+    try:
+        chats = ChatMessageRepository(database)
+        for i in range(5):
+            await chats.add("s1", ChatMessageRecord(0, 7, MessageType.QUESTION, f"질문 {i}",
+                                                    created_at=datetime(2024, 5, 1, 9, i)))
+        missions = MissionCompletionRepository(database)
+        # 같은 날짜에 두 건 → (날짜, completion_id) 순서
+        for day in (3, 1, 2, 2, 4):
+            await missions.add(MissionCompletionRecord(0, 1, 7, date(2024, 5, day), 3, 2))
+    finally:
+        await database.close()
+
+
+@pytest.fixture
+def client(tmp_path):
+    path = str(tmp_path / "healthsync.db")
+    asyncio.run(_seed(path))
+    database = Database(path)
+
+    async def connected() -> Database:
+        if not database.is_connected:
+            await database.connect()
+        return database
+
+    async def chat_service():
+        return ChatHistoryService(ChatMessageRepository(await connected()), LocalSessionCache(1 << 20, 60))
+
+    async def mission_service():
+        return MissionHistoryService(MissionCompletionRepository(await connected()))
+
+    app = FastAPI()
+    app.include_router(HistoryController().router)
+    app.dependency_overrides[get_chat_history_service] = chat_service
+    app.dependency_overrides[get_mission_history_service] = mission_service
+    with TestClient(app) as test_client:
+        yield test_client
+        test_client.portal.call(database.close)
+
+
+def _pages(client, url: str, **params):
+    pages, cursor = [], None
+    while True:
+        query = dict(params, user_id="u1", **({"cursor": cursor} if cursor else {}))
+        response = client.get(url, params=query)
+        assert response.status_code == 200, response.text
+        page = response.json()["data"]
+        pages.append(page["items"])
+        cursor = page["next_cursor"]
+        if not page["has_next"]:
+            assert cursor is None
+            return pages
+
+
+def test_chat_and_mission_history_pages(client):
+    chat = _pages(client, "/chat/s1/messages", limit=2)
+    assert [[m["message_content"] for m in page] for page in chat] == [["질문 4", "질문 3"], ["질문 2", "질문 1"],
+                                                                       ["질문 0"]]
+
+    missions = _pages(client, "/missions/7/completions", limit=2)
+    assert [[(m["completion_date"], m["completion_id"]) for m in page] for page in missions] == [
+        [("2024-05-01", 2), ("2024-05-02", 3)], [("2024-05-02", 4), ("2024-05-03", 1)], [("2024-05-04", 5)]]
+    window = _pages(client, "/missions/7/completions", limit=10, start_date="2024-05-02", end_date="2024-05-03")
+    assert [m["completion_id"] for m in window[0]] == [3, 4, 1]
+
+
+def test_bad_cursors_are_rejected(client):
+    first = client.get("/missions/7/completions", params={"user_id": "u1", "limit": 2}).json()["data"]
+    cursor = first["next_cursor"]
+    body, signature = cursor.split(".")
+
+    tampered = client.get("/missions/7/completions",
+                          params={"user_id": "u1", "cursor": f"{body}x.{signature}"})
+    assert tampered.status_code == 400
+    # 다른 회원 / 다른 조회 기간 / 다른 목록의 커서
+    for url, extra in (("/missions/8/completions", {}), ("/missions/7/completions", {"start_date": "2024-05-01"}),
+                       ("/chat/s1/messages", {})):
+        response = client.get(url, params={"user_id": "u1", "cursor": cursor, **extra})
+        assert response.status_code == 400, url
+    assert client.get("/missions/7/completions", params={"user_id": "u1", "limit": 0}).status_code == 422
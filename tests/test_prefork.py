@@ -0,0 +1,112 @@
+"""
+멀티 프로세스(pre-fork) 서버 스모크 테스트 (작업 프로세스 2개 응답, max_requests 재활용, SIGTERM 종료)
+
+서버는 신호 처리기를 설치하고 fork 하므로 별도 프로세스로 띄웁니다. 앱과 preload 는 이 모듈의 최소 ASGI 앱을 씁니다.
+"""
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+import numpy as np
+import pytest
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="fork 를 지원하지 않는 플랫폼")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAX_REQUESTS = 3
+
+_shared = None
+
+
+def preload():
+    """fork 전 공유 배열 준비 (작업 프로세스는 같은 영역을 읽음)"""
+    global _shared
+    from app.core.shared_arrays import SharedArrayStore
+    _shared = SharedArrayStore({"values": np.arange(10, dtype=np.int64)})
+    return _shared
+
+
+async def app(scope, receive, send):
+    """pid 와 공유 배열 합계를 돌려주는 최소 ASGI 앱"""
+    body = f"{os.getpid()} {int(_shared['values'].sum())}".encode()
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"text/plain")]})
+    await send({"type": "http.response.body", "body": body})
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _get(port: int):
+    request = urllib.request.Request(f"http://127.0.0.1:{port}/", headers={"Connection": "close"})
+    with urllib.request.urlopen(request, timeout=5) as response:
+        pid, total = response.read().decode().split()
+    return int(pid), int(total)
+
+
+def _wait_serving(port: int, server: subprocess.Popen, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        assert server.poll() is None, "서버가 시작 중에 종료됨"
+        try:
+            return _get(port)
+        except OSError:
+            time.sleep(0.1)
+    raise AssertionError("서버가 응답하지 않음")
+
+
+def _alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+def test_prefork_serves_recycles_and_stops(tmp_path):
+    port = _free_port()
+    script = (
+        "from app.core.prefork import PreforkServer\n"
+        f"PreforkServer('tests.test_prefork:app', '127.0.0.1', {port}, workers=2, max_requests={MAX_REQUESTS}, "
+        "graceful_timeout=5, log_level='warning', preload='tests.test_prefork:preload', "
+        "uvicorn_options={'lifespan': 'off'}).run()\n"
+    )
+    with open(tmp_path / "server.log", "wb") as log:
+        server = subprocess.Popen([sys.executable, "-c", script], cwd=ROOT, stdout=log, stderr=subprocess.STDOUT)
+    try:
+        assert _wait_serving(port, server)[1] == 45
+
+        # 작업 프로세스는 요청 MAX_REQUESTS 건을 넘긴 뒤 다음 틱(0.1초)에 종료되고 부모가 새로 fork 하므로
+        # 요청을 이어 보내면 처음 두 개 외의 pid 가 보임
+        seen = []
+        deadline = time.monotonic() + 30
+        while len(set(seen)) <= 2 and time.monotonic() < deadline:
+            try:
+                pid, total = _get(port)
+            except OSError:
+                # 재활용 직후 교체 프로세스가 준비되기 전의 짧은 공백
+                time.sleep(0.2)
+                continue
+            assert total == 45
+            seen.append(pid)
+            time.sleep(0.05)
+        assert len(set(seen)) > 2, seen
+        assert server.pid not in seen
+
+        server.send_signal(signal.SIGTERM)
+        assert server.wait(timeout=15) == 0
+        # 종료 후에는 작업 프로세스가 남지 않음
+        time.sleep(0.2)
+        assert not [pid for pid in set(seen) if _alive(pid)]
+    finally:
+        if server.poll() is None:
+            server.kill()
+            server.wait()
+        if os.path.exists(tmp_path / "server.log"):
+            print((tmp_path / "server.log").read_text(errors="replace"))
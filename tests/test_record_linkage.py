@@ -0,0 +1,85 @@
+"""
+원본 건강검진 → 회원 매칭 테스트 (정규화, 동명이인 처리, 병렬 처리 결과 일치)
+"""
+from datetime import date
+
+import numpy as np
+
+from app.core.checkup_store import CHECKUP_SCHEMA, RAW_SCHEMA, CheckupColumnStore, ColumnBatch
+from app.models.health import HealthCheckupRaw
+from app.services.checkup_pipeline_service import UNRESOLVED_MEMBER, CheckupPipelineService
+from app.services.record_linkage_service import (LINK_AMBIGUOUS, LINK_MATCHED, LINK_UNMATCHED, LinkageIndex,
+                                                 RecordLinkageService, normalize_name)
+
+_USERS = """member_serial_number,name,birth_date,gender_code,region_code
+101,김민준,1985-03-02,1,11
+102,이서연,1990-07-15,2,26
+103,박지훈,1978-11-30,1,11
+104,박지훈,1978-11-30,1,41
+105,최유진,1988-01-20,,
+106,최유진,1988-01-20,,
+"""
+
+
+def _raw(raw_id: int, name: str, birth_date: str, gender_code: int, region_code: int) -> HealthCheckupRaw:
+    return HealthCheckupRaw(raw_id=raw_id, reference_year=2024, birth_date=date.fromisoformat(birth_date), name=name,
+                            region_code=region_code, gender_code=gender_code, age=40, height=170, weight=70,
+                            waist_circumference=85)
+
+
+_RAW = [
+    _raw(1, "김민준", "1985-03-02", 1, 11),       # 매칭
+    _raw(2, " 이 서연 ", "1990-07-15", 2, 30),    # 공백 정규화 후 매칭 (지역은 후보 1명이면 무시)
+    _raw(3, "박지훈", "1978-11-30", 1, 41),       # 동명이인 → 지역으로 확정
+    _raw(4, "박지훈", "1978-11-30", 1, 26),       # 동명이인, 지역도 달라 모호
+    _raw(5, "최유진", "1988-01-20", 2, 11),       # 동명이인, 성별 / 지역 모름 → 모호
+    _raw(6, "김민준", "1985-03-02", 2, 11),       # 후보의 성별과 다름 → 미매칭
+    _raw(7, "홍길동", "1970-01-01", 1, 11),       # 미등록
+]
+
+
+def _linker(tmp_path, **kwargs) -> RecordLinkageService:
+    path = tmp_path / "users.csv"
+    path.write_text(_USERS, encoding="utf-8")
+    return RecordLinkageService.from_csv(str(path), **kwargs)
+
+
+def test_normalize_name():
+    assert normalize_name(" 김 민준 ") == normalize_name("김민준")
+    assert normalize_name("Ｋｉｍ·Min-Jun") == normalize_name("kim min jun")
+
+
+def test_link_statuses(tmp_path):
+    linker = _linker(tmp_path, workers=1)
+    members, status = linker.link(ColumnBatch.from_models(RAW_SCHEMA, _RAW))
+    assert members.tolist() == [101, 102, 104, UNRESOLVED_MEMBER, UNRESOLVED_MEMBER, UNRESOLVED_MEMBER,
+                                UNRESOLVED_MEMBER]
+    assert status.tolist() == [LINK_MATCHED, LINK_MATCHED, LINK_MATCHED, LINK_AMBIGUOUS, LINK_AMBIGUOUS,
+                               LINK_UNMATCHED, LINK_UNMATCHED]
+    assert (linker.stats.matched, linker.stats.ambiguous, linker.stats.unmatched) == (3, 2, 2)
+
+
+def test_process_pool_matches_single_process(tmp_path):
+    rng = np.random.default_rng(5)
+    rows = [_RAW[i] for i in rng.integers(0, len(_RAW), 500)]
+    batch = ColumnBatch.from_models(RAW_SCHEMA, rows)
+    expected = _linker(tmp_path, workers=1).link(batch)
+    with _linker(tmp_path, workers=2, chunk_rows=64) as parallel:
+        members, status = parallel.link(batch)
+        assert parallel.stats.rows == 500
+    assert np.array_equal(members, expected[0]) and np.array_equal(status, expected[1])
+
+
+def test_pipeline_uses_linker_as_resolver(tmp_path):
+    store = CheckupColumnStore.for_checkups(str(tmp_path / "checkups"))
+    service = CheckupPipelineService(store, resolver=_linker(tmp_path, workers=1))
+    stats = service.run_batches([ColumnBatch.from_models(RAW_SCHEMA, _RAW)])
+    assert (stats.rows_written, stats.rows_skipped) == (3, 4)
+    assert sorted(ColumnBatch.concat(CHECKUP_SCHEMA, list(store.scan())).column("member_serial_number").tolist()) == \
+        [101, 102, 104]
+
+
+def test_empty_index_leaves_rows_unresolved():
+    index = LinkageIndex.build([], [], [])
+    members, status = index.resolve(["김민준"], np.array([5539]), np.array([1]), np.array([11]))
+    assert members.tolist() == [UNRESOLVED_MEMBER] and status.tolist() == [LINK_UNMATCHED]
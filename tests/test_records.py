@@ -0,0 +1,79 @@
+"""
+내부 레코드 ↔ pydantic 모델 변환 일치 테스트
+"""
+from datetime import date, datetime
+
+import pytest
+
+from app.core.checkup_store import CHECKUP_SCHEMA, ColumnBatch
+from app.core.event_log import EventLog
+from app.models.common import EventStore, EventType
+from app.models.goal import MissionCompletionHistory
+from app.models.health import HealthCheckup
+from app.models.intelligence import ChatMessage, MessageType
+from app.models.records import ChatMessageRecord, CheckupRecord, EventRecord, MissionCompletionRecord
+
+_CHECKUP = HealthCheckup(checkup_id=1, member_serial_number=7, raw_id=3, reference_year=2024, age=45, height=172,
+                         weight=74, bmi="25.01", waist_circumference=88, systolic_bp=132, hemoglobin="14.2",
+                         smoking_status=2, processed_at=datetime(2024, 5, 1, 9, 0), created_at=datetime(2024, 5, 1, 9, 0))
+
+
+@pytest.mark.parametrize("record_type, model", [
+    (CheckupRecord, _CHECKUP),
+    (MissionCompletionRecord, MissionCompletionHistory(completion_id=1, mission_id=2, member_serial_number=7,
+                                                       completion_date=date(2024, 5, 1), daily_target_count=3,
+                                                       daily_completed_count=2)),
+    (ChatMessageRecord, ChatMessage(message_id=1, member_serial_number=7, message_type=MessageType.QUESTION,
+                                    message_content="혈압 관리 방법이 궁금해요")),
+    (EventRecord, EventStore(event_id=1, aggregate_id="member-7", event_type=EventType.HEALTH_DATA_SYNCED,
+                             event_data="{}", member_serial_number=7, service_name="health")),
+])
+def test_round_trip(record_type, model):
+    record = record_type.from_model(model)
+    assert record.as_dict() == model.model_dump()
+    assert record.to_model() == model
+
+
+def test_checkup_record_required_fields():
+    # HealthCheckup 에서 필수인 허리둘레는 기본값 없이, BMI 는 from_model 이 항상 넘기므로 필수 위치 인자
+    values = _CHECKUP.model_dump()
+    assert CheckupRecord(*values.values()) == CheckupRecord.from_model(_CHECKUP)
+    for name in ("bmi", "waist_circumference"):
+        with pytest.raises(TypeError):
+            CheckupRecord(**{k: v for k, v in values.items() if k != name})
+
+
+def test_chat_row_matches_model():
+    row = {"message_id": 5, "session_id": "s-1", "member_serial_number": 7, "message_type": "answer",
+           "message_content": "걷기를 추천합니다.", "response_content": None, "created_at": "2024-05-01T09:30:00.123456"}
+    model = ChatMessage(**{k: v for k, v in row.items() if k != "session_id"})
+    record = ChatMessageRecord.from_row(row)
+    assert record.to_model() == model
+    assert record.as_json() == model.model_dump(mode="json")
+
+
+def test_mission_row_matches_model():
+    row = {"completion_id": 1, "mission_id": 2, "member_serial_number": 7, "completion_date": "2024-05-01",
+           "daily_target_count": 3, "daily_completed_count": 3, "created_at": "2024-05-01T21:00:00"}
+    assert MissionCompletionRecord.from_row(row).to_model() == MissionCompletionHistory(**row)
+
+
+def test_column_batch_records_match_models():
+    batch = ColumnBatch.from_models(CHECKUP_SCHEMA, [_CHECKUP, _CHECKUP.model_copy(update={"checkup_id": 2})])
+    records = batch.to_records(CheckupRecord)
+    assert [r.to_model() for r in records] == batch.to_models()
+    assert ColumnBatch.from_models(CHECKUP_SCHEMA, records).to_models() == batch.to_models()
+
+
+def test_event_log_accepts_models_and_records(tmp_path):
+    log = EventLog(str(tmp_path), fsync=False)
+    try:
+        model = EventStore(event_id=0, aggregate_id="member-7", event_type=EventType.HEALTH_DATA_SYNCED,
+                           event_data='{"year":2024}', member_serial_number=7, service_name="health",
+                           created_at=datetime(2024, 5, 1, 9, 0))
+        stored = log.append_batch([model, EventRecord.from_model(model)])
+        assert [e.event_id for e in stored] == [1, 2]
+        assert list(log.replay_aggregate("member-7")) == stored
+        assert stored[0].to_model() == model.model_copy(update={"event_id": 1})
+    finally:
+        log.close()
@@ -0,0 +1,66 @@
+"""
+응답 JSON 직렬화 테스트 (Decimal, datetime, Enum, numpy 스칼라 / 배열, 응답 모델)
+"""
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+
+import numpy as np
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.responses import ModelJSONResponse, dump_json
+from app.models.base import BaseResponse
+from app.models.common import ChartResolution
+
+
+class _Opaque:
+    """직렬화기도 numpy 도 모르는 값 (str 로 대체)"""
+
+    def __str__(self) -> str:
+        return "opaque"
+
+
+def test_dump_json_native_and_numpy_values():
+    content = {
+        "decimal": Decimal("14.25"),
+        "datetime": datetime(2024, 5, 1, 9, 30),
+        "date": date(2024, 5, 1),
+        "enum": ChartResolution.WEEK,
+        "int64": np.int64(7),
+        "float32": np.float32(0.5),
+        "bool": np.bool_(True),
+        "vector": np.arange(3),
+        "matrix": np.array([[1.5, 2.0], [3.0, 4.5]]),
+        "empty": np.array([]),
+        "single": np.array([9]),
+        "other": _Opaque(),
+    }
+    assert json.loads(dump_json(content)) == {
+        "decimal": "14.25",
+        "datetime": "2024-05-01T09:30:00",
+        "date": "2024-05-01",
+        "enum": "week",
+        "int64": 7,
+        "float32": 0.5,
+        "bool": True,
+        "vector": [0, 1, 2],
+        "matrix": [[1.5, 2.0], [3.0, 4.5]],
+        "empty": [],
+        "single": [9],
+        "other": "opaque",
+    }
+
+
+def test_model_response_with_numpy_data():
+    app = FastAPI()
+
+    @app.get("/series", response_class=ModelJSONResponse)
+    async def series() -> Any:
+        return ModelJSONResponse(BaseResponse(success=True, message="ok", data={"y": np.linspace(0, 1, 3)}))
+
+    with TestClient(app) as client:
+        response = client.get("/series")
+    assert response.status_code == 200
+    assert response.json()["data"] == {"y": [0.0, 0.5, 1.0]}
@@ -0,0 +1,102 @@
+"""
+런타임 샘플러 테스트 (링 버퍼 크기, GC 구간 값 초기화, 빈 버퍼 조회, 요약, 콜백 해제)
+"""
+import asyncio
+import gc
+
+import pytest
+
+from app.core.runtime_sampler import GCMonitor, RuntimeSampler
+
+
+@pytest.fixture
+def no_automatic_gc():
+    """자동 수집이 구간 값을 바꾸지 않도록 테스트 동안 끔 (gc.collect 는 그대로 콜백 호출)"""
+    enabled = gc.isenabled()
+    gc.disable()
+    yield
+    if enabled:
+        gc.enable()
+
+
+def test_history_is_bounded_ring_buffer():
+    sampler = RuntimeSampler(history_size=3)
+    samples = [sampler.sample() for _ in range(5)]
+    assert sampler.history() == samples[-3:]
+    assert sampler.latest is samples[-1]
+    with pytest.raises(ValueError):
+        RuntimeSampler(interval=0)
+
+
+def test_gc_monitor_drain_resets_interval(no_automatic_gc):
+    monitor = GCMonitor()
+    monitor.install()
+    try:
+        gc.collect(0)
+        gc.collect(2)
+        collections, pause_ms, max_pause_ms = monitor.drain()
+        assert collections[0] >= 1 and collections[2] >= 1
+        assert 0 < max_pause_ms <= pause_ms
+        assert monitor.drain() == ((0, 0, 0), 0.0, 0.0)
+    finally:
+        monitor.uninstall()
+    gc.collect()
+    assert monitor.drain() == ((0, 0, 0), 0.0, 0.0)
+
+
+def test_sample_reports_gc_since_previous_sample(no_automatic_gc):
+    sampler = RuntimeSampler()
+    sampler._gc.install()
+    try:
+        sampler.sample()
+        gc.collect(2)
+        assert sampler.sample().gc_collections[2] == 1
+        assert sampler.sample().gc_collections == (0, 0, 0)
+    finally:
+        sampler._gc.uninstall()
+
+
+def test_current_samples_once_when_empty():
+    sampler = RuntimeSampler()
+    assert sampler.latest is None
+    first = sampler.current()
+    assert sampler.history() == [first] and first.rss_mb > 0 and first.threads >= 1
+    assert sampler.current() is first and len(sampler.history()) == 1
+
+
+def test_summary_empty_and_full(no_automatic_gc):
+    sampler = RuntimeSampler(interval=0.5, history_size=4)
+    assert sampler.summary() == {"samples": 0}
+
+    sampler._gc.install()
+    try:
+        for _ in range(6):
+            gc.collect(1)
+            sampler.sample()
+    finally:
+        sampler._gc.uninstall()
+    samples = sampler.history()
+    summary = sampler.summary()
+    assert summary["samples"] == 4 and summary["interval_seconds"] == 0.5
+    assert summary["window_seconds"] == round(samples[-1].timestamp - samples[0].timestamp, 3)
+    # 버퍼에 남은 마지막 4개 샘플만 요약
+    assert summary["gc_collections"] == [0, 4, 0]
+    assert summary["gc_max_pause_ms"] == max(s.gc_max_pause_ms for s in samples)
+    assert summary["rss_mb"] == {"min": min(s.rss_mb for s in samples), "max": max(s.rss_mb for s in samples)}
+    assert summary["loop_lag_ms"] == {"avg": 0.0, "max": 0.0}
+
+
+@pytest.mark.asyncio
+async def test_start_and_stop_manage_gc_callback():
+    callbacks = len(gc.callbacks)
+    sampler = RuntimeSampler(interval=0.01)
+    sampler.start()
+    sampler.start()
+    assert sampler.running and len(gc.callbacks) == callbacks + 1
+    await asyncio.sleep(0.1)
+    assert len(sampler.history()) >= 2
+
+    await sampler.stop()
+    assert not sampler.running and len(gc.callbacks) == callbacks
+    await sampler.stop()
+    assert len(gc.callbacks) == callbacks
@@ -0,0 +1,68 @@
+"""
+읽기 전용 공유 배열 테스트 (값 보존, 정렬, 읽기 전용 뷰, 공유 전후 조회 결과 동일)
+"""
+from datetime import date
+
+import numpy as np
+import pytest
+
+from app.config.settings import settings
+from app.core.shared_arrays import SharedArrayStore, share_read_only
+from app.models.health import HealthCheckupRaw
+from app.services.cohort_stats_service import CohortStatsService
+
+
+def _raw(raw_id: int, age: int, systolic_bp: int) -> HealthCheckupRaw:
+    return HealthCheckupRaw(raw_id=raw_id, reference_year=2023, birth_date=date(1981, 3, 2), name=f"회원{raw_id}",
+                            region_code=11 + raw_id % 2, gender_code=1 + raw_id % 2, age=age, height=172,
+                            weight=70, waist_circumference=84, systolic_bp=systolic_bp)
+
+
+def test_store_round_trip_aligned_and_read_only():
+    arrays = {
+        "a/int": np.arange(7, dtype=np.int32),
+        "a/float": np.linspace(0, 1, 5),
+        "b/matrix": np.arange(12, dtype=np.float32).reshape(3, 4)[:, ::2],
+        "b/empty": np.array([], dtype=np.int64),
+        "c": np.array([True, False, True]),
+    }
+    store = SharedArrayStore(arrays)
+    assert list(store) == list(arrays) and len(store) == 5
+    for name, array in arrays.items():
+        shared = store[name]
+        assert shared.dtype == array.dtype and shared.shape == array.shape
+        np.testing.assert_array_equal(shared, array)
+        # 배열 시작 주소는 64바이트 경계, 비연속 입력도 연속 배열로 복사
+        assert shared.ctypes.data % 64 == 0 and shared.flags.c_contiguous
+        assert not shared.flags.writeable
+        with pytest.raises(ValueError):
+            shared[...] = 0
+    assert store.nbytes >= sum(a.nbytes for a in arrays.values())
+    assert sorted(store.scoped("b")) == ["empty", "matrix"] and store.scoped("d") == {}
+    assert len(SharedArrayStore({})) == 0
+
+
+def test_share_read_only_keeps_cohort_percentiles(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "cohort_sketch_path", str(tmp_path / "cohort_sketches.bin"))
+    rng = np.random.default_rng(3)
+    service = CohortStatsService(min_samples=1)
+    service.add_checkups([_raw(i, int(rng.integers(40, 60)), int(rng.normal(125, 15))) for i in range(3_000)])
+    probes = [(age, gender, region, value) for age in (42, 55) for gender in (1, 2) for region in (11, 12)
+              for value in (100, 125, 150)]
+    before = [service.percentile(age, gender, region, "systolic_bp", value)
+              for age, gender, region, value in probes]
+
+    store = share_read_only({"cohort": service})
+    assert len(store) > 0 and all(not array.flags.writeable for array in store.values())
+    sketch, _ = service.sketch_for(42, 1, 11, "systolic_bp")
+    assert all(np.shares_memory(level, store._buffer) for level in sketch.levels if len(level))
+    after = [service.percentile(age, gender, region, "systolic_bp", value)
+             for age, gender, region, value in probes]
+    assert after == before
+
+    # 공유 뒤 갱신은 새 배열을 만들어 교체 (공유 영역은 그대로)
+    snapshot = {name: array.copy() for name, array in store.items()}
+    service.add_checkups([_raw(10_000 + i, 42, 180) for i in range(500)])
+    assert service.percentile(42, 1, 11, "systolic_bp", 150)["percentile"] < before[2]["percentile"]
+    for name, array in store.items():
+        np.testing.assert_array_equal(array, snapshot[name])
@@ -0,0 +1,37 @@
+"""
+기동 시간 예산 테스트 (새 프로세스에서 측정, 3회 중 최소값 기준)
+"""
+from app.config.settings import settings
+from app.utils.startup_profiler import (
+    DEFERRED_MODULES, measure_import_seconds, measure_ready_seconds, parse_importtime,
+)
+
+
+def test_app_import_does_not_load_deferred_modules():
+    loaded = measure_import_seconds("app.main")["deferred_loaded"]
+    assert loaded == [], f"기동 경로에서 로드됨: {loaded} (지연 대상: {DEFERRED_MODULES})"
+
+
+def test_app_import_within_budget():
+    best = min(measure_import_seconds("app.main")["seconds"] for _ in range(3)) * 1000
+    assert best <= settings.startup_import_budget_ms, \
+        f"app.main import {best:.1f}ms > 예산 {settings.startup_import_budget_ms}ms (python run.py --profile-startup 로 확인)"
+
+
+def test_first_request_within_budget():
+    best = min(measure_ready_seconds() for _ in range(3)) * 1000
+    assert best <= settings.startup_ready_budget_ms, \
+        f"첫 요청 응답까지 {best:.1f}ms > 예산 {settings.startup_ready_budget_ms}ms"
+
+
+def test_parse_importtime():
+    output = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |     app.views\n"
+        "import time:      4272 |      13470 |   app.controllers.status_controller\n"
+    )
+    timings = parse_importtime(output)
+    assert [(t.module, t.self_us, t.cumulative_us, t.depth) for t in timings] == [
+        ("app.views", 120, 120, 2),
+        ("app.controllers.status_controller", 4272, 13470, 1),
+    ]